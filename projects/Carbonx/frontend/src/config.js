@@ -1,18 +1,34 @@
+import deployments from './contracts/deployments.json';
+import retirementManagerSpec from './contracts/RetirementManager.arc56.json';
+
 // ─── Algorand Testnet Configuration ─────────────────────────────────
 export const ALGORAND_NODE = 'https://testnet-api.algonode.cloud';
 export const ALGORAND_INDEXER = 'https://testnet-idx.algonode.cloud';
 export const ALGORAND_NETWORK = 'testnet';
+export const ALGORAND_GENESIS_ID = 'testnet-v1.0';
 
 // ─── Deployed Contract App IDs (Testnet) ─────────────────────────────
+// Written with the app specs by `python scripts/carbonx.py export-frontend` after a deploy
+const DEPLOYED = deployments[ALGORAND_GENESIS_ID] || {};
+
 export const APP_IDS = {
-    CARBON_MARKETPLACE: 755796939,
-    ISSUER_REGISTRY: 755796937,
-    RETIREMENT_MANAGER: 755796917,
+    CARBON_MARKETPLACE: DEPLOYED.carbon_marketplace || 755796939,
+    ISSUER_REGISTRY: DEPLOYED.issuer_registry || 755796937,
+    // 0 until exported: 755796917 predates retirement certificates, whose schema needs a new app
+    RETIREMENT_MANAGER: DEPLOYED.retirement_manager || 0,
     CXT_ASSET_ID: 755796756,      // Official $CXT Asset ID
     GOVERNANCE_TOKEN_ID: 0,       // CXG not yet deployed on Testnet
 };
 
 // ─── ABI Method Signatures ──────────────────────────────────────────
+// Signatures of every method in an ARC-56 app spec, keyed by method name
+function methodSignatures(spec) {
+    return Object.fromEntries(spec.methods.map(m => [
+        m.name,
+        `${m.name}(${m.args.map(a => a.type).join(',')})${m.returns.type}`,
+    ]));
+}
+
 export const ABI_METHODS = {
     MARKETPLACE: {
         create: 'create()void',
@@ -35,11 +51,9 @@ export const ABI_METHODS = {
         get_approved_count: 'get_approved_count()uint64',
     },
     RETIREMENT_MANAGER: {
-        create: 'create()void',
         add_supply: 'add_supply(uint64)void',
-        retire_credits: 'retire_credits(axfer)void',
-        get_retirement_stats: 'get_retirement_stats()uint64',
         get_available_supply: 'get_available_supply()uint64',
-        init_asset: 'init_asset(uint64)void',
+        // The methods of the deployed app, from the app spec shipped with its ID
+        ...methodSignatures(retirementManagerSpec),
     },
 };
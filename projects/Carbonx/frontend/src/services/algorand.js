@@ -64,7 +64,7 @@ export async function getAlgoBalance(accountAddr) {
  * @param {string} sender - Sender address
  * @param {string} methodSignature - e.g. "mint_credits(uint64)void"
  * @param {any[]} args - Method arguments
- * @param {object} options - Extra options { onComplete, boxes, accounts, apps, assets }
+ * @param {object} options - Extra options { onComplete, boxes, accounts, apps, assets, transactions, signer }
  */
 export async function callMethod(appId, sender, methodSignature, args = [], options = {}) {
     let suggestedParams;
@@ -79,18 +79,24 @@ export async function callMethod(appId, sender, methodSignature, args = [], opti
 
     const atc = new algosdk.AtomicTransactionComposer();
 
+    // Transactions the call inspects through the group, e.g. a batch of asset transfers
+    for (const txnWithSigner of options.transactions || []) {
+        atc.addTransaction(txnWithSigner);
+    }
+
     atc.addMethodCall({
         appID: appId,
         method,
         sender,
         suggestedParams,
-        signer: async (txnGroup, indexesToSign) => {
+        // Sharing the signer of `transactions` lets the wallet sign the group in one approval
+        signer: options.signer || (async (txnGroup, indexesToSign) => {
             const txnsToSign = indexesToSign.map(i => ({
                 txn: txnGroup[i],
                 signers: [sender]
             }));
             return await signTransactions(txnsToSign);
-        },
+        }),
         methodArgs: args,
         onComplete: options.onComplete || algosdk.OnApplicationComplete.NoOpOC,
         boxes: options.boxes,
@@ -105,13 +111,14 @@ export async function callMethod(appId, sender, methodSignature, args = [], opti
 
 /**
  * Simulate a readonly ABI method call (no wallet needed).
+ * @param {object} options - Extra options { boxes } for methods that read boxes
  */
-export async function simulateReadonly(appId, sender, methodSignature, args = []) {
+export async function simulateReadonly(appId, sender, methodSignature, args = [], options = {}) {
     let suggestedParams;
     try {
         suggestedParams = await algodClient.getTransactionParams().do();
     } catch (e) {
-        if (await switchToFallback()) return simulateReadonly(appId, sender, methodSignature, args);
+        if (await switchToFallback()) return simulateReadonly(appId, sender, methodSignature, args, options);
         throw e;
     }
     const method = algosdk.ABIMethod.fromSignature(methodSignature);
@@ -125,6 +132,7 @@ export async function simulateReadonly(appId, sender, methodSignature, args = []
         suggestedParams,
         signer: algosdk.makeEmptyTransactionSigner(),
         methodArgs: args,
+        boxes: options.boxes,
     });
 
     const result = await atc.simulate(algodClient);
@@ -324,11 +324,82 @@ export async function addSupply(sender, amount) {
     );
 }
 
-export async function retireCreditsRM(sender, amount) {
+/**
+ * Number of retirement certificates of an account, read straight from its count box
+ * @param {string} retiree - Account address
+ * @returns {Promise<number>}
+ */
+export async function getCertificateCount(retiree) {
+    const name = new Uint8Array([...new TextEncoder().encode('n'), ...algosdk.decodeAddress(retiree).publicKey]);
+    try {
+        const box = await algodClient.getApplicationBoxByName(APP_IDS.RETIREMENT_MANAGER, name).do();
+        return Number(algosdk.decodeUint64(box.value, 'bigint'));
+    } catch (e) {
+        // No count box yet: the account has never retired
+        return 0;
+    }
+}
+
+/**
+ * MBR payment (microAlgos) the next retirement certificate of an account needs, as the
+ * deployed RetirementManager computes it: the certificate box, plus the count box on
+ * the account's first retirement
+ * @param {string} retiree - Account address
+ * @returns {Promise<bigint>}
+ */
+export async function getCertificateMbr(retiree) {
+    const publicKey = algosdk.decodeAddress(retiree).publicKey;
+    const mbr = await simulateReadonly(
+        APP_IDS.RETIREMENT_MANAGER,
+        null,
+        ABI_METHODS.RETIREMENT_MANAGER.certificate_mbr,
+        [retiree],
+        { boxes: [{ appIndex: 0, name: new Uint8Array([...new TextEncoder().encode('n'), ...publicKey]) }] }
+    );
+    return BigInt(mbr);
+}
+
+/**
+ * Build the MBR payment and box references for the next certificate of `sender`
+ */
+async function certificateGroupParts(sender, signer, params) {
+    if (!APP_IDS.RETIREMENT_MANAGER) {
+        throw new Error('RetirementManager is not deployed on this network yet');
+    }
+    const [count, mbr] = await Promise.all([getCertificateCount(sender), getCertificateMbr(sender)]);
+    const publicKey = algosdk.decodeAddress(sender).publicKey;
+    const prefix = (letter) => new TextEncoder().encode(letter);
+    const boxes = [
+        { appIndex: 0, name: new Uint8Array([...prefix('n'), ...publicKey]) },
+        { appIndex: 0, name: new Uint8Array([...prefix('r'), ...publicKey, ...algosdk.encodeUint64(count)]) },
+    ];
+    const mbrPayment = {
+        txn: algosdk.makePaymentTxnWithSuggestedParamsFromObject({
+            from: sender,
+            to: algosdk.getApplicationAddress(APP_IDS.RETIREMENT_MANAGER),
+            amount: mbr,
+            suggestedParams: params,
+        }),
+        signer,
+    };
+    return { mbrPayment, boxes };
+}
+
+/**
+ * Retire CXT and record a certificate of it
+ * @param {string} sender - Account retiring the credits
+ * @param {number|bigint} amount - Base-unit amount to retire
+ * @param {string} [beneficiary] - Account the credits are retired for, the sender by default
+ * @param {Uint8Array} [memo] - Up to 32 bytes of reference, zero-padded
+ */
+export async function retireCreditsRM(sender, amount, beneficiary = sender, memo = new Uint8Array(32)) {
     const params = await algodClient.getTransactionParams().do();
     params.genesisHash = params.genesisHash || 'SGO1GKSzyE7IEPItTxCBywTZ644S4o/W88un3Ry7jd0=';
     params.genesisID = params.genesisID || 'testnet-v1.0';
 
+    // One signer for every transaction, so the wallet approves the group at once
+    const { signer } = makeWalletTransactionWithSigner(sender);
+    const { mbrPayment, boxes } = await certificateGroupParts(sender, signer, params);
     const axferTxn = algosdk.makeAssetTransferTxnWithSuggestedParamsFromObject({
         from: sender,
         to: algosdk.getApplicationAddress(APP_IDS.RETIREMENT_MANAGER),
@@ -342,13 +413,66 @@ export async function retireCreditsRM(sender, amount) {
         sender,
         ABI_METHODS.RETIREMENT_MANAGER.retire_credits,
         [
-            { txn: axferTxn, sign: true }
-        ]
+            mbrPayment,
+            { txn: axferTxn, signer },
+            beneficiary,
+            padMemo(memo),
+        ],
+        { boxes, signer }
     );
 }
 
+function padMemo(memo) {
+    const padded = new Uint8Array(32);
+    padded.set(memo.slice(0, 32));
+    return padded;
+}
+
 export const retireCredits = retireCreditsRM;
 
+// Asset transfers a single retire_credits_batch call can cover: a group holds 16
+// transactions, one of which is the MBR payment and one the app call
+export const MAX_RETIREMENT_BATCH = 14;
+
+/**
+ * Retire several lots of CXT with one app call instead of one call per lot, recorded
+ * as a single certificate
+ * @param {string} sender - Account retiring the credits
+ * @param {Array<number|bigint>} amounts - Base-unit amount of each lot, at most MAX_RETIREMENT_BATCH
+ * @param {string} [beneficiary] - Account the credits are retired for, the sender by default
+ * @param {Uint8Array} [memo] - Up to 32 bytes of reference, zero-padded
+ */
+export async function retireCreditsBatch(sender, amounts, beneficiary = sender, memo = new Uint8Array(32)) {
+    if (amounts.length === 0 || amounts.length > MAX_RETIREMENT_BATCH) {
+        throw new Error(`A retirement batch holds 1 to ${MAX_RETIREMENT_BATCH} lots`);
+    }
+    const params = await algodClient.getTransactionParams().do();
+    params.genesisHash = params.genesisHash || 'SGO1GKSzyE7IEPItTxCBywTZ644S4o/W88un3Ry7jd0=';
+    params.genesisID = params.genesisID || 'testnet-v1.0';
+
+    // One signer for every transaction, so the wallet approves the whole batch at once
+    const { signer } = makeWalletTransactionWithSigner(sender);
+    const { mbrPayment, boxes } = await certificateGroupParts(sender, signer, params);
+    const transfers = amounts.map(amount => ({
+        txn: algosdk.makeAssetTransferTxnWithSuggestedParamsFromObject({
+            from: sender,
+            to: algosdk.getApplicationAddress(APP_IDS.RETIREMENT_MANAGER),
+            assetIndex: APP_IDS.CXT_ASSET_ID,
+            amount: BigInt(amount),
+            suggestedParams: params,
+        }),
+        signer,
+    }));
+
+    return callMethod(
+        APP_IDS.RETIREMENT_MANAGER,
+        sender,
+        ABI_METHODS.RETIREMENT_MANAGER.retire_credits_batch,
+        [mbrPayment, beneficiary, padMemo(memo)],
+        { transactions: transfers, boxes, signer }
+    );
+}
+
 export async function getRetirementStats() {
     return simulateReadonly(
         APP_IDS.RETIREMENT_MANAGER,
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["OptIn"], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Initialise the marketplace.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "number of credits to mint (must be > 0)", "name": "amount"}], "name": "mint_credits", "returns": {"type": "void"}, "desc": "Mint new carbon credits to the caller. Creator only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "number of credits to retire (must be > 0)", "name": "amount"}], "name": "retire_credits", "returns": {"type": "void"}, "desc": "Retire (burn) carbon credits from the caller's balance.\nAnyone who holds credits can retire them. This permanently removes them from circulation.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "get_credits", "returns": {"type": "uint64"}, "desc": "Return the credit balance for the given account.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_credits", "returns": {"type": "uint64"}, "desc": "Return the total credits currently in circulation.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_retired_credits", "returns": {"type": "uint64"}, "desc": "Return the cumulative retired credits.", "events": [], "readonly": true, "recommendations": {}}], "name": "CarbonMarketplace", "state": {"keys": {"box": {}, "global": {"total_credits": {"key": "dG90YWxfY3JlZGl0cw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "retired_credits": {"key": "cmV0aXJlZF9jcmVkaXRz", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"credits_minted": {"key": "Y3JlZGl0c19taW50ZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 2}, "local": {"bytes": 0, "ints": 1}}}, "structs": {}, "byteCode": {"approval": "CyADAAEIJgQNdG90YWxfY3JlZGl0cw9yZXRpcmVkX2NyZWRpdHMOY3JlZGl0c19taW50ZWQEFR98dTEYQAAGKCJnKSJnMRtBAEIxGRREMRhBACuCBQQppRkIBG0QAJ8EjeesIQQJL1rRBBQJGVI2GgCOBQAfAEwAggCZAKQAgARMXGG6NhoAjgEACQAxGSMSMRgQQygiZykiZyNDNhoBSRUkEkQXMQAyCRJESUQiKGVESwEIKExnMQAiKmMiTgJNCDEAKk8CZiNDNhoBSRUkEkQXSUQxACIqYyJOAk1JSwIPREsBCTEAKk8CZiIoZURLAQkoTGciKWVECClMZyNDNhoBSRWBIBJEIipjIk4CTRYrTFCwI0MiKGVEFitMULAjQyIpZUQWK0xQsCND", "clear": "C4EBQw=="}, "desc": "Marketplace for minting and retiring carbon credits with per-user tracking.\n\n    Global state:\n        total_credits    \u2013 total minted credits in circulation\n        retired_credits  \u2013 cumulative credits permanently retired\n\n    Local state (per account):\n        credits_minted   \u2013 credits minted by/for this account\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOAogICAgYnl0ZWNibG9jayAidG90YWxfY3JlZGl0cyIgInJldGlyZWRfY3JlZGl0cyIgImNyZWRpdHNfbWludGVkIiAweDE1MWY3Yzc1CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE3CiAgICAvLyBzZWxmLnRvdGFsX2NyZWRpdHMgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0idG90YWxfY3JlZGl0cyIpCiAgICBieXRlY18wIC8vICJ0b3RhbF9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE4CiAgICAvLyBzZWxmLnJldGlyZWRfY3JlZGl0cyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJyZXRpcmVkX2NyZWRpdHMiKQogICAgYnl0ZWNfMSAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQ2FyYm9uTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX29wdF9pbkAxNgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAxMgogICAgcHVzaGJ5dGVzcyAweDI5YTUxOTA4IDB4NmQxMDAwOWYgMHg4ZGU3YWMyMSAweDA5MmY1YWQxIDB4MTQwOTE5NTIgLy8gbWV0aG9kICJtaW50X2NyZWRpdHModWludDY0KXZvaWQiLCBtZXRob2QgInJldGlyZV9jcmVkaXRzKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJnZXRfY3JlZGl0cyhhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3RvdGFsX2NyZWRpdHMoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3JldGlyZWRfY3JlZGl0cygpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWludF9jcmVkaXRzIHJldGlyZV9jcmVkaXRzIGdldF9jcmVkaXRzIGdldF90b3RhbF9jcmVkaXRzIGdldF9yZXRpcmVkX2NyZWRpdHMKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQ2FyYm9uTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCm1haW5fb3B0X2luQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNwogICAgLy8gQGJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIk9wdEluIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnRjXzEgLy8gT3B0SW4KICAgID09CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYXJib25fbWFya2V0cGxhY2UuY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNAogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJ0b3RhbF9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI1CiAgICAvLyBzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIxCiAgICAvLyBAYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhcmJvbl9tYXJrZXRwbGFjZS5jb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5taW50X2NyZWRpdHNbcm91dGluZ10oKSAtPiB2b2lkOgptaW50X2NyZWRpdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjMyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzkKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIG1pbnQgY3JlZGl0cyIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIG1pbnQgY3JlZGl0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MAogICAgLy8gYXNzZXJ0IGFtb3VudCA+IDAsICJBbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybyIKICAgIGR1cAogICAgYXNzZXJ0IC8vIEFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQxCiAgICAvLyBzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUgKz0gYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzIGV4aXN0cwogICAgZGlnIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MgogICAgLy8gY3VycmVudCA9IHNlbGYuY3JlZGl0c19taW50ZWQuZ2V0KFR4bi5zZW5kZXIsIGRlZmF1bHQ9VUludDY0KDApKQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNyZWRpdHNfbWludGVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MwogICAgLy8gc2VsZi5jcmVkaXRzX21pbnRlZFtUeG4uc2VuZGVyXSA9IGN1cnJlbnQgKyBhbW91bnQKICAgICsKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjXzIgLy8gImNyZWRpdHNfbWludGVkIgogICAgdW5jb3ZlciAyCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjMyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2FyYm9uX21hcmtldHBsYWNlLmNvbnRyYWN0LkNhcmJvbk1hcmtldHBsYWNlLnJldGlyZV9jcmVkaXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKcmV0aXJlX2NyZWRpdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTUKICAgIC8vIGFzc2VydCBhbW91bnQgPiAwLCAiQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBkdXAKICAgIGFzc2VydCAvLyBBbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NgogICAgLy8gY3VycmVudCA9IHNlbGYuY3JlZGl0c19taW50ZWQuZ2V0KFR4bi5zZW5kZXIsIGRlZmF1bHQ9VUludDY0KDApKQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNyZWRpdHNfbWludGVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NwogICAgLy8gYXNzZXJ0IGN1cnJlbnQgPj0gYW1vdW50LCAiSW5zdWZmaWNpZW50IGNyZWRpdHMgdG8gcmV0aXJlIgogICAgZHVwCiAgICBkaWcgMgogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgY3JlZGl0cyB0byByZXRpcmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTgKICAgIC8vIHNlbGYuY3JlZGl0c19taW50ZWRbVHhuLnNlbmRlcl0gPSBjdXJyZW50IC0gYW1vdW50CiAgICBkaWcgMQogICAgLQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWNfMiAvLyAiY3JlZGl0c19taW50ZWQiCiAgICB1bmNvdmVyIDIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTkKICAgIC8vIHNlbGYudG90YWxfY3JlZGl0cy52YWx1ZSAtPSBhbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJ0b3RhbF9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2NyZWRpdHMgZXhpc3RzCiAgICBkaWcgMQogICAgLQogICAgYnl0ZWNfMCAvLyAidG90YWxfY3JlZGl0cyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYwCiAgICAvLyBzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZSArPSBhbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV0aXJlZF9jcmVkaXRzIGV4aXN0cwogICAgKwogICAgYnl0ZWNfMSAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDUKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYXJib25fbWFya2V0cGxhY2UuY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UuZ2V0X2NyZWRpdHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfY3JlZGl0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjUKICAgIC8vIHJldHVybiBzZWxmLmNyZWRpdHNfbWludGVkLmdldChhY2NvdW50LCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVkaXRzX21pbnRlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2FyYm9uX21hcmtldHBsYWNlLmNvbnRyYWN0LkNhcmJvbk1hcmtldHBsYWNlLmdldF90b3RhbF9jcmVkaXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3RvdGFsX2NyZWRpdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcwCiAgICAvLyByZXR1cm4gc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYXJib25fbWFya2V0cGxhY2UuY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UuZ2V0X3JldGlyZWRfY3JlZGl0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yZXRpcmVkX2NyZWRpdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc1CiAgICAvLyByZXR1cm4gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV0aXJlZF9jcmVkaXRzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [172, 211], "errorMessage": "Amount must be greater than zero"}, {"pc": [225], "errorMessage": "Insufficient credits to retire"}, {"pc": [170], "errorMessage": "Only creator can mint credits"}, {"pc": [248, 292], "errorMessage": "check self.retired_credits exists"}, {"pc": [176, 238, 281], "errorMessage": "check self.total_credits exists"}, {"pc": [263], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [163, 208], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Initialise the marketplace.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "number of credits to mint (must be > 0)", "name": "amount"}], "name": "mint_credits", "returns": {"type": "void"}, "desc": "Mint new carbon credits to the caller. Creator only.\nThe caller's balance box, if new, is paid for from the app account.", "events": [{"args": [{"type": "address", "name": "account"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "total_credits"}], "name": "CreditsMinted", "desc": "ARC-28 event of `mint_credits`, with the new supply in circulation."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "number of credits to retire (must be > 0)", "name": "amount"}], "name": "retire_credits", "returns": {"type": "void"}, "desc": "Retire (burn) carbon credits from the caller's balance.\nAnyone who holds credits can retire them. This permanently removes them from circulation.", "events": [{"args": [{"type": "address", "name": "account"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "total_credits"}, {"type": "uint64", "name": "retired_credits"}], "name": "CreditsRetired", "desc": "ARC-28 event of `retire_credits`, with the new supply and retired total."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment transaction to the contract's account.", "name": "payment"}, {"type": "uint64", "desc": "Number of credits to buy.", "name": "amount"}], "name": "buy_credits", "returns": {"type": "void"}, "desc": "Buy credits from the marketplace.\nPrice increases as total supply increases (Linear Bonding Curve). Formula: Price = (Base + Supply * Slope) * Amount Base = 0.1 ALGO (100,000 microAlgos) Slope = 1 microAlgo per credit\nA buyer's first purchase creates their balance box, so the payment must also cover `BALANCE_BOX_MBR`. No opt-in is needed.", "events": [{"args": [{"type": "address", "name": "buyer"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "price"}, {"type": "uint64", "name": "total_credits"}], "name": "CreditsBought", "desc": "ARC-28 event of `buy_credits`: the unit price paid and the new supply."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_current_price", "returns": {"type": "uint64"}, "desc": "Return the current price per credit in microAlgos.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "get_credits", "returns": {"type": "uint64"}, "desc": "Return the credit balance for the given account.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "desc": "The accounts to look up.", "name": "addresses"}], "name": "get_balances", "returns": {"type": "uint64[]"}, "desc": "Return the credit balances of a page of accounts, in the order given.\nAccounts without a balance box read as 0. Read large holder lists in pages of up to `MAX_BALANCES_PAGE` addresses, which fit the opcode budget of a single app call, simulating with unnamed resources allowed so the boxes do not need to be referenced.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_credits", "returns": {"type": "uint64"}, "desc": "Return the total credits currently in circulation.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_retired_credits", "returns": {"type": "uint64"}, "desc": "Return the cumulative retired credits.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_stats", "returns": {"type": "(uint64,uint64,uint64)", "struct": "MarketplaceStats"}, "desc": "Return the credits in circulation, retired credits and current price in one call.", "events": [], "readonly": true, "recommendations": {}}], "name": "CarbonMarketplace", "state": {"keys": {"box": {}, "global": {"total_credits": {"key": "dG90YWxfY3JlZGl0cw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "retired_credits": {"key": "cmV0aXJlZF9jcmVkaXRz", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"balances": {"keyType": "address", "valueType": "uint64", "prefix": "Yw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"MarketplaceStats": [{"name": "total_credits", "type": "uint64"}, {"name": "retired_credits", "type": "uint64"}, {"name": "current_price", "type": "uint64"}]}, "byteCode": {"approval": "CyAFAAEgCKCNBiYEDXRvdGFsX2NyZWRpdHMBYw9yZXRpcmVkX2NyZWRpdHMEFR98dTEYQAAGKCJnKiJnMRkURDEYQQBHggkEKaUZCARtEACfBL1K6H0EIR1QzgSN56whBKtWZOQECS9a0QQUCRlSBDYfaME2GgCOCQAXAF8AuAEvAT0BVwG3AcIBzQCABExcYbo2GgCOAQABACgiZyoiZyNDNhoBSRUlEkRJFzEAMgkSRElEIihlREsBCChLAWcpMQBQvkwXIkxPAk1PAggpMQBQTBa/MQBMFkxPAlBMUIAEIsLxy0xQsCNDNhoBSRUlEkRJF0lEKTEAUL5MFyJMTwJNSUsCD0RLAQkpMQBQTBa/IihlREsBCShMZyIqZUQIKksBZzEAIihlRBZPAhZPAk8DUE8CUExQgAQZWTGdTFCwI0MxFiMJSTgQIxJENhoBRwIVJRJEF0cCRCIoZUQhBAhJTwILKTEAUL5MF04CQAAFgdSTAQhLBUk4BzIKEkQ4CA5EIihlREsDSU4CCChLAWdLAk8CCCkxAFBMFr8xAEsDFk8CFk8CSwZQTwJQTFCABONVeS9MULAjQyIoZUQhBAgWK0xQsCNDNhoBSRUkEkQpTFC+TBciTE8CTRYrTFCwI0M2GgFHAiJZSU4CSSQLgQIITwIVEkSBDw5EgAIAACJJSwMMQQA0SwNXAgBLAUlOAiQLJFgpTFC+TBciTE8CTRZLA0lPAlBMIlkjCBZXBgJcAEUDIwhFAUL/xStLAlCwI0MiKGVEFitMULAjQyIqZUQWK0xQsCNDIihlREkWIiplRBYhBE8DCBZOAlBMUCtMULAjQw==", "clear": "C4EBQw=="}, "desc": "Marketplace for minting and retiring carbon credits with per-user tracking.\n\n    Global state:\n        total_credits    \u2013 total minted credits in circulation\n        retired_credits  \u2013 cumulative credits permanently retired\n\n    Boxes (per account, created on the account's first credits):\n        c<address>       \u2013 credit balance of the account, see `BALANCE_PREFIX`\n    ", "events": [{"args": [{"type": "address", "name": "account"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "total_credits"}], "name": "CreditsMinted", "desc": "ARC-28 event of `mint_credits`, with the new supply in circulation."}, {"args": [{"type": "address", "name": "account"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "total_credits"}, {"type": "uint64", "name": "retired_credits"}], "name": "CreditsRetired", "desc": "ARC-28 event of `retire_credits`, with the new supply and retired total."}, {"args": [{"type": "address", "name": "buyer"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "price"}, {"type": "uint64", "name": "total_credits"}], "name": "CreditsBought", "desc": "ARC-28 event of `buy_credits`: the unit price paid and the new supply."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgOCAxMDAwMDAKICAgIGJ5dGVjYmxvY2sgInRvdGFsX2NyZWRpdHMiIDB4NjMgInJldGlyZWRfY3JlZGl0cyIgMHgxNTFmN2M3NQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NAogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzID0gR2xvYmFsU3RhdGUoVUludDY0KDApLCBrZXk9InRvdGFsX2NyZWRpdHMiKQogICAgYnl0ZWNfMCAvLyAidG90YWxfY3JlZGl0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NQogICAgLy8gc2VsZi5yZXRpcmVkX2NyZWRpdHMgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0icmV0aXJlZF9jcmVkaXRzIikKICAgIGJ5dGVjXzIgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBjbGFzcyBDYXJib25NYXJrZXRwbGFjZShBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAxNQogICAgcHVzaGJ5dGVzcyAweDI5YTUxOTA4IDB4NmQxMDAwOWYgMHhiZDRhZTg3ZCAweDIxMWQ1MGNlIDB4OGRlN2FjMjEgMHhhYjU2NjRlNCAweDA5MmY1YWQxIDB4MTQwOTE5NTIgMHgzNjFmNjhjMSAvLyBtZXRob2QgIm1pbnRfY3JlZGl0cyh1aW50NjQpdm9pZCIsIG1ldGhvZCAicmV0aXJlX2NyZWRpdHModWludDY0KXZvaWQiLCBtZXRob2QgImJ1eV9jcmVkaXRzKHBheSx1aW50NjQpdm9pZCIsIG1ldGhvZCAiZ2V0X2N1cnJlbnRfcHJpY2UoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2NyZWRpdHMoYWRkcmVzcyl1aW50NjQiLCBtZXRob2QgImdldF9iYWxhbmNlcyhhZGRyZXNzW10pdWludDY0W10iLCBtZXRob2QgImdldF90b3RhbF9jcmVkaXRzKCl1aW50NjQiLCBtZXRob2QgImdldF9yZXRpcmVkX2NyZWRpdHMoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3N0YXRzKCkodWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWludF9jcmVkaXRzIHJldGlyZV9jcmVkaXRzIGJ1eV9jcmVkaXRzIGdldF9jdXJyZW50X3ByaWNlIGdldF9jcmVkaXRzIGdldF9iYWxhbmNlcyBnZXRfdG90YWxfY3JlZGl0cyBnZXRfcmV0aXJlZF9jcmVkaXRzIGdldF9zdGF0cwogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MgogICAgLy8gY2xhc3MgQ2FyYm9uTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCgovLyBzbWFydF9jb250cmFjdHMuY2FyYm9uX21hcmtldHBsYWNlLmNvbnRyYWN0LkNhcmJvbk1hcmtldHBsYWNlLmNyZWF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzEKICAgIC8vIHNlbGYudG90YWxfY3JlZGl0cy52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAidG90YWxfY3JlZGl0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3MgogICAgLy8gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2OAogICAgLy8gQGFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYXJib25fbWFya2V0cGxhY2UuY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UubWludF9jcmVkaXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKbWludF9jcmVkaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBkdXAKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIG1pbnQgY3JlZGl0cyIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIG1pbnQgY3JlZGl0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4NAogICAgLy8gYXNzZXJ0IGFtb3VudCA+IDAsICJBbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybyIKICAgIGR1cAogICAgYXNzZXJ0IC8vIEFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUgKz0gYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzIGV4aXN0cwogICAgZGlnIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODYKICAgIC8vIHNlbGYuYmFsYW5jZXNbVHhuLnNlbmRlcl0gPSBzZWxmLmJhbGFuY2VzLmdldChUeG4uc2VuZGVyLCBkZWZhdWx0PVVJbnQ2NCgwKSkgKyBhbW91bnQKICAgIGJ5dGVjXzEgLy8gMHg2MwogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHVuY292ZXIgMgogICAgKwogICAgYnl0ZWNfMSAvLyAweDYzCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODkKICAgIC8vIGFjY291bnQ9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MQogICAgLy8gdG90YWxfY3JlZGl0cz1hcmM0LlVJbnQ2NChzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUpLAogICAgc3dhcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4OC05MgogICAgLy8gQ3JlZGl0c01pbnRlZCgKICAgIC8vICAgICBhY2NvdW50PWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICB0b3RhbF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYudG90YWxfY3JlZGl0cy52YWx1ZSksCiAgICAvLyApCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg3LTkzCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgQ3JlZGl0c01pbnRlZCgKICAgIC8vICAgICAgICAgYWNjb3VudD1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgICAgICB0b3RhbF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYudG90YWxfY3JlZGl0cy52YWx1ZSksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MjJjMmYxY2IgLy8gbWV0aG9kICJDcmVkaXRzTWludGVkKGFkZHJlc3MsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhcmJvbl9tYXJrZXRwbGFjZS5jb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5yZXRpcmVfY3JlZGl0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnJldGlyZV9jcmVkaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBkdXAKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA1CiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIkFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZHVwCiAgICBhc3NlcnQgLy8gQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA2CiAgICAvLyBjdXJyZW50ID0gc2VsZi5iYWxhbmNlcy5nZXQoVHhuLnNlbmRlciwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBieXRlY18xIC8vIDB4NjMKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNwogICAgLy8gYXNzZXJ0IGN1cnJlbnQgPj0gYW1vdW50LCAiSW5zdWZmaWNpZW50IGNyZWRpdHMgdG8gcmV0aXJlIgogICAgZHVwCiAgICBkaWcgMgogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgY3JlZGl0cyB0byByZXRpcmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA4CiAgICAvLyBzZWxmLmJhbGFuY2VzW1R4bi5zZW5kZXJdID0gY3VycmVudCAtIGFtb3VudAogICAgZGlnIDEKICAgIC0KICAgIGJ5dGVjXzEgLy8gMHg2MwogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwOQogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlIC09IGFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0cyBleGlzdHMKICAgIGRpZyAxCiAgICAtCiAgICBieXRlY18wIC8vICJ0b3RhbF9jcmVkaXRzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTEwCiAgICAvLyBzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZSArPSBhbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV0aXJlZF9jcmVkaXRzIGV4aXN0cwogICAgKwogICAgYnl0ZWNfMiAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExMwogICAgLy8gYWNjb3VudD1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExNQogICAgLy8gdG90YWxfY3JlZGl0cz1hcmM0LlVJbnQ2NChzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0cyBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTE2CiAgICAvLyByZXRpcmVkX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExMi0xMTcKICAgIC8vIENyZWRpdHNSZXRpcmVkKAogICAgLy8gICAgIGFjY291bnQ9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgIHRvdGFsX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlKSwKICAgIC8vICAgICByZXRpcmVkX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMTEtMTE4CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgQ3JlZGl0c1JldGlyZWQoCiAgICAvLyAgICAgICAgIGFjY291bnQ9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICAgICAgdG90YWxfY3JlZGl0cz1hcmM0LlVJbnQ2NChzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUpLAogICAgLy8gICAgICAgICByZXRpcmVkX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDE5NTkzMTlkIC8vIG1ldGhvZCAiQ3JlZGl0c1JldGlyZWQoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhcmJvbl9tYXJrZXRwbGFjZS5jb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5idXlfY3JlZGl0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmJ1eV9jcmVkaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTM2CiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIkFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgYXNzZXJ0IC8vIEFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gcmV0dXJuIEJBU0VfUFJJQ0UgKyBzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUgKiBTTE9QRQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0cyBleGlzdHMKICAgIGludGMgNCAvLyAxMDAwMDAKICAgICsKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEzOQogICAgLy8gdG90YWxfY29zdCA9IHVuaXRfcHJpY2UgKiBhbW91bnQKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQwCiAgICAvLyBjdXJyZW50X2JhbCwgaGFzX2JveCA9IHNlbGYuYmFsYW5jZXMubWF5YmUoVHhuLnNlbmRlcikKICAgIGJ5dGVjXzEgLy8gMHg2MwogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE0MQogICAgLy8gaWYgbm90IGhhc19ib3g6CiAgICBibnogYnV5X2NyZWRpdHNfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gdG90YWxfY29zdCArPSBCQUxBTkNFX0JPWF9NQlIKICAgIHB1c2hpbnQgMTg5MDAKICAgICsKCmJ1eV9jcmVkaXRzX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQ0LTE0NQogICAgLy8gIyBWZXJpZnkgUGF5bWVudAogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlBheW1lbnQgbXVzdCBiZSB0byBjb250cmFjdCIKICAgIGRpZyA1CiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBQYXltZW50IG11c3QgYmUgdG8gY29udHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQ2CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPj0gdG90YWxfY29zdCwgIkluc3VmZmljaWVudCBwYXltZW50IgogICAgZ3R4bnMgQW1vdW50CiAgICA8PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBwYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE0OC0xNDkKICAgIC8vICMgTWludCBDcmVkaXRzCiAgICAvLyBzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUgKz0gYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzIGV4aXN0cwogICAgZGlnIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgKwogICAgYnl0ZWNfMCAvLyAidG90YWxfY3JlZGl0cyIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNTAKICAgIC8vIHNlbGYuYmFsYW5jZXNbVHhuLnNlbmRlcl0gPSBjdXJyZW50X2JhbCArIGFtb3VudAogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgKwogICAgYnl0ZWNfMSAvLyAweDYzCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTUzCiAgICAvLyBidXllcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE1NQogICAgLy8gcHJpY2U9YXJjNC5VSW50NjQodW5pdF9wcmljZSksCiAgICBkaWcgMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNTYKICAgIC8vIHRvdGFsX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlKSwKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNTItMTU3CiAgICAvLyBDcmVkaXRzQm91Z2h0KAogICAgLy8gICAgIGJ1eWVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICBwcmljZT1hcmM0LlVJbnQ2NCh1bml0X3ByaWNlKSwKICAgIC8vICAgICB0b3RhbF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYudG90YWxfY3JlZGl0cy52YWx1ZSksCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIGRpZyA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTUxLTE1OAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIENyZWRpdHNCb3VnaHQoCiAgICAvLyAgICAgICAgIGJ1eWVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksCiAgICAvLyAgICAgICAgIHByaWNlPWFyYzQuVUludDY0KHVuaXRfcHJpY2UpLAogICAgLy8gICAgICAgICB0b3RhbF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYudG90YWxfY3JlZGl0cy52YWx1ZSksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZTM1NTc5MmYgLy8gbWV0aG9kICJDcmVkaXRzQm91Z2h0KGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2FyYm9uX21hcmtldHBsYWNlLmNvbnRyYWN0LkNhcmJvbk1hcmtldHBsYWNlLmdldF9jdXJyZW50X3ByaWNlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2N1cnJlbnRfcHJpY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gcmV0dXJuIEJBU0VfUFJJQ0UgKyBzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUgKiBTTE9QRQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0cyBleGlzdHMKICAgIGludGMgNCAvLyAxMDAwMDAKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTY0CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhcmJvbl9tYXJrZXRwbGFjZS5jb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5nZXRfY3JlZGl0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9jcmVkaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNjkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNzIKICAgIC8vIHJldHVybiBzZWxmLmJhbGFuY2VzLmdldChhY2NvdW50LCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGJ5dGVjXzEgLy8gMHg2MwogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTY5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhcmJvbl9tYXJrZXRwbGFjZS5jb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5nZXRfYmFsYW5jZXNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYmFsYW5jZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE3NAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICB1bmNvdmVyIDIKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTg4CiAgICAvLyBhc3NlcnQgYWRkcmVzc2VzLmxlbmd0aCA8PSBNQVhfQkFMQU5DRVNfUEFHRSwgIlRvbyBtYW55IGFkZHJlc3NlcyBmb3Igb25lIHBhZ2UiCiAgICBwdXNoaW50IDE1CiAgICA8PQogICAgYXNzZXJ0IC8vIFRvbyBtYW55IGFkZHJlc3NlcyBmb3Igb25lIHBhZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTg5CiAgICAvLyBiYWxhbmNlcyA9IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSgpCiAgICBwdXNoYnl0ZXMgMHgwMDAwCiAgICBpbnRjXzAgLy8gMAoKZ2V0X2JhbGFuY2VzX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTkwCiAgICAvLyBmb3IgYWRkcmVzcyBpbiBhZGRyZXNzZXM6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiBnZXRfYmFsYW5jZXNfYWZ0ZXJfZm9yQDUKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxOTEKICAgIC8vIGJhbGFuY2VzLmFwcGVuZChhcmM0LlVJbnQ2NChzZWxmLmJhbGFuY2VzLmdldChhZGRyZXNzLm5hdGl2ZSwgZGVmYXVsdD1VSW50NjQoMCkpKSkKICAgIGJ5dGVjXzEgLy8gMHg2MwogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGl0b2IKICAgIGRpZyAzCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0IC8vIG9uIGVycm9yOiBtYXggYXJyYXkgbGVuZ3RoIGV4Y2VlZGVkCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcmVwbGFjZTIgMAogICAgYnVyeSAzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGdldF9iYWxhbmNlc19mb3JfaGVhZGVyQDIKCmdldF9iYWxhbmNlc19hZnRlcl9mb3JANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTc0CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYXJib25fbWFya2V0cGxhY2UuY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UuZ2V0X3RvdGFsX2NyZWRpdHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdG90YWxfY3JlZGl0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTk3CiAgICAvLyByZXR1cm4gc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxOTQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2FyYm9uX21hcmtldHBsYWNlLmNvbnRyYWN0LkNhcmJvbk1hcmtldHBsYWNlLmdldF9yZXRpcmVkX2NyZWRpdHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcmV0aXJlZF9jcmVkaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMDIKICAgIC8vIHJldHVybiBzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXRpcmVkX2NyZWRpdHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE5OQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYXJib25fbWFya2V0cGxhY2UuY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UuZ2V0X3N0YXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3N0YXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMDgKICAgIC8vIHRvdGFsX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJ0b3RhbF9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2NyZWRpdHMgZXhpc3RzCiAgICBkdXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjA5CiAgICAvLyByZXRpcmVkX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXRpcmVkX2NyZWRpdHMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gcmV0dXJuIEJBU0VfUFJJQ0UgKyBzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUgKiBTTE9QRQogICAgaW50YyA0IC8vIDEwMDAwMAogICAgdW5jb3ZlciAzCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIxMAogICAgLy8gY3VycmVudF9wcmljZT1hcmM0LlVJbnQ2NChzZWxmLl91bml0X3ByaWNlKCkpLAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMDctMjExCiAgICAvLyByZXR1cm4gTWFya2V0cGxhY2VTdGF0cygKICAgIC8vICAgICB0b3RhbF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYudG90YWxfY3JlZGl0cy52YWx1ZSksCiAgICAvLyAgICAgcmV0aXJlZF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlKSwKICAgIC8vICAgICBjdXJyZW50X3ByaWNlPWFyYzQuVUludDY0KHNlbGYuX3VuaXRfcHJpY2UoKSksCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMDQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [179, 245, 345], "errorMessage": "Amount must be greater than zero"}, {"pc": [262], "errorMessage": "Insufficient credits to retire"}, {"pc": [386], "errorMessage": "Insufficient payment"}, {"pc": [177], "errorMessage": "Only creator can mint credits"}, {"pc": [382], "errorMessage": "Payment must be to contract"}, {"pc": [506], "errorMessage": "Too many addresses for one page"}, {"pc": [286, 592, 609], "errorMessage": "check self.retired_credits exists"}, {"pc": [183, 276, 297, 349, 390, 445, 581, 603], "errorMessage": "check self.total_credits exists"}, {"pc": [532], "errorMessage": "index access is out of bounds"}, {"pc": [488], "errorMessage": "invalid array length header"}, {"pc": [502], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [463], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [169, 241, 341], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [550], "errorMessage": "max array length exceeded"}, {"pc": [332], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,14 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class MarketplaceStats:
+    """Struct for MarketplaceStats"""
+    total_credits: int
+    retired_credits: int
+    current_price: int
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class MintCreditsArgs:
     """Dataclass for mint_credits arguments"""
@@ -82,6 +90,16 @@ class RetireCreditsArgs:
     def abi_method_signature(self) -> str:
         return "retire_credits(uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BuyCreditsArgs:
+    """Dataclass for buy_credits arguments"""
+    payment: algokit_utils.AppMethodCallTransactionArgument
+    amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "buy_credits(pay,uint64)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetCreditsArgs:
     """Dataclass for get_credits arguments"""
@@ -91,25 +109,20 @@ class GetCreditsArgs:
     def abi_method_signature(self) -> str:
         return "get_credits(address)uint64"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetBalancesArgs:
+    """Dataclass for get_balances arguments"""
+    addresses: list[str]
 
-class _CarbonMarketplaceOptIn:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
-
-    def bare(
-        self, params: algokit_utils.AppClientBareCallParams | None = None
-    ) -> algokit_utils.AppCallParams:
-        return self.app_client.params.bare.opt_in(params)
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_balances(address[])uint64[]"
 
 
 class CarbonMarketplaceParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
-    @property
-    def opt_in(self) -> "_CarbonMarketplaceOptIn":
-        return _CarbonMarketplaceOptIn(self.app_client)
-
     def mint_credits(
         self,
         args: tuple[int] | MintCreditsArgs,
@@ -136,6 +149,30 @@ class CarbonMarketplaceParams:
             "args": method_args,
         }))
 
+    def buy_credits(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | BuyCreditsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_credits(pay,uint64)void",
+            "args": method_args,
+        }))
+
+    def get_current_price(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_current_price()uint64",
+        }))
+
     def get_credits(
         self,
         args: tuple[str] | GetCreditsArgs,
@@ -149,6 +186,19 @@ class CarbonMarketplaceParams:
             "args": method_args,
         }))
 
+    def get_balances(
+        self,
+        args: tuple[list[str]] | GetBalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_balances(address[])uint64[]",
+            "args": method_args,
+        }))
+
     def get_total_credits(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -171,6 +221,17 @@ class CarbonMarketplaceParams:
             "method": "get_retired_credits()uint64",
         }))
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64,uint64)",
+        }))
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -193,22 +254,10 @@ class CarbonMarketplaceParams:
         )
 
 
-class _CarbonMarketplaceOptInTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
-
-    def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
-        return self.app_client.create_transaction.bare.opt_in(params)
-
-
 class CarbonMarketplaceCreateTransactionParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
-    @property
-    def opt_in(self) -> "_CarbonMarketplaceOptInTransaction":
-        return _CarbonMarketplaceOptInTransaction(self.app_client)
-
     def mint_credits(
         self,
         args: tuple[int] | MintCreditsArgs,
@@ -235,6 +284,30 @@ class CarbonMarketplaceCreateTransactionParams:
             "args": method_args,
         }))
 
+    def buy_credits(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | BuyCreditsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_credits(pay,uint64)void",
+            "args": method_args,
+        }))
+
+    def get_current_price(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_current_price()uint64",
+        }))
+
     def get_credits(
         self,
         args: tuple[str] | GetCreditsArgs,
@@ -248,6 +321,19 @@ class CarbonMarketplaceCreateTransactionParams:
             "args": method_args,
         }))
 
+    def get_balances(
+        self,
+        args: tuple[list[str]] | GetBalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_balances(address[])uint64[]",
+            "args": method_args,
+        }))
+
     def get_total_credits(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -270,6 +356,17 @@ class CarbonMarketplaceCreateTransactionParams:
             "method": "get_retired_credits()uint64",
         }))
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64,uint64)",
+        }))
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -292,31 +389,10 @@ class CarbonMarketplaceCreateTransactionParams:
         )
 
 
-class _CarbonMarketplaceOptInSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
-
-    def bare(
-        self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None,
-        
-    ) -> algokit_utils.SendAppTransactionResult:
-        return self.app_client.send.bare.opt_in(
-            params=params,
-            send_params=send_params,
-            
-        )
-
-
 class CarbonMarketplaceSend:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
-    @property
-    def opt_in(self) -> "_CarbonMarketplaceOptInSend":
-        return _CarbonMarketplaceOptInSend(self.app_client)
-
     def mint_credits(
         self,
         args: tuple[int] | MintCreditsArgs,
@@ -349,6 +425,36 @@ class CarbonMarketplaceSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def buy_credits(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | BuyCreditsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_credits(pay,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_current_price(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_current_price()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
     def get_credits(
         self,
         args: tuple[str] | GetCreditsArgs,
@@ -365,6 +471,22 @@ class CarbonMarketplaceSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def get_balances(
+        self,
+        args: tuple[list[str]] | GetBalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_balances(address[])uint64[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
     def get_total_credits(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -393,6 +515,20 @@ class CarbonMarketplaceSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[MarketplaceStats]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64,uint64)",
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(MarketplaceStats, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[MarketplaceStats], parsed_response)
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -423,10 +559,6 @@ class GlobalStateValue(typing.TypedDict):
     total_credits: int
     retired_credits: int
 
-class LocalStateValue(typing.TypedDict):
-    """Shape of local_state state key values"""
-    credits_minted: int
-
 class CarbonMarketplaceState:
     """Methods to access state for the current CarbonMarketplace app"""
 
@@ -440,11 +572,12 @@ class CarbonMarketplaceState:
             """Methods to access global_state for the current app"""
             return _GlobalState(self.app_client)
 
-    def local_state(
-        self, address: str
-    ) -> "_LocalState":
-            """Methods to access local_state for the current app"""
-            return _LocalState(self.app_client, address)
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
 
 class _GlobalState:
     def __init__(self, app_client: algokit_utils.AppClient):
@@ -485,36 +618,72 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
-class _LocalState:
-    def __init__(self, app_client: algokit_utils.AppClient, address: str):
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
-        self.address = address
+        
         # Pre-generated mapping of value types to their struct classes
         self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
 
-    def get_all(self) -> LocalStateValue:
-        """Get all current keyed values from local_state state"""
-        result = self.app_client.state.local_state(self.address).get_all()
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
         if not result:
-            return typing.cast(LocalStateValue, {})
+            return {}
 
         converted = {}
         for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.local_state.get(key)
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
             struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
             converted[key] = (
                 _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
                 else value
             )
-        return typing.cast(LocalStateValue, converted)
+        return converted
 
     @property
-    def credits_minted(self) -> int:
-        """Get the current value of the credits_minted key in local_state state"""
-        value = self.app_client.state.local_state(self.address).get_value("credits_minted")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
-        return typing.cast(int, value)
+    def balances(self) -> "_MapState[str, int]":
+        """Get values from the balances map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "balances",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
 
 class CarbonMarketplaceClient:
     """Client for interacting with CarbonMarketplace smart contract"""
@@ -672,12 +841,30 @@ class CarbonMarketplaceClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["buy_credits(pay,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_current_price()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_credits(address)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_balances(address[])uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_total_credits()uint64"],
@@ -690,6 +877,12 @@ class CarbonMarketplaceClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_stats()(uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> MarketplaceStats | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["create()void"],
@@ -706,7 +899,7 @@ class CarbonMarketplaceClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | MarketplaceStats | None | int | list[int]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -930,6 +1123,45 @@ class CarbonMarketplaceFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def buy_credits(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | BuyCreditsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the buy_credits(pay,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "buy_credits(pay,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_current_price(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_current_price()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_current_price()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_credits(
         self,
         args: tuple[str] | GetCreditsArgs,
@@ -950,6 +1182,26 @@ class CarbonMarketplaceFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_balances(
+        self,
+        args: tuple[list[str]] | GetBalancesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_balances(address[])uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_balances(address[])uint64[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_total_credits(
         self,
         *,
@@ -988,6 +1240,25 @@ class CarbonMarketplaceFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_stats(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_stats()(uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_stats()(uint64,uint64,uint64)",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def create(
         self,
         *,
@@ -1137,11 +1408,6 @@ class CarbonMarketplaceFactorySendCreate:
             )
 
 
-class _CarbonMarketplaceOptInComposer:
-    def __init__(self, composer: "CarbonMarketplaceComposer"):
-        self.composer = composer
-
-
 class CarbonMarketplaceComposer:
     """Composer for creating transaction groups for CarbonMarketplace contract calls"""
 
@@ -1150,10 +1416,6 @@ class CarbonMarketplaceComposer:
         self._composer = client.algorand.new_group()
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
 
-    @property
-    def opt_in(self) -> "_CarbonMarketplaceOptInComposer":
-        return _CarbonMarketplaceOptInComposer(self)
-
     def mint_credits(
         self,
         args: tuple[int] | MintCreditsArgs,
@@ -1190,6 +1452,41 @@ class CarbonMarketplaceComposer:
         )
         return self
 
+    def buy_credits(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | BuyCreditsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CarbonMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.buy_credits(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "buy_credits(pay,uint64)void", v
+            )
+        )
+        return self
+
+    def get_current_price(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CarbonMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_current_price(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_current_price()uint64", v
+            )
+        )
+        return self
+
     def get_credits(
         self,
         args: tuple[str] | GetCreditsArgs,
@@ -1208,6 +1505,24 @@ class CarbonMarketplaceComposer:
         )
         return self
 
+    def get_balances(
+        self,
+        args: tuple[list[str]] | GetBalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CarbonMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_balances(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_balances(address[])uint64[]", v
+            )
+        )
+        return self
+
     def get_total_credits(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -1242,6 +1557,23 @@ class CarbonMarketplaceComposer:
         )
         return self
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CarbonMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_stats(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_stats()(uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
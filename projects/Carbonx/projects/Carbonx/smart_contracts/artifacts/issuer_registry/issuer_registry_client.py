@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["OptIn"], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Set the contract creator as admin.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "register_issuer", "returns": {"type": "void"}, "desc": "Register the caller as an issuer.\nReverts if the caller is already registered.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "approve_issuer", "returns": {"type": "void"}, "desc": "Approve a registered issuer. Admin only.\nThe target account must have registered first.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "revoke_issuer", "returns": {"type": "void"}, "desc": "Revoke an approved issuer. Admin only.\nSets the account's approved flag back to 0 and decrements the counter.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "get_issuer_status", "returns": {"type": "uint64", "desc": "0 \u2013 not registered 1 \u2013 registered but not approved 2 \u2013 registered and approved"}, "desc": "Return the approval status for the given account.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_approved_count", "returns": {"type": "uint64"}, "desc": "Return the total number of currently approved issuers.", "events": [], "readonly": true, "recommendations": {}}], "name": "IssuerRegistry", "state": {"keys": {"box": {}, "global": {"admin": {"key": "YWRtaW4=", "keyType": "AVMString", "valueType": "AVMBytes"}, "approved_count": {"key": "YXBwcm92ZWRfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"is_registered": {"key": "aXNfcmVnaXN0ZXJlZA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_approved": {"key": "aXNfYXBwcm92ZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 1}, "local": {"bytes": 0, "ints": 2}}}, "structs": {}, "byteCode": {"approval": "CyADAAEgJgUOYXBwcm92ZWRfY291bnQLaXNfYXBwcm92ZWQFYWRtaW4NaXNfcmVnaXN0ZXJlZAQVH3x1MRhAAAcqgABnKCJnMRtBAEIxGRREMRhBACuCBQT1WuCwBIUghAEEje0IKgRKmL40BKM0WJY2GgCOBQAgADIAZQCOAMAAgARMXGG6NhoAjgEACQAxGSMSMRgQQyoxAGcoImcjQzEAIitjIk4CTRREMQArI2YjQzYaAUkVJBJEMQAiKmVEEkRJIitjIk4CTSMSREkiKWMiTgJNFEQpI2YiKGVEIwgoTGcjQzYaAUkVJBJEMQAiKmVEEkRJIiljIk4CTSMSRCkiZiIoZUQjCShMZyNDNhoBRwIVJBJEIitjIk4CTUAACSIWJwRMULAjQ0kiKWMiTgJNIxJBAAWBAkL/5iNC/+IiKGVEFicETFCwI0M=", "clear": "C4EBQw=="}, "desc": "Registry for carbon credit issuers with admin approval workflow.\n\n    Global state:\n        admin           \u2013 address of the contract administrator\n        approved_count  \u2013 total number of currently approved issuers\n\n    Local state (per account):\n        is_registered   \u2013 1 if the account has registered as an issuer\n        is_approved     \u2013 1 if the account has been approved by admin\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIKICAgIGJ5dGVjYmxvY2sgImFwcHJvdmVkX2NvdW50IiAiaXNfYXBwcm92ZWQiICJhZG1pbiIgImlzX3JlZ2lzdGVyZWQiIDB4MTUxZjdjNzUKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTgKICAgIC8vIHNlbGYuYWRtaW4gPSBHbG9iYWxTdGF0ZShCeXRlcygpLCBrZXk9ImFkbWluIikKICAgIGJ5dGVjXzIgLy8gImFkbWluIgogICAgcHVzaGJ5dGVzIDB4CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxOQogICAgLy8gc2VsZi5hcHByb3ZlZF9jb3VudCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJhcHByb3ZlZF9jb3VudCIpCiAgICBieXRlY18wIC8vICJhcHByb3ZlZF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIElzc3VlclJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9vcHRfaW5AMTYKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMTIKICAgIHB1c2hieXRlc3MgMHhmNTVhZTBiMCAweDg1MjA4NDAxIDB4OGRlZDA4MmEgMHg0YTk4YmUzNCAweGEzMzQ1ODk2IC8vIG1ldGhvZCAicmVnaXN0ZXJfaXNzdWVyKCl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX2lzc3VlcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInJldm9rZV9pc3N1ZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJnZXRfaXNzdWVyX3N0YXR1cyhhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2FwcHJvdmVkX2NvdW50KCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCByZWdpc3Rlcl9pc3N1ZXIgYXBwcm92ZV9pc3N1ZXIgcmV2b2tlX2lzc3VlciBnZXRfaXNzdWVyX3N0YXR1cyBnZXRfYXBwcm92ZWRfY291bnQKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgSXNzdWVyUmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCm1haW5fb3B0X2luQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToyOQogICAgLy8gQGJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIk9wdEluIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnRjXzEgLy8gT3B0SW4KICAgID09CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToyNgogICAgLy8gc2VsZi5hZG1pbi52YWx1ZSA9IFR4bi5zZW5kZXIuYnl0ZXMKICAgIGJ5dGVjXzIgLy8gImFkbWluIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MjcKICAgIC8vIHNlbGYuYXBwcm92ZWRfY291bnQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzCiAgICAvLyBAYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmlzc3Vlcl9yZWdpc3RyeS5jb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5yZWdpc3Rlcl9pc3N1ZXJbcm91dGluZ10oKSAtPiB2b2lkOgpyZWdpc3Rlcl9pc3N1ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwCiAgICAvLyBjdXJyZW50ID0gc2VsZi5pc19yZWdpc3RlcmVkLmdldChUeG4uc2VuZGVyLCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJpc19yZWdpc3RlcmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo0MQogICAgLy8gYXNzZXJ0IGN1cnJlbnQgPT0gMCwgIkFscmVhZHkgcmVnaXN0ZXJlZCIKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IHJlZ2lzdGVyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NDIKICAgIC8vIHNlbGYuaXNfcmVnaXN0ZXJlZFtUeG4uc2VuZGVyXSA9IFVJbnQ2NCgxKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWNfMyAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuaXNzdWVyX3JlZ2lzdHJ5LmNvbnRyYWN0Lklzc3VlclJlZ2lzdHJ5LmFwcHJvdmVfaXNzdWVyW3JvdXRpbmddKCkgLT4gdm9pZDoKYXBwcm92ZV9pc3N1ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIuYnl0ZXMgPT0gc2VsZi5hZG1pbi52YWx1ZSwgIk9ubHkgYWRtaW4gY2FuIGFwcHJvdmUiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgYWRtaW4gY2FuIGFwcHJvdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NTEKICAgIC8vIHJlZ2lzdGVyZWQgPSBzZWxmLmlzX3JlZ2lzdGVyZWQuZ2V0KGFjY291bnQsIGRlZmF1bHQ9VUludDY0KDApKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NTIKICAgIC8vIGFzc2VydCByZWdpc3RlcmVkID09IDEsICJBY2NvdW50IG5vdCByZWdpc3RlcmVkIgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gQWNjb3VudCBub3QgcmVnaXN0ZXJlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1MwogICAgLy8gYWxyZWFkeV9hcHByb3ZlZCA9IHNlbGYuaXNfYXBwcm92ZWQuZ2V0KGFjY291bnQsIGRlZmF1bHQ9VUludDY0KDApKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiaXNfYXBwcm92ZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0CiAgICAvLyBhc3NlcnQgYWxyZWFkeV9hcHByb3ZlZCA9PSAwLCAiQWNjb3VudCBhbHJlYWR5IGFwcHJvdmVkIgogICAgIQogICAgYXNzZXJ0IC8vIEFjY291bnQgYWxyZWFkeSBhcHByb3ZlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1NQogICAgLy8gc2VsZi5pc19hcHByb3ZlZFthY2NvdW50XSA9IFVJbnQ2NCgxKQogICAgYnl0ZWNfMSAvLyAiaXNfYXBwcm92ZWQiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1NgogICAgLy8gc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJhcHByb3ZlZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlZF9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18wIC8vICJhcHByb3ZlZF9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuaXNzdWVyX3JlZ2lzdHJ5LmNvbnRyYWN0Lklzc3VlclJlZ2lzdHJ5LnJldm9rZV9pc3N1ZXJbcm91dGluZ10oKSAtPiB2b2lkOgpyZXZva2VfaXNzdWVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NjQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyLmJ5dGVzID09IHNlbGYuYWRtaW4udmFsdWUsICJPbmx5IGFkbWluIGNhbiByZXZva2UiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgYWRtaW4gY2FuIHJldm9rZQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo2NQogICAgLy8gYXBwcm92ZWQgPSBzZWxmLmlzX2FwcHJvdmVkLmdldChhY2NvdW50LCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImlzX2FwcHJvdmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo2NgogICAgLy8gYXNzZXJ0IGFwcHJvdmVkID09IDEsICJBY2NvdW50IG5vdCBhcHByb3ZlZCIKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIEFjY291bnQgbm90IGFwcHJvdmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY3CiAgICAvLyBzZWxmLmlzX2FwcHJvdmVkW2FjY291bnRdID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJpc19hcHByb3ZlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4CiAgICAvLyBzZWxmLmFwcHJvdmVkX2NvdW50LnZhbHVlIC09IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVkX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuZ2V0X2lzc3Vlcl9zdGF0dXNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfaXNzdWVyX3N0YXR1czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NzAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo3OQogICAgLy8gcmVnaXN0ZXJlZCA9IHNlbGYuaXNfcmVnaXN0ZXJlZC5nZXQoYWNjb3VudCwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODAKICAgIC8vIGlmIHJlZ2lzdGVyZWQgPT0gMDoKICAgIGJueiBnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODEKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCgpnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuZ2V0X2lzc3Vlcl9zdGF0dXNANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NzAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODIKICAgIC8vIGFwcHJvdmVkID0gc2VsZi5pc19hcHByb3ZlZC5nZXQoYWNjb3VudCwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpc19hcHByb3ZlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODMKICAgIC8vIGlmIGFwcHJvdmVkID09IDE6CiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo4NAogICAgLy8gcmV0dXJuIFVJbnQ2NCgyKQogICAgcHVzaGludCAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIGdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmlzc3Vlcl9yZWdpc3RyeS5jb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5nZXRfaXNzdWVyX3N0YXR1c0A2CgpnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg1CiAgICAvLyByZXR1cm4gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo3MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuZ2V0X2lzc3Vlcl9zdGF0dXNANgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuZ2V0X2FwcHJvdmVkX2NvdW50W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2FwcHJvdmVkX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo5MAogICAgLy8gcmV0dXJuIHNlbGYuYXBwcm92ZWRfY291bnQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJhcHByb3ZlZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlZF9jb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [214], "errorMessage": "Account already approved"}, {"pc": [255], "errorMessage": "Account not approved"}, {"pc": [204], "errorMessage": "Account not registered"}, {"pc": [170], "errorMessage": "Already registered"}, {"pc": [193], "errorMessage": "Only admin can approve"}, {"pc": [244], "errorMessage": "Only admin can revoke"}, {"pc": [191, 242], "errorMessage": "check self.admin exists"}, {"pc": [221, 262, 323], "errorMessage": "check self.approved_count exists"}, {"pc": [185, 236, 278], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["OptIn"], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Set the contract creator as admin.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "asset"}], "name": "set_governance_asset", "returns": {"type": "void"}, "desc": "Set the governance token (CXG) voters must hold. Admin only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "register_issuer", "returns": {"type": "void"}, "desc": "Register the caller as an issuer.\nReverts if the caller is already registered.", "events": [{"args": [{"type": "address", "name": "issuer"}], "name": "IssuerRegistered", "desc": "ARC-28 event of `register_issuer`."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "issuer"}], "name": "vote", "returns": {"type": "void"}, "desc": "Vote for an issuer to be approved. Requires holding the governance token (CXG).", "events": [{"args": [{"type": "address", "name": "voter"}, {"type": "address", "name": "issuer"}, {"type": "uint64", "name": "votes"}], "name": "IssuerVoted", "desc": "ARC-28 event of `vote`, with the issuer's new vote count."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "approve_issuer", "returns": {"type": "void"}, "desc": "Approve a registered issuer. Admin only.\nThe target account must have registered first.", "events": [{"args": [{"type": "address", "name": "issuer"}, {"type": "uint64", "name": "approved_count"}], "name": "IssuerApproved", "desc": "ARC-28 event of `approve_issuer`, with the new number of approved issuers."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "revoke_issuer", "returns": {"type": "void"}, "desc": "Revoke an approved issuer. Admin only.\nSets the account's approved flag back to 0 and decrements the counter.", "events": [{"args": [{"type": "address", "name": "issuer"}, {"type": "uint64", "name": "approved_count"}], "name": "IssuerRevoked", "desc": "ARC-28 event of `revoke_issuer`, with the new number of approved issuers."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "get_issuer_status", "returns": {"type": "uint64", "desc": "0 \u2013 not registered 1 \u2013 registered but not approved 2 \u2013 registered and approved"}, "desc": "Return the approval status for the given account.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_approved_count", "returns": {"type": "uint64"}, "desc": "Return the total number of currently approved issuers.", "events": [], "readonly": true, "recommendations": {}}], "name": "IssuerRegistry", "state": {"keys": {"box": {}, "global": {"admin": {"key": "YWRtaW4=", "keyType": "AVMString", "valueType": "AVMBytes"}, "approved_count": {"key": "YXBwcm92ZWRfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "governance_asset": {"key": "Z292ZXJuYW5jZV9hc3NldA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"is_registered": {"key": "aXNfcmVnaXN0ZXJlZA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_approved": {"key": "aXNfYXBwcm92ZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "vote_count": {"key": "dm90ZV9jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 2}, "local": {"bytes": 0, "ints": 3}}}, "structs": {}, "byteCode": {"approval": "CyADAAEgJgcOYXBwcm92ZWRfY291bnQLaXNfYXBwcm92ZWQFYWRtaW4NaXNfcmVnaXN0ZXJlZAp2b3RlX2NvdW50EGdvdmVybmFuY2VfYXNzZXQEFR98dTEYQAALKoAAZygiZycFImcxG0EAUDEZFEQxGEEAOYIHBClGHhoE9VrgsARijOMtBIUghAEEje0IKgRKmL40BKM0WJY2GgCOBwAgADgAWgDIARMBSQF7AIAETFxhujYaAI4BAAkAMRkjEjEYEEMqMQBnKCJnI0M2GgFJFYEIEkQXMQAiKmVEEkQnBUxnI0MxACIrYyJOAk0URDEAKyNmMQAnBCJmgAS+rTXtMQBQsCNDNhoBSRUkEkQiJwVlRElEMQBMcABBAFNJQQBPI0RLAUkiK2MiTgJNIxJESSIpYyJOAk0URDEASwFQSb1FARREgAExv0kiJwRjIk4CTSMISwEnBEsCZjEATBZMTwJQTFCABPeIbYdMULAjQyJC/642GgFJFSQSRDEAIiplRBJLASInBGMiTgJNEURJIitjIk4CTSMSREkiKWMiTgJNFERJKSNmIihlRCMIKEsBZxZQgARDeSv7TFCwI0M2GgFJFSQSRDEAIiplRBJESSIpYyJOAk0jEkRJKSJmIihlRCMJKEsBZxZQgAT42pmBTFCwI0M2GgFHAhUkEkQiK2MiTgJNQAAJIhYnBkxQsCNDSSIpYyJOAk0jEkEABYECQv/mI0L/4iIoZUQWJwZMULAjQw==", "clear": "C4EBQw=="}, "desc": "Registry for carbon credit issuers with admin approval workflow.\n\n    Global state:\n        admin             \u2013 address of the contract administrator\n        approved_count    \u2013 total number of currently approved issuers\n        governance_asset  \u2013 ID of the governance token (CXG) voters must hold\n\n    Local state (per account):\n        is_registered   \u2013 1 if the account has registered as an issuer\n        is_approved     \u2013 1 if the account has been approved by admin\n    ", "events": [{"args": [{"type": "address", "name": "issuer"}], "name": "IssuerRegistered", "desc": "ARC-28 event of `register_issuer`."}, {"args": [{"type": "address", "name": "voter"}, {"type": "address", "name": "issuer"}, {"type": "uint64", "name": "votes"}], "name": "IssuerVoted", "desc": "ARC-28 event of `vote`, with the issuer's new vote count."}, {"args": [{"type": "address", "name": "issuer"}, {"type": "uint64", "name": "approved_count"}], "name": "IssuerApproved", "desc": "ARC-28 event of `approve_issuer`, with the new number of approved issuers."}, {"args": [{"type": "address", "name": "issuer"}, {"type": "uint64", "name": "approved_count"}], "name": "IssuerRevoked", "desc": "ARC-28 event of `revoke_issuer`, with the new number of approved issuers."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIKICAgIGJ5dGVjYmxvY2sgImFwcHJvdmVkX2NvdW50IiAiaXNfYXBwcm92ZWQiICJhZG1pbiIgImlzX3JlZ2lzdGVyZWQiICJ2b3RlX2NvdW50IiAiZ292ZXJuYW5jZV9hc3NldCIgMHgxNTFmN2M3NQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo0OAogICAgLy8gc2VsZi5hZG1pbiA9IEdsb2JhbFN0YXRlKEJ5dGVzKCksIGtleT0iYWRtaW4iKQogICAgYnl0ZWNfMiAvLyAiYWRtaW4iCiAgICBwdXNoYnl0ZXMgMHgKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBzZWxmLmFwcHJvdmVkX2NvdW50ID0gR2xvYmFsU3RhdGUoVUludDY0KDApLCBrZXk9ImFwcHJvdmVkX2NvdW50IikKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwCiAgICAvLyBzZWxmLmdvdmVybmFuY2VfYXNzZXQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0iZ292ZXJuYW5jZV9hc3NldCIpCiAgICBieXRlYyA1IC8vICJnb3Zlcm5hbmNlX2Fzc2V0IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MzQKICAgIC8vIGNsYXNzIElzc3VlclJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9vcHRfaW5AMTgKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMTQKICAgIHB1c2hieXRlc3MgMHgyOTQ2MWUxYSAweGY1NWFlMGIwIDB4NjI4Y2UzMmQgMHg4NTIwODQwMSAweDhkZWQwODJhIDB4NGE5OGJlMzQgMHhhMzM0NTg5NiAvLyBtZXRob2QgInNldF9nb3Zlcm5hbmNlX2Fzc2V0KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZWdpc3Rlcl9pc3N1ZXIoKXZvaWQiLCBtZXRob2QgInZvdGUoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX2lzc3VlcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInJldm9rZV9pc3N1ZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJnZXRfaXNzdWVyX3N0YXR1cyhhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2FwcHJvdmVkX2NvdW50KCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBzZXRfZ292ZXJuYW5jZV9hc3NldCByZWdpc3Rlcl9pc3N1ZXIgdm90ZSBhcHByb3ZlX2lzc3VlciByZXZva2VfaXNzdWVyIGdldF9pc3N1ZXJfc3RhdHVzIGdldF9hcHByb3ZlZF9jb3VudAogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTozNAogICAgLy8gY2xhc3MgSXNzdWVyUmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCm1haW5fb3B0X2luQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo2NwogICAgLy8gQGJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIk9wdEluIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnRjXzEgLy8gT3B0SW4KICAgID09CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1OAogICAgLy8gc2VsZi5hZG1pbi52YWx1ZSA9IFR4bi5zZW5kZXIuYnl0ZXMKICAgIGJ5dGVjXzIgLy8gImFkbWluIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NTkKICAgIC8vIHNlbGYuYXBwcm92ZWRfY291bnQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1CiAgICAvLyBAYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmlzc3Vlcl9yZWdpc3RyeS5jb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5zZXRfZ292ZXJuYW5jZV9hc3NldFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF9nb3Zlcm5hbmNlX2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo2MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo2NAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIuYnl0ZXMgPT0gc2VsZi5hZG1pbi52YWx1ZSwgIk9ubHkgYWRtaW4gY2FuIHNldCBnb3Zlcm5hbmNlIGFzc2V0IgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGFkbWluIGNhbiBzZXQgZ292ZXJuYW5jZSBhc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo2NQogICAgLy8gc2VsZi5nb3Zlcm5hbmNlX2Fzc2V0LnZhbHVlID0gYXNzZXQuaWQKICAgIGJ5dGVjIDUgLy8gImdvdmVybmFuY2VfYXNzZXQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo2MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmlzc3Vlcl9yZWdpc3RyeS5jb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5yZWdpc3Rlcl9pc3N1ZXJbcm91dGluZ10oKSAtPiB2b2lkOgpyZWdpc3Rlcl9pc3N1ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBjdXJyZW50ID0gc2VsZi5pc19yZWdpc3RlcmVkLmdldChUeG4uc2VuZGVyLCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJpc19yZWdpc3RlcmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo3OQogICAgLy8gYXNzZXJ0IGN1cnJlbnQgPT0gMCwgIkFscmVhZHkgcmVnaXN0ZXJlZCIKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IHJlZ2lzdGVyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODAKICAgIC8vIHNlbGYuaXNfcmVnaXN0ZXJlZFtUeG4uc2VuZGVyXSA9IFVJbnQ2NCgxKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWNfMyAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgxCiAgICAvLyBzZWxmLnZvdGVfY291bnRbVHhuLnNlbmRlcl0gPSBVSW50NjQoMCkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjIDQgLy8gInZvdGVfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo4MgogICAgLy8gYXJjNC5lbWl0KElzc3VlclJlZ2lzdGVyZWQoaXNzdWVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSkpCiAgICBwdXNoYnl0ZXMgMHhiZWFkMzVlZCAvLyBtZXRob2QgIklzc3VlclJlZ2lzdGVyZWQoYWRkcmVzcykiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo3MgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmlzc3Vlcl9yZWdpc3RyeS5jb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS52b3RlW3JvdXRpbmddKCkgLT4gdm9pZDoKdm90ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3LTg4CiAgICAvLyAjIDEuIENoZWNrIFRva2VuIEJhbGFuY2UKICAgIC8vIGFzc2V0X2lkID0gc2VsZi5nb3Zlcm5hbmNlX2Fzc2V0LnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiZ292ZXJuYW5jZV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nb3Zlcm5hbmNlX2Fzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo4OQogICAgLy8gYXNzZXJ0IGFzc2V0X2lkICE9IDAsICJHb3Zlcm5hbmNlIGFzc2V0IG5vdCBzZXQiCiAgICBkdXAKICAgIGFzc2VydCAvLyBHb3Zlcm5hbmNlIGFzc2V0IG5vdCBzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6OTAKICAgIC8vIGJhbGFuY2UsIGV4aXN0cyA9IG9wLkFzc2V0SG9sZGluZ0dldC5hc3NldF9iYWxhbmNlKFR4bi5zZW5kZXIsIGFzc2V0X2lkKQogICAgdHhuIFNlbmRlcgogICAgc3dhcAogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxCiAgICAvLyBhc3NlcnQgZXhpc3RzIGFuZCBiYWxhbmNlID4gMCwgIk11c3QgaG9sZCBHb3Zlcm5hbmNlIFRva2VuIChDWEcpIgogICAgYnogdm90ZV9ib29sX2ZhbHNlQDQKICAgIGR1cAogICAgYnogdm90ZV9ib29sX2ZhbHNlQDQKICAgIGludGNfMSAvLyAxCgp2b3RlX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6OTEKICAgIC8vIGFzc2VydCBleGlzdHMgYW5kIGJhbGFuY2UgPiAwLCAiTXVzdCBob2xkIEdvdmVybmFuY2UgVG9rZW4gKENYRykiCiAgICBhc3NlcnQgLy8gTXVzdCBob2xkIEdvdmVybmFuY2UgVG9rZW4gKENYRykKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6OTMtOTQKICAgIC8vICMgMi4gQ2hlY2sgVGFyZ2V0CiAgICAvLyByZWdpc3RlcmVkID0gc2VsZi5pc19yZWdpc3RlcmVkLmdldChpc3N1ZXIsIGRlZmF1bHQ9VUludDY0KDApKQogICAgZGlnIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk1CiAgICAvLyBhc3NlcnQgcmVnaXN0ZXJlZCA9PSAxLCAiSXNzdWVyIG5vdCByZWdpc3RlcmVkIgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gSXNzdWVyIG5vdCByZWdpc3RlcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBhcHByb3ZlZCA9IHNlbGYuaXNfYXBwcm92ZWQuZ2V0KGlzc3VlciwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpc19hcHByb3ZlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6OTcKICAgIC8vIGFzc2VydCBhcHByb3ZlZCA9PSAwLCAiSXNzdWVyIGFscmVhZHkgYXBwcm92ZWQiCiAgICAhCiAgICBhc3NlcnQgLy8gSXNzdWVyIGFscmVhZHkgYXBwcm92ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6OTktMTAxCiAgICAvLyAjIDMuIENoZWNrIERvdWJsZSBWb3RpbmcgKEJveDogVm90ZXIgKyBJc3N1ZXIpCiAgICAvLyAjIEtleSA9IFZvdGVyKDMyKSArIElzc3VlcigzMikKICAgIC8vIGtleSA9IFR4bi5zZW5kZXIuYnl0ZXMgKyBpc3N1ZXIuYnl0ZXMKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyCiAgICAvLyBib3hfZXhpc3RzID0gb3AuQm94LmdldChrZXkpCiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxMDMKICAgIC8vIGFzc2VydCBub3QgYm94X2V4aXN0c1sxXSwgIkFscmVhZHkgdm90ZWQgZm9yIHRoaXMgaXNzdWVyIgogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgdm90ZWQgZm9yIHRoaXMgaXNzdWVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNS0xMDYKICAgIC8vICMgNC4gUmVjb3JkIFZvdGUKICAgIC8vIG9wLkJveC5wdXQoa2V5LCBCeXRlcyhiIjEiKSkKICAgIHB1c2hieXRlcyAweDMxCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOC0xMDkKICAgIC8vICMgNS4gSW5jcmVtZW50IFZvdGUgQ291bnQKICAgIC8vIGN1cnJlbnRfdm90ZXMgPSBzZWxmLnZvdGVfY291bnQuZ2V0KGlzc3VlciwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJ2b3RlX2NvdW50IgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxMTAKICAgIC8vIHNlbGYudm90ZV9jb3VudFtpc3N1ZXJdID0gY3VycmVudF92b3RlcyArIFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGRpZyAxCiAgICBieXRlYyA0IC8vICJ2b3RlX2NvdW50IgogICAgZGlnIDIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTEzCiAgICAvLyB2b3Rlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNQogICAgLy8gdm90ZXM9YXJjNC5VSW50NjQoY3VycmVudF92b3RlcyArIDEpLAogICAgc3dhcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxMTItMTE2CiAgICAvLyBJc3N1ZXJWb3RlZCgKICAgIC8vICAgICB2b3Rlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgaXNzdWVyPWFyYzQuQWRkcmVzcyhpc3N1ZXIpLAogICAgLy8gICAgIHZvdGVzPWFyYzQuVUludDY0KGN1cnJlbnRfdm90ZXMgKyAxKSwKICAgIC8vICkKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTExLTExNwogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIElzc3VlclZvdGVkKAogICAgLy8gICAgICAgICB2b3Rlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgICAgIGlzc3Vlcj1hcmM0LkFkZHJlc3MoaXNzdWVyKSwKICAgIC8vICAgICAgICAgdm90ZXM9YXJjNC5VSW50NjQoY3VycmVudF92b3RlcyArIDEpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGY3ODg2ZDg3IC8vIG1ldGhvZCAiSXNzdWVyVm90ZWQoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo4NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgp2b3RlX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIHZvdGVfYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLmlzc3Vlcl9yZWdpc3RyeS5jb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5hcHByb3ZlX2lzc3Vlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFwcHJvdmVfaXNzdWVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxMTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNi0xMjcKICAgIC8vICMgQWRtaW4gb3IgREFPIGNoZWNrCiAgICAvLyBpc19hZG1pbiA9IFR4bi5zZW5kZXIuYnl0ZXMgPT0gc2VsZi5hZG1pbi52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTI4CiAgICAvLyB2b3RlcyA9IHNlbGYudm90ZV9jb3VudC5nZXQoYWNjb3VudCwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBkaWcgMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInZvdGVfY291bnQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMQogICAgLy8gYXNzZXJ0IGlzX2FkbWluIG9yIGlzX2RhbywgIk5vdCBhdXRob3JpemVkIChBZG1pbiBvciA1KyB2b3RlcyByZXF1aXJlZCkiCiAgICB8fAogICAgYXNzZXJ0IC8vIE5vdCBhdXRob3JpemVkIChBZG1pbiBvciA1KyB2b3RlcyByZXF1aXJlZCkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTMzCiAgICAvLyByZWdpc3RlcmVkID0gc2VsZi5pc19yZWdpc3RlcmVkLmdldChhY2NvdW50LCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNAogICAgLy8gYXNzZXJ0IHJlZ2lzdGVyZWQgPT0gMSwgIkFjY291bnQgbm90IHJlZ2lzdGVyZWQiCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBBY2NvdW50IG5vdCByZWdpc3RlcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNQogICAgLy8gYWxyZWFkeV9hcHByb3ZlZCA9IHNlbGYuaXNfYXBwcm92ZWQuZ2V0KGFjY291bnQsIGRlZmF1bHQ9VUludDY0KDApKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiaXNfYXBwcm92ZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNgogICAgLy8gYXNzZXJ0IGFscmVhZHlfYXBwcm92ZWQgPT0gMCwgIkFjY291bnQgYWxyZWFkeSBhcHByb3ZlZCIKICAgICEKICAgIGFzc2VydCAvLyBBY2NvdW50IGFscmVhZHkgYXBwcm92ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTM3CiAgICAvLyBzZWxmLmlzX2FwcHJvdmVkW2FjY291bnRdID0gVUludDY0KDEpCiAgICBkdXAKICAgIGJ5dGVjXzEgLy8gImlzX2FwcHJvdmVkIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4CiAgICAvLyBzZWxmLmFwcHJvdmVkX2NvdW50LnZhbHVlICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVkX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MgogICAgLy8gYXBwcm92ZWRfY291bnQ9YXJjNC5VSW50NjQoc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZSksCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MC0xNDMKICAgIC8vIElzc3VlckFwcHJvdmVkKAogICAgLy8gICAgIGlzc3Vlcj1hcmM0LkFkZHJlc3MoYWNjb3VudCksCiAgICAvLyAgICAgYXBwcm92ZWRfY291bnQ9YXJjNC5VSW50NjQoc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZSksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTM5LTE0NAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIElzc3VlckFwcHJvdmVkKAogICAgLy8gICAgICAgICBpc3N1ZXI9YXJjNC5BZGRyZXNzKGFjY291bnQpLAogICAgLy8gICAgICAgICBhcHByb3ZlZF9jb3VudD1hcmM0LlVJbnQ2NChzZWxmLmFwcHJvdmVkX2NvdW50LnZhbHVlKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg0Mzc5MmJmYiAvLyBtZXRob2QgIklzc3VlckFwcHJvdmVkKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmlzc3Vlcl9yZWdpc3RyeS5jb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5yZXZva2VfaXNzdWVyW3JvdXRpbmddKCkgLT4gdm9pZDoKcmV2b2tlX2lzc3VlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNTIKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyLmJ5dGVzID09IHNlbGYuYWRtaW4udmFsdWUsICJPbmx5IGFkbWluIGNhbiByZXZva2UiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgYWRtaW4gY2FuIHJldm9rZQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNTMKICAgIC8vIGFwcHJvdmVkID0gc2VsZi5pc19hcHByb3ZlZC5nZXQoYWNjb3VudCwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpc19hcHByb3ZlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTU0CiAgICAvLyBhc3NlcnQgYXBwcm92ZWQgPT0gMSwgIkFjY291bnQgbm90IGFwcHJvdmVkIgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gQWNjb3VudCBub3QgYXBwcm92ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTU1CiAgICAvLyBzZWxmLmlzX2FwcHJvdmVkW2FjY291bnRdID0gVUludDY0KDApCiAgICBkdXAKICAgIGJ5dGVjXzEgLy8gImlzX2FwcHJvdmVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTU2CiAgICAvLyBzZWxmLmFwcHJvdmVkX2NvdW50LnZhbHVlIC09IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVkX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MAogICAgLy8gYXBwcm92ZWRfY291bnQ9YXJjNC5VSW50NjQoc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZSksCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OC0xNjEKICAgIC8vIElzc3VlclJldm9rZWQoCiAgICAvLyAgICAgaXNzdWVyPWFyYzQuQWRkcmVzcyhhY2NvdW50KSwKICAgIC8vICAgICBhcHByb3ZlZF9jb3VudD1hcmM0LlVJbnQ2NChzZWxmLmFwcHJvdmVkX2NvdW50LnZhbHVlKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNTctMTYyCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgSXNzdWVyUmV2b2tlZCgKICAgIC8vICAgICAgICAgaXNzdWVyPWFyYzQuQWRkcmVzcyhhY2NvdW50KSwKICAgIC8vICAgICAgICAgYXBwcm92ZWRfY291bnQ9YXJjNC5VSW50NjQoc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZSksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZjhkYTk5ODEgLy8gbWV0aG9kICJJc3N1ZXJSZXZva2VkKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmlzc3Vlcl9yZWdpc3RyeS5jb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5nZXRfaXNzdWVyX3N0YXR1c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9pc3N1ZXJfc3RhdHVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNjQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNzMKICAgIC8vIHJlZ2lzdGVyZWQgPSBzZWxmLmlzX3JlZ2lzdGVyZWQuZ2V0KGFjY291bnQsIGRlZmF1bHQ9VUludDY0KDApKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NAogICAgLy8gaWYgcmVnaXN0ZXJlZCA9PSAwOgogICAgYm56IGdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNzUKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCgpnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuZ2V0X2lzc3Vlcl9zdGF0dXNANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTY0CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NgogICAgLy8gYXBwcm92ZWQgPSBzZWxmLmlzX2FwcHJvdmVkLmdldChhY2NvdW50LCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImlzX2FwcHJvdmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNzcKICAgIC8vIGlmIGFwcHJvdmVkID09IDE6CiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNzgKICAgIC8vIHJldHVybiBVSW50NjQoMikKICAgIHB1c2hpbnQgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNjQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X2lzc3Vlcl9zdGF0dXNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuaXNzdWVyX3JlZ2lzdHJ5LmNvbnRyYWN0Lklzc3VlclJlZ2lzdHJ5LmdldF9pc3N1ZXJfc3RhdHVzQDYKCmdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTc5CiAgICAvLyByZXR1cm4gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNjQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X2lzc3Vlcl9zdGF0dXNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuaXNzdWVyX3JlZ2lzdHJ5LmNvbnRyYWN0Lklzc3VlclJlZ2lzdHJ5LmdldF9pc3N1ZXJfc3RhdHVzQDYKCgovLyBzbWFydF9jb250cmFjdHMuaXNzdWVyX3JlZ2lzdHJ5LmNvbnRyYWN0Lklzc3VlclJlZ2lzdHJ5LmdldF9hcHByb3ZlZF9jb3VudFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9hcHByb3ZlZF9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTg0CiAgICAvLyByZXR1cm4gc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVkX2NvdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxODEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjIDYgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [421], "errorMessage": "Account already approved"}, {"pc": [475], "errorMessage": "Account not approved"}, {"pc": [411], "errorMessage": "Account not registered"}, {"pc": [240], "errorMessage": "Already registered"}, {"pc": [326], "errorMessage": "Already voted for this issuer"}, {"pc": [278], "errorMessage": "Governance asset not set"}, {"pc": [315], "errorMessage": "Issuer already approved"}, {"pc": [305], "errorMessage": "Issuer not registered"}, {"pc": [292], "errorMessage": "Must hold Governance Token (CXG)"}, {"pc": [400], "errorMessage": "Not authorized (Admin or 5+ votes required)"}, {"pc": [464], "errorMessage": "Only admin can revoke"}, {"pc": [223], "errorMessage": "Only admin can set governance asset"}, {"pc": [221, 387, 462], "errorMessage": "check self.admin exists"}, {"pc": [429, 483, 556], "errorMessage": "check self.approved_count exists"}, {"pc": [276], "errorMessage": "check self.governance_asset exists"}, {"pc": [271, 381, 456, 511], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [214], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,24 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetGovernanceAssetArgs:
+    """Dataclass for set_governance_asset arguments"""
+    asset: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_governance_asset(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VoteArgs:
+    """Dataclass for vote arguments"""
+    issuer: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "vote(address)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class ApproveIssuerArgs:
     """Dataclass for approve_issuer arguments"""
@@ -110,6 +128,19 @@ class IssuerRegistryParams:
     def opt_in(self) -> "_IssuerRegistryOptIn":
         return _IssuerRegistryOptIn(self.app_client)
 
+    def set_governance_asset(
+        self,
+        args: tuple[int] | SetGovernanceAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_governance_asset(uint64)void",
+            "args": method_args,
+        }))
+
     def register_issuer(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -121,6 +152,19 @@ class IssuerRegistryParams:
             "method": "register_issuer()void",
         }))
 
+    def vote(
+        self,
+        args: tuple[str] | VoteArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote(address)void",
+            "args": method_args,
+        }))
+
     def approve_issuer(
         self,
         args: tuple[str] | ApproveIssuerArgs,
@@ -209,6 +253,19 @@ class IssuerRegistryCreateTransactionParams:
     def opt_in(self) -> "_IssuerRegistryOptInTransaction":
         return _IssuerRegistryOptInTransaction(self.app_client)
 
+    def set_governance_asset(
+        self,
+        args: tuple[int] | SetGovernanceAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_governance_asset(uint64)void",
+            "args": method_args,
+        }))
+
     def register_issuer(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -220,6 +277,19 @@ class IssuerRegistryCreateTransactionParams:
             "method": "register_issuer()void",
         }))
 
+    def vote(
+        self,
+        args: tuple[str] | VoteArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote(address)void",
+            "args": method_args,
+        }))
+
     def approve_issuer(
         self,
         args: tuple[str] | ApproveIssuerArgs,
@@ -317,6 +387,22 @@ class IssuerRegistrySend:
     def opt_in(self) -> "_IssuerRegistryOptInSend":
         return _IssuerRegistryOptInSend(self.app_client)
 
+    def set_governance_asset(
+        self,
+        args: tuple[int] | SetGovernanceAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_governance_asset(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def register_issuer(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -331,6 +417,22 @@ class IssuerRegistrySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def vote(
+        self,
+        args: tuple[str] | VoteArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote(address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def approve_issuer(
         self,
         args: tuple[str] | ApproveIssuerArgs,
@@ -422,11 +524,13 @@ class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     admin: bytes
     approved_count: int
+    governance_asset: int
 
 class LocalStateValue(typing.TypedDict):
     """Shape of local_state state key values"""
     is_registered: int
     is_approved: int
+    vote_count: int
 
 class IssuerRegistryState:
     """Methods to access state for the current IssuerRegistry app"""
@@ -486,6 +590,14 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def governance_asset(self) -> int:
+        """Get the current value of the governance_asset key in global_state state"""
+        value = self.app_client.state.global_state.get_value("governance_asset")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class _LocalState:
     def __init__(self, app_client: algokit_utils.AppClient, address: str):
         self.app_client = app_client
@@ -525,6 +637,14 @@ class _LocalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def vote_count(self) -> int:
+        """Get the current value of the vote_count key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("vote_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class IssuerRegistryClient:
     """Client for interacting with IssuerRegistry smart contract"""
 
@@ -668,6 +788,12 @@ class IssuerRegistryClient:
     def new_group(self) -> "IssuerRegistryComposer":
         return IssuerRegistryComposer(self)
 
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_governance_asset(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
@@ -675,6 +801,12 @@ class IssuerRegistryClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["vote(address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["approve_issuer(address)void"],
@@ -899,6 +1031,26 @@ class IssuerRegistryFactoryCreateParams:
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             compilation_params=compilation_params)
 
+    def set_governance_asset(
+        self,
+        args: tuple[int] | SetGovernanceAssetArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_governance_asset(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_governance_asset(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def register_issuer(
         self,
         *,
@@ -918,6 +1070,26 @@ class IssuerRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def vote(
+        self,
+        args: tuple[str] | VoteArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the vote(address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "vote(address)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def approve_issuer(
         self,
         args: tuple[str] | ApproveIssuerArgs,
@@ -1163,6 +1335,24 @@ class IssuerRegistryComposer:
     def opt_in(self) -> "_IssuerRegistryOptInComposer":
         return _IssuerRegistryOptInComposer(self)
 
+    def set_governance_asset(
+        self,
+        args: tuple[int] | SetGovernanceAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "IssuerRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_governance_asset(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_governance_asset(uint64)void", v
+            )
+        )
+        return self
+
     def register_issuer(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -1180,6 +1370,24 @@ class IssuerRegistryComposer:
         )
         return self
 
+    def vote(
+        self,
+        args: tuple[str] | VoteArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "IssuerRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.vote(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "vote(address)void", v
+            )
+        )
+        return self
+
     def approve_issuer(
         self,
         args: tuple[str] | ApproveIssuerArgs,
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Initialise retirement tracking.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "number of credits to add (must be > 0)", "name": "amount"}], "name": "add_supply", "returns": {"type": "void"}, "desc": "Register additional credit supply. Creator only.\nThis should be called when credits are minted in the marketplace so this manager knows the total supply available for retirement.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "number of credits to retire (must be > 0)", "name": "amount"}], "name": "retire_credits", "returns": {"type": "void"}, "desc": "Retire carbon credits permanently. Creator only.\nCredits are removed from the available supply and added to the retirement tally.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_retirement_stats", "returns": {"type": "uint64"}, "desc": "Return the total retired credits.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_available_supply", "returns": {"type": "uint64"}, "desc": "Return credits available for retirement (total_supply - retired).", "events": [], "readonly": true, "recommendations": {}}], "name": "RetirementManager", "state": {"keys": {"box": {}, "global": {"total_supply": {"key": "dG90YWxfc3VwcGx5", "keyType": "AVMString", "valueType": "AVMUint64"}, "retired_credits": {"key": "cmV0aXJlZF9jcmVkaXRz", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CyADAAEIJgMMdG90YWxfc3VwcGx5D3JldGlyZWRfY3JlZGl0cwQVH3x1MRhAAAYoImcpImcxGRREMRhBACSCBASc4pFBBG0QAJ8EkPWoggRpbgFmNhoAjgQAFwAyAFkAZACABExcYbo2GgCOAQABACgiZykiZyNDNhoBSRUkEkQXMQAyCRJESUQiKGVECChMZyNDNhoBSRUkEkQXMQAyCRJESUQiKGVEIillRExLAQlLAg9ECClMZyNDIillRBYqTFCwI0MiKGVEIillRAkWKkxQsCND", "clear": "C4EBQw=="}, "desc": "Manages carbon credit retirements with admin access control.\n\n    Global state:\n        total_supply     \u2013 total credits registered in this manager\n        retired_credits  \u2013 credits permanently retired\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOAogICAgYnl0ZWNibG9jayAidG90YWxfc3VwcGx5IiAicmV0aXJlZF9jcmVkaXRzIiAweDE1MWY3Yzc1CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE0CiAgICAvLyBzZWxmLnRvdGFsX3N1cHBseSA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJ0b3RhbF9zdXBwbHkiKQogICAgYnl0ZWNfMCAvLyAidG90YWxfc3VwcGx5IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE1CiAgICAvLyBzZWxmLnJldGlyZWRfY3JlZGl0cyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJyZXRpcmVkX2NyZWRpdHMiKQogICAgYnl0ZWNfMSAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgUmV0aXJlbWVudE1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMTAKICAgIHB1c2hieXRlc3MgMHg5Y2UyOTE0MSAweDZkMTAwMDlmIDB4OTBmNWE4ODIgMHg2OTZlMDE2NiAvLyBtZXRob2QgImFkZF9zdXBwbHkodWludDY0KXZvaWQiLCBtZXRob2QgInJldGlyZV9jcmVkaXRzKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJnZXRfcmV0aXJlbWVudF9zdGF0cygpdWludDY0IiwgbWV0aG9kICJnZXRfYXZhaWxhYmxlX3N1cHBseSgpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggYWRkX3N1cHBseSByZXRpcmVfY3JlZGl0cyBnZXRfcmV0aXJlbWVudF9zdGF0cyBnZXRfYXZhaWxhYmxlX3N1cHBseQogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBSZXRpcmVtZW50TWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4NGM1YzYxYmEgLy8gbWV0aG9kICJjcmVhdGUoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGUKICAgIGVycgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXRpcmVtZW50X21hbmFnZXIuY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMAogICAgLy8gc2VsZi50b3RhbF9zdXBwbHkudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gInRvdGFsX3N1cHBseSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMQogICAgLy8gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzEgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxNwogICAgLy8gQGFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXRpcmVtZW50X21hbmFnZXIuY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIuYWRkX3N1cHBseVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmFkZF9zdXBwbHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIGFkZCBzdXBwbHkiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBhZGQgc3VwcGx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIkFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZHVwCiAgICBhc3NlcnQgLy8gQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzUKICAgIC8vIHNlbGYudG90YWxfc3VwcGx5LnZhbHVlICs9IGFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX3N1cHBseSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9zdXBwbHkgZXhpc3RzCiAgICArCiAgICBieXRlY18wIC8vICJ0b3RhbF9zdXBwbHkiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJldGlyZW1lbnRfbWFuYWdlci5jb250cmFjdC5SZXRpcmVtZW50TWFuYWdlci5yZXRpcmVfY3JlZGl0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnJldGlyZV9jcmVkaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTozNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSBjcmVhdG9yIGNhbiByZXRpcmUgY3JlZGl0cyIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIHJldGlyZSBjcmVkaXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjQ4CiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIkFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZHVwCiAgICBhc3NlcnQgLy8gQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NDkKICAgIC8vIGF2YWlsYWJsZSA9IHNlbGYudG90YWxfc3VwcGx5LnZhbHVlIC0gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJ0b3RhbF9zdXBwbHkiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfc3VwcGx5IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXRpcmVkX2NyZWRpdHMgZXhpc3RzCiAgICBzd2FwCiAgICBkaWcgMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo1MAogICAgLy8gYXNzZXJ0IGF2YWlsYWJsZSA+PSBhbW91bnQsICJJbnN1ZmZpY2llbnQgc3VwcGx5IHRvIHJldGlyZSIKICAgIGRpZyAyCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBzdXBwbHkgdG8gcmV0aXJlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjUxCiAgICAvLyBzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZSArPSBhbW91bnQKICAgICsKICAgIGJ5dGVjXzEgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmV0aXJlbWVudF9tYW5hZ2VyLmNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLmdldF9yZXRpcmVtZW50X3N0YXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3JldGlyZW1lbnRfc3RhdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjU2CiAgICAvLyByZXR1cm4gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV0aXJlZF9jcmVkaXRzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo1MwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXRpcmVtZW50X21hbmFnZXIuY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIuZ2V0X2F2YWlsYWJsZV9zdXBwbHlbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYXZhaWxhYmxlX3N1cHBseToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NjEKICAgIC8vIHJldHVybiBzZWxmLnRvdGFsX3N1cHBseS52YWx1ZSAtIHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfc3VwcGx5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3N1cHBseSBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV0aXJlZF9jcmVkaXRzIGV4aXN0cwogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo1OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [136, 163], "errorMessage": "Amount must be greater than zero"}, {"pc": [179], "errorMessage": "Insufficient supply to retire"}, {"pc": [134], "errorMessage": "Only creator can add supply"}, {"pc": [161], "errorMessage": "Only creator can retire credits"}, {"pc": [171, 189, 204], "errorMessage": "check self.retired_credits exists"}, {"pc": [140, 167, 200], "errorMessage": "check self.total_supply exists"}, {"pc": [127, 154], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Initialise retirement tracking.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "number of credits to add (must be > 0)", "name": "amount"}], "name": "add_supply", "returns": {"type": "void"}, "desc": "Register additional credit supply. Creator only.\nThis should be called when credits are minted in the marketplace so this manager knows the total supply available for retirement.", "events": [{"args": [{"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "total_supply"}], "name": "SupplyAdded", "desc": "ARC-28 event of `add_supply`, with the new total supply."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "number of credits to retire (must be > 0)", "name": "amount"}], "name": "retire_credits", "returns": {"type": "void"}, "desc": "Retire carbon credits permanently. Creator only.\nCredits are removed from the available supply and added to the retirement tally.", "events": [{"args": [{"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "retired_credits"}], "name": "CreditsRetired", "desc": "ARC-28 event of `retire_credits`, with the new retired total."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_retirement_stats", "returns": {"type": "uint64"}, "desc": "Return the total retired credits.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_available_supply", "returns": {"type": "uint64"}, "desc": "Return credits available for retirement (total_supply - retired).", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_stats", "returns": {"type": "(uint64,uint64,uint64)", "struct": "RetirementStats"}, "desc": "Return the total, retired and available supply in one call.", "events": [], "readonly": true, "recommendations": {}}], "name": "RetirementManager", "state": {"keys": {"box": {}, "global": {"total_supply": {"key": "dG90YWxfc3VwcGx5", "keyType": "AVMString", "valueType": "AVMUint64"}, "retired_credits": {"key": "cmV0aXJlZF9jcmVkaXRz", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"RetirementStats": [{"name": "total_supply", "type": "uint64"}, {"name": "retired_credits", "type": "uint64"}, {"name": "available_supply", "type": "uint64"}]}, "byteCode": {"approval": "CyADAAEIJgMMdG90YWxfc3VwcGx5D3JldGlyZWRfY3JlZGl0cwQVH3x1MRhAAAYoImcpImcxGRREMRhBACuCBQSc4pFBBG0QAJ8EkPWoggRpbgFmBDYfaME2GgCOBQAXAD8AcwB+AI4AgARMXGG6NhoAjgEAAQAoImcpImcjQzYaAUkVJBJESRcxADIJEkRJRCIoZUQIKEsBZxZQgAR0wOjMTFCwI0M2GgFJFSQSREkXMQAyCRJESUQiKGVEIillRExLAQlLAg9ECClLAWcWUIAEALWwz0xQsCNDIillRBYqTFCwI0MiKGVEIillRAkWKkxQsCNDIihlREkWIillREkWTwNPAgkWTgJQTFAqTFCwI0M=", "clear": "C4EBQw=="}, "desc": "Manages carbon credit retirements with admin access control.\n\n    Global state:\n        total_supply     \u2013 total credits registered in this manager\n        retired_credits  \u2013 credits permanently retired\n    ", "events": [{"args": [{"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "total_supply"}], "name": "SupplyAdded", "desc": "ARC-28 event of `add_supply`, with the new total supply."}, {"args": [{"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "retired_credits"}], "name": "CreditsRetired", "desc": "ARC-28 event of `retire_credits`, with the new retired total."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOAogICAgYnl0ZWNibG9jayAidG90YWxfc3VwcGx5IiAicmV0aXJlZF9jcmVkaXRzIiAweDE1MWY3Yzc1CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM2CiAgICAvLyBzZWxmLnRvdGFsX3N1cHBseSA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJ0b3RhbF9zdXBwbHkiKQogICAgYnl0ZWNfMCAvLyAidG90YWxfc3VwcGx5IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM3CiAgICAvLyBzZWxmLnJldGlyZWRfY3JlZGl0cyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJyZXRpcmVkX2NyZWRpdHMiKQogICAgYnl0ZWNfMSAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjcKICAgIC8vIGNsYXNzIFJldGlyZW1lbnRNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDExCiAgICBwdXNoYnl0ZXNzIDB4OWNlMjkxNDEgMHg2ZDEwMDA5ZiAweDkwZjVhODgyIDB4Njk2ZTAxNjYgMHgzNjFmNjhjMSAvLyBtZXRob2QgImFkZF9zdXBwbHkodWludDY0KXZvaWQiLCBtZXRob2QgInJldGlyZV9jcmVkaXRzKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJnZXRfcmV0aXJlbWVudF9zdGF0cygpdWludDY0IiwgbWV0aG9kICJnZXRfYXZhaWxhYmxlX3N1cHBseSgpdWludDY0IiwgbWV0aG9kICJnZXRfc3RhdHMoKSh1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBhZGRfc3VwcGx5IHJldGlyZV9jcmVkaXRzIGdldF9yZXRpcmVtZW50X3N0YXRzIGdldF9hdmFpbGFibGVfc3VwcGx5IGdldF9zdGF0cwogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyNwogICAgLy8gY2xhc3MgUmV0aXJlbWVudE1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCgovLyBzbWFydF9jb250cmFjdHMucmV0aXJlbWVudF9tYW5hZ2VyLmNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLmNyZWF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NDIKICAgIC8vIHNlbGYudG90YWxfc3VwcGx5LnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJ0b3RhbF9zdXBwbHkiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NDMKICAgIC8vIHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzkKICAgIC8vIEBhYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmV0aXJlbWVudF9tYW5hZ2VyLmNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLmFkZF9zdXBwbHlbcm91dGluZ10oKSAtPiB2b2lkOgphZGRfc3VwcGx5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo0NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBkdXAKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NTUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIGFkZCBzdXBwbHkiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBhZGQgc3VwcGx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjU2CiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIkFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZHVwCiAgICBhc3NlcnQgLy8gQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NTcKICAgIC8vIHNlbGYudG90YWxfc3VwcGx5LnZhbHVlICs9IGFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX3N1cHBseSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9zdXBwbHkgZXhpc3RzCiAgICArCiAgICBieXRlY18wIC8vICJ0b3RhbF9zdXBwbHkiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NjAKICAgIC8vIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLCB0b3RhbF9zdXBwbHk9YXJjNC5VSW50NjQoc2VsZi50b3RhbF9zdXBwbHkudmFsdWUpCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjU5LTYxCiAgICAvLyBTdXBwbHlBZGRlZCgKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwgdG90YWxfc3VwcGx5PWFyYzQuVUludDY0KHNlbGYudG90YWxfc3VwcGx5LnZhbHVlKQogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjU4LTYyCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgU3VwcGx5QWRkZWQoCiAgICAvLyAgICAgICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLCB0b3RhbF9zdXBwbHk9YXJjNC5VSW50NjQoc2VsZi50b3RhbF9zdXBwbHkudmFsdWUpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4NzRjMGU4Y2MgLy8gbWV0aG9kICJTdXBwbHlBZGRlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmV0aXJlbWVudF9tYW5hZ2VyLmNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLnJldGlyZV9jcmVkaXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKcmV0aXJlX2NyZWRpdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjY0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGR1cAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo3NAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gcmV0aXJlIGNyZWRpdHMiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiByZXRpcmUgY3JlZGl0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo3NQogICAgLy8gYXNzZXJ0IGFtb3VudCA+IDAsICJBbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybyIKICAgIGR1cAogICAgYXNzZXJ0IC8vIEFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBhdmFpbGFibGUgPSBzZWxmLnRvdGFsX3N1cHBseS52YWx1ZSAtIHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfc3VwcGx5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3N1cHBseSBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV0aXJlZF9jcmVkaXRzIGV4aXN0cwogICAgc3dhcAogICAgZGlnIDEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NzcKICAgIC8vIGFzc2VydCBhdmFpbGFibGUgPj0gYW1vdW50LCAiSW5zdWZmaWNpZW50IHN1cHBseSB0byByZXRpcmUiCiAgICBkaWcgMgogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgc3VwcGx5IHRvIHJldGlyZQogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo3OAogICAgLy8gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUgKz0gYW1vdW50CiAgICArCiAgICBieXRlY18xIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6ODIKICAgIC8vIHJldGlyZWRfY3JlZGl0cz1hcmM0LlVJbnQ2NChzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZSksCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjgwLTgzCiAgICAvLyBDcmVkaXRzUmV0aXJlZCgKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICByZXRpcmVkX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5Ojc5LTg0CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgQ3JlZGl0c1JldGlyZWQoCiAgICAvLyAgICAgICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgICAgICByZXRpcmVkX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDAwYjViMGNmIC8vIG1ldGhvZCAiQ3JlZGl0c1JldGlyZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo2NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJldGlyZW1lbnRfbWFuYWdlci5jb250cmFjdC5SZXRpcmVtZW50TWFuYWdlci5nZXRfcmV0aXJlbWVudF9zdGF0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yZXRpcmVtZW50X3N0YXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo4OQogICAgLy8gcmV0dXJuIHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJldGlyZWRfY3JlZGl0cyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6ODYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmV0aXJlbWVudF9tYW5hZ2VyLmNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLmdldF9hdmFpbGFibGVfc3VwcGx5W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2F2YWlsYWJsZV9zdXBwbHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5Ojk0CiAgICAvLyByZXR1cm4gc2VsZi50b3RhbF9zdXBwbHkudmFsdWUgLSBzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX3N1cHBseSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9zdXBwbHkgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJldGlyZWRfY3JlZGl0cyBleGlzdHMKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6OTEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmV0aXJlbWVudF9tYW5hZ2VyLmNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLmdldF9zdGF0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9zdGF0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTAwCiAgICAvLyB0b3RhbF9zdXBwbHk9YXJjNC5VSW50NjQoc2VsZi50b3RhbF9zdXBwbHkudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX3N1cHBseSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9zdXBwbHkgZXhpc3RzCiAgICBkdXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTAxCiAgICAvLyByZXRpcmVkX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXRpcmVkX2NyZWRpdHMgZXhpc3RzCiAgICBkdXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTAyCiAgICAvLyBhdmFpbGFibGVfc3VwcGx5PWFyYzQuVUludDY0KHNlbGYudG90YWxfc3VwcGx5LnZhbHVlIC0gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIC0KICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6OTktMTAzCiAgICAvLyByZXR1cm4gUmV0aXJlbWVudFN0YXRzKAogICAgLy8gICAgIHRvdGFsX3N1cHBseT1hcmM0LlVJbnQ2NChzZWxmLnRvdGFsX3N1cHBseS52YWx1ZSksCiAgICAvLyAgICAgcmV0aXJlZF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlKSwKICAgIC8vICAgICBhdmFpbGFibGVfc3VwcGx5PWFyYzQuVUludDY0KHNlbGYudG90YWxfc3VwcGx5LnZhbHVlIC0gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgLy8gKQogICAgY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6OTYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [144, 184], "errorMessage": "Amount must be greater than zero"}, {"pc": [200], "errorMessage": "Insufficient supply to retire"}, {"pc": [142], "errorMessage": "Only creator can add supply"}, {"pc": [182], "errorMessage": "Only creator can retire credits"}, {"pc": [192, 222, 237, 255], "errorMessage": "check self.retired_credits exists"}, {"pc": [148, 188, 233, 249], "errorMessage": "check self.total_supply exists"}, {"pc": [134, 174], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,14 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class RetirementStats:
+    """Struct for RetirementStats"""
+    total_supply: int
+    retired_credits: int
+    available_supply: int
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class AddSupplyArgs:
     """Dataclass for add_supply arguments"""
@@ -135,6 +143,17 @@ class RetirementManagerParams:
             "method": "get_available_supply()uint64",
         }))
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64,uint64)",
+        }))
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -209,6 +228,17 @@ class RetirementManagerCreateTransactionParams:
             "method": "get_available_supply()uint64",
         }))
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64,uint64)",
+        }))
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -295,6 +325,20 @@ class RetirementManagerSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[RetirementStats]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64,uint64)",
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(RetirementStats, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[RetirementStats], parsed_response)
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -545,6 +589,12 @@ class RetirementManagerClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_stats()(uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> RetirementStats | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["create()void"],
@@ -561,7 +611,7 @@ class RetirementManagerClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | RetirementStats | int:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -823,6 +873,25 @@ class RetirementManagerFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_stats(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_stats()(uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_stats()(uint64,uint64,uint64)",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def create(
         self,
         *,
@@ -1050,6 +1119,23 @@ class RetirementManagerComposer:
         )
         return self
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "RetirementManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_stats(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_stats()(uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -1,5 +1,52 @@
-from algopy import ARC4Contract, Account, GlobalState, LocalState, Txn, Global, UInt64, gtxn
-from algopy.arc4 import abimethod, baremethod
+from algopy import ARC4Contract, Account, BoxMap, GlobalState, Txn, Global, UInt64, arc4, gtxn, subroutine
+from algopy.arc4 import abimethod
+
+# Linear bonding curve: the price of a credit rises by SLOPE for every credit in circulation.
+BASE_PRICE = 100_000  # 0.1 ALGO
+SLOPE = 1  # microAlgo per credit
+
+# Balance boxes are keyed by BALANCE_PREFIX + the 32-byte address and hold a uint64.
+BALANCE_PREFIX = b"c"
+# Minimum balance a balance box adds to the app account: 2500 + 400 per key and value byte.
+BALANCE_BOX_MBR = 2_500 + 400 * (1 + 32 + 8)
+# Addresses per `get_balances` call. The 2,048 bytes of ApplicationArgs would hold 63
+# addresses, but each lookup costs about 41 opcodes, so the 700 opcodes of one app call
+# cover about 16; 15 leaves headroom for the fixed cost of the call.
+MAX_BALANCES_PAGE = 15
+
+
+class MarketplaceStats(arc4.Struct, kw_only=True):
+    """Every counter of the marketplace and the current price, as returned by `get_stats`."""
+
+    total_credits: arc4.UInt64
+    retired_credits: arc4.UInt64
+    current_price: arc4.UInt64
+
+
+class CreditsMinted(arc4.Struct, kw_only=True):
+    """ARC-28 event of `mint_credits`, with the new supply in circulation."""
+
+    account: arc4.Address
+    amount: arc4.UInt64
+    total_credits: arc4.UInt64
+
+
+class CreditsRetired(arc4.Struct, kw_only=True):
+    """ARC-28 event of `retire_credits`, with the new supply and retired total."""
+
+    account: arc4.Address
+    amount: arc4.UInt64
+    total_credits: arc4.UInt64
+    retired_credits: arc4.UInt64
+
+
+class CreditsBought(arc4.Struct, kw_only=True):
+    """ARC-28 event of `buy_credits`: the unit price paid and the new supply."""
+
+    buyer: arc4.Address
+    amount: arc4.UInt64
+    price: arc4.UInt64
+    total_credits: arc4.UInt64
 
 
 class CarbonMarketplace(ARC4Contract):
@@ -9,14 +56,14 @@ class CarbonMarketplace(ARC4Contract):
         total_credits    – total minted credits in circulation
         retired_credits  – cumulative credits permanently retired
 
-    Local state (per account):
-        credits_minted   – credits minted by/for this account
+    Boxes (per account, created on the account's first credits):
+        c<address>       – credit balance of the account, see `BALANCE_PREFIX`
     """
 
     def __init__(self) -> None:
         self.total_credits = GlobalState(UInt64(0), key="total_credits")
         self.retired_credits = GlobalState(UInt64(0), key="retired_credits")
-        self.credits_minted = LocalState(UInt64, key="credits_minted")
+        self.balances = BoxMap(Account, UInt64, key_prefix=BALANCE_PREFIX)
 
     @abimethod(create="require")
     def create(self) -> None:
@@ -24,23 +71,26 @@ class CarbonMarketplace(ARC4Contract):
         self.total_credits.value = UInt64(0)
         self.retired_credits.value = UInt64(0)
 
-    @baremethod(allow_actions=["OptIn"])
-    def opt_in(self) -> None:
-        """Allow accounts to opt in for local state."""
-        pass
-
     @abimethod()
     def mint_credits(self, amount: UInt64) -> None:
         """Mint new carbon credits to the caller. Creator only.
 
+        The caller's balance box, if new, is paid for from the app account.
+
         Args:
             amount: number of credits to mint (must be > 0)
         """
         assert Txn.sender == Global.creator_address, "Only creator can mint credits"
         assert amount > 0, "Amount must be greater than zero"
         self.total_credits.value += amount
-        current = self.credits_minted.get(Txn.sender, default=UInt64(0))
-        self.credits_minted[Txn.sender] = current + amount
+        self.balances[Txn.sender] = self.balances.get(Txn.sender, default=UInt64(0)) + amount
+        arc4.emit(
+            CreditsMinted(
+                account=arc4.Address(Txn.sender),
+                amount=arc4.UInt64(amount),
+                total_credits=arc4.UInt64(self.total_credits.value),
+            )
+        )
 
     @abimethod()
     def retire_credits(self, amount: UInt64) -> None:
@@ -53,11 +103,19 @@ class CarbonMarketplace(ARC4Contract):
             amount: number of credits to retire (must be > 0)
         """
         assert amount > 0, "Amount must be greater than zero"
-        current = self.credits_minted.get(Txn.sender, default=UInt64(0))
+        current = self.balances.get(Txn.sender, default=UInt64(0))
         assert current >= amount, "Insufficient credits to retire"
-        self.credits_minted[Txn.sender] = current - amount
+        self.balances[Txn.sender] = current - amount
         self.total_credits.value -= amount
         self.retired_credits.value += amount
+        arc4.emit(
+            CreditsRetired(
+                account=arc4.Address(Txn.sender),
+                amount=arc4.UInt64(amount),
+                total_credits=arc4.UInt64(self.total_credits.value),
+                retired_credits=arc4.UInt64(self.retired_credits.value),
+            )
+        )
 
     @abimethod()
     def buy_credits(self, payment: gtxn.PaymentTransaction, amount: UInt64) -> None:
@@ -68,18 +126,20 @@ class CarbonMarketplace(ARC4Contract):
         Base = 0.1 ALGO (100,000 microAlgos)
         Slope = 1 microAlgo per credit
 
+        A buyer's first purchase creates their balance box, so the payment must
+        also cover `BALANCE_BOX_MBR`. No opt-in is needed.
+
         Args:
             payment: Payment transaction to the contract's account.
             amount: Number of credits to buy.
         """
         assert amount > 0, "Amount must be greater than zero"
         
-        # Calculate Price
-        base_price = UInt64(100_000) # 0.1 ALGO
-        slope = UInt64(1)
-        current_supply = self.total_credits.value
-        unit_price = base_price + (current_supply * slope)
+        unit_price = self._unit_price()
         total_cost = unit_price * amount
+        current_bal, has_box = self.balances.maybe(Txn.sender)
+        if not has_box:
+            total_cost += BALANCE_BOX_MBR
         
         # Verify Payment
         assert payment.receiver == Global.current_application_address, "Payment must be to contract"
@@ -87,20 +147,49 @@ class CarbonMarketplace(ARC4Contract):
         
         # Mint Credits
         self.total_credits.value += amount
-        current_bal = self.credits_minted.get(Txn.sender, default=UInt64(0))
-        self.credits_minted[Txn.sender] = current_bal + amount
+        self.balances[Txn.sender] = current_bal + amount
+        arc4.emit(
+            CreditsBought(
+                buyer=arc4.Address(Txn.sender),
+                amount=arc4.UInt64(amount),
+                price=arc4.UInt64(unit_price),
+                total_credits=arc4.UInt64(self.total_credits.value),
+            )
+        )
+
+    @subroutine
+    def _unit_price(self) -> UInt64:
+        return BASE_PRICE + self.total_credits.value * SLOPE
 
     @abimethod(readonly=True)
     def get_current_price(self) -> UInt64:
         """Return the current price per credit in microAlgos."""
-        base_price = UInt64(100_000)
-        slope = UInt64(1)
-        return base_price + (self.total_credits.value * slope)
+        return self._unit_price()
 
     @abimethod(readonly=True)
     def get_credits(self, account: Account) -> UInt64:
         """Return the credit balance for the given account."""
-        return self.credits_minted.get(account, default=UInt64(0))
+        return self.balances.get(account, default=UInt64(0))
+
+    @abimethod(readonly=True)
+    def get_balances(
+        self, addresses: arc4.DynamicArray[arc4.Address]
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Return the credit balances of a page of accounts, in the order given.
+
+        Accounts without a balance box read as 0. Read large holder lists in pages of
+        up to `MAX_BALANCES_PAGE` addresses, which fit the opcode budget of a single
+        app call, simulating with unnamed resources allowed so the boxes do not need
+        to be referenced.
+
+        Args:
+            addresses: The accounts to look up.
+        """
+        assert addresses.length <= MAX_BALANCES_PAGE, "Too many addresses for one page"
+        balances = arc4.DynamicArray[arc4.UInt64]()
+        for address in addresses:
+            balances.append(arc4.UInt64(self.balances.get(address.native, default=UInt64(0))))
+        return balances
 
     @abimethod(readonly=True)
     def get_total_credits(self) -> UInt64:
@@ -111,3 +200,12 @@ class CarbonMarketplace(ARC4Contract):
     def get_retired_credits(self) -> UInt64:
         """Return the cumulative retired credits."""
         return self.retired_credits.value
+
+    @abimethod(readonly=True)
+    def get_stats(self) -> MarketplaceStats:
+        """Return the credits in circulation, retired credits and current price in one call."""
+        return MarketplaceStats(
+            total_credits=arc4.UInt64(self.total_credits.value),
+            retired_credits=arc4.UInt64(self.retired_credits.value),
+            current_price=arc4.UInt64(self._unit_price()),
+        )
@@ -1,14 +1,43 @@
-from algopy import ARC4Contract, Account, GlobalState, LocalState, Txn, Global, UInt64, Bytes, op
+from algopy import ARC4Contract, Account, Asset, GlobalState, LocalState, Txn, Global, UInt64, Bytes, arc4, op
 
 from algopy.arc4 import abimethod, baremethod
 
 
+class IssuerRegistered(arc4.Struct, kw_only=True):
+    """ARC-28 event of `register_issuer`."""
+
+    issuer: arc4.Address
+
+
+class IssuerVoted(arc4.Struct, kw_only=True):
+    """ARC-28 event of `vote`, with the issuer's new vote count."""
+
+    voter: arc4.Address
+    issuer: arc4.Address
+    votes: arc4.UInt64
+
+
+class IssuerApproved(arc4.Struct, kw_only=True):
+    """ARC-28 event of `approve_issuer`, with the new number of approved issuers."""
+
+    issuer: arc4.Address
+    approved_count: arc4.UInt64
+
+
+class IssuerRevoked(arc4.Struct, kw_only=True):
+    """ARC-28 event of `revoke_issuer`, with the new number of approved issuers."""
+
+    issuer: arc4.Address
+    approved_count: arc4.UInt64
+
+
 class IssuerRegistry(ARC4Contract):
     """Registry for carbon credit issuers with admin approval workflow.
 
     Global state:
-        admin           – address of the contract administrator
-        approved_count  – total number of currently approved issuers
+        admin             – address of the contract administrator
+        approved_count    – total number of currently approved issuers
+        governance_asset  – ID of the governance token (CXG) voters must hold
 
     Local state (per account):
         is_registered   – 1 if the account has registered as an issuer
@@ -18,6 +47,7 @@ class IssuerRegistry(ARC4Contract):
     def __init__(self) -> None:
         self.admin = GlobalState(Bytes(), key="admin")
         self.approved_count = GlobalState(UInt64(0), key="approved_count")
+        self.governance_asset = GlobalState(UInt64(0), key="governance_asset")
         self.is_registered = LocalState(UInt64, key="is_registered")
         self.is_approved = LocalState(UInt64, key="is_approved")
         self.vote_count = LocalState(UInt64, key="vote_count")
@@ -28,6 +58,12 @@ class IssuerRegistry(ARC4Contract):
         self.admin.value = Txn.sender.bytes
         self.approved_count.value = UInt64(0)
 
+    @abimethod()
+    def set_governance_asset(self, asset: Asset) -> None:
+        """Set the governance token (CXG) voters must hold. Admin only."""
+        assert Txn.sender.bytes == self.admin.value, "Only admin can set governance asset"
+        self.governance_asset.value = asset.id
+
     @baremethod(allow_actions=["OptIn"])
     def opt_in(self) -> None:
         """Allow accounts to opt in for local state."""
@@ -43,13 +79,15 @@ class IssuerRegistry(ARC4Contract):
         assert current == 0, "Already registered"
         self.is_registered[Txn.sender] = UInt64(1)
         self.vote_count[Txn.sender] = UInt64(0)
+        arc4.emit(IssuerRegistered(issuer=arc4.Address(Txn.sender)))
 
     @abimethod()
     def vote(self, issuer: Account) -> None:
-        """Vote for an issuer to be approved. Requires holding CXG token (ID 1008)."""
+        """Vote for an issuer to be approved. Requires holding the governance token (CXG)."""
         # 1. Check Token Balance
-        asset_id = UInt64(1008)
-        balance, exists = op.AssetHolding.get_asset_balance(Txn.sender, asset_id)
+        asset_id = self.governance_asset.value
+        assert asset_id != 0, "Governance asset not set"
+        balance, exists = op.AssetHoldingGet.asset_balance(Txn.sender, asset_id)
         assert exists and balance > 0, "Must hold Governance Token (CXG)"
 
         # 2. Check Target
@@ -70,6 +108,13 @@ class IssuerRegistry(ARC4Contract):
         # 5. Increment Vote Count
         current_votes = self.vote_count.get(issuer, default=UInt64(0))
         self.vote_count[issuer] = current_votes + UInt64(1)
+        arc4.emit(
+            IssuerVoted(
+                voter=arc4.Address(Txn.sender),
+                issuer=arc4.Address(issuer),
+                votes=arc4.UInt64(current_votes + 1),
+            )
+        )
 
     @abimethod()
     def approve_issuer(self, account: Account) -> None:
@@ -91,6 +136,12 @@ class IssuerRegistry(ARC4Contract):
         assert already_approved == 0, "Account already approved"
         self.is_approved[account] = UInt64(1)
         self.approved_count.value += UInt64(1)
+        arc4.emit(
+            IssuerApproved(
+                issuer=arc4.Address(account),
+                approved_count=arc4.UInt64(self.approved_count.value),
+            )
+        )
 
     @abimethod()
     def revoke_issuer(self, account: Account) -> None:
@@ -103,6 +154,12 @@ class IssuerRegistry(ARC4Contract):
         assert approved == 1, "Account not approved"
         self.is_approved[account] = UInt64(0)
         self.approved_count.value -= UInt64(1)
+        arc4.emit(
+            IssuerRevoked(
+                issuer=arc4.Address(account),
+                approved_count=arc4.UInt64(self.approved_count.value),
+            )
+        )
 
     @abimethod(readonly=True)
     def get_issuer_status(self, account: Account) -> UInt64:
@@ -1,4 +1,5 @@
 import logging
+import os
 
 import algokit_utils
 
@@ -35,6 +36,24 @@ def deploy() -> None:
                 receiver=app_client.app_address,
             )
         )
+        # The governance token (CXG) that voters must hold, e.g. the asset created by
+        # `scripts/carbonx.py create-asset cxg` in the main project.
+        governance_asset_id = os.getenv("GOVERNANCE_ASSET_ID")
+        if governance_asset_id:
+            app_client.send.set_governance_asset(
+                args=(int(governance_asset_id),),
+                params=algokit_utils.CommonAppCallParams(
+                    asset_references=[int(governance_asset_id)]
+                ),
+            )
+            logger.info(
+                f"Set governance asset of {app_client.app_name} to {governance_asset_id}"
+            )
+        else:
+            logger.warning(
+                f"GOVERNANCE_ASSET_ID is not set; voting on {app_client.app_name} is disabled"
+                " until the admin calls set_governance_asset"
+            )
 
     logger.info(
         f"Deployed {app_client.app_name} ({app_client.app_id}) successfully"
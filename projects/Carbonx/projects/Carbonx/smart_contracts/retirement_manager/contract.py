@@ -1,7 +1,29 @@
-from algopy import ARC4Contract, GlobalState, Txn, Global, UInt64
+from algopy import ARC4Contract, GlobalState, Txn, Global, UInt64, arc4
 from algopy.arc4 import abimethod
 
 
+class RetirementStats(arc4.Struct, kw_only=True):
+    """Every counter of the retirement manager, as returned by `get_stats`."""
+
+    total_supply: arc4.UInt64
+    retired_credits: arc4.UInt64
+    available_supply: arc4.UInt64
+
+
+class SupplyAdded(arc4.Struct, kw_only=True):
+    """ARC-28 event of `add_supply`, with the new total supply."""
+
+    amount: arc4.UInt64
+    total_supply: arc4.UInt64
+
+
+class CreditsRetired(arc4.Struct, kw_only=True):
+    """ARC-28 event of `retire_credits`, with the new retired total."""
+
+    amount: arc4.UInt64
+    retired_credits: arc4.UInt64
+
+
 class RetirementManager(ARC4Contract):
     """Manages carbon credit retirements with admin access control.
 
@@ -33,6 +55,11 @@ class RetirementManager(ARC4Contract):
         assert Txn.sender == Global.creator_address, "Only creator can add supply"
         assert amount > 0, "Amount must be greater than zero"
         self.total_supply.value += amount
+        arc4.emit(
+            SupplyAdded(
+                amount=arc4.UInt64(amount), total_supply=arc4.UInt64(self.total_supply.value)
+            )
+        )
 
     @abimethod()
     def retire_credits(self, amount: UInt64) -> None:
@@ -49,6 +76,12 @@ class RetirementManager(ARC4Contract):
         available = self.total_supply.value - self.retired_credits.value
         assert available >= amount, "Insufficient supply to retire"
         self.retired_credits.value += amount
+        arc4.emit(
+            CreditsRetired(
+                amount=arc4.UInt64(amount),
+                retired_credits=arc4.UInt64(self.retired_credits.value),
+            )
+        )
 
     @abimethod(readonly=True)
     def get_retirement_stats(self) -> UInt64:
@@ -59,3 +92,12 @@ class RetirementManager(ARC4Contract):
     def get_available_supply(self) -> UInt64:
         """Return credits available for retirement (total_supply - retired)."""
         return self.total_supply.value - self.retired_credits.value
+
+    @abimethod(readonly=True)
+    def get_stats(self) -> RetirementStats:
+        """Return the total, retired and available supply in one call."""
+        return RetirementStats(
+            total_supply=arc4.UInt64(self.total_supply.value),
+            retired_credits=arc4.UInt64(self.retired_credits.value),
+            available_supply=arc4.UInt64(self.total_supply.value - self.retired_credits.value),
+        )
@@ -0,0 +1,67 @@
+import argparse
+import contextlib
+import io
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from smart_contracts._helpers.backends import BACKENDS  # noqa: E402
+from smart_contracts._helpers.build import BuildTarget, build_all  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+def discover_targets(output_root: Path) -> list[BuildTarget]:
+    contracts_root = project_root / "smart_contracts"
+    return [
+        BuildTarget(folder.name, folder / "contract.py", output_root / folder.name)
+        for folder in sorted(contracts_root.iterdir())
+        if (folder / "contract.py").exists() and not folder.name.startswith("_")
+    ]
+
+
+def bench_backend(backend_name: str, rounds: int) -> list[float]:
+    """Builds every contract `rounds` times without the build cache and returns the timings."""
+    timings = []
+    for _ in range(rounds):
+        with tempfile.TemporaryDirectory() as output_root:
+            targets = discover_targets(Path(output_root))
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                build_all(targets, cache=None, backend_name=backend_name)
+            timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare cold CLI builds against the in-process build backend"
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--backend", action="append", choices=list(BACKENDS), dest="backends"
+    )
+    args = parser.parse_args()
+
+    results = {
+        backend_name: bench_backend(backend_name, args.rounds)
+        for backend_name in args.backends or list(BACKENDS)
+    }
+
+    print(f"{'backend':<12}{'first (s)':>12}{'median (s)':>12}{'min (s)':>12}")
+    for backend_name, timings in results.items():
+        print(
+            f"{backend_name:<12}{timings[0]:>12.2f}"
+            f"{statistics.median(timings):>12.2f}{min(timings):>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+
+# Modules a plain `build` must never load; they belong to the deploy path.
+FORBIDDEN_MODULES = ("algokit_utils", "algosdk")
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def measure_import(module: str) -> tuple[int, set[str]]:
+    """Imports `module` in a fresh interpreter with -X importtime.
+
+    Returns the cumulative import time of `module` in microseconds and the names
+    of every module that was imported along the way.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode:
+        raise Exception(f"Could not import {module}:\n{result.stderr}")
+
+    cumulative_us = 0
+    imported: set[str] = set()
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        imported.add(name)
+        if name == module:
+            cumulative_us = int(match.group(2))
+    return cumulative_us, imported
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Check the import-time budget of `python -m smart_contracts`"
+    )
+    parser.add_argument("--module", default="smart_contracts.__main__")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=150.0,
+        help="Median import time allowed; about 1.5x the ~100 ms the import takes today",
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    timings = []
+    imported: set[str] = set()
+    for _ in range(args.rounds):
+        cumulative_us, imported = measure_import(args.module)
+        timings.append(cumulative_us / 1000)
+
+    median_ms = statistics.median(timings)
+    print(f"{args.module}: median {median_ms:.1f} ms, min {min(timings):.1f} ms "
+          f"over {args.rounds} runs (budget {args.budget_ms:.1f} ms)")
+
+    failures = []
+    leaked = sorted(
+        name
+        for name in imported
+        if any(name == forbidden or name.startswith(f"{forbidden}.") for forbidden in FORBIDDEN_MODULES)
+    )
+    if leaked:
+        failures.append(f"deploy-only modules imported at startup: {', '.join(leaked)}")
+    if median_ms > args.budget_ms:
+        failures.append(f"import time {median_ms:.1f} ms exceeds budget of {args.budget_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Operator CLI for CarbonX deployments.
+
+    python scripts/carbonx.py daemon start    # keep clients warm in the background
+    python scripts/carbonx.py asset-info 1008
+    python scripts/carbonx.py app-state carbon_marketplace
+    python scripts/carbonx.py stats carbon_marketplace retirement_manager
+    python scripts/carbonx.py events 41000000 41000010 --contract carbon_marketplace
+    python scripts/carbonx.py certificates --retiree ADDRESS
+    python scripts/carbonx.py create-asset cxg
+    python scripts/carbonx.py init-asset retirement_manager 755796756
+    python scripts/carbonx.py deploy [contract]
+    python scripts/carbonx.py export-frontend retirement_manager
+    python scripts/carbonx.py daemon stop
+
+Commands are sent to the daemon when one is running, so they skip the algokit_utils
+import, the .env load and the client setup; otherwise they run in this process.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from smart_contracts._helpers import daemon  # noqa: E402
+
+daemon_log = project_root / ".cache" / "carbonx-daemon.log"
+
+DAEMON_START_TIMEOUT_S = 30
+
+
+def _start_daemon() -> int:
+    if daemon.is_running():
+        print("carbonx daemon is already running")
+        return 0
+    daemon_log.parent.mkdir(parents=True, exist_ok=True)
+    with daemon_log.open("ab") as log:
+        process = subprocess.Popen(
+            [sys.executable, __file__, "daemon", "run"],
+            cwd=project_root,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT_S
+    while time.monotonic() < deadline:
+        if daemon.is_running():
+            print(f"carbonx daemon started (pid {process.pid}), logging to {daemon_log}")
+            return 0
+        if process.poll() is not None:
+            break
+        time.sleep(0.1)
+    print(f"carbonx daemon did not start, see {daemon_log}", file=sys.stderr)
+    return 1
+
+
+def _run_daemon() -> int:
+    from smart_contracts.__main__ import configure
+    from smart_contracts._helpers.operator import Operator
+
+    configure("deploy")
+    # Pay for the imports and client setup once, before the first request.
+    operator = Operator()
+    daemon.serve(operator.run)
+    return 0
+
+
+def _daemon(action: str) -> int:
+    match action:
+        case "start":
+            return _start_daemon()
+        case "run":
+            return _run_daemon()
+        case "stop":
+            response = daemon.request(daemon.STOP, [])
+            print(response[1] if response else "carbonx daemon is not running")
+            return 0
+        case "status":
+            print("running" if daemon.is_running() else "not running")
+            return 0
+    return 1
+
+
+def _run_in_process(command: str, args: list[str]) -> int:
+    from smart_contracts.__main__ import configure
+    from smart_contracts._helpers.operator import Operator
+
+    configure("deploy")
+    try:
+        print(Operator().run(command, args))
+    except Exception as e:
+        print(f"carbonx: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="carbonx", add_help=False)
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run the command in this process even if a daemon is running",
+    )
+    parser.add_argument("command")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    if not argv or {"-h", "--help"} & set(argv):
+        from smart_contracts._helpers.operator import parser as operator_parser
+
+        print(__doc__.strip(), end="\n\n")
+        operator_parser().print_help()
+        return 0
+    parsed = parser.parse_args(argv)
+
+    if parsed.command == "daemon":
+        if parsed.args not in (["start"], ["stop"], ["status"], ["run"]):
+            print("usage: carbonx daemon {start,stop,status,run}", file=sys.stderr)
+            return 2
+        return _daemon(parsed.args[0])
+
+    response = None if parsed.no_daemon else daemon.request(parsed.command, parsed.args)
+    if response is None:
+        return _run_in_process(parsed.command, parsed.args)
+    status, output, logs = response
+    for line in logs:
+        print(line, file=sys.stderr)
+    if status != "ok":
+        print(f"carbonx: {output}", file=sys.stderr)
+        return 1
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
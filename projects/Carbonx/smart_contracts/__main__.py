@@ -1,30 +1,43 @@
+import argparse
 import dataclasses
+import functools
 import importlib
 import logging
-import subprocess
+import os
 import sys
 from collections.abc import Callable
 from pathlib import Path
-from shutil import rmtree
+from typing import TYPE_CHECKING
+
+from smart_contracts._helpers import trace
+from smart_contracts._helpers.backends import (
+    BACKENDS,
+    CliBackend,
+    InProcessBackend,
+    get_backend,
+)
+from smart_contracts._helpers.build import (
+    BuildTarget,
+    build,
+    build_all,
+    build_pipelined,
+)
+from smart_contracts._helpers.build_cache import BuildCache
 
-from algokit_utils.config import config
-from dotenv import load_dotenv
+# Helpers that only some actions need are imported by those actions, keeping startup
+# within the budget checked by scripts/bench_import.py.
+if TYPE_CHECKING:
+    from algokit_utils import AlgorandClient
 
-# Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
-# Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
-# Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
-config.configure(debug=True, trace_all=False)
+    from smart_contracts._helpers.deploy_executor import DeployExecutor
+    from smart_contracts._helpers.deploy_graph import GraphNode
+    from smart_contracts._helpers.watch import WatchedContract
 
-# Set up logging and load environment variables.
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
-)
 logger = logging.getLogger(__name__)
-logger.info("Loading .env")
-load_dotenv()
 
 # Determine the root path based on this file's location.
 root_path = Path(__file__).parent
+build_cache_dir = root_path.parent / ".cache" / "build"
 
 # ----------------------- Contract Configuration ----------------------- #
 
@@ -33,7 +46,20 @@ root_path = Path(__file__).parent
 class SmartContract:
     path: Path
     name: str
-    deploy: Callable[[], None] | None = None
+
+    @functools.cached_property
+    def deploy(self) -> Callable[..., int] | None:
+        """The deploy function of the contract, imported on first use."""
+        return import_deploy_if_exists(self.path.parent)
+
+    @property
+    def graph_node(self) -> "GraphNode":
+        """The node of the contract in the deployment graph, empty if it is not listed."""
+        from smart_contracts._helpers.deploy_graph import GraphNode, load_graph
+
+        return load_graph().get(
+            f"apps.{self.name}", GraphNode("apps", self.name, params={}, references={})
+        )
 
 
 def import_contract(folder: Path) -> Path:
@@ -45,7 +71,7 @@ def import_contract(folder: Path) -> Path:
         raise Exception(f"Contract not found in {folder}")
 
 
-def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
+def import_deploy_if_exists(folder: Path) -> Callable[..., int] | None:
     """Imports the deploy function from a folder if it exists."""
     try:
         module_name = f"{folder.parent.name}.{folder.name}.deploy_config"
@@ -55,120 +81,186 @@ def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
         return None
 
 
+def reload_deploy(contract: SmartContract) -> None:
+    """Re-imports the deploy config and generated client of a contract after they change."""
+    folder = contract.path.parent
+    stale_prefixes = (
+        f"{folder.parent.name}.{folder.name}.deploy_config",
+        f"{folder.parent.name}.artifacts.{folder.name}.",
+    )
+    for module_name in [name for name in sys.modules if name.startswith(stale_prefixes)]:
+        del sys.modules[module_name]
+    contract.__dict__.pop("deploy", None)
+
+
+def deployment_waves(selected: list[SmartContract]) -> list[list["GraphNode"]]:
+    """
+    Groups the selected contracts and the assets they reference into waves: assets
+    first, then each contract after the contracts it references. Contracts within a wave
+    do not reference each other and are listed alphabetically.
+    """
+    from smart_contracts._helpers.deploy_graph import load_graph, waves
+
+    nodes = dict(load_graph())
+    for contract in selected:
+        nodes[contract.graph_node.key] = contract.graph_node
+    selected_keys = {contract.graph_node.key for contract in selected}
+    result = [
+        [nodes[key] for key in wave if nodes[key].kind == "assets" or key in selected_keys]
+        for wave in waves(nodes, selected_keys)
+    ]
+    result = [wave for wave in result if wave]
+    logger.debug(
+        "Deployment waves: " + " | ".join(", ".join(node.key for node in wave) for wave in result)
+    )
+    return result
+
+
+def _wave_contracts(waves: list[list["GraphNode"]]) -> list[SmartContract]:
+    """The contracts in `waves`, in deploy order."""
+    by_key = {contract.graph_node.key: contract for contract in contracts}
+    return [by_key[node.key] for wave in waves for node in wave if node.key in by_key]
+
+
 def has_contract_file(directory: Path) -> bool:
     """Checks whether the directory contains a contract.py file."""
     return (directory / "contract.py").exists()
 
 
 # Use the current directory (root_path) as the base for contract folders and exclude
-# folders that start with '_' (internal helpers).
+# folders that start with '_' (internal helpers). Only the filesystem is scanned here;
+# deploy configs (and with them algokit_utils) are imported when a deploy needs them.
 contracts: list[SmartContract] = [
-    SmartContract(
-        path=import_contract(folder),
-        name=folder.name,
-        deploy=import_deploy_if_exists(folder),
-    )
-    for folder in root_path.iterdir()
+    SmartContract(path=import_contract(folder), name=folder.name)
+    for folder in sorted(root_path.iterdir())
     if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
 ]
 
-# -------------------------- Build Logic -------------------------- #
-
-deployment_extension = "py"
+# --------------------------- Main Logic --------------------------- #
 
 
-def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
-    """Constructs the output path for the generated client file."""
-    return output_dir / Path(
-        "{contract_name}"
-        + ("_client" if deployment_extension == "py" else "Client")
-        + f".{deployment_extension}"
+def configure(action: str, deploy_on_change: bool = False) -> None:
+    """Sets up logging and the environment once the requested action is known."""
+    deploys = action in ("deploy", "all", "plan") or (action == "watch" and deploy_on_change)
+    logging.basicConfig(
+        level=logging.DEBUG if deploys else logging.INFO,
+        format="%(asctime)s %(levelname)-10s: %(message)s",
     )
+    if not deploys:
+        return
 
+    from algokit_utils.config import config
+    from dotenv import load_dotenv
+
+    # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
+    # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
+    # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
+    config.configure(debug=True, trace_all=False)
+
+    logger.info("Loading .env")
+    load_dotenv()
 
-def build(output_dir: Path, contract_path: Path) -> Path:
-    """
-    Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
-    """
-    output_dir = output_dir.resolve()
-    if output_dir.exists():
-        rmtree(output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
-    logger.info(f"Exporting {contract_path} to {output_dir}")
-
-    build_result = subprocess.run(
-        [
-            "algokit",
-            "--no-color",
-            "compile",
-            "python",
-            str(contract_path.resolve()),
-            f"--out-dir={output_dir}",
-            "--output-source-map",
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
 
-    if build_result.stdout:
-        print(build_result.stdout)
+def _targets_localnet() -> bool:
+    """Checks whether the environment points at a LocalNet algod (the default when unset)."""
+    server = os.getenv("ALGOD_SERVER", "http://localhost")
+    return any(host in server for host in ("localhost", "127.0.0.1"))
 
-    if build_result.returncode:
-        raise Exception(f"Could not build contract:\n{build_result.stdout}")
 
-    # Look for arc56.json files and generate the client based on them.
-    app_spec_file_names: list[str] = [
-        file.name for file in output_dir.glob("*.arc56.json")
+def _deploy_executors(
+    waves: list[list["GraphNode"]], networks: list[str] | None = None
+) -> list["DeployExecutor"]:
+    """
+    Creates an executor per network that can run the widest wave concurrently with one
+    client, or a single executor for the network configured in the environment.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from smart_contracts._helpers.deploy import network_deploy_args, shared_deploy_args
+    from smart_contracts._helpers.deploy_executor import DeployExecutor
+
+    max_workers = max(map(len, waves), default=1)
+    if not networks:
+        return [DeployExecutor(max_workers, **shared_deploy_args())]
+    # Clients and deployer accounts of the networks are set up side by side.
+    with ThreadPoolExecutor(max_workers=len(networks)) as pool:
+        deploy_args = list(pool.map(network_deploy_args, networks))
+    return [
+        DeployExecutor(max_workers, network, **args)
+        for network, args in zip(networks, deploy_args, strict=True)
     ]
 
-    client_file: str | None = None
-    if not app_spec_file_names:
-        logger.warning(
-            "No '*.arc56.json' file found (likely a logic signature being compiled). Skipping client generation."
-        )
-    else:
-        for file_name in app_spec_file_names:
-            client_file = file_name
-            print(file_name)
-            generate_result = subprocess.run(
-                [
-                    "algokit",
-                    "generate",
-                    "client",
-                    str(output_dir),
-                    "--output",
-                    str(_get_output_path(output_dir, deployment_extension)),
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
 
-            if generate_result.stdout:
-                print(generate_result.stdout)
+def _submit_assets(executor: "DeployExecutor", waves: list[list["GraphNode"]]) -> None:
+    """Starts creating (or looking up) every asset in `waves`."""
+    from smart_contracts._helpers.deploy_manifest import deploy_asset
 
-            if generate_result.returncode:
-                if "No such command" in generate_result.stdout:
-                    raise Exception(
-                        "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
-                    )
-                else:
-                    raise Exception(
-                        f"Could not generate typed client:\n{generate_result.stdout}"
-                    )
-    if client_file:
-        return output_dir / client_file
-    return output_dir
+    for wave in waves:
+        for node in wave:
+            if node.kind == "assets":
+                executor.submit(
+                    node.key,
+                    functools.partial(deploy_asset, name=node.name, params=node.params),
+                )
 
 
-# --------------------------- Main Logic --------------------------- #
+def _submit_deploys(
+    executor: "DeployExecutor", artifact_path: Path, ordered: list[SmartContract]
+) -> None:
+    """Starts the deploy of each contract once the nodes it references have finished."""
+    for contract in ordered:
+        output_dir = artifact_path / contract.name
+        app_spec_file_name = next(
+            (
+                file.name
+                for file in output_dir.iterdir()
+                if file.is_file() and file.suffixes == [".arc56", ".json"]
+            ),
+            None,
+        )
+        if app_spec_file_name is None:
+            raise Exception("Could not deploy app, .arc56.json file not found")
+        if contract.deploy:
+            node = contract.graph_node
+            executor.submit(
+                node.key, functools.partial(contract.deploy, **node.params), node.references
+            )
 
 
-def main(action: str, contract_name: str | None = None) -> None:
+def _resolve_assets(
+    algorand: "AlgorandClient", deployer_address: str, waves: list[list["GraphNode"]]
+) -> dict[str, int]:
+    """IDs of the assets in `waves` that already exist, without creating any."""
+    from smart_contracts._helpers.deploy_manifest import find_asset
+
+    resolved = {}
+    for wave in waves:
+        for node in wave:
+            if node.kind == "assets":
+                asset_id = find_asset(algorand, deployer_address, node.name, node.params)
+                if asset_id is not None:
+                    resolved[node.key] = asset_id
+    return resolved
+
+
+def main(
+    action: str,
+    contract_name: str | None = None,
+    *,
+    use_cache: bool = True,
+    jobs: int = 1,
+    backend_name: str | None = None,
+    deploy_on_change: bool = False,
+    budget: int | None = None,
+    policy: str = "size",
+    networks: list[str] | None = None,
+) -> None:
     """Main entry point to build and/or deploy smart contracts."""
     artifact_path = root_path / "artifacts"
+    # Watch keeps one interpreter alive, so it defaults to the warm in-process backend.
+    if backend_name is None:
+        backend_name = InProcessBackend.name if action == "watch" else CliBackend.name
+    cache = BuildCache(build_cache_dir) if use_cache else None
     # Filter contracts based on an optional specific contract name.
     filtered_contracts = [
         contract
@@ -176,42 +268,259 @@ def main(action: str, contract_name: str | None = None) -> None:
         if contract_name is None or contract.name == contract_name
     ]
 
+    if networks and action not in ("deploy", "all"):
+        raise Exception("--network only applies to deploy and all")
+
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            from smart_contracts._helpers.teal_report import check_budget
+
+            build_all(
+                [
+                    BuildTarget(contract.name, contract.path, artifact_path / contract.name)
+                    for contract in filtered_contracts
+                ],
+                cache,
+                jobs,
+                backend_name,
+            )
+            if budget is not None:
+                check_budget(
+                    (artifact_path / contract.name for contract in filtered_contracts),
+                    budget,
+                )
         case "deploy":
+            from smart_contracts._helpers.deploy_executor import wait_all
+
+            deploy_waves = deployment_waves(filtered_contracts)
+            executors = _deploy_executors(deploy_waves, networks)
+            try:
+                for executor in executors:
+                    _submit_assets(executor, deploy_waves)
+                    _submit_deploys(executor, artifact_path, _wave_contracts(deploy_waves))
+            finally:
+                wait_all(executors)
+        case "all":
+            from smart_contracts._helpers.deploy_executor import wait_all
+            from smart_contracts._helpers.teal_report import check_budget
+
+            # Builds run ahead in worker processes while assets and earlier contracts deploy.
+            deploy_waves = deployment_waves(filtered_contracts)
+            ordered = _wave_contracts(deploy_waves)
+            contracts_by_name = {contract.name: contract for contract in ordered}
+            executors = _deploy_executors(deploy_waves, networks)
+            try:
+                for executor in executors:
+                    _submit_assets(executor, deploy_waves)
+                for target in build_pipelined(
+                    [
+                        BuildTarget(contract.name, contract.path, artifact_path / contract.name)
+                        for contract in ordered
+                    ],
+                    cache,
+                    jobs,
+                    backend_name,
+                ):
+                    if budget is not None:
+                        check_budget([target.output_dir], budget)
+                    for executor in executors:
+                        _submit_deploys(
+                            executor, artifact_path, [contracts_by_name[target.name]]
+                        )
+            finally:
+                wait_all(executors)
+        case "plan":
+            from smart_contracts._helpers.deploy import shared_deploy_args
+            from smart_contracts._helpers.plan import plan_deployment
+
+            deploy_waves = deployment_waves(filtered_contracts)
+            app_spec_paths = []
+            for contract in _wave_contracts(deploy_waves):
+                app_spec_path = next((artifact_path / contract.name).glob("*.arc56.json"), None)
+                if app_spec_path is None:
+                    raise Exception("Could not plan deploy, .arc56.json file not found")
+                app_spec_paths.append(app_spec_path)
+            deploy_args = shared_deploy_args()
+            asset_ids = _resolve_assets(
+                deploy_args["algorand"], deploy_args["deployer"].address, deploy_waves
+            )
+            # Apps are only planned with init_asset if the asset they take already exists.
+            cxt_asset_id = next(
+                (
+                    asset_ids[reference]
+                    for contract in filtered_contracts
+                    for argument, reference in contract.graph_node.references.items()
+                    if argument == "cxt_asset_id" and reference in asset_ids
+                ),
+                0,
+            )
+            print(
+                plan_deployment(
+                    deploy_args["algorand"],
+                    deploy_args["deployer"].address,
+                    app_spec_paths,
+                    cxt_asset_id,
+                )
+            )
+        case "matrix":
+            from smart_contracts._helpers.opt_matrix import (
+                compile_levels,
+                format_matrix,
+                select_level,
+                write_matrix,
+            )
+            from smart_contracts._helpers.teal_report import check_budget
+
+            backend = get_backend(backend_name)
             for contract in filtered_contracts:
+                results = compile_levels(contract.path, backend)
+                selected = select_level(results, policy)
+                print(format_matrix(contract.name, results, selected, policy))
                 output_dir = artifact_path / contract.name
-                app_spec_file_name = next(
-                    (
-                        file.name
-                        for file in output_dir.iterdir()
-                        if file.is_file() and file.suffixes == [".arc56", ".json"]
-                    ),
-                    None,
+                build(output_dir, contract.path, cache, backend, selected.level)
+                write_matrix(output_dir, contract.name, results, selected, policy)
+                if budget is not None:
+                    check_budget([output_dir], budget)
+        case "watch":
+            from smart_contracts._helpers.teal_report import check_budget
+            from smart_contracts._helpers.watch import WatchedContract, watch_contracts
+
+            if deploy_on_change and not _targets_localnet():
+                raise Exception("Redeploying on change is only supported against LocalNet")
+            backend = get_backend(backend_name)
+            contracts_by_name = {contract.name: contract for contract in filtered_contracts}
+
+            def on_change(watched: WatchedContract, changed_files: set[Path]) -> None:
+                contract = contracts_by_name[watched.name]
+                if changed_files - {watched.deploy_config_path.resolve()}:
+                    logger.info(f"Rebuilding {contract.name}")
+                    with trace.span(f"build {contract.name}", "build"):
+                        build(artifact_path / contract.name, contract.path, cache, backend)
+                    if budget is not None:
+                        check_budget([artifact_path / contract.name], budget)
+                if deploy_on_change:
+                    reload_deploy(contract)
+                    logger.info(f"Redeploying {contract.name} to LocalNet")
+                    deploy_waves = deployment_waves([contract])
+                    [executor] = _deploy_executors(deploy_waves)
+                    try:
+                        _submit_assets(executor, deploy_waves)
+                        _submit_deploys(executor, artifact_path, [contract])
+                    finally:
+                        executor.wait()
+
+            try:
+                watch_contracts(
+                    [
+                        WatchedContract(
+                            contract.name,
+                            contract.path,
+                            contract.path.parent / "deploy_config.py",
+                        )
+                        for contract in filtered_contracts
+                    ],
+                    root_path.parent,
+                    on_change,
                 )
-                if app_spec_file_name is None:
-                    raise Exception("Could not deploy app, .arc56.json file not found")
-                if contract.deploy:
-                    logger.info(f"Deploying app {contract.name}")
-                    contract.deploy()
-        case "all":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
-                if contract.deploy:
-                    logger.info(f"Deploying {contract.name}")
-                    contract.deploy()
+            except KeyboardInterrupt:
+                logger.info("Stopped watching")
         case _:
             logger.error(f"Unknown action: {action}")
 
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    from smart_contracts._helpers.opt_matrix import POLICIES
+    from smart_contracts._helpers.teal_report import APP_CALL_BUDGET
+
+    parser = argparse.ArgumentParser(prog="python -m smart_contracts")
+    parser.add_argument("action", nargs="?", default="all")
+    parser.add_argument("contract_name", nargs="?", default=None)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always recompile instead of restoring artifacts from {build_cache_dir}",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count() or 1,
+        default=1,
+        help="Build contracts in N worker processes (defaults to the CPU count if N is omitted)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=list(BACKENDS),
+        default=None,
+        help=(
+            "Compile via the algokit CLI, or run puyapy and the client generator in-process"
+            f" (default: {CliBackend.name}, or {InProcessBackend.name} for watch)"
+        ),
+    )
+    parser.add_argument(
+        "--deploy",
+        action="store_true",
+        help="With watch, redeploy each rebuilt contract to LocalNet",
+    )
+    parser.add_argument(
+        "--policy",
+        choices=list(POLICIES),
+        default="size",
+        help=(
+            "With matrix, keep the optimization level with the smallest program (size)"
+            " or the cheapest most expensive method (cost)"
+        ),
+    )
+    parser.add_argument(
+        "--network",
+        dest="networks",
+        action="append",
+        default=None,
+        metavar="NAME",
+        help=(
+            "With deploy or all, deploy to NAME (localnet, testnet, mainnet, or a network"
+            " configured in .env.NAME); repeat to deploy to several networks concurrently"
+        ),
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Write build and deploy timings to PATH as a Chrome/Perfetto trace",
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        metavar="OPCODES",
+        help=(
+            "Fail the build if the static worst-case cost of any ABI method exceeds OPCODES"
+            f" (a single app call has {APP_CALL_BUDGET})"
+        ),
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
+    args = parse_args()
+    configure(args.action, args.deploy)
+    if args.trace is not None:
+        trace.enable()
+    try:
+        with trace.span(f"main {args.action}", "main"):
+            main(
+                args.action,
+                args.contract_name,
+                use_cache=not args.no_cache,
+                jobs=args.jobs,
+                backend_name=args.backend,
+                deploy_on_change=args.deploy,
+                budget=args.budget,
+                policy=args.policy,
+                networks=list(dict.fromkeys(args.networks)) if args.networks else None,
+            )
+    finally:
+        if args.trace is not None:
+            trace.write(args.trace)
@@ -0,0 +1,319 @@
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import io
+import json
+import logging
+import re
+import subprocess
+import types
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class BuildBackend(Protocol):
+    """Compiles contracts and generates typed clients for them."""
+
+    name: str
+
+    def compile(self, contract_path: Path, output_dir: Path, flags: Sequence[str]) -> str:
+        """Compiles `contract_path` into `output_dir` and returns the compiler output."""
+        ...
+
+    def generate_client(self, app_spec_path: Path, output_path: Path) -> str:
+        """Generates a typed client for `app_spec_path` and returns the generator output.
+
+        `output_path` may contain a `{contract_name}` placeholder.
+        """
+        ...
+
+
+class CliBackend:
+    """Shells out to the `algokit` CLI for every compile and client generation."""
+
+    name = "cli"
+
+    def compile(self, contract_path: Path, output_dir: Path, flags: Sequence[str]) -> str:
+        build_result = subprocess.run(
+            [
+                "algokit",
+                "--no-color",
+                "compile",
+                "python",
+                str(contract_path.resolve()),
+                f"--out-dir={output_dir}",
+                *flags,
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        if build_result.returncode:
+            raise Exception(f"Could not build contract:\n{build_result.stdout}")
+        return build_result.stdout
+
+    def generate_client(self, app_spec_path: Path, output_path: Path) -> str:
+        generate_result = subprocess.run(
+            [
+                "algokit",
+                "generate",
+                "client",
+                str(app_spec_path),
+                "--output",
+                str(output_path),
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        if generate_result.returncode:
+            if "No such command" in generate_result.stdout:
+                raise Exception(
+                    "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
+                )
+            raise Exception(f"Could not generate typed client:\n{generate_result.stdout}")
+        return generate_result.stdout
+
+
+def snake_case(name: str) -> str:
+    """Converts a contract name like `CarbonMarketplace` to `carbon_marketplace`."""
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    return re.sub(r"([a-z\d])([A-Z])", r"\1_\2", name).replace("-", "_").lower()
+
+
+def _puyapy_options(flags: Sequence[str]) -> dict[str, Any]:
+    """Translates `algokit compile python` flags into PuyaPyOptions keyword arguments."""
+    options: dict[str, Any] = {"output_teal": True, "output_arc56": True}
+    for flag in flags:
+        if match := re.fullmatch(r"-O(\d)", flag):
+            options["optimization_level"] = int(match.group(1))
+            continue
+        if not flag.startswith("--"):
+            raise ValueError(f"Unsupported compile flag for the in-process backend: {flag}")
+        name, _, value = flag[2:].partition("=")
+        key = name.replace("-", "_")
+        if not value:
+            if key.startswith("no_"):
+                options[key[3:]] = False
+            else:
+                options[key] = True
+        else:
+            options[key] = int(value) if value.isdigit() else value
+    return options
+
+
+@dataclasses.dataclass
+class _ParsedContract:
+    """The AWST puyapy built for a contract, and what it was built from."""
+
+    # Options with every backend-only setting (outputs, optimization) reset.
+    frontend_options: Any
+    # sha256 of each user module the AWST was built from.
+    source_hashes: dict[Path, str]
+    parse_result: Any
+    awst: Any
+    targets: Any
+
+
+def _source_hashes(paths: Sequence[Path]) -> dict[Path, str] | None:
+    try:
+        return {path: hashlib.sha256(path.read_bytes()).hexdigest() for path in paths}
+    except OSError:
+        return None
+
+
+class InProcessBackend:
+    """
+    Runs puyapy and the client generator as libraries inside the current interpreter.
+
+    The compiler and generator modules are imported once and reused for every
+    contract built by this process, so only the first contract pays their import cost.
+    The parsed and type-checked sources (AWST) of each contract are kept as well, per
+    contract: rebuilding the same contract with only different optimization or output
+    flags, e.g. at each level of the matrix or on a `watch` rebuild, goes straight to
+    code generation. Other contracts are parsed separately, and the AWST is rebuilt
+    once any user module it was built from changes.
+
+    This drives puyapy's compile steps directly, so it relies on puyapy internals;
+    pyproject.toml pins puyapy to the release range it was written against.
+    """
+
+    name = "inprocess"
+
+    def __init__(self) -> None:
+        self._parsed: dict[Path, _ParsedContract] = {}
+
+    @functools.cached_property
+    def _puyapy(self) -> Any:
+        import attrs
+        import mypy.errors
+        from puya import log
+        from puya.compile import awst_to_teal
+        from puya.errors import PuyaExitError, log_exceptions
+        from puyapy.awst_build.main import transform_ast
+        from puyapy.compile import determine_out_dir, output_inputs
+        from puyapy.options import PuyaPyOptions
+        from puyapy.parse import parse_python
+
+        # Same default as the CLI; unset, puya logs every debug line. Loggers are not
+        # cached, so each compile writes to the stdout it redirects.
+        log.configure_logging(
+            min_log_level=log.LogLevel.info, cache_logger=False, reconfigure_stdio=False
+        )
+        return types.SimpleNamespace(
+            attrs=attrs,
+            CompileError=mypy.errors.CompileError,
+            log=log,
+            awst_to_teal=awst_to_teal,
+            PuyaExitError=PuyaExitError,
+            log_exceptions=log_exceptions,
+            transform_ast=transform_ast,
+            determine_out_dir=determine_out_dir,
+            output_inputs=output_inputs,
+            PuyaPyOptions=PuyaPyOptions,
+            parse_python=parse_python,
+        )
+
+    @functools.cached_property
+    def _client_generator(self) -> Any:
+        from algokit_client_generator import generate_client
+
+        return generate_client
+
+    def _frontend_options(self, options: Any) -> Any:
+        """`options` without the settings that only affect code generation."""
+        backend_only = {
+            field.name: field.default
+            for field in self._puyapy.attrs.fields(type(options))
+            if field.name.startswith("output_")
+            or field.name in ("out_dir", "optimization_level", "debug_level")
+        }
+        return self._puyapy.attrs.evolve(options, **backend_only)
+
+    def _parse(self, contract_path: Path, options: Any, log_ctx: Any) -> _ParsedContract:
+        """The AWST of `contract_path`, reused while its sources and front-end options match."""
+        puyapy = self._puyapy
+        frontend_options = self._frontend_options(options)
+        parsed = self._parsed.get(contract_path)
+        if (
+            parsed is not None
+            and parsed.frontend_options == frontend_options
+            and _source_hashes(list(parsed.source_hashes)) == parsed.source_hashes
+        ):
+            logger.debug(f"Reusing the parsed sources of {contract_path}")
+            log_ctx.sources_by_path = parsed.parse_result.sources_by_path
+            return parsed
+
+        self._parsed.pop(contract_path, None)
+        parse_result = puyapy.parse_python([contract_path], package_search_paths="infer")
+        log_ctx.sources_by_path = parse_result.sources_by_path
+        log_ctx.exit_if_errors()
+        try:
+            awst, targets = puyapy.transform_ast(parse_result, options)
+        except puyapy.CompileError as err:
+            # Already reported by mypy; logged so exit_if_errors below stops the build.
+            puyapy.log.get_logger(__name__).error(err)
+        log_ctx.exit_if_errors()
+        user_modules = [
+            module.path
+            for module in parse_result.ordered_modules.values()
+            if not module.node.is_stub
+        ]
+        parsed = _ParsedContract(
+            frontend_options,
+            _source_hashes(user_modules) or {},
+            parse_result,
+            awst,
+            targets,
+        )
+        # Only cache what could be fingerprinted, so a stale AWST is never reused.
+        if parsed.source_hashes:
+            self._parsed[contract_path] = parsed
+        return parsed
+
+    def _compile_to_teal(self, contract_path: Path, options: Any) -> None:
+        """puyapy's compile_to_teal, with the parse and AST build cached per contract."""
+        puyapy = self._puyapy
+        with (
+            puyapy.log.logging_context(
+                treat_warnings_as_errors=options.treat_warnings_as_errors
+            ) as log_ctx,
+            puyapy.log_exceptions(),
+        ):
+            parsed = self._parse(contract_path, options, log_ctx)
+            puyapy.output_inputs(parsed.awst, parsed.parse_result, options)
+            awst_lookup = {node.id: node for node in parsed.awst}
+            compilation_set = {
+                target: puyapy.determine_out_dir(location.file.parent, options)
+                for target, location in (
+                    (target, awst_lookup[target].source_location) for target in parsed.targets
+                )
+                if location.file
+            }
+            puyapy.awst_to_teal(
+                log_ctx,
+                options,
+                compilation_set,
+                parsed.parse_result.sources_by_path,
+                parsed.awst,
+            )
+            log_ctx.exit_if_errors()
+        log_ctx.exit_if_errors()
+
+    def compile(self, contract_path: Path, output_dir: Path, flags: Sequence[str]) -> str:
+        puyapy = self._puyapy
+        contract_path = contract_path.resolve()
+        options = puyapy.PuyaPyOptions(
+            paths=[contract_path],
+            out_dir=output_dir,
+            **_puyapy_options(flags),
+        )
+        buffer = io.StringIO()
+        puya_logger = logging.getLogger("puya")
+        handler = logging.StreamHandler(buffer)
+        puya_logger.addHandler(handler)
+        try:
+            with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+                self._compile_to_teal(contract_path, options)
+        except puyapy.PuyaExitError:
+            # Raised once puyapy has logged the compilation errors.
+            self._parsed.pop(contract_path, None)
+            raise Exception(f"Could not build contract:\n{buffer.getvalue()}") from None
+        finally:
+            puya_logger.removeHandler(handler)
+        return buffer.getvalue()
+
+    def generate_client(self, app_spec_path: Path, output_path: Path) -> str:
+        generate_client = self._client_generator
+        app_spec = json.loads(app_spec_path.read_text())
+        resolved_output = Path(
+            str(output_path).replace("{contract_name}", snake_case(app_spec["name"]))
+        )
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+                generate_client(app_spec_path, resolved_output)
+        except Exception as ex:
+            raise Exception(f"Could not generate typed client:\n{buffer.getvalue()}{ex}") from ex
+        return buffer.getvalue()
+
+
+BACKENDS: dict[str, type[CliBackend] | type[InProcessBackend]] = {
+    CliBackend.name: CliBackend,
+    InProcessBackend.name: InProcessBackend,
+}
+
+
+@functools.cache
+def get_backend(name: str) -> BuildBackend:
+    """Returns the process-wide backend instance for `name`, so warm state is shared."""
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown build backend {name!r}, expected one of: {', '.join(BACKENDS)}"
+        ) from None
@@ -0,0 +1,321 @@
+import contextlib
+import dataclasses
+import io
+import json
+import logging
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from shutil import rmtree
+
+from smart_contracts._helpers.backends import (
+    BuildBackend,
+    CliBackend,
+    get_backend,
+    snake_case,
+)
+from smart_contracts._helpers.build_cache import (
+    BuildCache,
+    cache_key,
+    client_stamp,
+    read_client_stamp,
+    stamp_client,
+)
+from smart_contracts._helpers import trace
+from smart_contracts._helpers.teal_report import write_reports
+
+logger = logging.getLogger(__name__)
+
+# The project root contains the `smart_contracts` package.
+project_root = Path(__file__).parent.parent.parent
+
+deployment_extension = "py"
+compile_flags = ["--output-source-map"]
+
+# Written by the matrix next to a contract's artifacts; records the level it selected.
+matrix_suffix = ".optimization_matrix.json"
+
+
+def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
+    """Constructs the output path for the generated client file."""
+    return output_dir / Path(
+        "{contract_name}"
+        + ("_client" if deployment_extension == "py" else "Client")
+        + f".{deployment_extension}"
+    )
+
+
+def _resolve_client_path(output_path: Path, app_spec_path: Path) -> Path:
+    """Substitutes the contract name into a client output path, as `algokit generate client` does."""
+    contract_name = json.loads(app_spec_path.read_text())["name"]
+    if deployment_extension == "py":
+        contract_name = snake_case(contract_name)
+    return Path(str(output_path).replace("{contract_name}", contract_name))
+
+
+def _get_app_spec_path(output_dir: Path) -> Path:
+    """Returns the path of the app spec the client was generated from, or the output dir."""
+    app_spec_file = next(output_dir.glob("*.arc56.json"), None)
+    return app_spec_file if app_spec_file else output_dir
+
+
+def _selected_level(matrices: dict[Path, str]) -> int | None:
+    """The optimization level the matrix selected for a contract, if it was run."""
+    for path, matrix in matrices.items():
+        try:
+            return int(json.loads(matrix)["selected_level"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring {path.name}, it does not record a selected level")
+    return None
+
+
+def _write_files(files: dict[Path, str]) -> None:
+    for path, content in files.items():
+        path.write_text(content)
+
+
+def build(
+    output_dir: Path,
+    contract_path: Path,
+    cache: BuildCache | None = None,
+    backend: BuildBackend | None = None,
+    optimization_level: int | None = None,
+) -> Path:
+    """
+    Builds the contract by exporting (compiling) its source and generating a client.
+    If the output directory already exists, it is cleared.
+    When a cache is given, artifacts are restored from it if the contract sources,
+    tool versions and compile flags are unchanged since a previous build.
+    The backend defaults to shelling out to the `algokit` CLI, and the
+    optimization level to the one the matrix selected for the contract (kept in
+    `<name>.optimization_matrix.json` across rebuilds), or else the compiler's default.
+    A previously generated client is kept, instead of being regenerated, when the
+    app spec it was generated from is byte-identical to the freshly compiled one and
+    it came from the installed version of the client generator.
+    """
+    backend = backend or get_backend(CliBackend.name)
+    output_dir = output_dir.resolve()
+    previous_clients: dict[Path, str] = {}
+    matrices: dict[Path, str] = {}
+    if output_dir.exists():
+        client_glob = _get_output_path(output_dir, deployment_extension).name.replace(
+            "{contract_name}", "*"
+        )
+        previous_clients = {
+            client_path: client_path.read_text()
+            for client_path in output_dir.glob(client_glob)
+        }
+        matrices = {path: path.read_text() for path in output_dir.glob(f"*{matrix_suffix}")}
+        rmtree(output_dir)
+    output_dir.mkdir(exist_ok=True, parents=True)
+
+    if optimization_level is None:
+        optimization_level = _selected_level(matrices)
+        if optimization_level is not None:
+            logger.info(
+                f"Building {output_dir.name} at -O{optimization_level}, as selected by matrix"
+            )
+    flags = list(compile_flags)
+    if optimization_level is not None:
+        flags.append(f"-O{optimization_level}")
+
+    key: str | None = None
+    if cache is not None:
+        # The backends format compiler output differently, so their artifacts are not shared.
+        key = cache_key(
+            contract_path, project_root, [*flags, deployment_extension, f"backend={backend.name}"]
+        )
+        with trace.span("restore from cache", "build", contract=output_dir.name):
+            restored = cache.restore(key, output_dir)
+        if restored:
+            write_reports(output_dir)
+            _write_files(matrices)
+            return _get_app_spec_path(output_dir)
+
+    logger.info(f"Exporting {contract_path} to {output_dir} ({backend.name} backend)")
+
+    with trace.span("compile", "build", contract=output_dir.name, backend=backend.name):
+        build_output = backend.compile(contract_path, output_dir, flags)
+    if build_output:
+        print(build_output)
+
+    # Look for arc56.json files and generate the client based on them.
+    app_spec_file_names: list[str] = [
+        file.name for file in output_dir.glob("*.arc56.json")
+    ]
+
+    client_file: str | None = None
+    if not app_spec_file_names:
+        logger.warning(
+            "No '*.arc56.json' file found (likely a logic signature being compiled). Skipping client generation."
+        )
+    else:
+        for file_name in app_spec_file_names:
+            client_file = file_name
+            print(file_name)
+            app_spec_path = output_dir / file_name
+            stamp = client_stamp(app_spec_path)
+            client_path = _resolve_client_path(
+                _get_output_path(output_dir, deployment_extension), app_spec_path
+            )
+            previous_client = previous_clients.get(client_path)
+            if (
+                previous_client is not None
+                and read_client_stamp(previous_client, deployment_extension) == stamp
+            ):
+                logger.info(f"{file_name} is unchanged, keeping {client_path.name}")
+                client_path.write_text(previous_client)
+                continue
+
+            with trace.span("generate client", "build", contract=output_dir.name):
+                generate_output = backend.generate_client(app_spec_path, client_path)
+            if generate_output:
+                print(generate_output)
+            stamp_client(client_path, stamp, deployment_extension)
+
+    # Static cost and size report for each approval program, stored with the artifacts.
+    with trace.span("cost report", "build", contract=output_dir.name):
+        write_reports(output_dir)
+
+    if cache is not None and key is not None:
+        cache.store(key, output_dir)
+    # Written after storing, so cache entries only hold what the compiler produced.
+    _write_files(matrices)
+
+    if client_file:
+        return output_dir / client_file
+    return output_dir
+
+
+# ----------------------- Parallel Build Logic ----------------------- #
+
+
+@dataclasses.dataclass
+class BuildTarget:
+    name: str
+    contract_path: Path
+    output_dir: Path
+
+
+@dataclasses.dataclass
+class BuildOutcome:
+    name: str
+    output: str
+    error: str | None = None
+    trace_events: list[dict] = dataclasses.field(default_factory=list)
+
+
+def _build_buffered(
+    target: BuildTarget, cache_dir: Path | None, backend_name: str, tracing: bool
+) -> BuildOutcome:
+    """Builds a single target in a worker, capturing its prints, log records and trace spans."""
+    if tracing:
+        trace.enable()
+    buffer = io.StringIO()
+    root_logger = logging.getLogger()
+    handler = logging.StreamHandler(buffer)
+    if root_logger.handlers and root_logger.handlers[0].formatter:
+        handler.setFormatter(root_logger.handlers[0].formatter)
+    saved_handlers = root_logger.handlers[:]
+    root_logger.handlers = [handler]
+    try:
+        with contextlib.redirect_stdout(buffer):
+            logger.info(f"Building app at {target.contract_path}")
+            cache = BuildCache(cache_dir) if cache_dir is not None else None
+            with trace.span(f"build {target.name}", "build"):
+                build(
+                    target.output_dir, target.contract_path, cache, get_backend(backend_name)
+                )
+    except Exception as e:
+        return BuildOutcome(target.name, buffer.getvalue(), str(e), trace.collect())
+    finally:
+        root_logger.handlers = saved_handlers
+    return BuildOutcome(target.name, buffer.getvalue(), trace_events=trace.collect())
+
+
+def build_all(
+    targets: Sequence[BuildTarget],
+    cache: BuildCache | None = None,
+    jobs: int = 1,
+    backend_name: str = CliBackend.name,
+) -> None:
+    """
+    Builds every target, using a pool of `jobs` worker processes when jobs > 1.
+    Output from parallel builds is buffered per contract and printed in the order
+    of `targets`, so logs read the same as a serial build.
+    Each process keeps a single backend instance, so an in-process compiler stays
+    warm across all the contracts that process builds.
+    """
+    if jobs <= 1 or len(targets) <= 1:
+        backend = get_backend(backend_name)
+        for target in targets:
+            logger.info(f"Building app at {target.contract_path}")
+            with trace.span(f"build {target.name}", "build"):
+                build(target.output_dir, target.contract_path, cache, backend)
+        return
+
+    # Imported here as it pulls in multiprocessing, which serial builds never need.
+    from concurrent.futures import ProcessPoolExecutor
+
+    cache_dir = cache.cache_dir if cache is not None else None
+    workers = min(jobs, len(targets))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_build_buffered, target, cache_dir, backend_name, trace.is_enabled())
+            for target in targets
+        ]
+        outcomes = [future.result() for future in futures]
+
+    failed: list[BuildOutcome] = []
+    for outcome in outcomes:
+        print(outcome.output, end="")
+        trace.extend(outcome.trace_events)
+        if outcome.error is not None:
+            failed.append(outcome)
+    if failed:
+        details = "\n".join(f"{outcome.name}: {outcome.error}" for outcome in failed)
+        raise Exception(f"Could not build {len(failed)} contract(s):\n{details}")
+
+
+def build_pipelined(
+    targets: Sequence[BuildTarget],
+    cache: BuildCache | None = None,
+    jobs: int = 1,
+    backend_name: str = CliBackend.name,
+) -> Iterator[BuildTarget]:
+    """
+    Builds the targets in background worker processes and yields each one, in
+    order, as soon as its build has finished. Later targets keep compiling while
+    the caller works on the ones already yielded, e.g. waits for a deploy to confirm.
+    Raises as soon as the next target in order fails to build.
+    """
+    if len(targets) <= 1:
+        backend = get_backend(backend_name)
+        for target in targets:
+            logger.info(f"Building app at {target.contract_path}")
+            with trace.span(f"build {target.name}", "build"):
+                build(target.output_dir, target.contract_path, cache, backend)
+            yield target
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    cache_dir = cache.cache_dir if cache is not None else None
+    # At least one worker, so the first build overlaps with the caller even when jobs=1.
+    workers = max(1, min(jobs, len(targets)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_build_buffered, target, cache_dir, backend_name, trace.is_enabled())
+            for target in targets
+        ]
+        try:
+            for target, future in zip(targets, futures, strict=True):
+                with trace.span(f"wait for build {target.name}", "build"):
+                    outcome = future.result()
+                print(outcome.output, end="")
+                trace.extend(outcome.trace_events)
+                if outcome.error is not None:
+                    raise Exception(f"Could not build {outcome.name}: {outcome.error}")
+                yield target
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,198 @@
+import ast
+import functools
+import hashlib
+import logging
+import shutil
+import subprocess
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the layout of a cache entry or the key derivation changes.
+CACHE_VERSION = "1"
+
+
+@functools.cache
+def tool_versions() -> dict[str, str]:
+    """Returns the versions of the tools whose output ends up in the artifacts."""
+    import importlib.metadata
+
+    versions: dict[str, str] = {}
+    for package in ("puyapy", "algorand-python", "algokit-client-generator"):
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = "unknown"
+
+    try:
+        result = subprocess.run(
+            ["algokit", "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        versions["algokit"] = result.stdout.strip()
+    except OSError:
+        versions["algokit"] = "unknown"
+    return versions
+
+
+def _module_file(module: str, project_root: Path) -> Path | None:
+    """Maps a dotted module name to a source file inside the project, if any."""
+    base = project_root.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _direct_imports(source_file: Path, project_root: Path) -> Iterable[Path]:
+    """Yields the project-local files imported by `source_file`."""
+    tree = ast.parse(source_file.read_bytes(), filename=str(source_file))
+    package = source_file.parent.relative_to(project_root).parts
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                anchor = package[: len(package) - node.level + 1]
+                prefix = ".".join(anchor)
+                base = f"{prefix}.{node.module}" if node.module else prefix
+            else:
+                base = node.module or ""
+            # `from x import y` may refer to a submodule `x.y` as well as a name in `x`.
+            modules = [base] + [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+
+        for module in modules:
+            if module and (path := _module_file(module, project_root)):
+                yield path
+
+
+def local_dependencies(contract_path: Path, project_root: Path) -> list[Path]:
+    """Returns the contract source and every project-local module it imports, transitively."""
+    contract_path = contract_path.resolve()
+    project_root = project_root.resolve()
+    seen: set[Path] = set()
+    pending = [contract_path]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        pending.extend(_direct_imports(current, project_root))
+    return sorted(seen)
+
+
+def cache_key(
+    contract_path: Path, project_root: Path, flags: Sequence[str]
+) -> str:
+    """Computes a content hash over everything that influences the build output."""
+    project_root = project_root.resolve()
+    digest = hashlib.sha256()
+    digest.update(f"cache-version={CACHE_VERSION}\n".encode())
+    for name, version in sorted(tool_versions().items()):
+        digest.update(f"{name}={version}\n".encode())
+    for flag in flags:
+        digest.update(f"flag={flag}\n".encode())
+    # The relative path ends up in the TEAL comments and source maps.
+    digest.update(
+        f"contract={contract_path.resolve().relative_to(project_root).as_posix()}\n".encode()
+    )
+    for source in local_dependencies(contract_path, project_root):
+        digest.update(f"source={source.relative_to(project_root).as_posix()}\n".encode())
+        digest.update(hashlib.sha256(source.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """Content-addressed store of build outputs, one directory per cache key."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def restore(self, key: str, output_dir: Path) -> bool:
+        """Copies the cached artifacts for `key` into `output_dir`. Returns False on a miss."""
+        entry = self._entry(key)
+        if not entry.is_dir():
+            return False
+        output_dir.mkdir(exist_ok=True, parents=True)
+        for artifact in entry.iterdir():
+            shutil.copy2(artifact, output_dir / artifact.name)
+        logger.info(f"Restored {output_dir.name} from build cache ({key[:12]})")
+        return True
+
+    def store(self, key: str, output_dir: Path) -> None:
+        """Saves the artifacts in `output_dir` under `key`."""
+        entry = self._entry(key)
+        if entry.is_dir():
+            return
+        staging = entry.with_name(f"{entry.name}.tmp")
+        if staging.exists():
+            shutil.rmtree(staging)
+        staging.mkdir(parents=True)
+        for artifact in output_dir.iterdir():
+            if artifact.is_file():
+                shutil.copy2(artifact, staging / artifact.name)
+        try:
+            staging.rename(entry)
+        except OSError:
+            # Another build stored the same key first; both copies are identical.
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+# ------------------------ Client Generation Cache ------------------------ #
+
+# Comments recording what a client was generated from: the sha256 of its app spec and
+# the version of the client generator, so upgrading the generator regenerates it too.
+_CLIENT_STAMP_COMMENTS = {"py": "# ", "ts": "// "}
+_CLIENT_STAMP_FIELDS = ("arc56-sha256", "algokit-client-generator")
+
+
+def file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def client_stamp(app_spec_path: Path) -> dict[str, str]:
+    """The stamp of a client generated from `app_spec_path` with the installed generator."""
+    return {
+        "arc56-sha256": file_sha256(app_spec_path),
+        "algokit-client-generator": tool_versions().get("algokit-client-generator", "unknown"),
+    }
+
+
+def read_client_stamp(client_source: str, extension: str) -> dict[str, str]:
+    """Returns the stamp in the leading comments of a generated client, empty if unstamped."""
+    comment = _CLIENT_STAMP_COMMENTS.get(extension)
+    stamp: dict[str, str] = {}
+    if comment is None:
+        return stamp
+    for line in client_source.splitlines():
+        if not line.startswith(comment.rstrip()):
+            break
+        field, separator, value = line[len(comment) :].partition(": ")
+        if separator and field in _CLIENT_STAMP_FIELDS:
+            stamp[field] = value.strip()
+    return stamp
+
+
+def stamp_client(client_path: Path, stamp: dict[str, str], extension: str) -> None:
+    """Records `stamp` at the end of the leading comment block of a generated client."""
+    comment = _CLIENT_STAMP_COMMENTS.get(extension)
+    if comment is None:
+        return
+    lines = client_path.read_text().splitlines(keepends=True)
+    header_end = next(
+        (index for index, line in enumerate(lines) if not line.startswith(comment.rstrip())),
+        len(lines),
+    )
+    lines[header_end:header_end] = [
+        f"{comment}{field}: {value}\n" for field, value in stamp.items()
+    ]
+    client_path.write_text("".join(lines))
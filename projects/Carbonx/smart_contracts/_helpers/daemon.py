@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+import secrets
+import socket
+from collections.abc import Callable, Sequence
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Address and auth key of the running daemon; only readable by the user who started it.
+daemon_file = Path(__file__).parent.parent.parent / ".cache" / "carbonx-daemon.json"
+
+STOP = "stop"
+
+
+class _CaptureLogs(logging.Handler):
+    """Collects the log lines of one request, to be printed by the client that sent it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.setFormatter(logging.Formatter("%(levelname)-10s: %(message)s"))
+        self.lines: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+
+
+def _no_delay(connection: Any) -> None:
+    # Requests and replies are single small writes; without this, Nagle's algorithm and
+    # delayed ACKs hold each reply back for ~40 ms.
+    with socket.socket(fileno=os.dup(connection.fileno())) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def serve(handle: Callable[[str, Sequence[str]], str]) -> None:
+    """
+    Answers requests from `request` until it is asked to stop. Each request is a
+    command and its arguments; `handle` runs it and returns its output, which is sent
+    back with the log lines it emitted. Requests are handled one at a time.
+    """
+    authkey = secrets.token_bytes(32)
+    with Listener(("127.0.0.1", 0), authkey=authkey) as listener:
+        host, port = listener.address
+        daemon_file.parent.mkdir(parents=True, exist_ok=True)
+        descriptor = os.open(daemon_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w") as file:
+            json.dump(
+                {"host": host, "port": port, "authkey": authkey.hex(), "pid": os.getpid()}, file
+            )
+        logger.info(f"carbonx daemon listening on {host}:{port}")
+        try:
+            while True:
+                try:
+                    connection = listener.accept()
+                except Exception as e:
+                    # A client that failed authentication, or hung up early.
+                    logger.warning(f"Rejected connection: {e}")
+                    continue
+                with connection:
+                    _no_delay(connection)
+                    try:
+                        command, args = connection.recv()
+                    except EOFError:
+                        # `is_running` only checks that it can connect.
+                        continue
+                    if command == STOP:
+                        connection.send(("ok", "carbonx daemon stopped", []))
+                        return
+                    capture = _CaptureLogs()
+                    logging.getLogger().addHandler(capture)
+                    try:
+                        connection.send(("ok", handle(command, args), capture.lines))
+                    except Exception as e:
+                        # The traceback goes to the daemon log, the client gets the message.
+                        logging.getLogger().removeHandler(capture)
+                        logger.exception(f"{command} failed")
+                        connection.send(("error", str(e), capture.lines))
+                    finally:
+                        logging.getLogger().removeHandler(capture)
+        finally:
+            daemon_file.unlink(missing_ok=True)
+
+
+def _connect() -> Any:
+    try:
+        details = json.loads(daemon_file.read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+    try:
+        return Client(
+            (details["host"], details["port"]), authkey=bytes.fromhex(details["authkey"])
+        )
+    except (ConnectionRefusedError, OSError):
+        # Left behind by a daemon that was killed.
+        daemon_file.unlink(missing_ok=True)
+        return None
+
+
+def is_running() -> bool:
+    connection = _connect()
+    if connection is None:
+        return False
+    connection.close()
+    return True
+
+
+def request(command: str, args: Sequence[str]) -> tuple[str, str, list[str]] | None:
+    """
+    Runs a command in the daemon and returns its status ("ok" or "error"), output and
+    log lines, or None if no daemon is running.
+    """
+    connection = _connect()
+    if connection is None:
+        return None
+    with connection:
+        _no_delay(connection)
+        connection.send((command, list(args)))
+        return connection.recv()  # type: ignore[no-any-return]
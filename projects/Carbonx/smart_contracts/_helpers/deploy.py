@@ -0,0 +1,216 @@
+import functools
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+import algokit_utils
+
+from smart_contracts._helpers import trace
+from smart_contracts._helpers.deploy_journal import open_journal, round_of
+from smart_contracts._helpers.mbr import ASSET_OPT_IN_MIN_BALANCE, app_account_min_balance
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for an app call that also pays for its inner transactions.
+INIT_ASSET_MAX_FEE = algokit_utils.AlgoAmount(micro_algo=3_000)
+
+DEPLOY_MODES = ("update", "append")
+
+# Directory of the `.env.<network>` files written by `algokit generate env-file`.
+env_dir = Path(__file__).parent.parent.parent
+
+# Networks that can be reached without a `.env.<network>` file.
+DEFAULT_NETWORKS = {
+    "localnet": algokit_utils.AlgorandClient.default_localnet,
+    "testnet": algokit_utils.AlgorandClient.testnet,
+    "mainnet": algokit_utils.AlgorandClient.mainnet,
+}
+
+
+def update_policy(mode: str) -> dict[str, Any]:
+    """
+    The `on_update` and `on_schema_break` deploy parameters of a deploy mode. "update"
+    replaces the program of an existing app in place through its `update` method, so
+    its ID and state are kept; "append" creates a new app for every change. A schema
+    cannot grow in place, so a schema break always creates a new app, which then
+    imports the state of the one it replaces.
+    """
+    if mode not in DEPLOY_MODES:
+        raise Exception(f"Unknown deploy mode {mode}, expected one of {', '.join(DEPLOY_MODES)}")
+    return {
+        "on_update": (
+            algokit_utils.OnUpdate.UpdateApp
+            if mode == "update"
+            else algokit_utils.OnUpdate.AppendApp
+        ),
+        "on_schema_break": algokit_utils.OnSchemaBreak.AppendApp,
+    }
+
+
+@functools.cache
+def shared_deploy_args() -> dict[str, Any]:
+    """
+    Creates the Algorand client and deployer account shared by every deploy in a run,
+    and by later runs in the same process (watch, or the carbonx daemon).
+    """
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    return {"algorand": algorand, "deployer": algorand.account.from_environment("DEPLOYER")}
+
+
+def _network_config(
+    values: dict[str, str | None], prefix: str
+) -> algokit_utils.AlgoClientNetworkConfig | None:
+    server = values.get(f"{prefix}_SERVER")
+    if not server:
+        return None
+    return algokit_utils.AlgoClientNetworkConfig(
+        server=server,
+        token=values.get(f"{prefix}_TOKEN") or "",
+        port=values.get(f"{prefix}_PORT"),
+    )
+
+
+@functools.cache
+def network_deploy_args(network: str) -> dict[str, Any]:
+    """
+    Creates the Algorand client and deployer account for one of several networks
+    deployed to in the same run. Unlike `shared_deploy_args` nothing is read from the
+    process environment, which holds a single network: the algod, indexer and kmd
+    settings come from `.env.<network>` (or the public defaults for localnet, testnet
+    and mainnet), and the deployer from `<NETWORK>_DEPLOYER_MNEMONIC` or the
+    `DEPLOYER_MNEMONIC` in that file. LocalNet falls back to the KMD `DEPLOYER` account.
+    """
+    from dotenv import dotenv_values
+
+    values = dotenv_values(env_dir / f".env.{network}")
+    algod_config = _network_config(values, "ALGOD")
+    if algod_config is not None:
+        algorand = algokit_utils.AlgorandClient.from_config(
+            algod_config=algod_config,
+            indexer_config=_network_config(values, "INDEXER"),
+            kmd_config=_network_config(values, "KMD"),
+        )
+    elif network in DEFAULT_NETWORKS:
+        algorand = DEFAULT_NETWORKS[network]()
+    else:
+        raise Exception(f"Network {network} has no ALGOD_SERVER in .env.{network}")
+
+    mnemonic = os.getenv(f"{network.upper()}_DEPLOYER_MNEMONIC") or values.get(
+        "DEPLOYER_MNEMONIC"
+    )
+    if mnemonic:
+        deployer = algorand.account.from_mnemonic(mnemonic=mnemonic)
+    elif algorand.client.is_localnet():
+        deployer = algorand.account.kmd.get_or_create_wallet_account(
+            "DEPLOYER", fund_with=algokit_utils.AlgoAmount(algo=1000)
+        )
+    else:
+        raise Exception(
+            f"No deployer for network {network}: set {network.upper()}_DEPLOYER_MNEMONIC "
+            f"or DEPLOYER_MNEMONIC in .env.{network}"
+        )
+    return {"algorand": algorand, "deployer": deployer}
+
+
+def fund_and_init_asset(
+    algorand: algokit_utils.AlgorandClient,
+    app_client: Any,
+    deployer_address: str,
+    created: bool,
+    artifact_dir: Path,
+    cxt_asset_id: int = 0,
+) -> None:
+    """
+    Tops the app account up to its minimum balance and, when `cxt_asset_id` is set,
+    calls `init_asset`, sending both in a single atomic group so they confirm in the
+    same round. Only the shortfall is paid: the minimum balance is worked out from the
+    ARC-56 spec in `artifact_dir` and the ASA opt-in `init_asset` performs.
+    The inner opt-in fee of `init_asset` is covered from the group automatically.
+    A freshly created app is known to be empty and uninitialised, so it is not looked up,
+    and an app this step already settled in an unfinished deploy in the journal is skipped.
+    """
+    journal = open_journal(algorand)
+    if journal.find(
+        app_client.app_name,
+        "fund and init_asset",
+        app_id=app_client.app_id,
+        cxt_asset_id=cxt_asset_id,
+    ):
+        logger.info(f"{app_client.app_name} was funded and initialized earlier in this deploy")
+        return
+
+    app_spec = json.loads(next(artifact_dir.glob("*.arc56.json")).read_text())
+    if created:
+        balance = 0
+        current_min_balance = 0
+        current_asset_id = 0
+    else:
+        with trace.span("app state lookup", "deploy", contract=app_client.app_name):
+            app_info = algorand.account.get_information(app_client.app_address)
+            balance = app_info.amount.micro_algo
+            # Already covers the assets and boxes the account holds.
+            current_min_balance = app_info.min_balance.micro_algo
+            current_asset_id = (
+                app_client.state.global_state.cxt_asset_id if cxt_asset_id else 0
+            )
+
+    needs_init = cxt_asset_id != 0 and current_asset_id == 0
+    if cxt_asset_id != 0 and not needs_init:
+        logger.info(f"{app_client.app_name} already initialized with ASA {current_asset_id}")
+    required = max(current_min_balance, app_account_min_balance(app_spec))
+    if needs_init:
+        required += ASSET_OPT_IN_MIN_BALANCE
+    shortfall = required - balance
+    if shortfall <= 0 and not needs_init:
+        journal.record(
+            app_client.app_name,
+            "fund and init_asset",
+            [],
+            None,
+            app_id=app_client.app_id,
+            cxt_asset_id=cxt_asset_id,
+        )
+        return
+
+    group = app_client.new_group()
+    if shortfall > 0:
+        logger.info(
+            f"Funding {app_client.app_name} with {shortfall} µALGO to reach its "
+            f"{required} µALGO minimum balance"
+        )
+        group.composer().add_payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount(micro_algo=shortfall),
+                sender=deployer_address,
+                receiver=app_client.app_address,
+            )
+        )
+    if needs_init:
+        logger.info(f"Initializing {app_client.app_name} with $CXT ASA {cxt_asset_id}")
+        group.init_asset(
+            args=(cxt_asset_id,),
+            params=algokit_utils.CommonAppCallParams(
+                asset_references=[cxt_asset_id],
+                max_fee=INIT_ASSET_MAX_FEE,
+            ),
+        )
+
+    # A failure propagates, so the deploy fails and a rerun resumes from this step.
+    with trace.span("fund and init_asset", "deploy", contract=app_client.app_name):
+        result = group.send(algokit_utils.SendParams(cover_app_call_inner_transaction_fees=True))
+    # One entry for the group: the funding payment, init_asset and its inner ASA opt-in
+    # confirm together.
+    journal.record(
+        app_client.app_name,
+        "fund and init_asset",
+        list(result.tx_ids),
+        round_of(result.confirmations[0]) if result.confirmations else None,
+        app_id=app_client.app_id,
+        cxt_asset_id=cxt_asset_id,
+        funded=max(shortfall, 0),
+        initialized=needs_init,
+    )
+    if needs_init:
+        logger.info(f"Successfully initialized {app_client.app_name} with ASA {cxt_asset_id}")
@@ -0,0 +1,136 @@
+import logging
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from smart_contracts._helpers import trace
+from smart_contracts._helpers.deploy_journal import complete_journal
+
+logger = logging.getLogger(__name__)
+
+
+class DeployExecutor:
+    """
+    Runs the nodes of a deployment graph (asset creates and contract deploys) on threads,
+    sharing one Algorand client and deployer account. A node starts as soon as the nodes
+    it references have finished, and receives their IDs as keyword arguments, so nodes
+    that do not reference each other wait for their confirmations at the same time.
+    Nodes must be submitted after the nodes they reference.
+    One executor deploys to one network; `network` labels its progress and summary.
+    """
+
+    def __init__(
+        self, max_workers: int, network: str | None = None, **deploy_kwargs: Any
+    ) -> None:
+        self.network = network
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix=f"deploy-{network}" if network else "deploy",
+        )
+        self._deploy_kwargs = deploy_kwargs
+        self._futures: dict[str, Future[int]] = {}
+        self._finished = 0
+        self._progress_lock = threading.Lock()
+
+    def _log(self, message: str) -> None:
+        logger.info(f"[{self.network}] {message}" if self.network else message)
+
+    def submit(
+        self,
+        name: str,
+        deploy: Callable[..., int],
+        references: Mapping[str, str] | None = None,
+    ) -> None:
+        """
+        Starts `deploy`, which returns the ID it deployed, once the nodes named in
+        `references` have finished; each keyword argument in `references` is passed the
+        ID returned by the node it names.
+        """
+        references = dict(references or {})
+        for reference in references.values():
+            if reference not in self._futures:
+                raise Exception(f"{name} references {reference}, which is not being deployed")
+        self._futures[name] = self._pool.submit(self._run, name, deploy, references)
+
+    def _run(self, name: str, deploy: Callable[..., int], references: dict[str, str]) -> int:
+        resolved = {}
+        for argument, reference in references.items():
+            future = self._futures[reference]
+            if future.exception() is not None:
+                raise Exception(f"skipped, {reference} failed to deploy")
+            resolved[argument] = future.result()
+        self._log(f"Deploying {name}")
+        with trace.span(f"deploy {name}", "deploy", network=self.network):
+            result = deploy(**self._deploy_kwargs, **resolved)
+        with self._progress_lock:
+            self._finished += 1
+            self._log(f"Deployed {name} ({result}), {self._finished}/{len(self._futures)} done")
+        return result
+
+    def outcomes(self) -> dict[str, int | BaseException]:
+        """The ID each finished node deployed, or the exception it failed with."""
+        return {
+            name: future.exception() or future.result()
+            for name, future in self._futures.items()
+            if future.done()
+        }
+
+    def wait(self) -> None:
+        """
+        Waits for every submitted node and raises if any of them failed. Once all of
+        them have succeeded the deploy is marked complete in the journal, so the next
+        run starts afresh instead of resuming it.
+        """
+        self._pool.shutdown(wait=True)
+        failed = [
+            f"{name}: {future.exception()}"
+            for name, future in self._futures.items()
+            if future.exception() is not None
+        ]
+        if failed:
+            raise Exception(
+                f"Could not deploy {len(failed)} node(s), rerun to resume:\n" + "\n".join(failed)
+            )
+        if "algorand" in self._deploy_kwargs:
+            complete_journal(self._deploy_kwargs["algorand"])
+
+
+def wait_all(executors: Sequence[DeployExecutor]) -> None:
+    """
+    Waits for the deploys to every network, logs a summary of all of them when there
+    are several, and raises if any network failed.
+    """
+    failures = []
+    for executor in executors:
+        try:
+            executor.wait()
+        except Exception as e:
+            failures.append(f"{executor.network}: {e}" if executor.network else str(e))
+    if len(executors) > 1:
+        logger.info("Deploy summary:\n" + format_summary(executors))
+    if failures:
+        raise Exception("\n".join(failures))
+
+
+def format_summary(executors: Sequence[DeployExecutor]) -> str:
+    """A table of the ID each node deployed on each network, or FAILED."""
+    outcomes = {executor.network or "default": executor.outcomes() for executor in executors}
+    nodes = list(dict.fromkeys(name for results in outcomes.values() for name in results))
+    rows = [["node", *outcomes]]
+    for name in nodes:
+        row = [name]
+        for results in outcomes.values():
+            result = results.get(name)
+            if result is None:
+                row.append("-")
+            elif isinstance(result, BaseException):
+                row.append("FAILED")
+            else:
+                row.append(str(result))
+        rows.append(row)
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True)).rstrip()
+        for row in rows
+    )
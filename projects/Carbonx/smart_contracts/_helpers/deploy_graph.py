@@ -0,0 +1,92 @@
+import dataclasses
+import functools
+import graphlib
+import logging
+import re
+import tomllib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+graph_path = Path(__file__).parent.parent / "deployment.toml"
+
+KINDS = ("assets", "apps")
+
+# The whole value must name a node, so literals like "apps.carbonx.finance" stay params.
+_REFERENCE = re.compile(rf"(?:{'|'.join(KINDS)})\.[A-Za-z_]\w*")
+
+
+@dataclasses.dataclass
+class GraphNode:
+    kind: str
+    name: str
+    # Literal keyword arguments, and keyword arguments that take the ID of another node.
+    params: dict[str, Any]
+    references: dict[str, str]
+
+    @property
+    def key(self) -> str:
+        return f"{self.kind}.{self.name}"
+
+    @property
+    def dependencies(self) -> set[str]:
+        return set(self.references.values())
+
+
+def _is_reference(value: Any) -> bool:
+    return isinstance(value, str) and _REFERENCE.fullmatch(value) is not None
+
+
+@functools.cache
+def load_graph(path: Path = graph_path) -> dict[str, GraphNode]:
+    """Reads the deployment graph, keyed by "assets.<name>" and "apps.<name>"."""
+    if not path.exists():
+        return {}
+    with path.open("rb") as file:
+        document = tomllib.load(file)
+    nodes = {}
+    for kind in KINDS:
+        for name, table in document.get(kind, {}).items():
+            node = GraphNode(
+                kind,
+                name,
+                params={key: value for key, value in table.items() if not _is_reference(value)},
+                references={key: value for key, value in table.items() if _is_reference(value)},
+            )
+            nodes[node.key] = node
+    for node in nodes.values():
+        for reference in node.dependencies:
+            if reference not in nodes:
+                raise Exception(f"{node.key} in {path.name} references unknown {reference}")
+        if node.kind == "assets" and node.references:
+            raise Exception(f"{node.key} in {path.name} cannot reference other nodes")
+    return nodes
+
+
+def waves(nodes: dict[str, GraphNode], keys: Iterable[str]) -> list[list[str]]:
+    """
+    Groups `keys` and everything they reference into waves: each wave only references
+    nodes in earlier waves, so the nodes within a wave can be deployed in parallel.
+    """
+    pending = list(keys)
+    included: set[str] = set()
+    while pending:
+        key = pending.pop()
+        if key not in included:
+            included.add(key)
+            pending.extend(nodes[key].dependencies)
+    sorter = graphlib.TopologicalSorter(
+        {key: nodes[key].dependencies for key in sorted(included)}
+    )
+    try:
+        sorter.prepare()
+    except graphlib.CycleError as e:
+        raise Exception(f"Circular reference in the deployment graph: {' -> '.join(e.args[1])}")
+    result = []
+    while sorter.is_active():
+        wave = sorted(sorter.get_ready())
+        sorter.done(*wave)
+        result.append(wave)
+    return result
@@ -0,0 +1,128 @@
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+journal_dir = Path(__file__).parent.parent.parent / ".cache" / "deployments"
+
+# Written once every node of a deploy has finished; steps before it are not resumed.
+RUN_COMPLETE = "run complete"
+
+# Deploys run on threads and append to one journal per network.
+_lock = threading.Lock()
+_journals: dict[str, "DeployJournal"] = {}
+
+
+def round_of(confirmation: Any) -> int | None:
+    """The round a transaction confirmed in, from its pending transaction response."""
+    if isinstance(confirmation, dict):
+        return confirmation.get("confirmed-round")
+    return getattr(confirmation, "confirmed_round", None)
+
+
+class DeployJournal:
+    """
+    Append-only log of the deploy steps confirmed on one network, with their
+    transaction IDs and confirmed round. Steps logged since the last completed deploy
+    are resumed: a rerun after a crash or timeout skips them without querying the
+    chain, and only re-checks the step that was in flight.
+    """
+
+    def __init__(self, genesis_id: str, genesis_hash: str) -> None:
+        self.path = journal_dir / f"{genesis_id}.journal.jsonl"
+        self.genesis_hash = genesis_hash
+        self._steps = self._read_unfinished()
+
+    def _read_unfinished(self) -> list[dict[str, Any]]:
+        try:
+            lines = self.path.read_text().splitlines()
+        except FileNotFoundError:
+            return []
+        steps: list[dict[str, Any]] = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A line cut short by a crash; its step is treated as not confirmed.
+                continue
+            if entry.get("step") == RUN_COMPLETE:
+                steps = []
+            # A reset LocalNet keeps its genesis ID but gets a new genesis hash.
+            elif entry.get("genesis_hash") == self.genesis_hash:
+                steps.append(entry)
+        if steps:
+            logger.info(
+                f"Resuming the unfinished deploy in {self.path.name} "
+                f"({len(steps)} confirmed step(s))"
+            )
+        return steps
+
+    def find(self, node: str, step: str, **match: Any) -> dict[str, Any] | None:
+        """The latest resumable entry for `step` of `node` whose fields equal `match`."""
+        with _lock:
+            for entry in reversed(self._steps):
+                if (
+                    entry["node"] == node
+                    and entry["step"] == step
+                    and all(entry.get(key) == value for key, value in match.items())
+                ):
+                    return entry
+        return None
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a+b") as file:
+            if file.seek(0, os.SEEK_END) > 0:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    # Ends a line cut short by a crash, so it stays unreadable on its own.
+                    file.write(b"\n")
+            file.write(json.dumps(entry).encode() + b"\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def record(
+        self,
+        node: str,
+        step: str,
+        tx_ids: list[str],
+        confirmed_round: int | None,
+        **result: Any,
+    ) -> None:
+        """Logs a confirmed step; `tx_ids` is empty for steps that found nothing to send."""
+        entry = {
+            "genesis_hash": self.genesis_hash,
+            "node": node,
+            "step": step,
+            "tx_ids": tx_ids,
+            "confirmed_round": confirmed_round,
+            **result,
+        }
+        with _lock:
+            self._append(entry)
+            self._steps.append(entry)
+
+    def complete(self) -> None:
+        with _lock:
+            self._append({"step": RUN_COMPLETE, "genesis_hash": self.genesis_hash})
+            self._steps = []
+
+
+def open_journal(algorand: Any) -> DeployJournal:
+    """The journal of the network `algorand` points at, shared by every deploy in a run."""
+    network = algorand.client.network()
+    with _lock:
+        journal = _journals.get(network.genesis_id)
+        if journal is None or journal.genesis_hash != network.genesis_hash:
+            journal = DeployJournal(network.genesis_id, network.genesis_hash)
+            _journals[network.genesis_id] = journal
+        return journal
+
+
+def complete_journal(algorand: Any) -> None:
+    """Marks the deploy logged in the journal of `algorand`'s network as finished."""
+    open_journal(algorand).complete()
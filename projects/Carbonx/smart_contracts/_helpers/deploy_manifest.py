@@ -0,0 +1,316 @@
+import base64
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from smart_contracts._helpers import trace
+from smart_contracts._helpers.deploy_journal import open_journal, round_of
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the layout of a manifest changes; older manifests are discarded.
+MANIFEST_VERSION = 1
+
+manifest_dir = Path(__file__).parent.parent.parent / ".cache" / "deployments"
+
+# Deploys of several contracts run on threads and share one manifest file per network.
+_lock = threading.Lock()
+
+
+def _sha256(program: bytes) -> str:
+    return hashlib.sha256(program).hexdigest()
+
+
+def _compiled_app(artifact_dir: Path) -> dict[str, Any] | None:
+    """Hashes and schema of the compiled app in `artifact_dir`, as recorded in the manifest."""
+    app_spec_path = next(artifact_dir.glob("*.arc56.json"), None)
+    if app_spec_path is None:
+        return None
+    app_spec = json.loads(app_spec_path.read_text())
+    byte_code = app_spec.get("byteCode") or {}
+    if not byte_code.get("approval") or not byte_code.get("clear"):
+        return None
+    schema = app_spec["state"]["schema"]
+    return {
+        "approval_sha256": _sha256(base64.b64decode(byte_code["approval"])),
+        "clear_sha256": _sha256(base64.b64decode(byte_code["clear"])),
+        "global_schema": [schema["global"]["ints"], schema["global"]["bytes"]],
+        "local_schema": [schema["local"]["ints"], schema["local"]["bytes"]],
+    }
+
+
+def _on_chain_app(app_info: Any) -> dict[str, Any]:
+    return {
+        "approval_sha256": _sha256(app_info.approval_program),
+        "clear_sha256": _sha256(app_info.clear_state_program),
+        "global_schema": [app_info.global_ints, app_info.global_byte_slices],
+        "local_schema": [app_info.local_ints, app_info.local_byte_slices],
+    }
+
+
+class DeploymentManifest:
+    """
+    Records the app deployed for each contract (and the assets created for the
+    deployment graph) on one network, so a later deploy can confirm each with a
+    single lookup by ID instead of searching every app the deployer has created.
+    """
+
+    def __init__(self, genesis_id: str, genesis_hash: str) -> None:
+        self.path = manifest_dir / f"{genesis_id}.json"
+        self.genesis_hash = genesis_hash
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            manifest = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+        # A reset LocalNet keeps its genesis ID but gets a new genesis hash.
+        if (
+            manifest.get("version") != MANIFEST_VERSION
+            or manifest.get("genesis_hash") != self.genesis_hash
+        ):
+            return {}
+        return manifest
+
+    def get(self, name: str, section: str = "apps") -> dict[str, Any] | None:
+        with _lock:
+            return self._read().get(section, {}).get(name)
+
+    def record(self, name: str, entry: dict[str, Any], section: str = "apps") -> None:
+        with _lock:
+            manifest = self._read()
+            manifest.setdefault(section, {})[name] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            staging = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            staging.write_text(
+                json.dumps(
+                    {
+                        **manifest,
+                        "version": MANIFEST_VERSION,
+                        "genesis_hash": self.genesis_hash,
+                    },
+                    indent=2,
+                )
+                + "\n"
+            )
+            staging.replace(self.path)
+
+
+@dataclasses.dataclass
+class DeployedApp:
+    client: Any
+    # "create", "update", "replace" or "nothing", as performed by the deploy.
+    operation: str
+    # The app this one was created to replace, whose state it imports.
+    previous_app_id: int | None = None
+    # Taken from the journal of an unfinished deploy without looking anything up.
+    resumed: bool = False
+
+    @property
+    def created(self) -> bool:
+        """Whether the app was just created and is known to be empty."""
+        return self.operation in ("create", "replace") and not self.resumed
+
+
+def _previous_app_id(
+    algorand: Any, deployer_address: str, app_name: str, recorded: dict[str, Any] | None
+) -> int | None:
+    """The app a new deploy of `app_name` would replace, before the deploy runs."""
+    if recorded is not None:
+        return int(recorded["app_id"])
+    # Cached by the app deployer, so the deploy that follows does not look it up again.
+    app = algorand.app_deployer.get_creator_apps_by_name(
+        creator_address=deployer_address
+    ).apps.get(app_name)
+    return None if app is None or app.deleted else int(app.app_id)
+
+
+def deploy_app(
+    algorand: Any,
+    factory: Any,
+    deployer_address: str,
+    artifact_dir: Path,
+    **deploy_params: Any,
+) -> DeployedApp:
+    """
+    Returns a client for the app of `factory`, what the deploy did to it, and the app it
+    replaced, if any.
+
+    The app recorded in the deployment manifest is reused when a lookup by its ID shows
+    it still exists, belongs to the deployer, and matches the compiled programs and
+    schema. Otherwise `factory.deploy(**deploy_params)` runs its full lookup by creator
+    and name, and the app it returns is recorded in the manifest.
+    When an unfinished deploy in the journal already settled this app for the compiled
+    programs, that app is resumed without any lookup.
+    """
+    network = algorand.client.network()
+    manifest = DeploymentManifest(network.genesis_id, network.genesis_hash)
+    journal = open_journal(algorand)
+    compiled = _compiled_app(artifact_dir)
+    if compiled is not None:
+        resumed = journal.find(
+            factory.app_name,
+            "app",
+            approval_sha256=compiled["approval_sha256"],
+            clear_sha256=compiled["clear_sha256"],
+        )
+        if resumed is not None:
+            logger.info(f"Resuming {factory.app_name} ({resumed['app_id']}) from the journal")
+            # Whatever followed the create is re-checked, as it may not have confirmed.
+            return DeployedApp(
+                factory.get_app_client_by_id(resumed["app_id"]),
+                resumed.get("operation", "nothing"),
+                resumed.get("previous_app_id"),
+                resumed=True,
+            )
+    recorded = manifest.get(factory.app_name)
+
+    if compiled is not None and recorded is not None:
+        try:
+            with trace.span("manifest lookup", "deploy", contract=factory.app_name):
+                app_info = algorand.app.get_by_id(recorded["app_id"])
+        except Exception as e:
+            logger.info(f"App {recorded['app_id']} from the deployment manifest is gone: {e}")
+            recorded = None
+        else:
+            on_chain = _on_chain_app(app_info)
+            if (
+                app_info.creator == deployer_address
+                and recorded["creator"] == deployer_address
+                and on_chain == compiled
+                and {key: recorded.get(key) for key in compiled} == compiled
+            ):
+                logger.info(
+                    f"{factory.app_name} ({recorded['app_id']}) is up to date "
+                    f"according to {manifest.path.name}"
+                )
+                journal.record(
+                    factory.app_name,
+                    "app",
+                    [],
+                    None,
+                    app_id=recorded["app_id"],
+                    operation="nothing",
+                    **compiled,
+                )
+                return DeployedApp(
+                    factory.get_app_client_by_id(recorded["app_id"]),
+                    "nothing",
+                    recorded.get("previous_app_id"),
+                )
+            logger.info(
+                f"{factory.app_name} ({recorded['app_id']}) differs from the deployment "
+                "manifest, looking it up by creator"
+            )
+
+    previous_app_id = _previous_app_id(algorand, deployer_address, factory.app_name, recorded)
+    app_client, result = factory.deploy(**deploy_params)
+    operation = result.operation_performed.name.lower()
+    if previous_app_id == app_client.app_id:
+        # Updated in place (or unchanged): keep pointing at the app it once replaced.
+        previous_app_id = recorded.get("previous_app_id") if recorded is not None else None
+    elif operation != "create":
+        previous_app_id = None
+    if compiled is not None:
+        manifest.record(
+            factory.app_name,
+            {
+                "app_id": app_client.app_id,
+                "creator": deployer_address,
+                "previous_app_id": previous_app_id,
+                **compiled,
+            },
+        )
+        sent = result.create_result or result.update_result
+        journal.record(
+            factory.app_name,
+            "app",
+            [sent.tx_id] if sent is not None else [],
+            round_of(sent.confirmation) if sent is not None else None,
+            app_id=app_client.app_id,
+            operation=operation,
+            previous_app_id=previous_app_id,
+            **compiled,
+        )
+    return DeployedApp(app_client, operation, previous_app_id)
+
+
+def find_asset(
+    algorand: Any, deployer_address: str, name: str, params: dict[str, Any]
+) -> int | None:
+    """
+    Returns the ID of asset `name` of the deployment graph on the current network without
+    creating it: the ID configured under `existing` for the network, or the asset recorded
+    in the deployment manifest if it still exists and was created by the deployer.
+    """
+    network = algorand.client.network()
+    existing = params.get("existing", {})
+    if network.genesis_id in existing:
+        return int(existing[network.genesis_id])
+
+    manifest = DeploymentManifest(network.genesis_id, network.genesis_hash)
+    recorded = manifest.get(name, section="assets")
+    if recorded is None:
+        return None
+    try:
+        with trace.span("manifest lookup", "deploy", asset=name):
+            asset_info = algorand.asset.get_by_id(recorded["asset_id"])
+    except Exception as e:
+        logger.info(f"Asset {recorded['asset_id']} from the deployment manifest is gone: {e}")
+        return None
+    if asset_info.creator != deployer_address or recorded["creator"] != deployer_address:
+        return None
+    return int(recorded["asset_id"])
+
+
+def deploy_asset(
+    algorand: Any, deployer: Any, name: str, params: dict[str, Any]
+) -> int:
+    """
+    Returns the ID of asset `name` of the deployment graph, creating it with `params`
+    and recording it in the deployment manifest if `find_asset` finds none. The deployer
+    holds every management role of a created asset.
+    """
+    import algokit_utils
+
+    journal = open_journal(algorand)
+    resumed = journal.find(f"assets.{name}", "asset")
+    if resumed is not None:
+        logger.info(f"Resuming asset {name} ({resumed['asset_id']}) from the journal")
+        return int(resumed["asset_id"])
+
+    asset_id = find_asset(algorand, deployer.address, name, params)
+    if asset_id is not None:
+        logger.info(f"Using existing asset {name} ({asset_id})")
+        journal.record(f"assets.{name}", "asset", [], None, asset_id=asset_id)
+        return asset_id
+
+    with trace.span(f"create asset {name}", "deploy"):
+        result = algorand.send.asset_create(
+            algokit_utils.AssetCreateParams(
+                sender=deployer.address,
+                manager=deployer.address,
+                reserve=deployer.address,
+                freeze=deployer.address,
+                clawback=deployer.address,
+                **{key: value for key, value in params.items() if key != "existing"},
+            )
+        )
+    network = algorand.client.network()
+    DeploymentManifest(network.genesis_id, network.genesis_hash).record(
+        name, {"asset_id": result.asset_id, "creator": deployer.address}, section="assets"
+    )
+    journal.record(
+        f"assets.{name}",
+        "asset",
+        [result.tx_id],
+        round_of(result.confirmation),
+        asset_id=result.asset_id,
+    )
+    logger.info(f"Created asset {name} ({result.asset_id})")
+    return int(result.asset_id)
@@ -0,0 +1,104 @@
+import base64
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from algosdk import abi, encoding
+
+
+@dataclass(frozen=True)
+class Event:
+    """An ARC-28 event decoded from an app call log."""
+
+    name: str
+    fields: dict[str, Any]
+    app_id: int | None = None
+    round: int | None = None
+
+
+def _as_bytes(log: bytes | str) -> bytes:
+    # algod's JSON responses carry logs base64-encoded.
+    return log if isinstance(log, bytes) else base64.b64decode(log)
+
+
+class EventDecoder:
+    """
+    Decodes the ARC-28 events an app declares in its ARC-56 spec. puyapy lists every
+    struct passed to `arc4.emit` under `events`; a log is one of them when it starts
+    with the 4-byte selector of the event's signature, e.g. `CreditsBought(address,...)`.
+    """
+
+    def __init__(self, app_spec: dict[str, Any]) -> None:
+        self._events: dict[bytes, tuple[str, list[str], abi.ABIType]] = {}
+        for event in app_spec.get("events", []):
+            types = [arg["type"] for arg in event["args"]]
+            signature = f"{event['name']}({','.join(types)})"
+            selector = encoding.checksum(signature.encode())[:4]
+            names = [arg.get("name") or f"arg{index}" for index, arg in enumerate(event["args"])]
+            tuple_type = abi.ABIType.from_string(f"({','.join(types)})")
+            self._events[selector] = (event["name"], names, tuple_type)
+
+    @classmethod
+    def from_artifacts(cls, artifact_dir: Path) -> "EventDecoder":
+        """The decoder of the contract built into `artifact_dir`."""
+        app_spec_path = next(artifact_dir.glob("*.arc56.json"), None)
+        if app_spec_path is None:
+            raise Exception(f"No app spec in {artifact_dir}, build the contract first")
+        return cls(json.loads(app_spec_path.read_text()))
+
+    def decode(
+        self, log: bytes | str, app_id: int | None = None, round_: int | None = None
+    ) -> Event | None:
+        """The event `log` holds, or None for ABI return values and other logs."""
+        log = _as_bytes(log)
+        known = self._events.get(log[:4])
+        if known is None:
+            return None
+        name, names, tuple_type = known
+        values = tuple_type.decode(log[4:])
+        return Event(name, dict(zip(names, values, strict=True)), app_id, round_)
+
+    def decode_all(
+        self, logs: Iterable[bytes | str], app_id: int | None = None, round_: int | None = None
+    ) -> list[Event]:
+        """The events among `logs`, e.g. the `logs` of a transaction confirmation."""
+        events = (self.decode(log, app_id, round_) for log in logs)
+        return [event for event in events if event is not None]
+
+    def decode_confirmation(self, confirmation: dict[str, Any]) -> list[Event]:
+        """The events of a confirmed app call, e.g. `result.confirmation` of a typed client."""
+        txn = confirmation.get("txn", {}).get("txn", {})
+        app_id = txn.get("apid") or confirmation.get("application-index")
+        return self.decode_all(
+            confirmation.get("logs", []), app_id, confirmation.get("confirmed-round")
+        )
+
+
+def _app_call_logs(signed_txn: dict[str, Any]) -> Iterator[tuple[int, list[Any]]]:
+    """The logs of an app call in a block, and of the app calls it made, per app."""
+    txn = signed_txn.get("txn", {})
+    apply_data = signed_txn.get("dt", {})
+    # A create carries the new app ID in the apply data instead of the transaction.
+    app_id = txn.get("apid") or signed_txn.get("apid")
+    if app_id and apply_data.get("lg"):
+        yield app_id, apply_data["lg"]
+    for inner in apply_data.get("itx", []):
+        yield from _app_call_logs(inner)
+
+
+def block_events(algod: Any, round_: int, decoders: dict[int, EventDecoder]) -> list[Event]:
+    """
+    The events every app in `decoders` (keyed by app ID) emitted in block `round_`, in
+    order, from a single block fetch instead of a state read per app. Events of inner
+    app calls are included.
+    """
+    block = algod.block_info(round_)["block"]
+    events = []
+    for signed_txn in block.get("txns", []):
+        for app_id, logs in _app_call_logs(signed_txn):
+            decoder = decoders.get(app_id)
+            if decoder is not None:
+                events.extend(decoder.decode_all(logs, app_id, round_))
+    return events
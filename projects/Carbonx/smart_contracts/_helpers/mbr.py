@@ -0,0 +1,122 @@
+import base64
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Minimum balance requirements in microALGO, as defined by the Algorand protocol.
+ACCOUNT_MIN_BALANCE = 100_000
+ASSET_OPT_IN_MIN_BALANCE = 100_000
+APP_PAGE_MIN_BALANCE = 100_000
+SCHEMA_ENTRY_MIN_BALANCE = 25_000
+SCHEMA_UINT_MIN_BALANCE = 3_500
+SCHEMA_BYTES_MIN_BALANCE = 25_000
+BOX_FLAT_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+
+_STATIC_ARRAY = re.compile(r"(.+)\[(\d+)\]")
+_UINT = re.compile(r"u?(?:int|fixed)(\d+)(?:x\d+)?")
+
+
+def schema_min_balance(ints: int, byte_slices: int) -> int:
+    """Minimum balance for `ints` uint64 and `byte_slices` byte-slice state entries."""
+    return (
+        ints * (SCHEMA_ENTRY_MIN_BALANCE + SCHEMA_UINT_MIN_BALANCE)
+        + byte_slices * (SCHEMA_ENTRY_MIN_BALANCE + SCHEMA_BYTES_MIN_BALANCE)
+    )
+
+
+def box_min_balance(key_length: int, value_size: int) -> int:
+    """Minimum balance an app account needs for one box."""
+    return BOX_FLAT_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * (key_length + value_size)
+
+
+def _split_tuple(abi_type: str) -> list[str]:
+    """Splits the members of an ABI tuple type like `(uint64,(bool,byte[4]))`."""
+    members, depth, start = [], 0, 1
+    for index, char in enumerate(abi_type[1:-1], start=1):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            members.append(abi_type[start:index])
+            start = index + 1
+    if abi_type[start:-1]:
+        members.append(abi_type[start:-1])
+    return members
+
+
+def abi_static_size(abi_type: str, structs: dict | None = None) -> int | None:
+    """Encoded size in bytes of an ARC-4 (or AVM) type, or None if it is dynamically sized."""
+    structs = structs or {}
+    if abi_type in structs:
+        return abi_static_size(
+            "(" + ",".join(field["type"] for field in structs[abi_type]) + ")", structs
+        )
+    if abi_type in ("uint64", "AVMUint64"):
+        return 8
+    if abi_type in ("bool", "byte"):
+        return 1
+    if abi_type == "address":
+        return 32
+    if match := _UINT.fullmatch(abi_type):
+        return int(match.group(1)) // 8
+    if match := _STATIC_ARRAY.fullmatch(abi_type):
+        element, length = match.group(1), int(match.group(2))
+        if element == "bool":
+            return (length + 7) // 8
+        element_size = abi_static_size(element, structs)
+        return None if element_size is None else element_size * length
+    if abi_type.startswith("(") and abi_type.endswith(")"):
+        size, bools = 0, 0
+        for member in _split_tuple(abi_type):
+            # Consecutive bools in a tuple are packed into one byte per eight.
+            if member == "bool":
+                bools += 1
+                continue
+            size += (bools + 7) // 8
+            bools = 0
+            member_size = abi_static_size(member, structs)
+            if member_size is None:
+                return None
+            size += member_size
+        return size + (bools + 7) // 8
+    # string, T[], AVMBytes, AVMString and other dynamic types
+    return None
+
+
+def creator_min_balance(app_spec: dict, extra_pages: int = 0) -> int:
+    """Increase in the creator's minimum balance when it creates an app from `app_spec`."""
+    schema = app_spec["state"]["schema"]["global"]
+    return APP_PAGE_MIN_BALANCE * (1 + extra_pages) + schema_min_balance(
+        schema["ints"], schema["bytes"]
+    )
+
+
+def static_box_min_balance(app_spec: dict) -> int:
+    """
+    Minimum balance for the boxes declared under `state.keys.box` in an ARC-56 spec.
+    Box maps hold one box per key written at runtime, so they are funded by their callers
+    and not included here.
+    """
+    total = 0
+    for name, box in app_spec["state"]["keys"].get("box", {}).items():
+        value_size = abi_static_size(box["valueType"], app_spec.get("structs"))
+        if value_size is None:
+            logger.warning(
+                f"Box {name} of {app_spec['name']} has dynamic type {box['valueType']}; "
+                "not included in its minimum balance"
+            )
+            continue
+        total += box_min_balance(len(base64.b64decode(box["key"])), value_size)
+    return total
+
+
+def app_account_min_balance(app_spec: dict, asset_opt_ins: int = 0) -> int:
+    """Minimum balance of an app account holding `asset_opt_ins` assets and its static boxes."""
+    return (
+        ACCOUNT_MIN_BALANCE
+        + ASSET_OPT_IN_MIN_BALANCE * asset_opt_ins
+        + static_box_min_balance(app_spec)
+    )
@@ -0,0 +1,154 @@
+import base64
+import logging
+from typing import Any
+
+import algokit_utils
+
+from smart_contracts._helpers import trace
+from smart_contracts._helpers.deploy_journal import open_journal, round_of
+from smart_contracts._helpers.deploy_manifest import DeployedApp
+
+logger = logging.getLogger(__name__)
+
+# Accounts a single app call can reference, and app calls in one atomic group.
+ACCOUNTS_PER_CALL = 4
+MAX_GROUP_SIZE = 16
+
+
+def migrate_app(algorand: algokit_utils.AlgorandClient, deployed: DeployedApp) -> None:
+    """After an in-place update, calls `migrate` to convert the state to the new layout."""
+    if deployed.operation != "update":
+        return
+    app_client = deployed.client
+    journal = open_journal(algorand)
+    if journal.find(app_client.app_name, "migrate", app_id=app_client.app_id):
+        return
+    with trace.span("migrate", "deploy", contract=app_client.app_name):
+        result = app_client.send.migrate()
+    journal.record(
+        app_client.app_name,
+        "migrate",
+        [result.tx_id],
+        round_of(result.confirmation),
+        app_id=app_client.app_id,
+        schema_version=result.abi_return,
+    )
+    logger.info(f"Migrated {app_client.app_name} state to schema version {result.abi_return}")
+
+
+def import_app_state(algorand: algokit_utils.AlgorandClient, deployed: DeployedApp) -> None:
+    """
+    After a schema break created a new app, calls `import_state` to copy the global
+    state of the app it replaces, so the old app's counters are not stranded.
+    """
+    if deployed.operation != "create" or deployed.previous_app_id is None:
+        return
+    app_client = deployed.client
+    previous_app_id = deployed.previous_app_id
+    journal = open_journal(algorand)
+    if journal.find(app_client.app_name, "import state", app_id=app_client.app_id):
+        return
+    logger.info(f"Importing the state of {app_client.app_name} app {previous_app_id}")
+    with trace.span("import state", "deploy", contract=app_client.app_name):
+        result = app_client.send.import_state(
+            args=(previous_app_id,),
+            params=algokit_utils.CommonAppCallParams(app_references=[previous_app_id]),
+        )
+    journal.record(
+        app_client.app_name,
+        "import state",
+        [result.tx_id],
+        round_of(result.confirmation),
+        app_id=app_client.app_id,
+        previous_app_id=previous_app_id,
+    )
+
+
+def _local_state_keys(account: dict[str, Any], app_id: int) -> set[bytes] | None:
+    """Keys `account` holds in the local state of `app_id`, or None if it is not opted in."""
+    for local_state in account.get("apps-local-state", []):
+        if local_state["id"] == app_id and not local_state.get("deleted"):
+            return {
+                base64.b64decode(entry["key"]) for entry in local_state.get("key-value", [])
+            }
+    return None
+
+
+def _pending_accounts(
+    algorand: algokit_utils.AlgorandClient, previous_app_id: int, app_id: int, marker: bytes
+) -> list[str]:
+    """
+    Accounts with local state in `previous_app_id` that have opted in to `app_id`
+    but do not hold `marker` there yet, from one paginated indexer search.
+    """
+    indexer = algorand.client.indexer
+    accounts: list[str] = []
+    next_page = None
+    while True:
+        response = indexer.accounts(
+            application_id=previous_app_id, limit=1000, next_page=next_page
+        )
+        for account in response.get("accounts", []):
+            keys = _local_state_keys(account, app_id)
+            if keys is not None and marker not in keys:
+                accounts.append(account["address"])
+        next_page = response.get("next-token")
+        if not next_page or not response.get("accounts"):
+            return accounts
+
+
+def import_account_state(
+    algorand: algokit_utils.AlgorandClient,
+    deployed: DeployedApp,
+    method: str,
+    marker: bytes,
+) -> None:
+    """
+    Copies the local state of the app `deployed` replaced, for every account that has
+    opted in to the new app but not been imported yet (it has no `marker` key there).
+    `method(previous, accounts)` is called with `ACCOUNTS_PER_CALL` accounts per call
+    and `MAX_GROUP_SIZE` calls per atomic group. It runs on every deploy of a
+    replacement app, so issuers that opt in later are picked up by the next deploy.
+    """
+    previous_app_id = deployed.previous_app_id
+    if previous_app_id is None:
+        return
+    app_client = deployed.client
+    try:
+        with trace.span("find accounts to import", "deploy", contract=app_client.app_name):
+            accounts = _pending_accounts(algorand, previous_app_id, app_client.app_id, marker)
+    except Exception as e:
+        logger.warning(f"Could not look up accounts to import into {app_client.app_name}: {e}")
+        return
+    if not accounts:
+        return
+
+    journal = open_journal(algorand)
+    batches = [
+        accounts[start : start + ACCOUNTS_PER_CALL]
+        for start in range(0, len(accounts), ACCOUNTS_PER_CALL)
+    ]
+    for start in range(0, len(batches), MAX_GROUP_SIZE):
+        group = app_client.new_group()
+        for batch in batches[start : start + MAX_GROUP_SIZE]:
+            getattr(group, method)(
+                args=(previous_app_id, batch),
+                params=algokit_utils.CommonAppCallParams(
+                    account_references=batch, app_references=[previous_app_id]
+                ),
+            )
+        with trace.span(method, "deploy", contract=app_client.app_name):
+            result = group.send()
+        imported = sum(abi_return.value for abi_return in result.returns)
+        journal.record(
+            app_client.app_name,
+            method,
+            list(result.tx_ids),
+            round_of(result.confirmations[0]) if result.confirmations else None,
+            app_id=app_client.app_id,
+            previous_app_id=previous_app_id,
+            imported=imported,
+        )
+        logger.info(
+            f"Imported {imported} account(s) into {app_client.app_name} from app {previous_app_id}"
+        )
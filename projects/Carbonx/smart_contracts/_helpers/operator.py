@@ -0,0 +1,270 @@
+import argparse
+import dataclasses
+import importlib
+import json
+import logging
+import shutil
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import algokit_utils
+from algosdk import abi, encoding
+
+from smart_contracts._helpers.backends import snake_case
+from smart_contracts._helpers.deploy import fund_and_init_asset, shared_deploy_args
+from smart_contracts._helpers.deploy_graph import load_graph
+from smart_contracts._helpers.deploy_journal import complete_journal
+from smart_contracts._helpers.deploy_manifest import DeploymentManifest, deploy_asset
+from smart_contracts._helpers.events import EventDecoder, block_events
+
+logger = logging.getLogger(__name__)
+
+artifacts_dir = Path(__file__).parent.parent / "artifacts"
+# App specs and deployed app IDs the frontend imports, see `export_frontend`.
+frontend_contracts_dir = Path(__file__).parent.parent.parent / "frontend" / "src" / "contracts"
+
+# Box layout of RetirementManager certificates: b"r" + retiree + sequence -> certificate.
+CERTIFICATE_PREFIX = b"r"
+CERTIFICATE_TYPE = abi.ABIType.from_string("(uint64,uint64,address,byte[32])")
+
+# Operator commands run seconds apart, well within the validity window of the params.
+SUGGESTED_PARAMS_CACHE_MS = 60_000
+
+
+class Operator:
+    """
+    Runs carbonx operator commands against the network configured in the environment.
+    One instance lives as long as the carbonx daemon, so the Algorand client, deployer
+    account, suggested params, parsed ARC-56 specs and typed app clients are set up by
+    the first command that needs them and reused by every later one.
+    """
+
+    def __init__(self) -> None:
+        deploy_args = shared_deploy_args()
+        self.algorand: algokit_utils.AlgorandClient = deploy_args["algorand"]
+        self.deployer = deploy_args["deployer"]
+        self.algorand.set_suggested_params_cache_timeout(SUGGESTED_PARAMS_CACHE_MS)
+        self._app_clients: dict[str, Any] = {}
+
+    def app_client(self, contract: str) -> Any:
+        """The typed client of the app deployed for `contract`, per the deployment manifest."""
+        if contract not in self._app_clients:
+            app_spec_path = next((artifacts_dir / contract).glob("*.arc56.json"), None)
+            if app_spec_path is None:
+                raise Exception(f"No artifacts for {contract}, build it first")
+            app_name = json.loads(app_spec_path.read_text())["name"]
+            client_module = importlib.import_module(
+                f"smart_contracts.artifacts.{contract}.{snake_case(app_name)}_client"
+            )
+            factory = self.algorand.client.get_typed_app_factory(
+                getattr(client_module, f"{app_name}Factory"),
+                default_sender=self.deployer.address,
+            )
+            network = self.algorand.client.network()
+            recorded = DeploymentManifest(network.genesis_id, network.genesis_hash).get(app_name)
+            if recorded is None:
+                raise Exception(f"{app_name} is not in the deployment manifest, deploy it first")
+            self._app_clients[contract] = factory.get_app_client_by_id(recorded["app_id"])
+        return self._app_clients[contract]
+
+    def asset_info(self, asset_id: int) -> str:
+        params = self.algorand.client.algod.asset_info(asset_id)["params"]
+        return json.dumps(params, indent=2)
+
+    def app_state(self, contract: str) -> str:
+        app_client = self.app_client(contract)
+        state = {
+            key: value.hex() if isinstance(value, bytes) else value
+            for key, value in app_client.app_client.get_global_state().items()
+        }
+        return json.dumps(
+            {"app_id": app_client.app_id, "global_state": state}, indent=2, default=str
+        )
+
+    def stats(self, contracts: Sequence[str]) -> str:
+        # get_stats is readonly, so each app costs one simulate and no fees.
+        stats = {}
+        for contract in contracts:
+            result = self.app_client(contract).send.get_stats()
+            stats[contract] = dataclasses.asdict(result.abi_return)
+        return json.dumps(stats, indent=2)
+
+    def events(self, contracts: Sequence[str], first: int, last: int | None) -> str:
+        # One block fetch per round covers every app, instead of a state read per app.
+        decoders = {
+            self.app_client(contract).app_id: EventDecoder.from_artifacts(artifacts_dir / contract)
+            for contract in contracts
+        }
+        lines = []
+        for round_ in range(first, (last if last is not None else first) + 1):
+            for event in block_events(self.algorand.client.algod, round_, decoders):
+                lines.append(json.dumps(dataclasses.asdict(event)))
+        return "\n".join(lines)
+
+    def certificates(self, contract: str, retiree: str | None) -> str:
+        """Every retirement certificate of the app, one JSON line each, from its boxes."""
+        app_id = self.app_client(contract).app_id
+        keys = []
+        for box_name in self.algorand.app.get_box_names(app_id):
+            name = box_name.name_raw
+            if len(name) != 41 or not name.startswith(CERTIFICATE_PREFIX):
+                continue
+            box_retiree = encoding.encode_address(name[1:33])
+            if retiree is None or box_retiree == retiree:
+                keys.append((box_retiree, int.from_bytes(name[33:], "big"), name))
+        lines = []
+        for box_retiree, sequence, name in sorted(keys):
+            amount, round_, beneficiary, memo = CERTIFICATE_TYPE.decode(
+                self.algorand.app.get_box_value(app_id, name)
+            )
+            certificate = {
+                "retiree": box_retiree,
+                "sequence": sequence,
+                "amount": amount,
+                "round": round_,
+                "beneficiary": beneficiary,
+                "memo": bytes(memo).hex(),
+            }
+            lines.append(json.dumps(certificate))
+        return "\n".join(lines)
+
+    def create_asset(self, name: str) -> str:
+        node = load_graph().get(f"assets.{name}")
+        if node is None:
+            raise Exception(f"No asset {name} in the deployment graph")
+        asset_id = deploy_asset(self.algorand, self.deployer, node.name, node.params)
+        complete_journal(self.algorand)
+        return str(asset_id)
+
+    def init_asset(self, contract: str, asset_id: int) -> str:
+        app_client = self.app_client(contract)
+        fund_and_init_asset(
+            self.algorand,
+            app_client,
+            self.deployer.address,
+            False,
+            artifacts_dir / contract,
+            asset_id,
+        )
+        complete_journal(self.algorand)
+        return f"{app_client.app_name} ({app_client.app_id}) initialized with asset {asset_id}"
+
+    def export_frontend(self, contracts: Sequence[str]) -> str:
+        """
+        Copies the app specs of `contracts` (default: every built contract) to the frontend,
+        and records the IDs of their apps on this network, per the deployment manifest, in
+        its deployments.json, keyed by genesis ID and contract.
+        """
+        contracts = contracts or sorted(
+            path.parent.name for path in artifacts_dir.glob("*/*.arc56.json")
+        )
+        network = self.algorand.client.network()
+        manifest = DeploymentManifest(network.genesis_id, network.genesis_hash)
+        deployments_path = frontend_contracts_dir / "deployments.json"
+        deployments = (
+            json.loads(deployments_path.read_text()) if deployments_path.exists() else {}
+        )
+        app_ids = deployments.setdefault(network.genesis_id, {})
+        frontend_contracts_dir.mkdir(parents=True, exist_ok=True)
+        lines = []
+        for contract in contracts:
+            app_spec_path = next((artifacts_dir / contract).glob("*.arc56.json"), None)
+            if app_spec_path is None:
+                raise Exception(f"No artifacts for {contract}, build it first")
+            shutil.copyfile(app_spec_path, frontend_contracts_dir / app_spec_path.name)
+            recorded = manifest.get(json.loads(app_spec_path.read_text())["name"])
+            if recorded is None:
+                lines.append(f"{contract}: app spec only, not deployed on {network.genesis_id}")
+                continue
+            app_ids[contract] = recorded["app_id"]
+            lines.append(f"{contract}: app {recorded['app_id']} on {network.genesis_id}")
+        deployments_path.write_text(json.dumps(deployments, indent=2, sort_keys=True) + "\n")
+        return "\n".join(lines)
+
+    def deploy(self, contract: str | None) -> str:
+        # Runs the same deploy as `python -m smart_contracts deploy`, with warm imports.
+        smart_contracts_main = importlib.import_module("smart_contracts.__main__")
+        smart_contracts_main.main("deploy", contract)
+        # A deploy can replace apps, so clients cached by contract may point at old app IDs.
+        self._app_clients.clear()
+        return "deployed"
+
+    def run(self, command: str, args: Sequence[str]) -> str:
+        """Runs one command line, e.g. `asset-info 1008`, and returns its output."""
+        parsed = parser().parse_args([command, *args])
+        match parsed.command:
+            case "asset-info":
+                return self.asset_info(parsed.asset_id)
+            case "app-state":
+                return self.app_state(parsed.contract)
+            case "stats":
+                return self.stats(parsed.contracts)
+            case "events":
+                return self.events(parsed.contracts, parsed.first, parsed.last)
+            case "certificates":
+                return self.certificates(parsed.contract, parsed.retiree)
+            case "create-asset":
+                return self.create_asset(parsed.name)
+            case "init-asset":
+                return self.init_asset(parsed.contract, parsed.asset_id)
+            case "export-frontend":
+                return self.export_frontend(parsed.contracts)
+            case "deploy":
+                return self.deploy(parsed.contract)
+        raise Exception(f"Unknown command: {command}")
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    def error(self, message: str) -> Any:
+        # Raised instead of exiting, so a bad command does not stop the daemon.
+        raise Exception(f"{self.prog}: {message}")
+
+    def exit(self, status: int = 0, message: str | None = None) -> Any:
+        raise Exception(message or f"{self.prog} exited with status {status}")
+
+
+def parser() -> argparse.ArgumentParser:
+    """Arguments of the operator commands, shared by the CLI and the daemon."""
+    parser = _ArgumentParser(prog="carbonx")
+    commands = parser.add_subparsers(dest="command", required=True)
+    asset_info = commands.add_parser("asset-info", help="Show the parameters of an asset")
+    asset_info.add_argument("asset_id", type=int)
+    app_state = commands.add_parser(
+        "app-state", help="Show the global state of the app deployed for a contract"
+    )
+    app_state.add_argument("contract")
+    stats = commands.add_parser(
+        "stats", help="Show the counters of the apps deployed for contracts, from get_stats"
+    )
+    stats.add_argument("contracts", nargs="+")
+    events = commands.add_parser(
+        "events",
+        help="Show the ARC-28 events the apps deployed for contracts emitted in a round range",
+    )
+    events.add_argument("first", type=int, help="First round")
+    events.add_argument("last", type=int, nargs="?", default=None, help="Last round")
+    events.add_argument("--contract", dest="contracts", action="append", required=True)
+    certificates = commands.add_parser(
+        "certificates", help="Export the retirement certificates of a retirement manager"
+    )
+    certificates.add_argument("contract", nargs="?", default="retirement_manager")
+    certificates.add_argument("--retiree", default=None, help="Only this account's")
+    create_asset = commands.add_parser(
+        "create-asset",
+        help="Create an asset of smart_contracts/deployment.toml, or show the existing one",
+    )
+    create_asset.add_argument("name")
+    init_asset = commands.add_parser(
+        "init-asset", help="Fund a deployed app and call init_asset with an asset"
+    )
+    init_asset.add_argument("contract")
+    init_asset.add_argument("asset_id", type=int)
+    export_frontend = commands.add_parser(
+        "export-frontend",
+        help="Copy app specs and the app IDs deployed on this network to the frontend",
+    )
+    export_frontend.add_argument("contracts", nargs="*")
+    deploy = commands.add_parser("deploy", help="Deploy all contracts, or one")
+    deploy.add_argument("contract", nargs="?", default=None)
+    return parser
@@ -0,0 +1,167 @@
+import base64
+import dataclasses
+import hashlib
+import json
+import logging
+import tempfile
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from smart_contracts._helpers import trace
+from smart_contracts._helpers.backends import BuildBackend
+from smart_contracts._helpers.build import compile_flags
+from smart_contracts._helpers.teal_report import write_reports
+
+logger = logging.getLogger(__name__)
+
+# Optimization levels accepted by puyapy's -O flag.
+OPTIMIZATION_LEVELS = (0, 1, 2)
+
+
+@dataclasses.dataclass
+class LevelResult:
+    level: int
+    program_size_bytes: int | None
+    method_costs: dict[str, int]
+    approval_sha256: str
+
+    @property
+    def total_cost(self) -> int:
+        return sum(self.method_costs.values())
+
+    @property
+    def max_cost(self) -> int:
+        return max(self.method_costs.values(), default=0)
+
+
+def _size_or_inf(result: LevelResult) -> float:
+    return float("inf") if result.program_size_bytes is None else result.program_size_bytes
+
+
+# Sort keys for picking a level; lower is better and ties go to the lower level.
+POLICIES: dict[str, Callable[[LevelResult], tuple]] = {
+    "size": lambda result: (_size_or_inf(result), result.total_cost, result.level),
+    "cost": lambda result: (
+        result.max_cost,
+        result.total_cost,
+        _size_or_inf(result),
+        result.level,
+    ),
+}
+
+
+def _approval_sha256(output_dir: Path) -> str:
+    """Hashes the approval bytecode from the app spec, or the TEAL when there is none."""
+    digest = hashlib.sha256()
+    for app_spec_path in sorted(output_dir.glob("*.arc56.json")):
+        approval = json.loads(app_spec_path.read_text()).get("byteCode", {}).get("approval")
+        if approval:
+            digest.update(base64.b64decode(approval))
+            continue
+        for teal_path in sorted(output_dir.glob("*.approval.teal")):
+            digest.update(teal_path.read_bytes())
+    return digest.hexdigest()
+
+
+def compile_levels(
+    contract_path: Path,
+    backend: BuildBackend,
+    levels: Sequence[int] = OPTIMIZATION_LEVELS,
+) -> list[LevelResult]:
+    """Compiles the contract once per optimization level and measures each approval program."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="carbonx-opt-") as work_dir:
+        for level in levels:
+            output_dir = Path(work_dir) / f"O{level}"
+            output_dir.mkdir()
+            logger.info(f"Compiling {contract_path} at -O{level}")
+            with trace.span("compile", "matrix", contract=contract_path.parent.name, level=level):
+                backend.compile(contract_path, output_dir, [*compile_flags, f"-O{level}"])
+            reports = [json.loads(path.read_text()) for path in write_reports(output_dir)]
+            sizes = [report["program_size_bytes"] for report in reports]
+            results.append(
+                LevelResult(
+                    level=level,
+                    program_size_bytes=sum(sizes) if sizes and None not in sizes else None,
+                    method_costs={
+                        signature: method["cost"]
+                        for report in reports
+                        for signature, method in report["methods"].items()
+                    },
+                    approval_sha256=_approval_sha256(output_dir),
+                )
+            )
+    return results
+
+
+def select_level(results: Sequence[LevelResult], policy: str) -> LevelResult:
+    return min(results, key=POLICIES[policy])
+
+
+def format_matrix(
+    name: str, results: Sequence[LevelResult], selected: LevelResult, policy: str
+) -> str:
+    """Renders the per-level sizes and method costs as a table, one column per level."""
+    first_with_hash: dict[str, int] = {}
+    for result in results:
+        first_with_hash.setdefault(result.approval_sha256, result.level)
+
+    rows = [
+        [name, *(f"-O{result.level}" for result in results)],
+        ["program bytes", *(str(result.program_size_bytes or "?") for result in results)],
+    ]
+    signatures = list(
+        dict.fromkeys(signature for result in results for signature in result.method_costs)
+    )
+    for signature in signatures:
+        rows.append(
+            [signature, *(str(result.method_costs.get(signature, "-")) for result in results)]
+        )
+    rows.append(
+        [
+            "same program as",
+            *(
+                f"-O{first_with_hash[result.approval_sha256]}"
+                if first_with_hash[result.approval_sha256] != result.level
+                else "-"
+                for result in results
+            ),
+        ]
+    )
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    lines = [
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True))
+        for row in rows
+    ]
+    lines.append(f"selected -O{selected.level} (policy: {policy})")
+    return "\n".join(lines)
+
+
+def write_matrix(
+    output_dir: Path,
+    name: str,
+    results: Sequence[LevelResult],
+    selected: LevelResult,
+    policy: str,
+) -> Path:
+    """Stores the matrix next to the selected artifacts as `<name>.optimization_matrix.json`."""
+    path = output_dir / f"{name}.optimization_matrix.json"
+    path.write_text(
+        json.dumps(
+            {
+                "policy": policy,
+                "selected_level": selected.level,
+                "levels": [
+                    {
+                        **dataclasses.asdict(result),
+                        "total_cost": result.total_cost,
+                        "max_cost": result.max_cost,
+                    }
+                    for result in results
+                ],
+            },
+            indent=2,
+        )
+        + "\n"
+    )
+    return path
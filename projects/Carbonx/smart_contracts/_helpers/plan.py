@@ -0,0 +1,240 @@
+import dataclasses
+import json
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import algokit_utils
+from algosdk.logic import get_application_address
+from algosdk.transaction import SignedTransaction, assign_group_id
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from smart_contracts._helpers.mbr import app_account_min_balance, creator_min_balance
+
+logger = logging.getLogger(__name__)
+
+CREATE_METHOD = "create()void"
+INIT_ASSET_METHOD = "init_asset(uint64)void"
+# Fee surplus carried by the first transaction, so the simulation reports what the
+# inner transactions need instead of stopping at the first fee shortfall.
+FEE_HEADROOM = algokit_utils.AlgoAmount(micro_algo=16_000)
+
+
+@dataclasses.dataclass
+class PlannedApp:
+    name: str
+    app_spec: dict
+    app_id: int
+    init_asset: bool
+
+    @property
+    def funding(self) -> int:
+        """What the deploy pays into the new app account: exactly its minimum balance."""
+        return app_account_min_balance(self.app_spec, 1 if self.init_asset else 0)
+
+
+@dataclasses.dataclass
+class PlannedTransaction:
+    label: str
+    app: PlannedApp | None = None
+    is_app_call: bool = False
+
+
+def _inner_transactions(txn_result: dict) -> list[dict]:
+    """Flattens the inner transactions of a simulated transaction, depth first."""
+    inner = []
+    for inner_txn in txn_result.get("inner-txns", []):
+        inner.append(inner_txn)
+        inner.extend(_inner_transactions(inner_txn))
+    return inner
+
+
+def _is_opt_in(inner_txn: dict) -> bool:
+    txn = inner_txn["txn"]["txn"]
+    return (
+        txn.get("type") == "axfer" and txn.get("snd") == txn.get("arcv") and not txn.get("aamt")
+    )
+
+
+def plan_deployment(
+    algorand: algokit_utils.AlgorandClient,
+    deployer_address: str,
+    app_spec_paths: Sequence[Path],
+    cxt_asset_id: int = 0,
+) -> str:
+    """
+    Simulates a fresh deployment of the given apps as one transaction group: every
+    create, then every MBR funding payment, then every `init_asset` call. Returns a
+    report of the fees, opcode budgets and minimum balances it needs, and any failure.
+
+    The apps do not exist yet, so their IDs are predicted from the transaction counter
+    of the latest block and checked against the IDs the simulation assigns.
+    """
+    algod = algorand.client.algod
+    last_round = algod.status()["last-round"]
+    txn_counter = algod.block_info(last_round)["block"].get("tc", 0)
+    min_fee = algorand.get_suggested_params().min_fee
+
+    apps = []
+    for index, app_spec_path in enumerate(app_spec_paths):
+        app_spec = json.loads(app_spec_path.read_text())
+        methods = {method["name"] for method in app_spec["methods"]}
+        apps.append(
+            PlannedApp(
+                name=app_spec["name"],
+                app_spec=app_spec,
+                # Creates go first in the group, and each one takes the next ID.
+                app_id=txn_counter + 1 + index,
+                init_asset=cxt_asset_id != 0 and "init_asset" in methods,
+            )
+        )
+
+    composer = algorand.new_group()
+    planned: list[PlannedTransaction] = []
+    factories = {}
+    for index, app in enumerate(apps):
+        factory = algokit_utils.AppFactory(
+            algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=json.dumps(app.app_spec),
+                default_sender=deployer_address,
+            )
+        )
+        factories[app.name] = factory
+        composer.add_app_create_method_call(
+            factory.params.create(
+                algokit_utils.AppFactoryCreateMethodCallParams(
+                    method=CREATE_METHOD,
+                    extra_fee=FEE_HEADROOM if index == 0 else None,
+                )
+            )
+        )
+        planned.append(PlannedTransaction(f"create {app.name}", app, is_app_call=True))
+    for app in apps:
+        composer.add_payment(
+            algokit_utils.PaymentParams(
+                sender=deployer_address,
+                receiver=get_application_address(app.app_id),
+                amount=algokit_utils.AlgoAmount(micro_algo=app.funding),
+            )
+        )
+        planned.append(PlannedTransaction(f"fund {app.name}", app))
+    for app in apps:
+        if not app.init_asset:
+            continue
+        app_client = factories[app.name].get_app_client_by_id(app.app_id)
+        composer.add_app_call_method_call(
+            app_client.params.call(
+                algokit_utils.AppClientMethodCallParams(
+                    method=INIT_ASSET_METHOD,
+                    args=[cxt_asset_id],
+                    asset_references=[cxt_asset_id],
+                )
+            )
+        )
+        planned.append(PlannedTransaction(f"init_asset {app.name}", app, is_app_call=True))
+
+    transactions = composer.build_transactions().transactions
+    if not transactions[0].group:
+        transactions = assign_group_id(transactions)
+    response = algod.simulate_transactions(
+        SimulateRequest(
+            txn_groups=[
+                SimulateRequestTransactionGroup(
+                    txns=[SignedTransaction(txn, None) for txn in transactions]
+                )
+            ],
+            round=last_round,
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True,
+        )
+    )
+    return _format_plan(planned, transactions, response, min_fee, last_round)
+
+
+def _format_plan(
+    planned: list[PlannedTransaction],
+    transactions: list[Any],
+    response: dict,
+    min_fee: int,
+    last_round: int,
+) -> str:
+    group = response["txn-groups"][0]
+    results = group.get("txn-results", [])
+    lines = [f"Simulated {len(planned)} transactions on top of round {last_round}"]
+    rows = [["#", "transaction", "fee paid", "fee needed", "budget used", "inner txns"]]
+    total_fees = 0
+    total_needed = 0
+    opt_ins: dict[str, int] = {}
+    apps: dict[str, PlannedApp] = {}
+    notes: list[str] = []
+    for index, (planned_txn, txn) in enumerate(zip(planned, transactions, strict=True)):
+        result = results[index] if index < len(results) else {}
+        txn_result = result.get("txn-result", {})
+        budget_used = result.get("app-call-budget-consumed", "-")
+        inner = _inner_transactions(txn_result)
+        needed = min_fee * (1 + len(inner))
+        total_fees += txn.fee
+        total_needed += needed
+        if planned_txn.app is not None:
+            apps[planned_txn.app.name] = planned_txn.app
+            opt_ins[planned_txn.app.name] = opt_ins.get(planned_txn.app.name, 0) + sum(
+                1 for inner_txn in inner if _is_opt_in(inner_txn)
+            )
+            created = txn_result.get("application-index")
+            if created is not None and created != planned_txn.app.app_id:
+                notes.append(
+                    f"{planned_txn.app.name} was assigned app {created}, not the predicted "
+                    f"{planned_txn.app.app_id}; a new block landed, re-run the plan"
+                )
+        if inner:
+            notes.append(
+                f"{planned_txn.label} needs {needed} µALGO in fees to cover its "
+                f"{len(inner)} inner transaction(s); pool them or set extra_fee"
+            )
+        rows.append(
+            [
+                str(index),
+                planned_txn.label,
+                str(txn.fee),
+                str(needed),
+                str(budget_used) if planned_txn.is_app_call else "-",
+                str(len(inner)),
+            ]
+        )
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    lines += [
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True)).rstrip()
+        for row in rows
+    ]
+
+    lines.append(
+        f"Fees: {total_needed} µALGO needed ({total_fees} paid in the simulation, including "
+        f"{FEE_HEADROOM.micro_algo} headroom); app budget "
+        f"{group.get('app-budget-consumed', 0)} of {group.get('app-budget-added', 0)} pooled"
+    )
+
+    creator_mbr = sum(
+        creator_min_balance(planned_txn.app.app_spec, txn.extra_pages)
+        for planned_txn, txn in zip(planned, transactions, strict=True)
+        if planned_txn.app is not None and planned_txn.label.startswith("create ")
+    )
+    lines.append(f"Deployer minimum balance: +{creator_mbr} µALGO for the created apps")
+    for name, count in opt_ins.items():
+        required = app_account_min_balance(apps[name].app_spec, count)
+        funded = apps[name].funding
+        lines.append(
+            f"{name} account minimum balance: {required} µALGO ({count} ASA opt-in(s)), "
+            f"funded {funded} µALGO ({funded - required:+} µALGO)"
+        )
+
+    unnamed = group.get("unnamed-resources-accessed")
+    if unnamed:
+        notes.append(f"Resources not referenced by the transactions: {json.dumps(unnamed)}")
+    if "failure-message" in group:
+        failed_at = group.get("failed-at", [])
+        label = planned[failed_at[0]].label if failed_at else "the group"
+        notes.append(f"FAILED at {label}: {group['failure-message']}")
+    lines += notes
+    return "\n".join(lines)
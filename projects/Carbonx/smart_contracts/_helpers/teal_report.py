@@ -0,0 +1,362 @@
+import base64
+import dataclasses
+import json
+import logging
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Opcode budget of a single application call.
+APP_CALL_BUDGET = 700
+
+# Static costs of opcodes that do not cost 1. Opcodes whose cost depends on their
+# input (e.g. `sumhash512`, `json_ref`) are listed with their minimum cost.
+OPCODE_COSTS: dict[str, int] = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "sumhash512": 150,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "divmodw": 20,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+    "json_ref": 25,
+    "ec_add": 125,
+    "ec_scalar_mul": 1810,
+    "ec_pairing_check": 8000,
+    "ec_multi_scalar_mul": 3600,
+    "ec_subgroup_check": 20,
+    "ec_map_to": 630,
+    "mimc": 10,
+}
+
+_TERMINATORS = {"return", "err", "retsub"}
+_CONDITIONAL_BRANCHES = {"bz", "bnz"}
+_MULTI_BRANCHES = {"match", "switch"}
+_STATIC_SCRATCH_OPS = {"load", "store"}
+_METHOD_COMMENT = re.compile(r'method "([^"]+)"')
+
+
+@dataclasses.dataclass
+class Instruction:
+    op: str
+    args: list[str]
+    comment: str
+    line: int
+    size: int | None = None
+
+    @property
+    def cost(self) -> int:
+        return OPCODE_COSTS.get(self.op, 1)
+
+
+@dataclasses.dataclass
+class MethodReport:
+    cost: int
+    size_bytes: int | None
+    scratch_slots: int
+    has_loops: bool
+
+
+def _split_comment(line: str) -> tuple[str, str]:
+    """Splits a TEAL line into code and comment, ignoring `//` inside string literals."""
+    in_string = False
+    escaped = False
+    for index, char in enumerate(line):
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = in_string
+        elif char == '"':
+            in_string = not in_string
+        elif not in_string and line.startswith("//", index):
+            return line[:index].strip(), line[index + 2 :].strip()
+    return line.strip(), ""
+
+
+def parse_teal(teal: str) -> tuple[list[Instruction], dict[str, int]]:
+    """Parses TEAL source into instructions and a map of label -> instruction index."""
+    instructions: list[Instruction] = []
+    labels: dict[str, int] = {}
+    for line_number, raw_line in enumerate(teal.splitlines(), start=1):
+        code, comment = _split_comment(raw_line)
+        if not code or code.startswith("#pragma"):
+            continue
+        if code.endswith(":") and " " not in code:
+            labels[code[:-1]] = len(instructions)
+            continue
+        op, *args = code.split()
+        instructions.append(Instruction(op, args, comment, line_number))
+    return instructions, labels
+
+
+def _apply_source_map(
+    instructions: list[Instruction], source_map: dict, program_size: int | None
+) -> None:
+    """Uses the pc of each op in a `.puya.map` to work out its encoded size in bytes."""
+    pcs = sorted(int(pc) for pc in source_map.get("pc_events", {}))
+    if len(pcs) != len(instructions):
+        logger.warning(
+            f"Source map lists {len(pcs)} ops but the TEAL has {len(instructions)}; "
+            "skipping size information"
+        )
+        return
+    ends = [*pcs[1:], program_size]
+    for instruction, start, end in zip(instructions, pcs, ends, strict=True):
+        instruction.size = end - start if end is not None else None
+
+
+class ProgramAnalysis:
+    """Static worst-case cost, size and scratch usage of a compiled approval program."""
+
+    def __init__(self, instructions: list[Instruction], labels: dict[str, int]) -> None:
+        self.instructions = instructions
+        self.labels = labels
+        self.back_edges = self._find_back_edges()
+        self._longest: dict[int, int] = {}
+
+    def _successors(self, index: int) -> list[int]:
+        instruction = self.instructions[index]
+        if instruction.op in _TERMINATORS:
+            return []
+        if instruction.op == "b":
+            return [self.labels[instruction.args[0]]]
+        following = [index + 1] if index + 1 < len(self.instructions) else []
+        if instruction.op in _CONDITIONAL_BRANCHES:
+            return following + [self.labels[instruction.args[0]]]
+        if instruction.op in _MULTI_BRANCHES:
+            return following + [self.labels[label] for label in instruction.args]
+        return following
+
+    def _find_back_edges(self) -> set[tuple[int, int]]:
+        """Finds the edges that close a loop, from the program entry and every subroutine."""
+        if not self.instructions:
+            return set()
+        roots = [0] + [
+            self.labels[instruction.args[0]]
+            for instruction in self.instructions
+            if instruction.op == "callsub"
+        ]
+        back_edges: set[tuple[int, int]] = set()
+        visited: set[int] = set()
+        for root in roots:
+            if root in visited:
+                continue
+            visited.add(root)
+            on_stack = {root}
+            stack = [(root, iter(self._successors(root)))]
+            while stack:
+                index, successors = stack[-1]
+                successor = next(successors, None)
+                if successor is None:
+                    stack.pop()
+                    on_stack.discard(index)
+                elif successor in on_stack:
+                    back_edges.add((index, successor))
+                elif successor not in visited:
+                    visited.add(successor)
+                    on_stack.add(successor)
+                    stack.append((successor, iter(self._successors(successor))))
+        return back_edges
+
+    def _forward(self, index: int) -> list[int]:
+        """Successors of `index` with loop-closing edges removed, so the graph is acyclic."""
+        return [
+            successor
+            for successor in self._successors(index)
+            if (index, successor) not in self.back_edges
+        ]
+
+    def _postorder(self, start: int, done: Iterable[int] = ()) -> list[int]:
+        """Acyclic-graph postorder from `start`: every node comes after its successors."""
+        visited = {start, *done}
+        order: list[int] = []
+        stack = [(start, iter(self._forward(start)))]
+        while stack:
+            index, successors = stack[-1]
+            successor = next(successors, None)
+            if successor is None:
+                stack.pop()
+                order.append(index)
+            elif successor not in visited:
+                visited.add(successor)
+                stack.append((successor, iter(self._forward(successor))))
+        return order
+
+    def _own_cost(self, index: int) -> int:
+        """Cost of one instruction, including the whole subroutine for a `callsub`."""
+        instruction = self.instructions[index]
+        if instruction.op == "callsub":
+            return instruction.cost + self._longest_from(self.labels[instruction.args[0]])
+        return instruction.cost
+
+    def _longest_from(self, start: int) -> int:
+        """Cost of the most expensive path from `start` to a terminator.
+
+        Loop bodies are counted once, as their trip count is unknown statically.
+        """
+        if start not in self._longest:
+            for index in self._postorder(start, self._longest):
+                self._longest[index] = self._own_cost(index) + max(
+                    (self._longest[successor] for successor in self._forward(index)),
+                    default=0,
+                )
+        return self._longest[start]
+
+    def _reachable(self, index: int) -> set[int]:
+        """Instructions reachable from `index`, including the bodies of called subroutines."""
+        reachable = {index}
+        pending = [index]
+        while pending:
+            current = pending.pop()
+            instruction = self.instructions[current]
+            following = list(self._successors(current))
+            if instruction.op == "callsub":
+                following.append(self.labels[instruction.args[0]])
+            for successor in following:
+                if successor not in reachable:
+                    reachable.add(successor)
+                    pending.append(successor)
+        return reachable
+
+    def _cost_to(self, target: int) -> int:
+        """Cost of the most expensive path from program entry up to, but excluding, `target`."""
+        costs = {0: 0}
+        for index in reversed(self._postorder(0)):
+            if index not in costs or index == target:
+                continue
+            cost = costs[index] + self._own_cost(index)
+            for successor in self._forward(index):
+                costs[successor] = max(costs.get(successor, 0), cost)
+        return costs.get(target, 0)
+
+    def method_entries(self) -> dict[str, tuple[int, int]]:
+        """Maps each ABI method signature to (router `match` index, method entry index)."""
+        entries: dict[str, tuple[int, int]] = {}
+        selectors: list[str] = []
+        previous_op = None
+        for index, instruction in enumerate(self.instructions):
+            if instruction.op in ("pushbytes", "pushbytess"):
+                # -O0 pushes each selector with its own pushbytes instead of one pushbytess.
+                pushed = _METHOD_COMMENT.findall(instruction.comment)
+                if pushed and previous_op in ("pushbytes", "pushbytess") and selectors:
+                    selectors.extend(pushed)
+                else:
+                    selectors = pushed
+            elif instruction.op == "match" and selectors:
+                for signature, label in zip(selectors, instruction.args, strict=False):
+                    entries[signature] = (index, self.labels[label])
+                selectors = []
+            previous_op = instruction.op
+        return entries
+
+    def method_report(self, match_index: int, entry: int) -> MethodReport:
+        router_cost = self._cost_to(match_index) + self.instructions[match_index].cost
+        reachable = self._reachable(entry) | set(range(match_index + 1))
+        sizes = [self.instructions[index].size for index in sorted(reachable)]
+        scratch_slots = {
+            self.instructions[index].args[0]
+            for index in reachable
+            if self.instructions[index].op in _STATIC_SCRATCH_OPS
+        }
+        return MethodReport(
+            cost=router_cost + self._longest_from(entry),
+            size_bytes=None if None in sizes else sum(sizes),  # type: ignore[arg-type]
+            scratch_slots=len(scratch_slots),
+            has_loops=any(edge[0] in reachable for edge in self.back_edges),
+        )
+
+
+def _program_size(app_spec_path: Path | None) -> int | None:
+    if app_spec_path is None or not app_spec_path.exists():
+        return None
+    app_spec = json.loads(app_spec_path.read_text())
+    approval = app_spec.get("byteCode", {}).get("approval")
+    return len(base64.b64decode(approval)) if approval else None
+
+
+def build_report(approval_teal_path: Path) -> dict:
+    """Builds the cost report for an `*.approval.teal` file and its sibling artifacts."""
+    contract_name = approval_teal_path.name.removesuffix(".approval.teal")
+    output_dir = approval_teal_path.parent
+    source_map_path = output_dir / f"{contract_name}.approval.puya.map"
+    app_spec_path = output_dir / f"{contract_name}.arc56.json"
+
+    instructions, labels = parse_teal(approval_teal_path.read_text())
+    program_size = _program_size(app_spec_path)
+    if source_map_path.exists():
+        _apply_source_map(instructions, json.loads(source_map_path.read_text()), program_size)
+
+    analysis = ProgramAnalysis(instructions, labels)
+    methods = {
+        signature: dataclasses.asdict(analysis.method_report(match_index, entry))
+        for signature, (match_index, entry) in analysis.method_entries().items()
+    }
+    return {
+        "contract": contract_name,
+        "program_size_bytes": program_size,
+        "app_call_budget": APP_CALL_BUDGET,
+        "methods": methods,
+    }
+
+
+def report_path(approval_teal_path: Path) -> Path:
+    contract_name = approval_teal_path.name.removesuffix(".approval.teal")
+    return approval_teal_path.with_name(f"{contract_name}.cost_report.json")
+
+
+def write_reports(output_dir: Path) -> list[Path]:
+    """Writes a `*.cost_report.json` next to every approval program in `output_dir`."""
+    written = []
+    for approval_teal_path in sorted(output_dir.glob("*.approval.teal")):
+        path = report_path(approval_teal_path)
+        path.write_text(json.dumps(build_report(approval_teal_path), indent=2) + "\n")
+        written.append(path)
+    return written
+
+
+def check_budget(output_dirs: Iterable[Path], budget: int) -> None:
+    """
+    Raises if any ABI method in the reports under `output_dirs` costs more than `budget`.
+
+    The cost of a method with loops counts each loop body once, so it is no upper
+    bound; those methods are listed in a warning instead of passing silently.
+    """
+    over_budget = []
+    unbounded = []
+    for output_dir in output_dirs:
+        for path in sorted(output_dir.glob("*.cost_report.json")):
+            report = json.loads(path.read_text())
+            for signature, method in report["methods"].items():
+                if method["cost"] > budget:
+                    over_budget.append(
+                        f"{report['contract']}.{signature}: {method['cost']} > {budget}"
+                    )
+                elif method["has_loops"]:
+                    unbounded.append(f"{report['contract']}.{signature}: {method['cost']}")
+    if unbounded:
+        logger.warning(
+            f"Not checked against the budget of {budget}: these methods loop, and their "
+            "static cost counts each loop body only once:\n" + "\n".join(unbounded)
+        )
+    if over_budget:
+        raise Exception(
+            "Static opcode cost exceeds the budget:\n" + "\n".join(over_budget)
+        )
@@ -0,0 +1,88 @@
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Trace events recorded by this process, or None while tracing is disabled.
+_events: list[dict[str, Any]] | None = None
+_lock = threading.Lock()
+
+
+def enable() -> None:
+    """Starts recording spans in this process."""
+    global _events
+    if _events is None:
+        _events = []
+
+
+def is_enabled() -> bool:
+    return _events is not None
+
+
+def _now_us() -> int:
+    # Wall-clock time, so spans recorded in build worker processes line up with the parent.
+    return time.time_ns() // 1000
+
+
+@contextlib.contextmanager
+def span(name: str, category: str = "carbonx", **args: Any) -> Iterator[None]:
+    """
+    Records the duration of the enclosed block as a Chrome trace "complete" event.
+    Does nothing unless tracing has been enabled.
+    """
+    if _events is None:
+        yield
+        return
+    start = _now_us()
+    try:
+        yield
+    finally:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start,
+            "dur": _now_us() - start,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+        with _lock:
+            _events.append(event)
+
+
+def collect() -> list[dict[str, Any]]:
+    """Returns and clears the spans recorded so far, e.g. to hand them from a worker to the parent."""
+    if _events is None:
+        return []
+    with _lock:
+        events = _events[:]
+        _events.clear()
+    return events
+
+
+def extend(events: Iterable[dict[str, Any]]) -> None:
+    """Adds spans recorded by another process."""
+    if _events is None:
+        return
+    with _lock:
+        _events.extend(events)
+
+
+def write(path: Path) -> None:
+    """Writes the recorded spans as a Chrome/Perfetto trace (open it in ui.perfetto.dev)."""
+    if _events is None:
+        return
+    with _lock:
+        events = sorted(_events, key=lambda event: event["ts"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+    logger.info(f"Wrote {len(events)} trace spans to {path}")
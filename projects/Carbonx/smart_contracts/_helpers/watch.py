@@ -0,0 +1,85 @@
+import dataclasses
+import logging
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from smart_contracts._helpers.build_cache import local_dependencies
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class WatchedContract:
+    name: str
+    contract_path: Path
+    deploy_config_path: Path
+
+
+def _mtimes(paths: set[Path]) -> dict[Path, int]:
+    """Returns the modification time of every path, or -1 if it does not exist."""
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtimes[path] = -1
+    return mtimes
+
+
+def _watched_files(contract: WatchedContract, project_root: Path) -> set[Path]:
+    """The contract, every project-local module it imports, and its deploy config."""
+    try:
+        files = set(local_dependencies(contract.contract_path, project_root))
+    except SyntaxError:
+        # Keep watching the file while it is mid-edit; imports are re-read on the next change.
+        files = {contract.contract_path.resolve()}
+    files.add(contract.deploy_config_path.resolve())
+    return files
+
+
+def watch_contracts(
+    contracts: Sequence[WatchedContract],
+    project_root: Path,
+    on_change: Callable[[WatchedContract, set[Path]], None],
+    interval: float = 0.5,
+) -> None:
+    """
+    Polls the sources of each contract and calls `on_change` with the files that
+    changed. Changes are debounced until the files have been stable for one
+    interval, so an editor saving several files only triggers one callback.
+    Runs until interrupted.
+    """
+    watched = {contract.name: _watched_files(contract, project_root) for contract in contracts}
+    mtimes = {name: _mtimes(files) for name, files in watched.items()}
+    logger.info(
+        f"Watching {len(contracts)} contract(s) for changes: "
+        + ", ".join(contract.name for contract in contracts)
+    )
+
+    pending: dict[str, set[Path]] = {}
+    while True:
+        time.sleep(interval)
+        settled = dict(pending)
+        pending.clear()
+        for contract in contracts:
+            current = _mtimes(watched[contract.name])
+            changed = {
+                path for path, mtime in current.items() if mtimes[contract.name].get(path) != mtime
+            }
+            mtimes[contract.name] = current
+            if changed:
+                pending[contract.name] = settled.pop(contract.name, set()) | changed
+
+        for contract in contracts:
+            changed_files = settled.get(contract.name)
+            if not changed_files:
+                continue
+            # The imports of the contract may have changed with the edit. Snapshot them
+            # before rebuilding, so files saved during the rebuild trigger another one.
+            watched[contract.name] = _watched_files(contract, project_root)
+            mtimes[contract.name] = _mtimes(watched[contract.name])
+            try:
+                on_change(contract, changed_files)
+            except Exception as e:
+                logger.error(f"Rebuilding {contract.name} failed: {e}")
@@ -4,6 +4,8 @@
 # This file was automatically generated by algokit-client-generator.
 # DO NOT MODIFY IT BY HAND.
 # requires: algokit-utils@^3.0.0
+# arc56-sha256: b670b0f159332c2f0780e4202287a5f44da3e04aa53ed35e2a1acc8c03d24f2a
+# algokit-client-generator: 2.2.0
 
 # common
 import dataclasses
@@ -19,7 +21,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Initialise the marketplace.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The $CXT asset to opt-in to.", "name": "asset"}], "name": "init_asset", "returns": {"type": "void"}, "desc": "Opt-in to the $CXT ASA and set its ID. Creator only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "The payment transaction from the buyer to the contract.", "name": "buyer_tx"}, {"type": "uint64", "desc": "Number of credits to purchase.", "name": "amount"}], "name": "buy_credits", "returns": {"type": "void"}, "desc": "Purchase carbon credits using ALGO.\nThe contract sends $CXT tokens from its balance to the buyer.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "axfer", "desc": "The asset transfer from the creator/reserve to the contract.", "name": "axfer_tx"}], "name": "mint_credits", "returns": {"type": "void"}, "desc": "Deposit new $CXT credits into the contract. Creator only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_asset_id", "returns": {"type": "uint64"}, "desc": "Return the $CXT Asset ID.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_credits", "returns": {"type": "uint64"}, "desc": "Return the total credits distributed.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_retired_credits", "returns": {"type": "uint64"}, "desc": "Return the cumulative retired credits.", "events": [], "readonly": true, "recommendations": {}}], "name": "CarbonMarketplace", "state": {"keys": {"box": {}, "global": {"total_credits": {"key": "dG90YWxfY3JlZGl0cw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "retired_credits": {"key": "cmV0aXJlZF9jcmVkaXRz", "keyType": "AVMString", "valueType": "AVMUint64"}, "cxt_asset_id": {"key": "Y3h0X2Fzc2V0X2lk", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 3}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CyAEAAEECCYEDGN4dF9hc3NldF9pZA10b3RhbF9jcmVkaXRzD3JldGlyZWRfY3JlZGl0cwQVH3x1MRhAAAkpImcqImcoImcxGRREMRhBADKCBgQ7tj7XBL1K6H0EBi1hngRboiqEBAkvWtEEFAkZUjYaAI4GABoARgCEAKUAsAC7AIAETFxhujYaAI4BAAEAKSJnKiJnKCJnI0M2GgFJFSUSRBcxADIJEkQiKGVEFEQoSwFnsTIKIrISshSyESSyECKyAbMjQzEWIwlJOBAjEkQ2GgFJFSUSRBdMOAcyChJESUQiKGVESUSxMQBLArISshSyESSyECKyAbMiKWVECClMZyNDMRYjCUk4ECQSRDEAMgkSREk4FDIKEkQ4ESIoZUQSRCNDIihlRBYrTFCwI0MiKWVEFitMULAjQyIqZUQWK0xQsCND", "clear": "C4EBQw=="}, "desc": "Marketplace for distributing $CXT carbon credits via real tokens.\n\n    Global state:\n        total_credits    \u2013 total credits distributed (informative)\n        retired_credits  \u2013 cumulative credits permanently retired\n        cxt_asset_id    \u2013 the Asset ID of the $CXT token\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgNCA4CiAgICBieXRlY2Jsb2NrICJjeHRfYXNzZXRfaWQiICJ0b3RhbF9jcmVkaXRzIiAicmV0aXJlZF9jcmVkaXRzIiAweDE1MWY3Yzc1CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE1CiAgICAvLyBzZWxmLnRvdGFsX2NyZWRpdHMgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0idG90YWxfY3JlZGl0cyIpCiAgICBieXRlY18xIC8vICJ0b3RhbF9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE2CiAgICAvLyBzZWxmLnJldGlyZWRfY3JlZGl0cyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJyZXRpcmVkX2NyZWRpdHMiKQogICAgYnl0ZWNfMiAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE3CiAgICAvLyBzZWxmLmN4dF9hc3NldF9pZCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJjeHRfYXNzZXRfaWQiKQogICAgYnl0ZWNfMCAvLyAiY3h0X2Fzc2V0X2lkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQ2FyYm9uTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMTIKICAgIHB1c2hieXRlc3MgMHgzYmI2M2VkNyAweGJkNGFlODdkIDB4MDYyZDYxOWUgMHg1YmEyMmE4NCAweDA5MmY1YWQxIDB4MTQwOTE5NTIgLy8gbWV0aG9kICJpbml0X2Fzc2V0KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJidXlfY3JlZGl0cyhwYXksdWludDY0KXZvaWQiLCBtZXRob2QgIm1pbnRfY3JlZGl0cyhheGZlcil2b2lkIiwgbWV0aG9kICJnZXRfYXNzZXRfaWQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3RvdGFsX2NyZWRpdHMoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3JldGlyZWRfY3JlZGl0cygpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggaW5pdF9hc3NldCBidXlfY3JlZGl0cyBtaW50X2NyZWRpdHMgZ2V0X2Fzc2V0X2lkIGdldF90b3RhbF9jcmVkaXRzIGdldF9yZXRpcmVkX2NyZWRpdHMKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQ2FyYm9uTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCgovLyBjb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5jcmVhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIyCiAgICAvLyBzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzEgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjMKICAgIC8vIHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18yIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjQKICAgIC8vIHNlbGYuY3h0X2Fzc2V0X2lkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJjeHRfYXNzZXRfaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTkKICAgIC8vIEBhYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5pbml0X2Fzc2V0W3JvdXRpbmddKCkgLT4gdm9pZDoKaW5pdF9hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozMwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gaW5pdCBhc3NldCIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIGluaXQgYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzQKICAgIC8vIGFzc2VydCBzZWxmLmN4dF9hc3NldF9pZC52YWx1ZSA9PSAwLCAiQXNzZXQgYWxyZWFkeSBpbml0aWFsaXplZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJjeHRfYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3h0X2Fzc2V0X2lkIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIEFzc2V0IGFscmVhZHkgaW5pdGlhbGl6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzYKICAgIC8vIHNlbGYuY3h0X2Fzc2V0X2lkLnZhbHVlID0gYXNzZXQuaWQKICAgIGJ5dGVjXzAgLy8gImN4dF9hc3NldF9pZCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozOC00MwogICAgLy8gIyBPcHQtaW4gdG8gYXNzZXQgdmlhIGlubmVyIHRyYW5zYWN0aW9uCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MQogICAgLy8gYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBhc3NldF9hbW91bnQ9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM4LTM5CiAgICAvLyAjIE9wdC1pbiB0byBhc3NldCB2aWEgaW5uZXIgdHJhbnNhY3Rpb24KICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludGNfMiAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM4LTQzCiAgICAvLyAjIE9wdC1pbiB0byBhc3NldCB2aWEgaW5uZXIgdHJhbnNhY3Rpb24KICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UuYnV5X2NyZWRpdHNbcm91dGluZ10oKSAtPiB2b2lkOgpidXlfY3JlZGl0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDUKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU1CiAgICAvLyBhc3NlcnQgYnV5ZXJfdHgucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlBheW1lbnQgbXVzdCBiZSB0byBjb250cmFjdCIKICAgIHN3YXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBQYXltZW50IG11c3QgYmUgdG8gY29udHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTYKICAgIC8vIGFzc2VydCBhbW91bnQgPiAwLCAiQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBkdXAKICAgIGFzc2VydCAvLyBBbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1OAogICAgLy8gYXNzZXRfaWQgPSBzZWxmLmN4dF9hc3NldF9pZC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImN4dF9hc3NldF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jeHRfYXNzZXRfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU5CiAgICAvLyBhc3NlcnQgYXNzZXRfaWQgIT0gMCwgIkFzc2V0IG5vdCBpbml0aWFsaXplZCIKICAgIGR1cAogICAgYXNzZXJ0IC8vIEFzc2V0IG5vdCBpbml0aWFsaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2Ni03MQogICAgLy8gIyBTZW5kICRDWFQgdG8gYnV5ZXIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KGFzc2V0X2lkKSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY5CiAgICAvLyBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgZGlnIDIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjYtNjcKICAgIC8vICMgU2VuZCAkQ1hUIHRvIGJ1eWVyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzIgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2Ni03MQogICAgLy8gIyBTZW5kICRDWFQgdG8gYnV5ZXIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KGFzc2V0X2lkKSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3MwogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlICs9IGFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0cyBleGlzdHMKICAgICsKICAgIGJ5dGVjXzEgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UubWludF9jcmVkaXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKbWludF9jcmVkaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMiAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSBjcmVhdG9yIGNhbiBkZXBvc2l0IGNyZWRpdHMiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBkZXBvc2l0IGNyZWRpdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODMKICAgIC8vIGFzc2VydCBheGZlcl90eC5hc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiVHJhbnNmZXIgbXVzdCBiZSB0byBjb250cmFjdCIKICAgIGR1cAogICAgZ3R4bnMgQXNzZXRSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gVHJhbnNmZXIgbXVzdCBiZSB0byBjb250cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4NAogICAgLy8gYXNzZXJ0IGF4ZmVyX3R4LnhmZXJfYXNzZXQuaWQgPT0gc2VsZi5jeHRfYXNzZXRfaWQudmFsdWUsICJJbmNvcnJlY3QgYXNzZXQgSUQiCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJjeHRfYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3h0X2Fzc2V0X2lkIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBJbmNvcnJlY3QgYXNzZXQgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzUKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0LkNhcmJvbk1hcmtldHBsYWNlLmdldF9hc3NldF9pZFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9hc3NldF9pZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTIKICAgIC8vIHJldHVybiBzZWxmLmN4dF9hc3NldF9pZC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImN4dF9hc3NldF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jeHRfYXNzZXRfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UuZ2V0X3RvdGFsX2NyZWRpdHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdG90YWxfY3JlZGl0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTcKICAgIC8vIHJldHVybiBzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b3RhbF9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2NyZWRpdHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UuZ2V0X3JldGlyZWRfY3JlZGl0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yZXRpcmVkX2NyZWRpdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gcmV0dXJuIHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJldGlyZWRfY3JlZGl0cyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [226], "errorMessage": "Amount must be greater than zero"}, {"pc": [175], "errorMessage": "Asset already initialized"}, {"pc": [232], "errorMessage": "Asset not initialized"}, {"pc": [291], "errorMessage": "Incorrect asset ID"}, {"pc": [276], "errorMessage": "Only creator can deposit credits"}, {"pc": [169], "errorMessage": "Only creator can init asset"}, {"pc": [224], "errorMessage": "Payment must be to contract"}, {"pc": [283], "errorMessage": "Transfer must be to contract"}, {"pc": [173, 230, 289, 297], "errorMessage": "check self.cxt_asset_id exists"}, {"pc": [319], "errorMessage": "check self.retired_credits exists"}, {"pc": [254, 308], "errorMessage": "check self.total_credits exists"}, {"pc": [162, 216], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [270], "errorMessage": "transaction type is axfer"}, {"pc": [208], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Initialise the marketplace.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update", "returns": {"type": "void"}, "desc": "Replace the program in place, keeping the app ID and state. Creator only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "migrate", "returns": {"type": "uint64", "desc": "The schema version the state is now at."}, "desc": "Convert the state of an updated app to the current layout. Creator only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The marketplace app to import from.", "name": "previous"}], "name": "import_state", "returns": {"type": "void"}, "desc": "Copy the counters of a marketplace this app replaces. Creator only.\nOnly allowed once, before any credits were distributed, and from an app of the same creator. The $CXT held by the previous app is not moved.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The $CXT asset to opt-in to.", "name": "asset"}], "name": "init_asset", "returns": {"type": "void"}, "desc": "Opt-in to the $CXT ASA and set its ID. Creator only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "The payment transaction from the buyer to the contract.", "name": "buyer_tx"}, {"type": "uint64", "desc": "Number of credits to purchase.", "name": "amount"}], "name": "buy_credits", "returns": {"type": "void"}, "desc": "Purchase carbon credits using ALGO.\nThe contract sends $CXT tokens from its balance to the buyer.", "events": [{"args": [{"type": "address", "name": "buyer"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "paid"}, {"type": "uint64", "name": "total_credits"}], "name": "CreditsBought", "desc": "ARC-28 event of `buy_credits`: $CXT sent to a buyer for an ALGO payment."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "axfer", "desc": "The asset transfer from the creator/reserve to the contract.", "name": "axfer_tx"}], "name": "mint_credits", "returns": {"type": "void"}, "desc": "Deposit new $CXT credits into the contract. Creator only.", "events": [{"args": [{"type": "address", "name": "depositor"}, {"type": "uint64", "name": "amount"}], "name": "CreditsDeposited", "desc": "ARC-28 event of `mint_credits`: $CXT deposited into the marketplace."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_asset_id", "returns": {"type": "uint64"}, "desc": "Return the $CXT Asset ID.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_credits", "returns": {"type": "uint64"}, "desc": "Return the total credits distributed.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_retired_credits", "returns": {"type": "uint64"}, "desc": "Return the cumulative retired credits.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_stats", "returns": {"type": "(uint64,uint64,uint64)", "struct": "MarketplaceStats"}, "desc": "Return the $CXT Asset ID, total distributed and retired credits in one call.", "events": [], "readonly": true, "recommendations": {}}], "name": "CarbonMarketplace", "state": {"keys": {"box": {}, "global": {"total_credits": {"key": "dG90YWxfY3JlZGl0cw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "retired_credits": {"key": "cmV0aXJlZF9jcmVkaXRz", "keyType": "AVMString", "valueType": "AVMUint64"}, "cxt_asset_id": {"key": "Y3h0X2Fzc2V0X2lk", "keyType": "AVMString", "valueType": "AVMUint64"}, "schema_version": {"key": "c2NoZW1hX3ZlcnNpb24=", "keyType": "AVMString", "valueType": "AVMUint64"}, "migrated_from": {"key": "bWlncmF0ZWRfZnJvbQ==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 5}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"MarketplaceStats": [{"name": "asset_id", "type": "uint64"}, {"name": "total_credits", "type": "uint64"}, {"name": "retired_credits", "type": "uint64"}]}, "byteCode": {"approval": "CyAEAAEECCYGDXRvdGFsX2NyZWRpdHMMY3h0X2Fzc2V0X2lkD3JldGlyZWRfY3JlZGl0cw5zY2hlbWFfdmVyc2lvbg1taWdyYXRlZF9mcm9tBBUffHUxGEAAECgiZyoiZykiZysiZycEImeABKDoGHI2GgCOAQBeMRkURDEYQQBHggkEIvN3OwQfY/JxBDu2PtcEvUrofQQGLWGeBFuiKoQECS9a0QQUCRlSBDYfaME2GgCOCQA0AFUAnADIASYBWQFlAXEBfQCABExcYbo2GgCOAQAMADEZJBIxGBBEQgASKCJnKiJnKSJnKyNnJwQiZyNDMQAyCRJEI0MxADIJEkQiK2VEIw5EKyNngAwVH3x1AAAAAAAAAAGwI0M2GgFJFSUSRBcxADIJEkRJcgdEMgkSREkyCBNEIicEZUQURCIoZUQUREkoZUhMSSplSEwoTwNnIiplRE8CCCpMZycETGcjQzYaAUkVJRJEFzEAMgkSRCIpZUQURClLAWexMgoishKyFLIRJLIQIrIBsyNDMRYjCUk4ECMSRDYaAUkVJRJESRdLAjgHMgoSRElEIillRElEsTEASwKyErIUshEkshAisgGzIihlRAgoSwFnMQBPAzgIFk8CFk8CTwNQTwJQTFCABONVeS9MULAjQzEWIwlJOBAkEkQxADIJEkRJOBQyChJESTgRIillRBJESTgATDgSFlCABAoIA+VMULAjQyIpZUQWJwVMULAjQyIoZUQWJwVMULAjQyIqZUQWJwVMULAjQyIpZUQWIihlRBYiKmVEFk4CUExQJwVMULAjQw==", "clear": "C4EBQw=="}, "desc": "Marketplace for distributing $CXT carbon credits via real tokens.\n\n    Global state:\n        total_credits    \u2013 total credits distributed (informative)\n        retired_credits  \u2013 cumulative credits permanently retired\n        cxt_asset_id    \u2013 the Asset ID of the $CXT token\n        schema_version  \u2013 version of the state layout, see `migrate`\n        migrated_from   \u2013 the app whose counters were imported, if any\n    ", "events": [{"args": [{"type": "address", "name": "buyer"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "paid"}, {"type": "uint64", "name": "total_credits"}], "name": "CreditsBought", "desc": "ARC-28 event of `buy_credits`: $CXT sent to a buyer for an ALGO payment."}, {"args": [{"type": "address", "name": "depositor"}, {"type": "uint64", "name": "amount"}], "name": "CreditsDeposited", "desc": "ARC-28 event of `mint_credits`: $CXT deposited into the marketplace."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgNCA4CiAgICBieXRlY2Jsb2NrIDB4NzQ2Zjc0NjE2YzVmNjM3MjY1NjQ2OTc0NzMgImN4dF9hc3NldF9pZCIgMHg3MjY1NzQ2OTcyNjU2NDVmNjM3MjY1NjQ2OTc0NzMgInNjaGVtYV92ZXJzaW9uIiAibWlncmF0ZWRfZnJvbSIgMHgxNTFmN2M3NQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NAogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzID0gR2xvYmFsU3RhdGUoVUludDY0KDApLCBrZXk9InRvdGFsX2NyZWRpdHMiKQogICAgYnl0ZWNfMCAvLyAidG90YWxfY3JlZGl0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NQogICAgLy8gc2VsZi5yZXRpcmVkX2NyZWRpdHMgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0icmV0aXJlZF9jcmVkaXRzIikKICAgIGJ5dGVjXzIgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NgogICAgLy8gc2VsZi5jeHRfYXNzZXRfaWQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0iY3h0X2Fzc2V0X2lkIikKICAgIGJ5dGVjXzEgLy8gImN4dF9hc3NldF9pZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NwogICAgLy8gc2VsZi5zY2hlbWFfdmVyc2lvbiA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJzY2hlbWFfdmVyc2lvbiIpCiAgICBieXRlY18zIC8vICJzY2hlbWFfdmVyc2lvbiIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0OAogICAgLy8gc2VsZi5taWdyYXRlZF9mcm9tID0gR2xvYmFsU3RhdGUoVUludDY0KDApLCBrZXk9Im1pZ3JhdGVkX2Zyb20iKQogICAgYnl0ZWMgNCAvLyAibWlncmF0ZWRfZnJvbSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjMyCiAgICAvLyBjbGFzcyBDYXJib25NYXJrZXRwbGFjZShBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4YTBlODE4NzIgLy8gbWV0aG9kICJ1cGRhdGUoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX3VwZGF0ZV9yb3V0ZUA0CgptYWluX3N3aXRjaF9jYXNlX25leHRANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzIKICAgIC8vIGNsYXNzIENhcmJvbk1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDE3CiAgICBwdXNoYnl0ZXNzIDB4MjJmMzc3M2IgMHgxZjYzZjI3MSAweDNiYjYzZWQ3IDB4YmQ0YWU4N2QgMHgwNjJkNjE5ZSAweDViYTIyYTg0IDB4MDkyZjVhZDEgMHgxNDA5MTk1MiAweDM2MWY2OGMxIC8vIG1ldGhvZCAibWlncmF0ZSgpdWludDY0IiwgbWV0aG9kICJpbXBvcnRfc3RhdGUodWludDY0KXZvaWQiLCBtZXRob2QgImluaXRfYXNzZXQodWludDY0KXZvaWQiLCBtZXRob2QgImJ1eV9jcmVkaXRzKHBheSx1aW50NjQpdm9pZCIsIG1ldGhvZCAibWludF9jcmVkaXRzKGF4ZmVyKXZvaWQiLCBtZXRob2QgImdldF9hc3NldF9pZCgpdWludDY0IiwgbWV0aG9kICJnZXRfdG90YWxfY3JlZGl0cygpdWludDY0IiwgbWV0aG9kICJnZXRfcmV0aXJlZF9jcmVkaXRzKCl1aW50NjQiLCBtZXRob2QgImdldF9zdGF0cygpKHVpbnQ2NCx1aW50NjQsdWludDY0KSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1pZ3JhdGUgaW1wb3J0X3N0YXRlIGluaXRfYXNzZXQgYnV5X2NyZWRpdHMgbWludF9jcmVkaXRzIGdldF9hc3NldF9pZCBnZXRfdG90YWxfY3JlZGl0cyBnZXRfcmV0aXJlZF9jcmVkaXRzIGdldF9zdGF0cwogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozMgogICAgLy8gY2xhc3MgQ2FyYm9uTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCm1haW5fdXBkYXRlX3JvdXRlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU5CiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50Y18yIC8vIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQKICAgIGIgdXBkYXRlCgoKLy8gY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MwogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJ0b3RhbF9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU1CiAgICAvLyBzZWxmLmN4dF9hc3NldF9pZC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAiY3h0X2Fzc2V0X2lkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU2CiAgICAvLyBzZWxmLnNjaGVtYV92ZXJzaW9uLnZhbHVlID0gVUludDY0KFNDSEVNQV9WRVJTSU9OKQogICAgYnl0ZWNfMyAvLyAic2NoZW1hX3ZlcnNpb24iCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTcKICAgIC8vIHNlbGYubWlncmF0ZWRfZnJvbS52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNCAvLyAibWlncmF0ZWRfZnJvbSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MAogICAgLy8gQGFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0LkNhcmJvbk1hcmtldHBsYWNlLnVwZGF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVwZGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjIKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIHVwZGF0ZSIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIHVwZGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1OQogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5taWdyYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKbWlncmF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIG1pZ3JhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBtaWdyYXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcyCiAgICAvLyBhc3NlcnQgc2VsZi5zY2hlbWFfdmVyc2lvbi52YWx1ZSA8PSBTQ0hFTUFfVkVSU0lPTiwgIlN0YXRlIGlzIG5ld2VyIHRoYW4gdGhpcyBwcm9ncmFtIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInNjaGVtYV92ZXJzaW9uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNjaGVtYV92ZXJzaW9uIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIDw9CiAgICBhc3NlcnQgLy8gU3RhdGUgaXMgbmV3ZXIgdGhhbiB0aGlzIHByb2dyYW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzMtNzQKICAgIC8vICMgQ29udmVyc2lvbnMgZ28gaGVyZSwgb25lIGBpZiBzZWxmLnNjaGVtYV92ZXJzaW9uLnZhbHVlIDwgTjpgIGJsb2NrIHBlciB2ZXJzaW9uLgogICAgLy8gc2VsZi5zY2hlbWFfdmVyc2lvbi52YWx1ZSA9IFVJbnQ2NChTQ0hFTUFfVkVSU0lPTikKICAgIGJ5dGVjXzMgLy8gInNjaGVtYV92ZXJzaW9uIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDAwMQogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UuaW1wb3J0X3N0YXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKaW1wb3J0X3N0YXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSBjcmVhdG9yIGNhbiBpbXBvcnQgc3RhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBpbXBvcnQgc3RhdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODgKICAgIC8vIGFzc2VydCBwcmV2aW91cy5jcmVhdG9yID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJQcmV2aW91cyBhcHAgaGFzIGFub3RoZXIgY3JlYXRvciIKICAgIGR1cAogICAgYXBwX3BhcmFtc19nZXQgQXBwQ3JlYXRvcgogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFByZXZpb3VzIGFwcCBoYXMgYW5vdGhlciBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBhc3NlcnQgcHJldmlvdXMuaWQgIT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQsICJDYW5ub3QgaW1wb3J0IGZyb20gaXRzZWxmIgogICAgZHVwCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgICE9CiAgICBhc3NlcnQgLy8gQ2Fubm90IGltcG9ydCBmcm9tIGl0c2VsZgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MAogICAgLy8gYXNzZXJ0IHNlbGYubWlncmF0ZWRfZnJvbS52YWx1ZSA9PSAwLCAiU3RhdGUgYWxyZWFkeSBpbXBvcnRlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJtaWdyYXRlZF9mcm9tIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pZ3JhdGVkX2Zyb20gZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gU3RhdGUgYWxyZWFkeSBpbXBvcnRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MQogICAgLy8gYXNzZXJ0IHNlbGYudG90YWxfY3JlZGl0cy52YWx1ZSA9PSAwLCAiQ3JlZGl0cyBhbHJlYWR5IGRpc3RyaWJ1dGVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0cyBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBDcmVkaXRzIGFscmVhZHkgZGlzdHJpYnV0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTMKICAgIC8vIHRvdGFsLCBfZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocHJldmlvdXMsIGIidG90YWxfY3JlZGl0cyIpCiAgICBkdXAKICAgIGJ5dGVjXzAgLy8gMHg3NDZmNzQ2MTZjNWY2MzcyNjU2NDY5NzQ3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHBvcAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NAogICAgLy8gcmV0aXJlZCwgX2V4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KHByZXZpb3VzLCBiInJldGlyZWRfY3JlZGl0cyIpCiAgICBkdXAKICAgIGJ5dGVjXzIgLy8gMHg3MjY1NzQ2OTcyNjU2NDVmNjM3MjY1NjQ2OTc0NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTUKICAgIC8vIHNlbGYudG90YWxfY3JlZGl0cy52YWx1ZSA9IHRvdGFsCiAgICBieXRlY18wIC8vICJ0b3RhbF9jcmVkaXRzIgogICAgdW5jb3ZlciAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NgogICAgLy8gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUgKz0gcmV0aXJlZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXRpcmVkX2NyZWRpdHMgZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGJ5dGVjXzIgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBzZWxmLm1pZ3JhdGVkX2Zyb20udmFsdWUgPSBwcmV2aW91cy5pZAogICAgYnl0ZWMgNCAvLyAibWlncmF0ZWRfZnJvbSIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5pbml0X2Fzc2V0W3JvdXRpbmddKCkgLT4gdm9pZDoKaW5pdF9hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIGluaXQgYXNzZXQiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBpbml0IGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNwogICAgLy8gYXNzZXJ0IHNlbGYuY3h0X2Fzc2V0X2lkLnZhbHVlID09IDAsICJBc3NldCBhbHJlYWR5IGluaXRpYWxpemVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImN4dF9hc3NldF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jeHRfYXNzZXRfaWQgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gQXNzZXQgYWxyZWFkeSBpbml0aWFsaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDkKICAgIC8vIHNlbGYuY3h0X2Fzc2V0X2lkLnZhbHVlID0gYXNzZXQuaWQKICAgIGJ5dGVjXzEgLy8gImN4dF9hc3NldF9pZCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMTEtMTE2CiAgICAvLyAjIE9wdC1pbiB0byBhc3NldCB2aWEgaW5uZXIgdHJhbnNhY3Rpb24KICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExNAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExNQogICAgLy8gYXNzZXRfYW1vdW50PTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMTEtMTEyCiAgICAvLyAjIE9wdC1pbiB0byBhc3NldCB2aWEgaW5uZXIgdHJhbnNhY3Rpb24KICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludGNfMiAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExMS0xMTYKICAgIC8vICMgT3B0LWluIHRvIGFzc2V0IHZpYSBpbm5lciB0cmFuc2FjdGlvbgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9YXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5idXlfY3JlZGl0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmJ1eV9jcmVkaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBkdXAKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTI4CiAgICAvLyBhc3NlcnQgYnV5ZXJfdHgucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlBheW1lbnQgbXVzdCBiZSB0byBjb250cmFjdCIKICAgIGRpZyAyCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IGJlIHRvIGNvbnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyOQogICAgLy8gYXNzZXJ0IGFtb3VudCA+IDAsICJBbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybyIKICAgIGR1cAogICAgYXNzZXJ0IC8vIEFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gYXNzZXRfaWQgPSBzZWxmLmN4dF9hc3NldF9pZC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImN4dF9hc3NldF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jeHRfYXNzZXRfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gYXNzZXJ0IGFzc2V0X2lkICE9IDAsICJBc3NldCBub3QgaW5pdGlhbGl6ZWQiCiAgICBkdXAKICAgIGFzc2VydCAvLyBBc3NldCBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTM5LTE0NAogICAgLy8gIyBTZW5kICRDWFQgdG8gYnV5ZXIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KGFzc2V0X2lkKSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIGRpZyAyCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEzOS0xNDAKICAgIC8vICMgU2VuZCAkQ1hUIHRvIGJ1eWVyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzIgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMzktMTQ0CiAgICAvLyAjIFNlbmQgJENYVCB0byBidXllcgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9QXNzZXQoYXNzZXRfaWQpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFtb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlICs9IGFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0cyBleGlzdHMKICAgICsKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQ5CiAgICAvLyBidXllcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gcGFpZD1hcmM0LlVJbnQ2NChidXllcl90eC5hbW91bnQpLAogICAgdW5jb3ZlciAzCiAgICBndHhucyBBbW91bnQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTUyCiAgICAvLyB0b3RhbF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYudG90YWxfY3JlZGl0cy52YWx1ZSksCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQ4LTE1MwogICAgLy8gQ3JlZGl0c0JvdWdodCgKICAgIC8vICAgICBidXllcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksCiAgICAvLyAgICAgcGFpZD1hcmM0LlVJbnQ2NChidXllcl90eC5hbW91bnQpLAogICAgLy8gICAgIHRvdGFsX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlKSwKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQ3LTE1NAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIENyZWRpdHNCb3VnaHQoCiAgICAvLyAgICAgICAgIGJ1eWVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksCiAgICAvLyAgICAgICAgIHBhaWQ9YXJjNC5VSW50NjQoYnV5ZXJfdHguYW1vdW50KSwKICAgIC8vICAgICAgICAgdG90YWxfY3JlZGl0cz1hcmM0LlVJbnQ2NChzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGUzNTU3OTJmIC8vIG1ldGhvZCAiQ3JlZGl0c0JvdWdodChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UubWludF9jcmVkaXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKbWludF9jcmVkaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNTYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzIgLy8gYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNjMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIGRlcG9zaXQgY3JlZGl0cyIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIGRlcG9zaXQgY3JlZGl0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNjQKICAgIC8vIGFzc2VydCBheGZlcl90eC5hc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiVHJhbnNmZXIgbXVzdCBiZSB0byBjb250cmFjdCIKICAgIGR1cAogICAgZ3R4bnMgQXNzZXRSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gVHJhbnNmZXIgbXVzdCBiZSB0byBjb250cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNjUKICAgIC8vIGFzc2VydCBheGZlcl90eC54ZmVyX2Fzc2V0LmlkID09IHNlbGYuY3h0X2Fzc2V0X2lkLnZhbHVlLCAiSW5jb3JyZWN0IGFzc2V0IElEIgogICAgZHVwCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJjeHRfYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3h0X2Fzc2V0X2lkIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBJbmNvcnJlY3QgYXNzZXQgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTcwCiAgICAvLyBkZXBvc2l0b3I9YXJjNC5BZGRyZXNzKGF4ZmVyX3R4LnNlbmRlciksCiAgICBkdXAKICAgIGd0eG5zIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNzEKICAgIC8vIGFtb3VudD1hcmM0LlVJbnQ2NChheGZlcl90eC5hc3NldF9hbW91bnQpLAogICAgc3dhcAogICAgZ3R4bnMgQXNzZXRBbW91bnQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTY5LTE3MgogICAgLy8gQ3JlZGl0c0RlcG9zaXRlZCgKICAgIC8vICAgICBkZXBvc2l0b3I9YXJjNC5BZGRyZXNzKGF4ZmVyX3R4LnNlbmRlciksCiAgICAvLyAgICAgYW1vdW50PWFyYzQuVUludDY0KGF4ZmVyX3R4LmFzc2V0X2Ftb3VudCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTY3LTE3MwogICAgLy8gIyBJbmZvcm1hdGl2ZSB1cGRhdGUsIHRoZSBhY3R1YWwgYmFsYW5jZSBpcyBvbiB0aGUgQVNBCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgQ3JlZGl0c0RlcG9zaXRlZCgKICAgIC8vICAgICAgICAgZGVwb3NpdG9yPWFyYzQuQWRkcmVzcyhheGZlcl90eC5zZW5kZXIpLAogICAgLy8gICAgICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYXhmZXJfdHguYXNzZXRfYW1vdW50KSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwYTA4MDNlNSAvLyBtZXRob2QgIkNyZWRpdHNEZXBvc2l0ZWQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTU2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5nZXRfYXNzZXRfaWRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYXNzZXRfaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE3OAogICAgLy8gcmV0dXJuIHNlbGYuY3h0X2Fzc2V0X2lkLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3h0X2Fzc2V0X2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN4dF9hc3NldF9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTc1CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlYyA1IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuQ2FyYm9uTWFya2V0cGxhY2UuZ2V0X3RvdGFsX2NyZWRpdHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdG90YWxfY3JlZGl0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTgzCiAgICAvLyByZXR1cm4gc2VsZi50b3RhbF9jcmVkaXRzLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxODAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5nZXRfcmV0aXJlZF9jcmVkaXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3JldGlyZWRfY3JlZGl0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTg4CiAgICAvLyByZXR1cm4gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV0aXJlZF9jcmVkaXRzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhcmJvbl9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxODUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5DYXJib25NYXJrZXRwbGFjZS5nZXRfc3RhdHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc3RhdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE5NAogICAgLy8gYXNzZXRfaWQ9YXJjNC5VSW50NjQoc2VsZi5jeHRfYXNzZXRfaWQudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImN4dF9hc3NldF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jeHRfYXNzZXRfaWQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gdG90YWxfY3JlZGl0cz1hcmM0LlVJbnQ2NChzZWxmLnRvdGFsX2NyZWRpdHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0cyBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYXJib25fbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTk2CiAgICAvLyByZXRpcmVkX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXRpcmVkX2NyZWRpdHMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE5My0xOTcKICAgIC8vIHJldHVybiBNYXJrZXRwbGFjZVN0YXRzKAogICAgLy8gICAgIGFzc2V0X2lkPWFyYzQuVUludDY0KHNlbGYuY3h0X2Fzc2V0X2lkLnZhbHVlKSwKICAgIC8vICAgICB0b3RhbF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYudG90YWxfY3JlZGl0cy52YWx1ZSksCiAgICAvLyAgICAgcmV0aXJlZF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlKSwKICAgIC8vICkKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FyYm9uX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgNSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [428], "errorMessage": "Amount must be greater than zero"}, {"pc": [375], "errorMessage": "Asset already initialized"}, {"pc": [434], "errorMessage": "Asset not initialized"}, {"pc": [311], "errorMessage": "Cannot import from itself"}, {"pc": [324], "errorMessage": "Credits already distributed"}, {"pc": [524], "errorMessage": "Incorrect asset ID"}, {"pc": [508], "errorMessage": "Only creator can deposit credits"}, {"pc": [298], "errorMessage": "Only creator can import state"}, {"pc": [369], "errorMessage": "Only creator can init asset"}, {"pc": [256], "errorMessage": "Only creator can migrate"}, {"pc": [248], "errorMessage": "Only creator can update"}, {"pc": [426], "errorMessage": "Payment must be to contract"}, {"pc": [306], "errorMessage": "Previous app has another creator"}, {"pc": [318], "errorMessage": "State already imported"}, {"pc": [263], "errorMessage": "State is newer than this program"}, {"pc": [515], "errorMessage": "Transfer must be to contract"}, {"pc": [302], "errorMessage": "application exists"}, {"pc": [373, 432, 522, 547, 583], "errorMessage": "check self.cxt_asset_id exists"}, {"pc": [316], "errorMessage": "check self.migrated_from exists"}, {"pc": [342, 571, 593], "errorMessage": "check self.retired_credits exists"}, {"pc": [260], "errorMessage": "check self.schema_version exists"}, {"pc": [322, 456, 559, 588], "errorMessage": "check self.total_credits exists"}, {"pc": [291, 362, 416], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [502], "errorMessage": "transaction type is axfer"}, {"pc": [408], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +66,23 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class MarketplaceStats:
+    """Struct for MarketplaceStats"""
+    asset_id: int
+    total_credits: int
+    retired_credits: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ImportStateArgs:
+    """Dataclass for import_state arguments"""
+    previous: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "import_state(uint64)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class InitAssetArgs:
     """Dataclass for init_asset arguments"""
@@ -93,10 +112,56 @@ class MintCreditsArgs:
         return "mint_credits(axfer)void"
 
 
+class _CarbonMarketplaceUpdate:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppUpdateMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        return self.app_client.params.update(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update()void",
+        }))
+
+
 class CarbonMarketplaceParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def update(self) -> "_CarbonMarketplaceUpdate":
+        return _CarbonMarketplaceUpdate(self.app_client)
+
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate()uint64",
+        }))
+
+    def import_state(
+        self,
+        args: tuple[int] | ImportStateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_state(uint64)void",
+            "args": method_args,
+        }))
+
     def init_asset(
         self,
         args: tuple[int] | InitAssetArgs,
@@ -169,6 +234,17 @@ class CarbonMarketplaceParams:
             "method": "get_retired_credits()uint64",
         }))
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64,uint64)",
+        }))
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -191,10 +267,56 @@ class CarbonMarketplaceParams:
         )
 
 
+class _CarbonMarketplaceUpdateTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        return self.app_client.create_transaction.update(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update()void",
+        }))
+
+
 class CarbonMarketplaceCreateTransactionParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def update(self) -> "_CarbonMarketplaceUpdateTransaction":
+        return _CarbonMarketplaceUpdateTransaction(self.app_client)
+
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate()uint64",
+        }))
+
+    def import_state(
+        self,
+        args: tuple[int] | ImportStateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_state(uint64)void",
+            "args": method_args,
+        }))
+
     def init_asset(
         self,
         args: tuple[int] | InitAssetArgs,
@@ -267,6 +389,17 @@ class CarbonMarketplaceCreateTransactionParams:
             "method": "get_retired_credits()uint64",
         }))
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64,uint64)",
+        }))
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -289,10 +422,65 @@ class CarbonMarketplaceCreateTransactionParams:
         )
 
 
+class _CarbonMarketplaceUpdateSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        response = self.app_client.send.update(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update()void",
+        }), send_params=send_params, compilation_params=compilation_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppUpdateTransactionResult[None], parsed_response)
+
+
 class CarbonMarketplaceSend:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def update(self) -> "_CarbonMarketplaceUpdateSend":
+        return _CarbonMarketplaceUpdateSend(self.app_client)
+
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def import_state(
+        self,
+        args: tuple[int] | ImportStateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_state(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def init_asset(
         self,
         args: tuple[int] | InitAssetArgs,
@@ -383,6 +571,20 @@ class CarbonMarketplaceSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[MarketplaceStats]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64,uint64)",
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(MarketplaceStats, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[MarketplaceStats], parsed_response)
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -413,6 +615,8 @@ class GlobalStateValue(typing.TypedDict):
     total_credits: int
     retired_credits: int
     cxt_asset_id: int
+    schema_version: int
+    migrated_from: int
 
 class CarbonMarketplaceState:
     """Methods to access state for the current CarbonMarketplace app"""
@@ -474,6 +678,22 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def schema_version(self) -> int:
+        """Get the current value of the schema_version key in global_state state"""
+        value = self.app_client.state.global_state.get_value("schema_version")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def migrated_from(self) -> int:
+        """Get the current value of the migrated_from key in global_state state"""
+        value = self.app_client.state.global_state.get_value("migrated_from")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class CarbonMarketplaceClient:
     """Client for interacting with CarbonMarketplace smart contract"""
 
@@ -617,6 +837,18 @@ class CarbonMarketplaceClient:
     def new_group(self) -> "CarbonMarketplaceComposer":
         return CarbonMarketplaceComposer(self)
 
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["migrate()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["import_state(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
@@ -654,12 +886,24 @@ class CarbonMarketplaceClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_stats()(uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> MarketplaceStats | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["create()void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["update()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -670,7 +914,7 @@ class CarbonMarketplaceClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | MarketplaceStats | None | int:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -710,7 +954,28 @@ class CarbonMarketplaceMethodCallCreateParams(
             }
         )
 
-class CarbonMarketplaceFactory(algokit_utils.TypedAppFactoryProtocol[CarbonMarketplaceMethodCallCreateParams, None, None]):
+@dataclasses.dataclass(frozen=True)
+class CarbonMarketplaceMethodCallUpdateParams(
+    algokit_utils.BaseAppClientMethodCallParams[
+        typing.Any,
+        str | None,
+    ]
+):
+    """Parameters for calling CarbonMarketplace contract using ABI"""
+    on_complete: typing.Literal[OnComplete.UpdateApplicationOC] | None = None
+    method: str | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientMethodCallParams:
+        method_args = _parse_abi_args(self.args)
+        return algokit_utils.AppClientMethodCallParams(
+            **{
+                **self.__dict__,
+                "method": self.method or getattr(self.args, "abi_method_signature", None),
+                "args": method_args,
+            }
+        )
+
+class CarbonMarketplaceFactory(algokit_utils.TypedAppFactoryProtocol[CarbonMarketplaceMethodCallCreateParams, CarbonMarketplaceMethodCallUpdateParams, None]):
     """Factory for deploying and managing CarbonMarketplaceClient smart contracts"""
 
     def __init__(
@@ -756,7 +1021,7 @@ class CarbonMarketplaceFactory(algokit_utils.TypedAppFactoryProtocol[CarbonMarke
         on_update: algokit_utils.OnUpdate | None = None,
         on_schema_break: algokit_utils.OnSchemaBreak | None = None,
         create_params: CarbonMarketplaceMethodCallCreateParams | None = None,
-        update_params: None = None,
+        update_params: CarbonMarketplaceMethodCallUpdateParams | None = None,
         delete_params: None = None,
         existing_deployments: algokit_utils.ApplicationLookup | None = None,
         ignore_cache: bool = False,
@@ -769,7 +1034,7 @@ class CarbonMarketplaceFactory(algokit_utils.TypedAppFactoryProtocol[CarbonMarke
             on_update=on_update,
             on_schema_break=on_schema_break,
             create_params=create_params.to_algokit_utils_params() if create_params else None,
-            update_params=update_params,
+            update_params=update_params.to_algokit_utils_params() if update_params else None,
             delete_params=delete_params,
             existing_deployments=existing_deployments,
             ignore_cache=ignore_cache,
@@ -854,6 +1119,45 @@ class CarbonMarketplaceFactoryCreateParams:
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             compilation_params=compilation_params)
 
+    def migrate(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the migrate()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "migrate()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def import_state(
+        self,
+        args: tuple[int] | ImportStateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the import_state(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "import_state(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def init_asset(
         self,
         args: tuple[int] | InitAssetArgs,
@@ -971,6 +1275,25 @@ class CarbonMarketplaceFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_stats(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_stats()(uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_stats()(uint64,uint64,uint64)",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def create(
         self,
         *,
@@ -990,6 +1313,25 @@ class CarbonMarketplaceFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def update(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the update()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "update()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
 class CarbonMarketplaceFactoryUpdateParams:
     """Parameters for 'update' operations of CarbonMarketplace contract"""
 
@@ -1120,6 +1462,29 @@ class CarbonMarketplaceFactorySendCreate:
             )
 
 
+class _CarbonMarketplaceUpdateComposer:
+    def __init__(self, composer: "CarbonMarketplaceComposer"):
+        self.composer = composer
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "CarbonMarketplaceComposer":
+        self.composer._composer.add_app_update_method_call(
+            self.composer.client.params.update.update(
+                
+                params=params,
+                compilation_params=compilation_params
+            )
+        )
+        self.composer._result_mappers.append(
+            lambda v: self.composer.client.decode_return_value(
+                "update()void", v
+            )
+        )
+        return self.composer
+
+
 class CarbonMarketplaceComposer:
     """Composer for creating transaction groups for CarbonMarketplace contract calls"""
 
@@ -1128,10 +1493,52 @@ class CarbonMarketplaceComposer:
         self._composer = client.algorand.new_group()
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
 
+    @property
+    def update(self) -> "_CarbonMarketplaceUpdateComposer":
+        return _CarbonMarketplaceUpdateComposer(self)
+
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "CarbonMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.migrate(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "migrate()uint64", v
+            )
+        )
+        return self
+
+    def import_state(
+        self,
+        args: tuple[int] | ImportStateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "CarbonMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.import_state(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "import_state(uint64)void", v
+            )
+        )
+        return self
+
     def init_asset(
         self,
         args: tuple[int] | InitAssetArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "CarbonMarketplaceComposer":
         self._composer.add_app_call_method_call(
             self.client.params.init_asset(
@@ -1149,7 +1556,8 @@ class CarbonMarketplaceComposer:
     def buy_credits(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | BuyCreditsArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "CarbonMarketplaceComposer":
         self._composer.add_app_call_method_call(
             self.client.params.buy_credits(
@@ -1167,7 +1575,8 @@ class CarbonMarketplaceComposer:
     def mint_credits(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | MintCreditsArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "CarbonMarketplaceComposer":
         self._composer.add_app_call_method_call(
             self.client.params.mint_credits(
@@ -1184,7 +1593,8 @@ class CarbonMarketplaceComposer:
 
     def get_asset_id(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "CarbonMarketplaceComposer":
         self._composer.add_app_call_method_call(
             self.client.params.get_asset_id(
@@ -1201,7 +1611,8 @@ class CarbonMarketplaceComposer:
 
     def get_total_credits(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "CarbonMarketplaceComposer":
         self._composer.add_app_call_method_call(
             self.client.params.get_total_credits(
@@ -1218,7 +1629,8 @@ class CarbonMarketplaceComposer:
 
     def get_retired_credits(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "CarbonMarketplaceComposer":
         self._composer.add_app_call_method_call(
             self.client.params.get_retired_credits(
@@ -1233,9 +1645,28 @@ class CarbonMarketplaceComposer:
         )
         return self
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "CarbonMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_stats(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_stats()(uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
     def create(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "CarbonMarketplaceComposer":
         self._composer.add_app_call_method_call(
             self.client.params.create(
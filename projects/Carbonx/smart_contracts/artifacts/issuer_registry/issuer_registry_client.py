@@ -4,6 +4,8 @@
 # This file was automatically generated by algokit-client-generator.
 # DO NOT MODIFY IT BY HAND.
 # requires: algokit-utils@^3.0.0
+# arc56-sha256: 7788ede76771c45a1173f5b2313a20eb0d4b5d49d5b9f5c9b2d336c026eeec4d
+# algokit-client-generator: 2.2.0
 
 # common
 import dataclasses
@@ -19,7 +21,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["OptIn"], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Set the contract creator as admin.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "register_issuer", "returns": {"type": "void"}, "desc": "Register the caller as an issuer.\nReverts if the caller is already registered.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "approve_issuer", "returns": {"type": "void"}, "desc": "Approve a registered issuer. Admin only.\nThe target account must have registered first.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "revoke_issuer", "returns": {"type": "void"}, "desc": "Revoke an approved issuer. Admin only.\nSets the account's approved flag back to 0 and decrements the counter.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "get_issuer_status", "returns": {"type": "uint64", "desc": "0 \u2013 not registered 1 \u2013 registered but not approved 2 \u2013 registered and approved"}, "desc": "Return the approval status for the given account.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_approved_count", "returns": {"type": "uint64"}, "desc": "Return the total number of currently approved issuers.", "events": [], "readonly": true, "recommendations": {}}], "name": "IssuerRegistry", "state": {"keys": {"box": {}, "global": {"admin": {"key": "YWRtaW4=", "keyType": "AVMString", "valueType": "AVMBytes"}, "approved_count": {"key": "YXBwcm92ZWRfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"is_registered": {"key": "aXNfcmVnaXN0ZXJlZA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_approved": {"key": "aXNfYXBwcm92ZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 1}, "local": {"bytes": 0, "ints": 2}}}, "structs": {}, "byteCode": {"approval": "CyADAAEgJgUOYXBwcm92ZWRfY291bnQLaXNfYXBwcm92ZWQFYWRtaW4NaXNfcmVnaXN0ZXJlZAQVH3x1MRhAAAcqgABnKCJnMRtBAEIxGRREMRhBACuCBQT1WuCwBIUghAEEje0IKgRKmL40BKM0WJY2GgCOBQAgADIAZQCOAMAAgARMXGG6NhoAjgEACQAxGSMSMRgQQyoxAGcoImcjQzEAIitjIk4CTRREMQArI2YjQzYaAUkVJBJEMQAiKmVEEkRJIitjIk4CTSMSREkiKWMiTgJNFEQpI2YiKGVEIwgoTGcjQzYaAUkVJBJEMQAiKmVEEkRJIiljIk4CTSMSRCkiZiIoZUQjCShMZyNDNhoBRwIVJBJEIitjIk4CTUAACSIWJwRMULAjQ0kiKWMiTgJNIxJBAAWBAkL/5iNC/+IiKGVEFicETFCwI0M=", "clear": "C4EBQw=="}, "desc": "Registry for carbon credit issuers with admin approval workflow.\n\n    Global state:\n        admin           \u2013 address of the contract administrator\n        approved_count  \u2013 total number of currently approved issuers\n\n    Local state (per account):\n        is_registered   \u2013 1 if the account has registered as an issuer\n        is_approved     \u2013 1 if the account has been approved by admin\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIKICAgIGJ5dGVjYmxvY2sgImFwcHJvdmVkX2NvdW50IiAiaXNfYXBwcm92ZWQiICJhZG1pbiIgImlzX3JlZ2lzdGVyZWQiIDB4MTUxZjdjNzUKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTgKICAgIC8vIHNlbGYuYWRtaW4gPSBHbG9iYWxTdGF0ZShCeXRlcygpLCBrZXk9ImFkbWluIikKICAgIGJ5dGVjXzIgLy8gImFkbWluIgogICAgcHVzaGJ5dGVzIDB4CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxOQogICAgLy8gc2VsZi5hcHByb3ZlZF9jb3VudCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJhcHByb3ZlZF9jb3VudCIpCiAgICBieXRlY18wIC8vICJhcHByb3ZlZF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIElzc3VlclJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9vcHRfaW5AMTYKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMTIKICAgIHB1c2hieXRlc3MgMHhmNTVhZTBiMCAweDg1MjA4NDAxIDB4OGRlZDA4MmEgMHg0YTk4YmUzNCAweGEzMzQ1ODk2IC8vIG1ldGhvZCAicmVnaXN0ZXJfaXNzdWVyKCl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX2lzc3VlcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInJldm9rZV9pc3N1ZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJnZXRfaXNzdWVyX3N0YXR1cyhhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2FwcHJvdmVkX2NvdW50KCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCByZWdpc3Rlcl9pc3N1ZXIgYXBwcm92ZV9pc3N1ZXIgcmV2b2tlX2lzc3VlciBnZXRfaXNzdWVyX3N0YXR1cyBnZXRfYXBwcm92ZWRfY291bnQKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgSXNzdWVyUmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCm1haW5fb3B0X2luQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToyOQogICAgLy8gQGJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIk9wdEluIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnRjXzEgLy8gT3B0SW4KICAgID09CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToyNgogICAgLy8gc2VsZi5hZG1pbi52YWx1ZSA9IFR4bi5zZW5kZXIuYnl0ZXMKICAgIGJ5dGVjXzIgLy8gImFkbWluIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MjcKICAgIC8vIHNlbGYuYXBwcm92ZWRfY291bnQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzCiAgICAvLyBAYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmlzc3Vlcl9yZWdpc3RyeS5jb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5yZWdpc3Rlcl9pc3N1ZXJbcm91dGluZ10oKSAtPiB2b2lkOgpyZWdpc3Rlcl9pc3N1ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwCiAgICAvLyBjdXJyZW50ID0gc2VsZi5pc19yZWdpc3RlcmVkLmdldChUeG4uc2VuZGVyLCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJpc19yZWdpc3RlcmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo0MQogICAgLy8gYXNzZXJ0IGN1cnJlbnQgPT0gMCwgIkFscmVhZHkgcmVnaXN0ZXJlZCIKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IHJlZ2lzdGVyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NDIKICAgIC8vIHNlbGYuaXNfcmVnaXN0ZXJlZFtUeG4uc2VuZGVyXSA9IFVJbnQ2NCgxKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWNfMyAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuaXNzdWVyX3JlZ2lzdHJ5LmNvbnRyYWN0Lklzc3VlclJlZ2lzdHJ5LmFwcHJvdmVfaXNzdWVyW3JvdXRpbmddKCkgLT4gdm9pZDoKYXBwcm92ZV9pc3N1ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIuYnl0ZXMgPT0gc2VsZi5hZG1pbi52YWx1ZSwgIk9ubHkgYWRtaW4gY2FuIGFwcHJvdmUiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgYWRtaW4gY2FuIGFwcHJvdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NTEKICAgIC8vIHJlZ2lzdGVyZWQgPSBzZWxmLmlzX3JlZ2lzdGVyZWQuZ2V0KGFjY291bnQsIGRlZmF1bHQ9VUludDY0KDApKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NTIKICAgIC8vIGFzc2VydCByZWdpc3RlcmVkID09IDEsICJBY2NvdW50IG5vdCByZWdpc3RlcmVkIgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gQWNjb3VudCBub3QgcmVnaXN0ZXJlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1MwogICAgLy8gYWxyZWFkeV9hcHByb3ZlZCA9IHNlbGYuaXNfYXBwcm92ZWQuZ2V0KGFjY291bnQsIGRlZmF1bHQ9VUludDY0KDApKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiaXNfYXBwcm92ZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0CiAgICAvLyBhc3NlcnQgYWxyZWFkeV9hcHByb3ZlZCA9PSAwLCAiQWNjb3VudCBhbHJlYWR5IGFwcHJvdmVkIgogICAgIQogICAgYXNzZXJ0IC8vIEFjY291bnQgYWxyZWFkeSBhcHByb3ZlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1NQogICAgLy8gc2VsZi5pc19hcHByb3ZlZFthY2NvdW50XSA9IFVJbnQ2NCgxKQogICAgYnl0ZWNfMSAvLyAiaXNfYXBwcm92ZWQiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1NgogICAgLy8gc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJhcHByb3ZlZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlZF9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18wIC8vICJhcHByb3ZlZF9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuaXNzdWVyX3JlZ2lzdHJ5LmNvbnRyYWN0Lklzc3VlclJlZ2lzdHJ5LnJldm9rZV9pc3N1ZXJbcm91dGluZ10oKSAtPiB2b2lkOgpyZXZva2VfaXNzdWVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NjQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyLmJ5dGVzID09IHNlbGYuYWRtaW4udmFsdWUsICJPbmx5IGFkbWluIGNhbiByZXZva2UiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgYWRtaW4gY2FuIHJldm9rZQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo2NQogICAgLy8gYXBwcm92ZWQgPSBzZWxmLmlzX2FwcHJvdmVkLmdldChhY2NvdW50LCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImlzX2FwcHJvdmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo2NgogICAgLy8gYXNzZXJ0IGFwcHJvdmVkID09IDEsICJBY2NvdW50IG5vdCBhcHByb3ZlZCIKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIEFjY291bnQgbm90IGFwcHJvdmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY3CiAgICAvLyBzZWxmLmlzX2FwcHJvdmVkW2FjY291bnRdID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJpc19hcHByb3ZlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4CiAgICAvLyBzZWxmLmFwcHJvdmVkX2NvdW50LnZhbHVlIC09IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVkX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuZ2V0X2lzc3Vlcl9zdGF0dXNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfaXNzdWVyX3N0YXR1czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NzAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo3OQogICAgLy8gcmVnaXN0ZXJlZCA9IHNlbGYuaXNfcmVnaXN0ZXJlZC5nZXQoYWNjb3VudCwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODAKICAgIC8vIGlmIHJlZ2lzdGVyZWQgPT0gMDoKICAgIGJueiBnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODEKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCgpnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuZ2V0X2lzc3Vlcl9zdGF0dXNANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NzAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODIKICAgIC8vIGFwcHJvdmVkID0gc2VsZi5pc19hcHByb3ZlZC5nZXQoYWNjb3VudCwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpc19hcHByb3ZlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODMKICAgIC8vIGlmIGFwcHJvdmVkID09IDE6CiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo4NAogICAgLy8gcmV0dXJuIFVJbnQ2NCgyKQogICAgcHVzaGludCAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIGdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmlzc3Vlcl9yZWdpc3RyeS5jb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5nZXRfaXNzdWVyX3N0YXR1c0A2CgpnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg1CiAgICAvLyByZXR1cm4gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo3MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuZ2V0X2lzc3Vlcl9zdGF0dXNANgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5pc3N1ZXJfcmVnaXN0cnkuY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuZ2V0X2FwcHJvdmVkX2NvdW50W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2FwcHJvdmVkX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo5MAogICAgLy8gcmV0dXJuIHNlbGYuYXBwcm92ZWRfY291bnQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJhcHByb3ZlZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlZF9jb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6ODcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [214], "errorMessage": "Account already approved"}, {"pc": [255], "errorMessage": "Account not approved"}, {"pc": [204], "errorMessage": "Account not registered"}, {"pc": [170], "errorMessage": "Already registered"}, {"pc": [193], "errorMessage": "Only admin can approve"}, {"pc": [244], "errorMessage": "Only admin can revoke"}, {"pc": [191, 242], "errorMessage": "check self.admin exists"}, {"pc": [221, 262, 323], "errorMessage": "check self.approved_count exists"}, {"pc": [185, 236, 278], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["OptIn"], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Set the contract creator as admin.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update", "returns": {"type": "void"}, "desc": "Replace the program in place, keeping the app ID and issuer state. Admin only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "migrate", "returns": {"type": "uint64", "desc": "The schema version the state is now at."}, "desc": "Convert the state of an updated app to the current layout. Admin only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The registry app to import from; the same for every batch.", "name": "previous"}, {"type": "address[]", "desc": "The issuers to import.", "name": "accounts"}], "name": "import_issuers", "returns": {"type": "uint64", "desc": "The number of issuers imported by this call."}, "desc": "Copy the issuer state of `accounts` from a registry this app replaces. Admin only.\nAccounts that have not opted in to this app, or already have state here, are skipped, so the same batch can be sent again once more issuers opt in.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "register_issuer", "returns": {"type": "void"}, "desc": "Register the caller as an issuer.\nReverts if the caller is already registered.", "events": [{"args": [{"type": "address", "name": "issuer"}], "name": "IssuerRegistered", "desc": "ARC-28 event of `register_issuer`."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "approve_issuer", "returns": {"type": "void"}, "desc": "Approve a registered issuer. Admin only.\nThe target account must have registered first.", "events": [{"args": [{"type": "address", "name": "issuer"}, {"type": "uint64", "name": "approved_count"}], "name": "IssuerApproved", "desc": "ARC-28 event of `approve_issuer`, with the new number of approved issuers."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "revoke_issuer", "returns": {"type": "void"}, "desc": "Revoke an approved issuer. Admin only.\nSets the account's approved flag back to 0 and decrements the counter.", "events": [{"args": [{"type": "address", "name": "issuer"}, {"type": "uint64", "name": "approved_count"}], "name": "IssuerRevoked", "desc": "ARC-28 event of `revoke_issuer`, with the new number of approved issuers."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "get_issuer_status", "returns": {"type": "uint64", "desc": "0 \u2013 not registered 1 \u2013 registered but not approved 2 \u2013 registered and approved"}, "desc": "Return the approval status for the given account.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_approved_count", "returns": {"type": "uint64"}, "desc": "Return the total number of currently approved issuers.", "events": [], "readonly": true, "recommendations": {}}], "name": "IssuerRegistry", "state": {"keys": {"box": {}, "global": {"admin": {"key": "YWRtaW4=", "keyType": "AVMString", "valueType": "AVMBytes"}, "approved_count": {"key": "YXBwcm92ZWRfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "schema_version": {"key": "c2NoZW1hX3ZlcnNpb24=", "keyType": "AVMString", "valueType": "AVMUint64"}, "migrated_from": {"key": "bWlncmF0ZWRfZnJvbQ==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"is_registered": {"key": "aXNfcmVnaXN0ZXJlZA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_approved": {"key": "aXNfYXBwcm92ZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 3}, "local": {"bytes": 0, "ints": 2}}}, "structs": {}, "byteCode": {"approval": "CyAEAAEgAiYHDmFwcHJvdmVkX2NvdW50BWFkbWluDWlzX3JlZ2lzdGVyZWQLaXNfYXBwcm92ZWQNbWlncmF0ZWRfZnJvbQ5zY2hlbWFfdmVyc2lvbgQVH3x1MRhAAA8pgABnKCJnJwUiZycEImcxG0EAaYAEoOgYcjYaAI4BAFAxGRREMRhBADmCBwQi83c7BPhe4CME9VrgsASFIIQBBI3tCCoESpi+NASjNFiWNhoAjgcAPgBjASQBQAGAAbYB5wCABExcYbo2GgCOAQAVADEZgQQSMRgQREIAGTEZIxIxGBBDKTEAZygiZycFI2cnBCJnI0MxACIpZUQSRCNDMQAiKWVEEkQiJwVlRCMORCcFI2eADBUffHUAAAAAAAAAAbAjQyKAAEcCNhoBSRWBCBJEF0k2GgJJTgJJIllJTgMkCyUITBUSRDEAIillRBJESXIHRDIJEkQyCBNEIicEZURAAAUnBEsDZyInBGVESwMSRCJFBiJFBUsESwEMQQBbSwFXAgBLBSQLJFhJRQhJFSQSRDIIYUEAOUsGIipjIk4CTUAALUsGSwMqY0hJRQVBACBLBklLBCtjSExJKksHZitLAmYiKGVECChMZ0sFIwhFBksEIwhFBUL/nUsFFicGTFCwI0MxACIqYyJOAk0URDEAKiNmgAS+rTXtMQBQsCNDNhoBSRUkEkQxACIpZUQSREkiKmMiTgJNIxJESSIrYyJOAk0UREkrI2YiKGVEIwgoSwFnFlCABEN5K/tMULAjQzYaAUkVJBJEMQAiKWVEEkRJIitjIk4CTSMSREkrImYiKGVEIwkoSwFnFlCABPjamYFMULAjQzYaAUcCFSQSRCIqYyJOAk1AAAkiFicGTFCwI0NJIitjIk4CTSMSQQAEJUL/5yNC/+MiKGVEFicGTFCwI0M=", "clear": "C4EBQw=="}, "desc": "Registry for carbon credit issuers with admin approval workflow.\n\n    Global state:\n        admin           \u2013 address of the contract administrator\n        approved_count  \u2013 total number of currently approved issuers\n        schema_version  \u2013 version of the state layout, see `migrate`\n        migrated_from   \u2013 the registry issuers are imported from, if any\n\n    Local state (per account):\n        is_registered   \u2013 1 if the account has registered as an issuer\n        is_approved     \u2013 1 if the account has been approved by admin\n    ", "events": [{"args": [{"type": "address", "name": "issuer"}], "name": "IssuerRegistered", "desc": "ARC-28 event of `register_issuer`."}, {"args": [{"type": "address", "name": "issuer"}, {"type": "uint64", "name": "approved_count"}], "name": "IssuerApproved", "desc": "ARC-28 event of `approve_issuer`, with the new number of approved issuers."}, {"args": [{"type": "address", "name": "issuer"}, {"type": "uint64", "name": "approved_count"}], "name": "IssuerRevoked", "desc": "ARC-28 event of `revoke_issuer`, with the new number of approved issuers."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgMgogICAgYnl0ZWNibG9jayAiYXBwcm92ZWRfY291bnQiICJhZG1pbiIgMHg2OTczNWY3MjY1Njc2OTczNzQ2NTcyNjU2NCAweDY5NzM1ZjYxNzA3MDcyNmY3NjY1NjQgIm1pZ3JhdGVkX2Zyb20iICJzY2hlbWFfdmVyc2lvbiIgMHgxNTFmN2M3NQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo0MwogICAgLy8gc2VsZi5hZG1pbiA9IEdsb2JhbFN0YXRlKEJ5dGVzKCksIGtleT0iYWRtaW4iKQogICAgYnl0ZWNfMSAvLyAiYWRtaW4iCiAgICBwdXNoYnl0ZXMgMHgKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBzZWxmLmFwcHJvdmVkX2NvdW50ID0gR2xvYmFsU3RhdGUoVUludDY0KDApLCBrZXk9ImFwcHJvdmVkX2NvdW50IikKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBzZWxmLnNjaGVtYV92ZXJzaW9uID0gR2xvYmFsU3RhdGUoVUludDY0KDApLCBrZXk9InNjaGVtYV92ZXJzaW9uIikKICAgIGJ5dGVjIDUgLy8gInNjaGVtYV92ZXJzaW9uIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBzZWxmLm1pZ3JhdGVkX2Zyb20gPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0ibWlncmF0ZWRfZnJvbSIpCiAgICBieXRlYyA0IC8vICJtaWdyYXRlZF9mcm9tIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MjgKICAgIC8vIGNsYXNzIElzc3VlclJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9vcHRfaW5AMjAKICAgIHB1c2hieXRlcyAweGEwZTgxODcyIC8vIG1ldGhvZCAidXBkYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl91cGRhdGVfcm91dGVANQoKbWFpbl9zd2l0Y2hfY2FzZV9uZXh0QDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4CiAgICAvLyBjbGFzcyBJc3N1ZXJSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAxNgogICAgcHVzaGJ5dGVzcyAweDIyZjM3NzNiIDB4Zjg1ZWUwMjMgMHhmNTVhZTBiMCAweDg1MjA4NDAxIDB4OGRlZDA4MmEgMHg0YTk4YmUzNCAweGEzMzQ1ODk2IC8vIG1ldGhvZCAibWlncmF0ZSgpdWludDY0IiwgbWV0aG9kICJpbXBvcnRfaXNzdWVycyh1aW50NjQsYWRkcmVzc1tdKXVpbnQ2NCIsIG1ldGhvZCAicmVnaXN0ZXJfaXNzdWVyKCl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX2lzc3VlcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInJldm9rZV9pc3N1ZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJnZXRfaXNzdWVyX3N0YXR1cyhhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2FwcHJvdmVkX2NvdW50KCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtaWdyYXRlIGltcG9ydF9pc3N1ZXJzIHJlZ2lzdGVyX2lzc3VlciBhcHByb3ZlX2lzc3VlciByZXZva2VfaXNzdWVyIGdldF9pc3N1ZXJfc3RhdHVzIGdldF9hcHByb3ZlZF9jb3VudAogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToyOAogICAgLy8gY2xhc3MgSXNzdWVyUmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCm1haW5fdXBkYXRlX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4CiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCA0IC8vIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQKICAgIGIgdXBkYXRlCgptYWluX29wdF9pbkAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTE2CiAgICAvLyBAYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludGNfMSAvLyBPcHRJbgogICAgPT0KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAmJgogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1MwogICAgLy8gc2VsZi5hZG1pbi52YWx1ZSA9IFR4bi5zZW5kZXIuYnl0ZXMKICAgIGJ5dGVjXzEgLy8gImFkbWluIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NTQKICAgIC8vIHNlbGYuYXBwcm92ZWRfY291bnQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1CiAgICAvLyBzZWxmLnNjaGVtYV92ZXJzaW9uLnZhbHVlID0gVUludDY0KFNDSEVNQV9WRVJTSU9OKQogICAgYnl0ZWMgNSAvLyAic2NoZW1hX3ZlcnNpb24iCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NTYKICAgIC8vIHNlbGYubWlncmF0ZWRfZnJvbS52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNCAvLyAibWlncmF0ZWRfZnJvbSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1MAogICAgLy8gQGFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0Lklzc3VlclJlZ2lzdHJ5LnVwZGF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVwZGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NjEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyLmJ5dGVzID09IHNlbGYuYWRtaW4udmFsdWUsICJPbmx5IGFkbWluIGNhbiB1cGRhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgYWRtaW4gY2FuIHVwZGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo1OAogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5taWdyYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKbWlncmF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NzAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyLmJ5dGVzID09IHNlbGYuYWRtaW4udmFsdWUsICJPbmx5IGFkbWluIGNhbiBtaWdyYXRlIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGFkbWluIGNhbiBtaWdyYXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxCiAgICAvLyBhc3NlcnQgc2VsZi5zY2hlbWFfdmVyc2lvbi52YWx1ZSA8PSBTQ0hFTUFfVkVSU0lPTiwgIlN0YXRlIGlzIG5ld2VyIHRoYW4gdGhpcyBwcm9ncmFtIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInNjaGVtYV92ZXJzaW9uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNjaGVtYV92ZXJzaW9uIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIDw9CiAgICBhc3NlcnQgLy8gU3RhdGUgaXMgbmV3ZXIgdGhhbiB0aGlzIHByb2dyYW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6NzItNzMKICAgIC8vICMgQ29udmVyc2lvbnMgZ28gaGVyZSwgb25lIGBpZiBzZWxmLnNjaGVtYV92ZXJzaW9uLnZhbHVlIDwgTjpgIGJsb2NrIHBlciB2ZXJzaW9uLgogICAgLy8gc2VsZi5zY2hlbWFfdmVyc2lvbi52YWx1ZSA9IFVJbnQ2NChTQ0hFTUFfVkVSU0lPTikKICAgIGJ5dGVjIDUgLy8gInNjaGVtYV92ZXJzaW9uIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDAwMQogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuaW1wb3J0X2lzc3VlcnNbcm91dGluZ10oKSAtPiB2b2lkOgppbXBvcnRfaXNzdWVyczoKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo3NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMwogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+PgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo5MgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIuYnl0ZXMgPT0gc2VsZi5hZG1pbi52YWx1ZSwgIk9ubHkgYWRtaW4gY2FuIGltcG9ydCBpc3N1ZXJzIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGFkbWluIGNhbiBpbXBvcnQgaXNzdWVycwogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo5MwogICAgLy8gYXNzZXJ0IHByZXZpb3VzLmNyZWF0b3IgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIlByZXZpb3VzIGFwcCBoYXMgYW5vdGhlciBjcmVhdG9yIgogICAgZHVwCiAgICBhcHBfcGFyYW1zX2dldCBBcHBDcmVhdG9yCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gUHJldmlvdXMgYXBwIGhhcyBhbm90aGVyIGNyZWF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6OTQKICAgIC8vIGFzc2VydCBwcmV2aW91cy5pZCAhPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCwgIkNhbm5vdCBpbXBvcnQgZnJvbSBpdHNlbGYiCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgICE9CiAgICBhc3NlcnQgLy8gQ2Fubm90IGltcG9ydCBmcm9tIGl0c2VsZgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo5NQogICAgLy8gaWYgc2VsZi5taWdyYXRlZF9mcm9tLnZhbHVlID09IDA6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAibWlncmF0ZWRfZnJvbSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWdyYXRlZF9mcm9tIGV4aXN0cwogICAgYm56IGltcG9ydF9pc3N1ZXJzX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weTo5NgogICAgLy8gc2VsZi5taWdyYXRlZF9mcm9tLnZhbHVlID0gcHJldmlvdXMuaWQKICAgIGJ5dGVjIDQgLy8gIm1pZ3JhdGVkX2Zyb20iCiAgICBkaWcgMwogICAgYXBwX2dsb2JhbF9wdXQKCmltcG9ydF9pc3N1ZXJzX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6OTcKICAgIC8vIGFzc2VydCBzZWxmLm1pZ3JhdGVkX2Zyb20udmFsdWUgPT0gcHJldmlvdXMuaWQsICJBbHJlYWR5IGltcG9ydGluZyBmcm9tIGFub3RoZXIgYXBwIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gIm1pZ3JhdGVkX2Zyb20iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlncmF0ZWRfZnJvbSBleGlzdHMKICAgIGRpZyAzCiAgICA9PQogICAgYXNzZXJ0IC8vIEFscmVhZHkgaW1wb3J0aW5nIGZyb20gYW5vdGhlciBhcHAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6OTkKICAgIC8vIGltcG9ydGVkID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA2CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA1CgppbXBvcnRfaXNzdWVyc19mb3JfaGVhZGVyQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMAogICAgLy8gZm9yIGFkZHJlc3MgaW4gYWNjb3VudHM6CiAgICBkaWcgNAogICAgZGlnIDEKICAgIDwKICAgIGJ6IGltcG9ydF9pc3N1ZXJzX2FmdGVyX2ZvckAxMwogICAgZGlnIDEKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgNQogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBidXJ5IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxCiAgICAvLyBhY2NvdW50ID0gQWNjb3VudChhZGRyZXNzLmJ5dGVzKQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxMDIKICAgIC8vIGlmIG5vdCBvcC5hcHBfb3B0ZWRfaW4oYWNjb3VudCwgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQpOgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICBhcHBfb3B0ZWRfaW4KICAgIGJ6IGltcG9ydF9pc3N1ZXJzX2Zvcl9mb290ZXJAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTA0CiAgICAvLyBpZiBzZWxmLmlzX3JlZ2lzdGVyZWQuZ2V0KGFjY291bnQsIGRlZmF1bHQ9VUludDY0KDApKSAhPSAwOgogICAgZGlnIDYKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJpc19yZWdpc3RlcmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgYm56IGltcG9ydF9pc3N1ZXJzX2Zvcl9mb290ZXJAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTA2CiAgICAvLyByZWdpc3RlcmVkLCBfZXhpc3RzID0gb3AuQXBwTG9jYWwuZ2V0X2V4X3VpbnQ2NChhY2NvdW50LCBwcmV2aW91cywgYiJpc19yZWdpc3RlcmVkIikKICAgIGRpZyA2CiAgICBkaWcgMwogICAgYnl0ZWNfMiAvLyAweDY5NzM1ZjcyNjU2NzY5NzM3NDY1NzI2NTY0CiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBwb3AKICAgIGR1cAogICAgYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNwogICAgLy8gaWYgcmVnaXN0ZXJlZCA9PSAwOgogICAgYnogaW1wb3J0X2lzc3VlcnNfZm9yX2Zvb3RlckAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxMDkKICAgIC8vIGFwcHJvdmVkLCBfZXhpc3RzID0gb3AuQXBwTG9jYWwuZ2V0X2V4X3VpbnQ2NChhY2NvdW50LCBwcmV2aW91cywgYiJpc19hcHByb3ZlZCIpCiAgICBkaWcgNgogICAgZHVwCiAgICBkaWcgNAogICAgYnl0ZWNfMyAvLyAweDY5NzM1ZjYxNzA3MDcyNmY3NjY1NjQKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIHBvcAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxMTAKICAgIC8vIHNlbGYuaXNfcmVnaXN0ZXJlZFthY2NvdW50XSA9IHJlZ2lzdGVyZWQKICAgIGR1cAogICAgYnl0ZWNfMiAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGRpZyA3CiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMQogICAgLy8gc2VsZi5pc19hcHByb3ZlZFthY2NvdW50XSA9IGFwcHJvdmVkCiAgICBieXRlY18zIC8vICJpc19hcHByb3ZlZCIKICAgIGRpZyAyCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMgogICAgLy8gc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZSArPSBhcHByb3ZlZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVkX2NvdW50IGV4aXN0cwogICAgKwogICAgYnl0ZWNfMCAvLyAiYXBwcm92ZWRfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxMTMKICAgIC8vIGltcG9ydGVkICs9IDEKICAgIGRpZyA1CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSA2CgppbXBvcnRfaXNzdWVyc19mb3JfZm9vdGVyQDEyOgogICAgZGlnIDQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDUKICAgIGIgaW1wb3J0X2lzc3VlcnNfZm9yX2hlYWRlckA0CgppbXBvcnRfaXNzdWVyc19hZnRlcl9mb3JAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGRpZyA1CiAgICBpdG9iCiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuSXNzdWVyUmVnaXN0cnkucmVnaXN0ZXJfaXNzdWVyW3JvdXRpbmddKCkgLT4gdm9pZDoKcmVnaXN0ZXJfaXNzdWVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxMjcKICAgIC8vIGN1cnJlbnQgPSBzZWxmLmlzX3JlZ2lzdGVyZWQuZ2V0KFR4bi5zZW5kZXIsIGRlZmF1bHQ9VUludDY0KDApKQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyOAogICAgLy8gYXNzZXJ0IGN1cnJlbnQgPT0gMCwgIkFscmVhZHkgcmVnaXN0ZXJlZCIKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IHJlZ2lzdGVyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTI5CiAgICAvLyBzZWxmLmlzX3JlZ2lzdGVyZWRbVHhuLnNlbmRlcl0gPSBVSW50NjQoMSkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjXzIgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxMzAKICAgIC8vIGFyYzQuZW1pdChJc3N1ZXJSZWdpc3RlcmVkKGlzc3Vlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikpKQogICAgcHVzaGJ5dGVzIDB4YmVhZDM1ZWQgLy8gbWV0aG9kICJJc3N1ZXJSZWdpc3RlcmVkKGFkZHJlc3MpIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTIxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5hcHByb3ZlX2lzc3Vlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFwcHJvdmVfaXNzdWVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxMzIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIuYnl0ZXMgPT0gc2VsZi5hZG1pbi52YWx1ZSwgIk9ubHkgYWRtaW4gY2FuIGFwcHJvdmUiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgYWRtaW4gY2FuIGFwcHJvdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTM5CiAgICAvLyByZWdpc3RlcmVkID0gc2VsZi5pc19yZWdpc3RlcmVkLmdldChhY2NvdW50LCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MAogICAgLy8gYXNzZXJ0IHJlZ2lzdGVyZWQgPT0gMSwgIkFjY291bnQgbm90IHJlZ2lzdGVyZWQiCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBBY2NvdW50IG5vdCByZWdpc3RlcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MQogICAgLy8gYWxyZWFkeV9hcHByb3ZlZCA9IHNlbGYuaXNfYXBwcm92ZWQuZ2V0KGFjY291bnQsIGRlZmF1bHQ9VUludDY0KDApKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiaXNfYXBwcm92ZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MgogICAgLy8gYXNzZXJ0IGFscmVhZHlfYXBwcm92ZWQgPT0gMCwgIkFjY291bnQgYWxyZWFkeSBhcHByb3ZlZCIKICAgICEKICAgIGFzc2VydCAvLyBBY2NvdW50IGFscmVhZHkgYXBwcm92ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzCiAgICAvLyBzZWxmLmlzX2FwcHJvdmVkW2FjY291bnRdID0gVUludDY0KDEpCiAgICBkdXAKICAgIGJ5dGVjXzMgLy8gImlzX2FwcHJvdmVkIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0CiAgICAvLyBzZWxmLmFwcHJvdmVkX2NvdW50LnZhbHVlICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVkX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gImFwcHJvdmVkX2NvdW50IgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OAogICAgLy8gYXBwcm92ZWRfY291bnQ9YXJjNC5VSW50NjQoc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZSksCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0Ni0xNDkKICAgIC8vIElzc3VlckFwcHJvdmVkKAogICAgLy8gICAgIGlzc3Vlcj1hcmM0LkFkZHJlc3MoYWNjb3VudCksCiAgICAvLyAgICAgYXBwcm92ZWRfY291bnQ9YXJjNC5VSW50NjQoc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZSksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ1LTE1MAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIElzc3VlckFwcHJvdmVkKAogICAgLy8gICAgICAgICBpc3N1ZXI9YXJjNC5BZGRyZXNzKGFjY291bnQpLAogICAgLy8gICAgICAgICBhcHByb3ZlZF9jb3VudD1hcmM0LlVJbnQ2NChzZWxmLmFwcHJvdmVkX2NvdW50LnZhbHVlKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg0Mzc5MmJmYiAvLyBtZXRob2QgIklzc3VlckFwcHJvdmVkKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuSXNzdWVyUmVnaXN0cnkucmV2b2tlX2lzc3Vlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnJldm9rZV9pc3N1ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTU4CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlci5ieXRlcyA9PSBzZWxmLmFkbWluLnZhbHVlLCAiT25seSBhZG1pbiBjYW4gcmV2b2tlIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGFkbWluIGNhbiByZXZva2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTU5CiAgICAvLyBhcHByb3ZlZCA9IHNlbGYuaXNfYXBwcm92ZWQuZ2V0KGFjY291bnQsIGRlZmF1bHQ9VUludDY0KDApKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiaXNfYXBwcm92ZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MAogICAgLy8gYXNzZXJ0IGFwcHJvdmVkID09IDEsICJBY2NvdW50IG5vdCBhcHByb3ZlZCIKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIEFjY291bnQgbm90IGFwcHJvdmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MQogICAgLy8gc2VsZi5pc19hcHByb3ZlZFthY2NvdW50XSA9IFVJbnQ2NCgwKQogICAgZHVwCiAgICBieXRlY18zIC8vICJpc19hcHByb3ZlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MgogICAgLy8gc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZSAtPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJhcHByb3ZlZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlZF9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBieXRlY18wIC8vICJhcHByb3ZlZF9jb3VudCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNjYKICAgIC8vIGFwcHJvdmVkX2NvdW50PWFyYzQuVUludDY0KHNlbGYuYXBwcm92ZWRfY291bnQudmFsdWUpLAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNjQtMTY3CiAgICAvLyBJc3N1ZXJSZXZva2VkKAogICAgLy8gICAgIGlzc3Vlcj1hcmM0LkFkZHJlc3MoYWNjb3VudCksCiAgICAvLyAgICAgYXBwcm92ZWRfY291bnQ9YXJjNC5VSW50NjQoc2VsZi5hcHByb3ZlZF9jb3VudC52YWx1ZSksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTYzLTE2OAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIElzc3VlclJldm9rZWQoCiAgICAvLyAgICAgICAgIGlzc3Vlcj1hcmM0LkFkZHJlc3MoYWNjb3VudCksCiAgICAvLyAgICAgICAgIGFwcHJvdmVkX2NvdW50PWFyYzQuVUludDY0KHNlbGYuYXBwcm92ZWRfY291bnQudmFsdWUpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGY4ZGE5OTgxIC8vIG1ldGhvZCAiSXNzdWVyUmV2b2tlZChhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNTIKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0Lklzc3VlclJlZ2lzdHJ5LmdldF9pc3N1ZXJfc3RhdHVzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2lzc3Vlcl9zdGF0dXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3OQogICAgLy8gcmVnaXN0ZXJlZCA9IHNlbGYuaXNfcmVnaXN0ZXJlZC5nZXQoYWNjb3VudCwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTgwCiAgICAvLyBpZiByZWdpc3RlcmVkID09IDA6CiAgICBibnogZ2V0X2lzc3Vlcl9zdGF0dXNfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKCmdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lubGluZWRfY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuZ2V0X2lzc3Vlcl9zdGF0dXNANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTcwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MgogICAgLy8gYXBwcm92ZWQgPSBzZWxmLmlzX2FwcHJvdmVkLmdldChhY2NvdW50LCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImlzX2FwcHJvdmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxODMKICAgIC8vIGlmIGFwcHJvdmVkID09IDE6CiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxODQKICAgIC8vIHJldHVybiBVSW50NjQoMikKICAgIGludGNfMyAvLyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfaXNzdWVyX3N0YXR1c19hZnRlcl9pbmxpbmVkX2NvbnRyYWN0Lklzc3VlclJlZ2lzdHJ5LmdldF9pc3N1ZXJfc3RhdHVzQDYKCmdldF9pc3N1ZXJfc3RhdHVzX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9pc3N1ZXJfcmVnaXN0cnkvY29udHJhY3QucHk6MTg1CiAgICAvLyByZXR1cm4gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxNzAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X2lzc3Vlcl9zdGF0dXNfYWZ0ZXJfaW5saW5lZF9jb250cmFjdC5Jc3N1ZXJSZWdpc3RyeS5nZXRfaXNzdWVyX3N0YXR1c0A2CgoKLy8gY29udHJhY3QuSXNzdWVyUmVnaXN0cnkuZ2V0X2FwcHJvdmVkX2NvdW50W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2FwcHJvdmVkX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2lzc3Vlcl9yZWdpc3RyeS9jb250cmFjdC5weToxOTAKICAgIC8vIHJldHVybiBzZWxmLmFwcHJvdmVkX2NvdW50LnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiYXBwcm92ZWRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZWRfY291bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvaXNzdWVyX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWMgNiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [549], "errorMessage": "Account already approved"}, {"pc": [603], "errorMessage": "Account not approved"}, {"pc": [539], "errorMessage": "Account not registered"}, {"pc": [402], "errorMessage": "Address length is 32 bytes"}, {"pc": [369], "errorMessage": "Already importing from another app"}, {"pc": [495], "errorMessage": "Already registered"}, {"pc": [347], "errorMessage": "Cannot import from itself"}, {"pc": [528], "errorMessage": "Only admin can approve"}, {"pc": [335], "errorMessage": "Only admin can import issuers"}, {"pc": [262], "errorMessage": "Only admin can migrate"}, {"pc": [592], "errorMessage": "Only admin can revoke"}, {"pc": [252], "errorMessage": "Only admin can update"}, {"pc": [343], "errorMessage": "Previous app has another creator"}, {"pc": [270], "errorMessage": "State is newer than this program"}, {"pc": [339], "errorMessage": "application exists"}, {"pc": [250, 260, 333, 526, 590], "errorMessage": "check self.admin exists"}, {"pc": [455, 557, 611, 683], "errorMessage": "check self.approved_count exists"}, {"pc": [352, 365], "errorMessage": "check self.migrated_from exists"}, {"pc": [267], "errorMessage": "check self.schema_version exists"}, {"pc": [394], "errorMessage": "index access is out of bounds"}, {"pc": [316], "errorMessage": "invalid array length header"}, {"pc": [327], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [520, 584, 639], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [305], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +66,16 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ImportIssuersArgs:
+    """Dataclass for import_issuers arguments"""
+    previous: int
+    accounts: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "import_issuers(uint64,address[])uint64"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class ApproveIssuerArgs:
     """Dataclass for approve_issuer arguments"""
@@ -92,6 +104,24 @@ class GetIssuerStatusArgs:
         return "get_issuer_status(address)uint64"
 
 
+class _IssuerRegistryUpdate:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppUpdateMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        return self.app_client.params.update(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update()void",
+        }))
+
+
 class _IssuerRegistryOptIn:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -106,10 +136,38 @@ class IssuerRegistryParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def update(self) -> "_IssuerRegistryUpdate":
+        return _IssuerRegistryUpdate(self.app_client)
+
     @property
     def opt_in(self) -> "_IssuerRegistryOptIn":
         return _IssuerRegistryOptIn(self.app_client)
 
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate()uint64",
+        }))
+
+    def import_issuers(
+        self,
+        args: tuple[int, list[str]] | ImportIssuersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_issuers(uint64,address[])uint64",
+            "args": method_args,
+        }))
+
     def register_issuer(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -193,6 +251,24 @@ class IssuerRegistryParams:
         )
 
 
+class _IssuerRegistryUpdateTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        return self.app_client.create_transaction.update(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update()void",
+        }))
+
+
 class _IssuerRegistryOptInTransaction:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -205,10 +281,38 @@ class IssuerRegistryCreateTransactionParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def update(self) -> "_IssuerRegistryUpdateTransaction":
+        return _IssuerRegistryUpdateTransaction(self.app_client)
+
     @property
     def opt_in(self) -> "_IssuerRegistryOptInTransaction":
         return _IssuerRegistryOptInTransaction(self.app_client)
 
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate()uint64",
+        }))
+
+    def import_issuers(
+        self,
+        args: tuple[int, list[str]] | ImportIssuersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_issuers(uint64,address[])uint64",
+            "args": method_args,
+        }))
+
     def register_issuer(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -292,6 +396,27 @@ class IssuerRegistryCreateTransactionParams:
         )
 
 
+class _IssuerRegistryUpdateSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        response = self.app_client.send.update(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update()void",
+        }), send_params=send_params, compilation_params=compilation_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppUpdateTransactionResult[None], parsed_response)
+
+
 class _IssuerRegistryOptInSend:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -313,10 +438,44 @@ class IssuerRegistrySend:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def update(self) -> "_IssuerRegistryUpdateSend":
+        return _IssuerRegistryUpdateSend(self.app_client)
+
     @property
     def opt_in(self) -> "_IssuerRegistryOptInSend":
         return _IssuerRegistryOptInSend(self.app_client)
 
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def import_issuers(
+        self,
+        args: tuple[int, list[str]] | ImportIssuersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_issuers(uint64,address[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
     def register_issuer(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -422,6 +581,8 @@ class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     admin: bytes
     approved_count: int
+    schema_version: int
+    migrated_from: int
 
 class LocalStateValue(typing.TypedDict):
     """Shape of local_state state key values"""
@@ -486,6 +647,22 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def schema_version(self) -> int:
+        """Get the current value of the schema_version key in global_state state"""
+        value = self.app_client.state.global_state.get_value("schema_version")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def migrated_from(self) -> int:
+        """Get the current value of the migrated_from key in global_state state"""
+        value = self.app_client.state.global_state.get_value("migrated_from")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class _LocalState:
     def __init__(self, app_client: algokit_utils.AppClient, address: str):
         self.app_client = app_client
@@ -668,6 +845,18 @@ class IssuerRegistryClient:
     def new_group(self) -> "IssuerRegistryComposer":
         return IssuerRegistryComposer(self)
 
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["migrate()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["import_issuers(uint64,address[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
@@ -705,6 +894,12 @@ class IssuerRegistryClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["update()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -755,7 +950,28 @@ class IssuerRegistryMethodCallCreateParams(
             }
         )
 
-class IssuerRegistryFactory(algokit_utils.TypedAppFactoryProtocol[IssuerRegistryMethodCallCreateParams, None, None]):
+@dataclasses.dataclass(frozen=True)
+class IssuerRegistryMethodCallUpdateParams(
+    algokit_utils.BaseAppClientMethodCallParams[
+        typing.Any,
+        str | None,
+    ]
+):
+    """Parameters for calling IssuerRegistry contract using ABI"""
+    on_complete: typing.Literal[OnComplete.UpdateApplicationOC] | None = None
+    method: str | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientMethodCallParams:
+        method_args = _parse_abi_args(self.args)
+        return algokit_utils.AppClientMethodCallParams(
+            **{
+                **self.__dict__,
+                "method": self.method or getattr(self.args, "abi_method_signature", None),
+                "args": method_args,
+            }
+        )
+
+class IssuerRegistryFactory(algokit_utils.TypedAppFactoryProtocol[IssuerRegistryMethodCallCreateParams, IssuerRegistryMethodCallUpdateParams, None]):
     """Factory for deploying and managing IssuerRegistryClient smart contracts"""
 
     def __init__(
@@ -801,7 +1017,7 @@ class IssuerRegistryFactory(algokit_utils.TypedAppFactoryProtocol[IssuerRegistry
         on_update: algokit_utils.OnUpdate | None = None,
         on_schema_break: algokit_utils.OnSchemaBreak | None = None,
         create_params: IssuerRegistryMethodCallCreateParams | None = None,
-        update_params: None = None,
+        update_params: IssuerRegistryMethodCallUpdateParams | None = None,
         delete_params: None = None,
         existing_deployments: algokit_utils.ApplicationLookup | None = None,
         ignore_cache: bool = False,
@@ -814,7 +1030,7 @@ class IssuerRegistryFactory(algokit_utils.TypedAppFactoryProtocol[IssuerRegistry
             on_update=on_update,
             on_schema_break=on_schema_break,
             create_params=create_params.to_algokit_utils_params() if create_params else None,
-            update_params=update_params,
+            update_params=update_params.to_algokit_utils_params() if update_params else None,
             delete_params=delete_params,
             existing_deployments=existing_deployments,
             ignore_cache=ignore_cache,
@@ -899,6 +1115,45 @@ class IssuerRegistryFactoryCreateParams:
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             compilation_params=compilation_params)
 
+    def migrate(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the migrate()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "migrate()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def import_issuers(
+        self,
+        args: tuple[int, list[str]] | ImportIssuersArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the import_issuers(uint64,address[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "import_issuers(uint64,address[])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def register_issuer(
         self,
         *,
@@ -1016,6 +1271,25 @@ class IssuerRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def update(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the update()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "update()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
 class IssuerRegistryFactoryUpdateParams:
     """Parameters for 'update' operations of IssuerRegistry contract"""
 
@@ -1146,6 +1420,29 @@ class IssuerRegistryFactorySendCreate:
             )
 
 
+class _IssuerRegistryUpdateComposer:
+    def __init__(self, composer: "IssuerRegistryComposer"):
+        self.composer = composer
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "IssuerRegistryComposer":
+        self.composer._composer.add_app_update_method_call(
+            self.composer.client.params.update.update(
+                
+                params=params,
+                compilation_params=compilation_params
+            )
+        )
+        self.composer._result_mappers.append(
+            lambda v: self.composer.client.decode_return_value(
+                "update()void", v
+            )
+        )
+        return self.composer
+
+
 class _IssuerRegistryOptInComposer:
     def __init__(self, composer: "IssuerRegistryComposer"):
         self.composer = composer
@@ -1159,10 +1456,49 @@ class IssuerRegistryComposer:
         self._composer = client.algorand.new_group()
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
 
+    @property
+    def update(self) -> "_IssuerRegistryUpdateComposer":
+        return _IssuerRegistryUpdateComposer(self)
+
     @property
     def opt_in(self) -> "_IssuerRegistryOptInComposer":
         return _IssuerRegistryOptInComposer(self)
 
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "IssuerRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.migrate(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "migrate()uint64", v
+            )
+        )
+        return self
+
+    def import_issuers(
+        self,
+        args: tuple[int, list[str]] | ImportIssuersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "IssuerRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.import_issuers(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "import_issuers(uint64,address[])uint64", v
+            )
+        )
+        return self
+
     def register_issuer(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -4,6 +4,8 @@
 # This file was automatically generated by algokit-client-generator.
 # DO NOT MODIFY IT BY HAND.
 # requires: algokit-utils@^3.0.0
+# arc56-sha256: 3d573d6681c032faffbc87d69221c5253ec62c71aeaceba2d1877a3f2445b321
+# algokit-client-generator: 2.2.0
 
 # common
 import dataclasses
@@ -19,7 +21,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Initialise retirement tracking.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The $CXT asset to track.", "name": "asset"}], "name": "init_asset", "returns": {"type": "void"}, "desc": "Set the $CXT Asset ID. Creator only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "axfer", "desc": "The asset transfer from the user to the contract.", "name": "axfer_tx"}], "name": "retire_credits", "returns": {"type": "void"}, "desc": "Retire carbon credits permanently.\nRequires an atomic group: 1. Asset Transfer ($CXT) from User to RetirementManager 2. App Call to this method", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_retirement_stats", "returns": {"type": "uint64"}, "desc": "Return the total retired credits.", "events": [], "readonly": true, "recommendations": {}}], "name": "RetirementManager", "state": {"keys": {"box": {}, "global": {"retired_credits": {"key": "cmV0aXJlZF9jcmVkaXRz", "keyType": "AVMString", "valueType": "AVMUint64"}, "cxt_asset_id": {"key": "Y3h0X2Fzc2V0X2lk", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CyADAAEEJgIPcmV0aXJlZF9jcmVkaXRzDGN4dF9hc3NldF9pZDEYQAAGKCJnKSJnMRkURDEYQQAdggMEO7Y+1wQb2gi6BJD1qII2GgCOAwAXAEQAbACABExcYbo2GgCOAQABACgiZykiZyNDNhoBSRWBCBJEFzEAMgkSRCIpZUQURClLAWexMgoishKyFLIRJLIQIrIBsyNDMRYjCUk4ECQSREk4FDIKEkRJOBEiKWVEEkQ4EklEIihlRAgoTGcjQyIoZUQWgAQVH3x1TFCwI0M=", "clear": "C4EBQw=="}, "desc": "Manages carbon credit retirements by verifying $CXT ASA transfers.\n\n    Global state:\n        retired_credits  \u2013 credits permanently retired\n        cxt_asset_id    \u2013 the Asset ID of the $CXT token\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgNAogICAgYnl0ZWNibG9jayAicmV0aXJlZF9jcmVkaXRzIiAiY3h0X2Fzc2V0X2lkIgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxNAogICAgLy8gc2VsZi5yZXRpcmVkX2NyZWRpdHMgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0icmV0aXJlZF9jcmVkaXRzIikKICAgIGJ5dGVjXzAgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxNQogICAgLy8gc2VsZi5jeHRfYXNzZXRfaWQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0iY3h0X2Fzc2V0X2lkIikKICAgIGJ5dGVjXzEgLy8gImN4dF9hc3NldF9pZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIFJldGlyZW1lbnRNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDkKICAgIHB1c2hieXRlc3MgMHgzYmI2M2VkNyAweDFiZGEwOGJhIDB4OTBmNWE4ODIgLy8gbWV0aG9kICJpbml0X2Fzc2V0KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZXRpcmVfY3JlZGl0cyhheGZlcil2b2lkIiwgbWV0aG9kICJnZXRfcmV0aXJlbWVudF9zdGF0cygpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggaW5pdF9hc3NldCByZXRpcmVfY3JlZGl0cyBnZXRfcmV0aXJlbWVudF9zdGF0cwogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIFJldGlyZW1lbnRNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICBwdXNoYnl0ZXMgMHg0YzVjNjFiYSAvLyBtZXRob2QgImNyZWF0ZSgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGNyZWF0ZQogICAgZXJyCgoKLy8gY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMAogICAgLy8gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMQogICAgLy8gc2VsZi5jeHRfYXNzZXRfaWQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzEgLy8gImN4dF9hc3NldF9pZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxNwogICAgLy8gQGFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLmluaXRfYXNzZXRbcm91dGluZ10oKSAtPiB2b2lkOgppbml0X2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTozMAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gaW5pdCBhc3NldCIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIGluaXQgYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzEKICAgIC8vIGFzc2VydCBzZWxmLmN4dF9hc3NldF9pZC52YWx1ZSA9PSAwLCAiQXNzZXQgYWxyZWFkeSBpbml0aWFsaXplZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJjeHRfYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3h0X2Fzc2V0X2lkIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIEFzc2V0IGFscmVhZHkgaW5pdGlhbGl6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzIKICAgIC8vIHNlbGYuY3h0X2Fzc2V0X2lkLnZhbHVlID0gYXNzZXQuaWQKICAgIGJ5dGVjXzEgLy8gImN4dF9hc3NldF9pZCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTozOC00MgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9YXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NDAKICAgIC8vIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo0MQogICAgLy8gYXNzZXRfYW1vdW50PTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTozOAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18yIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzgtNDIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIucmV0aXJlX2NyZWRpdHNbcm91dGluZ10oKSAtPiB2b2lkOgpyZXRpcmVfY3JlZGl0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NDQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzIgLy8gYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo1NQogICAgLy8gYXNzZXJ0IGF4ZmVyX3R4LmFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJUcmFuc2ZlciBtdXN0IGJlIHRvIGNvbnRyYWN0IgogICAgZHVwCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBUcmFuc2ZlciBtdXN0IGJlIHRvIGNvbnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjU2CiAgICAvLyBhc3NlcnQgYXhmZXJfdHgueGZlcl9hc3NldC5pZCA9PSBzZWxmLmN4dF9hc3NldF9pZC52YWx1ZSwgIkluY29ycmVjdCBhc3NldCBJRCIKICAgIGR1cAogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3h0X2Fzc2V0X2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN4dF9hc3NldF9pZCBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gSW5jb3JyZWN0IGFzc2V0IElECiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBhc3NlcnQgYXhmZXJfdHguYXNzZXRfYW1vdW50ID4gMCwgIkFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZ3R4bnMgQXNzZXRBbW91bnQKICAgIGR1cAogICAgYXNzZXJ0IC8vIEFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjU5LTYwCiAgICAvLyAjIFVwZGF0ZSBnbG9iYWwgdGFsbHkKICAgIC8vIHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlICs9IGF4ZmVyX3R4LmFzc2V0X2Ftb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXRpcmVkX2NyZWRpdHMgZXhpc3RzCiAgICArCiAgICBieXRlY18wIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo0NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIuZ2V0X3JldGlyZW1lbnRfc3RhdHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcmV0aXJlbWVudF9zdGF0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NjUKICAgIC8vIHJldHVybiBzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXRpcmVkX2NyZWRpdHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [182], "errorMessage": "Amount must be greater than zero"}, {"pc": [129], "errorMessage": "Asset already initialized"}, {"pc": [178], "errorMessage": "Incorrect asset ID"}, {"pc": [123], "errorMessage": "Only creator can init asset"}, {"pc": [169], "errorMessage": "Transfer must be to contract"}, {"pc": [127, 176], "errorMessage": "check self.cxt_asset_id exists"}, {"pc": [186, 196], "errorMessage": "check self.retired_credits exists"}, {"pc": [116], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [162], "errorMessage": "transaction type is axfer"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Initialise retirement tracking.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update", "returns": {"type": "void"}, "desc": "Replace the program in place, keeping the app ID and state. Creator only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "migrate", "returns": {"type": "uint64", "desc": "The schema version the state is now at."}, "desc": "Convert the state of an updated app to the current layout. Creator only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The retirement manager app to import from.", "name": "previous"}], "name": "import_state", "returns": {"type": "void"}, "desc": "Add the retired tally of a retirement manager this app replaces. Creator only.\nOnly allowed once, and from an app of the same creator.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The $CXT asset to track.", "name": "asset"}], "name": "init_asset", "returns": {"type": "void"}, "desc": "Set the $CXT Asset ID. Creator only.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment covering the minimum balance of the certificate boxes.", "name": "mbr_payment"}, {"type": "axfer", "desc": "The asset transfer from the user to the contract.", "name": "axfer_tx"}, {"type": "address", "desc": "The account the credits are retired on behalf of.", "name": "beneficiary"}, {"type": "byte[32]", "desc": "Free-form reference, e.g. a hash of the retirement claim.", "name": "memo"}], "name": "retire_credits", "returns": {"type": "uint64", "desc": "The sequence number of the certificate, per retiree."}, "desc": "Retire carbon credits permanently and record a certificate of it.\nRequires an atomic group: 1. Payment of the certificate's box MBR to RetirementManager, see `certificate_mbr` 2. Asset Transfer ($CXT) from User to RetirementManager 3. App Call to this method", "events": [{"args": [{"type": "address", "name": "retiree"}, {"type": "uint64", "name": "sequence"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "retired_credits"}], "name": "CreditsRetired", "desc": "ARC-28 event of `retire_credits`: $CXT permanently retired by an account."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment covering the minimum balance of the certificate boxes.", "name": "mbr_payment"}, {"type": "address", "desc": "The account the credits are retired on behalf of.", "name": "beneficiary"}, {"type": "byte[32]", "desc": "Free-form reference, e.g. a hash of the retirement claim.", "name": "memo"}], "name": "retire_credits_batch", "returns": {"type": "uint64", "desc": "The sequence number of the certificate, per retiree, as `retire_credits`."}, "desc": "Retire every $CXT transfer in the group with a single app call.\nThe group holds the MBR payment, up to 14 asset transfers from the user(s) to RetirementManager, and this call. Every asset transfer in the group is validated like the one passed to `retire_credits`; other transaction types are ignored. No other call to this app may be in the group, so no transfer is counted twice. The whole batch is recorded as one certificate under the caller (`Txn.sender`), even when the transfers come from several senders.", "events": [{"args": [{"type": "address", "name": "retiree"}, {"type": "uint64", "name": "sequence"}, {"type": "uint64", "name": "transfers"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "retired_credits"}], "name": "CreditsRetiredBatch", "desc": "ARC-28 event of `retire_credits_batch`: one record for every lot in the group."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "retiree"}], "name": "certificate_mbr", "returns": {"type": "uint64"}, "desc": "Return the MBR payment the next retirement of `retiree` needs, in microAlgos.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "retiree"}], "name": "get_certificate_count", "returns": {"type": "uint64"}, "desc": "Return the number of retirement certificates of `retiree`.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The account whose certificates to read.", "name": "retiree"}, {"type": "uint64", "desc": "Sequence number of the first certificate of the page.", "name": "start"}, {"type": "uint64", "desc": "Maximum number of certificates to return.", "name": "limit"}], "name": "get_certificates", "returns": {"type": "(uint64,uint64,address,byte[32])[]"}, "desc": "Return a page of the retirement certificates of `retiree`, oldest first.\nRead the full history in pages of up to `MAX_CERTIFICATES_PAGE`, from `start` = 0 until a page comes back short.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_retirement_stats", "returns": {"type": "uint64"}, "desc": "Return the total retired credits.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_stats", "returns": {"type": "(uint64,uint64)", "struct": "RetirementStats"}, "desc": "Return the $CXT Asset ID and total retired credits in one call.", "events": [], "readonly": true, "recommendations": {}}], "name": "RetirementManager", "state": {"keys": {"box": {}, "global": {"retired_credits": {"key": "cmV0aXJlZF9jcmVkaXRz", "keyType": "AVMString", "valueType": "AVMUint64"}, "cxt_asset_id": {"key": "Y3h0X2Fzc2V0X2lk", "keyType": "AVMString", "valueType": "AVMUint64"}, "schema_version": {"key": "c2NoZW1hX3ZlcnNpb24=", "keyType": "AVMString", "valueType": "AVMUint64"}, "migrated_from": {"key": "bWlncmF0ZWRfZnJvbQ==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"certificate_counts": {"keyType": "address", "valueType": "uint64", "prefix": "bg=="}, "certificates": {"keyType": "CertificateKey", "valueType": "RetirementCertificate", "prefix": "cg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 4}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"CertificateKey": [{"name": "retiree", "type": "address"}, {"name": "sequence", "type": "uint64"}], "RetirementCertificate": [{"name": "amount", "type": "uint64"}, {"name": "round", "type": "uint64"}, {"name": "beneficiary", "type": "address"}, {"name": "memo", "type": "byte[32]"}], "RetirementStats": [{"name": "asset_id", "type": "uint64"}, {"name": "retired_credits", "type": "uint64"}]}, "byteCode": {"approval": "CyAEAAEgBCYGD3JldGlyZWRfY3JlZGl0cwxjeHRfYXNzZXRfaWQEFR98dQ5zY2hlbWFfdmVyc2lvbg1taWdyYXRlZF9mcm9tAW4xGEAADSgiZykiZysiZycEImeABKDoGHI2GgCOAQBlMRkURDEYQQBOggoEIvN3OwQfY/JxBDu2PtcEHPXDBQQw7jfdBJ/L1wYE2q+ABARS0G6wBJD1qIIE5n2vUTYaAI4KADEAUgCIALUBMAH1AgcCIgKqArUAgARMXGG6NhoAjgEADAAxGSUSMRgQREIADygiZykiZysjZycEImcjQzEAMgkSRCNDMQAyCRJEIitlRCMORCsjZ4AMFR98dQAAAAAAAAABsCNDNhoBSRWBCBJEFzEAMgkSRElyB0QyCRJESTIIE0QiJwRlRBRESShlSCIoZUQIKExnJwRMZyNDNhoBSRWBCBJEFzEAMgkSRCIpZUQURClLAWexMgoishKyFLIRJbIQIrIBsyNDMRaBAglJOBAjEkQxFiMJSTgQJRJENhoBSRUkEkQ2GgJJFSQSREsCOBQyChJESwI4ESIpZUQSREsCOBJJRCIoZURLAQgoTGdPAzgATwRLAUsDTwZPBogB0UgWTwIWIihlRBZPA0sDUE8CUExQgAQZWTGdTFCwKkxQsCNDgAAxFiMJSTgQIxJENhoBSRUkEkQ2GgJJFSQSRCIpZUxJTwJERCJJMgQiSUsCDEEASkkxFhJAABNJOBBJRQqBBhJBAA9JOBgyCBNESSMIRQFC/9dLCCUSQf/xRwI4FDIKEkRJOBFLBhJEOBJJREsEIwhFBUsDCEUDQv/QSwNJRCIoZURLBElOAggoTGdLCTEASwJLC0sLiAEVSDEATBZPAxZPAxYiKGVEFk8ESwRQTwNQTwJQTFCABOkMBIlMULAqTFCwI0M2GgFJFSQSRIgAxhYqTFCwI0M2GgFJFSQSRCcFTFC+TBciTE8CTRYqTFCwI0MigAA2GgFHAhUkEkQ2GgJJFYEIEkQXSU4CNhoDSRWBCBJEF0mBDA5EJwVPA1C+TBciTE8CTUlOA04CCElPAg1BAARLAUUBgAIAAEUGSwJFBUsESwEMQQApSwRJFksFTFCAAXJMUL5ESwdJTwJQTCJZIwgWVwYCXABFByMIRQVC/88qSwZQsCNDIihlRBYqTFCwI0MiKWVEFiIoZUQWUCpMULAjQ4oBAScFi/9QvUUBQQAFgdSNA4mBqKEEiYoFAov7OAcyChJEi/s4CIv8iP/UD0QnBYv8UEm+TBciTE8CTUkWi/xMUIv9FjIGFlCL/lCL/1CAAXJPAlBMv0kjCBZPAky/i/+J", "clear": "C4EBQw=="}, "desc": "Manages carbon credit retirements by verifying $CXT ASA transfers.\n\n    Global state:\n        retired_credits  \u2013 credits permanently retired\n        cxt_asset_id    \u2013 the Asset ID of the $CXT token\n        schema_version  \u2013 version of the state layout, see `migrate`\n        migrated_from   \u2013 the app whose tally was imported, if any\n\n    Boxes (per retiree, paid for by the retiree, see `retire_credits`):\n        n<retiree>             \u2013 number of certificates of the retiree\n        r<retiree><sequence>   \u2013 `RetirementCertificate` of each retirement\n    ", "events": [{"args": [{"type": "address", "name": "retiree"}, {"type": "uint64", "name": "sequence"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "retired_credits"}], "name": "CreditsRetired", "desc": "ARC-28 event of `retire_credits`: $CXT permanently retired by an account."}, {"args": [{"type": "address", "name": "retiree"}, {"type": "uint64", "name": "sequence"}, {"type": "uint64", "name": "transfers"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "retired_credits"}], "name": "CreditsRetiredBatch", "desc": "ARC-28 event of `retire_credits_batch`: one record for every lot in the group."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgNAogICAgYnl0ZWNibG9jayAweDcyNjU3NDY5NzI2NTY0NWY2MzcyNjU2NDY5NzQ3MyAiY3h0X2Fzc2V0X2lkIiAweDE1MWY3Yzc1ICJzY2hlbWFfdmVyc2lvbiIgIm1pZ3JhdGVkX2Zyb20iIDB4NmUKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NzcKICAgIC8vIHNlbGYucmV0aXJlZF9jcmVkaXRzID0gR2xvYmFsU3RhdGUoVUludDY0KDApLCBrZXk9InJldGlyZWRfY3JlZGl0cyIpCiAgICBieXRlY18wIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NzgKICAgIC8vIHNlbGYuY3h0X2Fzc2V0X2lkID0gR2xvYmFsU3RhdGUoVUludDY0KDApLCBrZXk9ImN4dF9hc3NldF9pZCIpCiAgICBieXRlY18xIC8vICJjeHRfYXNzZXRfaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NzkKICAgIC8vIHNlbGYuc2NoZW1hX3ZlcnNpb24gPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0ic2NoZW1hX3ZlcnNpb24iKQogICAgYnl0ZWNfMyAvLyAic2NoZW1hX3ZlcnNpb24iCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6ODAKICAgIC8vIHNlbGYubWlncmF0ZWRfZnJvbSA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJtaWdyYXRlZF9mcm9tIikKICAgIGJ5dGVjIDQgLy8gIm1pZ3JhdGVkX2Zyb20iCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo2MgogICAgLy8gY2xhc3MgUmV0aXJlbWVudE1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweGEwZTgxODcyIC8vIG1ldGhvZCAidXBkYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl91cGRhdGVfcm91dGVANAoKbWFpbl9zd2l0Y2hfY2FzZV9uZXh0QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBjbGFzcyBSZXRpcmVtZW50TWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAxOAogICAgcHVzaGJ5dGVzcyAweDIyZjM3NzNiIDB4MWY2M2YyNzEgMHgzYmI2M2VkNyAweDFjZjVjMzA1IDB4MzBlZTM3ZGQgMHg5ZmNiZDcwNiAweGRhYWY4MDA0IDB4NTJkMDZlYjAgMHg5MGY1YTg4MiAweGU2N2RhZjUxIC8vIG1ldGhvZCAibWlncmF0ZSgpdWludDY0IiwgbWV0aG9kICJpbXBvcnRfc3RhdGUodWludDY0KXZvaWQiLCBtZXRob2QgImluaXRfYXNzZXQodWludDY0KXZvaWQiLCBtZXRob2QgInJldGlyZV9jcmVkaXRzKHBheSxheGZlcixhZGRyZXNzLGJ5dGVbMzJdKXVpbnQ2NCIsIG1ldGhvZCAicmV0aXJlX2NyZWRpdHNfYmF0Y2gocGF5LGFkZHJlc3MsYnl0ZVszMl0pdWludDY0IiwgbWV0aG9kICJjZXJ0aWZpY2F0ZV9tYnIoYWRkcmVzcyl1aW50NjQiLCBtZXRob2QgImdldF9jZXJ0aWZpY2F0ZV9jb3VudChhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2NlcnRpZmljYXRlcyhhZGRyZXNzLHVpbnQ2NCx1aW50NjQpKHVpbnQ2NCx1aW50NjQsYWRkcmVzcyxieXRlWzMyXSlbXSIsIG1ldGhvZCAiZ2V0X3JldGlyZW1lbnRfc3RhdHMoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3N0YXRzKCkodWludDY0LHVpbnQ2NCkiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtaWdyYXRlIGltcG9ydF9zdGF0ZSBpbml0X2Fzc2V0IHJldGlyZV9jcmVkaXRzIHJldGlyZV9jcmVkaXRzX2JhdGNoIGNlcnRpZmljYXRlX21iciBnZXRfY2VydGlmaWNhdGVfY291bnQgZ2V0X2NlcnRpZmljYXRlcyBnZXRfcmV0aXJlbWVudF9zdGF0cyBnZXRfc3RhdHMKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6NjIKICAgIC8vIGNsYXNzIFJldGlyZW1lbnRNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICBwdXNoYnl0ZXMgMHg0YzVjNjFiYSAvLyBtZXRob2QgImNyZWF0ZSgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGNyZWF0ZQogICAgZXJyCgptYWluX3VwZGF0ZV9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo5MgogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludGNfMyAvLyBVcGRhdGVBcHBsaWNhdGlvbgogICAgPT0KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAmJgogICAgYXNzZXJ0CiAgICBiIHVwZGF0ZQoKCi8vIGNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLmNyZWF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6ODcKICAgIC8vIHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYuY3h0X2Fzc2V0X2lkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJjeHRfYXNzZXRfaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6ODkKICAgIC8vIHNlbGYuc2NoZW1hX3ZlcnNpb24udmFsdWUgPSBVSW50NjQoU0NIRU1BX1ZFUlNJT04pCiAgICBieXRlY18zIC8vICJzY2hlbWFfdmVyc2lvbiIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo5MAogICAgLy8gc2VsZi5taWdyYXRlZF9mcm9tLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyA0IC8vICJtaWdyYXRlZF9mcm9tIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBAYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIudXBkYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKdXBkYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTo5NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gdXBkYXRlIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBjYW4gdXBkYXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLm1pZ3JhdGVbcm91dGluZ10oKSAtPiB2b2lkOgptaWdyYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxMDQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IGNyZWF0b3IgY2FuIG1pZ3JhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBtaWdyYXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjEwNQogICAgLy8gYXNzZXJ0IHNlbGYuc2NoZW1hX3ZlcnNpb24udmFsdWUgPD0gU0NIRU1BX1ZFUlNJT04sICJTdGF0ZSBpcyBuZXdlciB0aGFuIHRoaXMgcHJvZ3JhbSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJzY2hlbWFfdmVyc2lvbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zY2hlbWFfdmVyc2lvbiBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA8PQogICAgYXNzZXJ0IC8vIFN0YXRlIGlzIG5ld2VyIHRoYW4gdGhpcyBwcm9ncmFtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjEwNi0xMDcKICAgIC8vICMgQ29udmVyc2lvbnMgZ28gaGVyZSwgb25lIGBpZiBzZWxmLnNjaGVtYV92ZXJzaW9uLnZhbHVlIDwgTjpgIGJsb2NrIHBlciB2ZXJzaW9uLgogICAgLy8gc2VsZi5zY2hlbWFfdmVyc2lvbi52YWx1ZSA9IFVJbnQ2NChTQ0hFTUFfVkVSU0lPTikKICAgIGJ5dGVjXzMgLy8gInNjaGVtYV92ZXJzaW9uIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDAwMQogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIuaW1wb3J0X3N0YXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKaW1wb3J0X3N0YXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxMTAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTE5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSBjcmVhdG9yIGNhbiBpbXBvcnQgc3RhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBpbXBvcnQgc3RhdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTIwCiAgICAvLyBhc3NlcnQgcHJldmlvdXMuY3JlYXRvciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiUHJldmlvdXMgYXBwIGhhcyBhbm90aGVyIGNyZWF0b3IiCiAgICBkdXAKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcENyZWF0b3IKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBQcmV2aW91cyBhcHAgaGFzIGFub3RoZXIgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxMjEKICAgIC8vIGFzc2VydCBwcmV2aW91cy5pZCAhPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCwgIkNhbm5vdCBpbXBvcnQgZnJvbSBpdHNlbGYiCiAgICBkdXAKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25JRAogICAgIT0KICAgIGFzc2VydCAvLyBDYW5ub3QgaW1wb3J0IGZyb20gaXRzZWxmCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjEyMgogICAgLy8gYXNzZXJ0IHNlbGYubWlncmF0ZWRfZnJvbS52YWx1ZSA9PSAwLCAiU3RhdGUgYWxyZWFkeSBpbXBvcnRlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJtaWdyYXRlZF9mcm9tIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pZ3JhdGVkX2Zyb20gZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gU3RhdGUgYWxyZWFkeSBpbXBvcnRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxMjQKICAgIC8vIHJldGlyZWQsIF9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NChwcmV2aW91cywgYiJyZXRpcmVkX2NyZWRpdHMiKQogICAgZHVwCiAgICBieXRlY18wIC8vIDB4NzI2NTc0Njk3MjY1NjQ1ZjYzNzI2NTY0Njk3NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjEyNQogICAgLy8gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUgKz0gcmV0aXJlZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXRpcmVkX2NyZWRpdHMgZXhpc3RzCiAgICArCiAgICBieXRlY18wIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxMjYKICAgIC8vIHNlbGYubWlncmF0ZWRfZnJvbS52YWx1ZSA9IHByZXZpb3VzLmlkCiAgICBieXRlYyA0IC8vICJtaWdyYXRlZF9mcm9tIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTEwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5SZXRpcmVtZW50TWFuYWdlci5pbml0X2Fzc2V0W3JvdXRpbmddKCkgLT4gdm9pZDoKaW5pdF9hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTI4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjEzNQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gaW5pdCBhc3NldCIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIGluaXQgYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTM2CiAgICAvLyBhc3NlcnQgc2VsZi5jeHRfYXNzZXRfaWQudmFsdWUgPT0gMCwgIkFzc2V0IGFscmVhZHkgaW5pdGlhbGl6ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3h0X2Fzc2V0X2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN4dF9hc3NldF9pZCBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBBc3NldCBhbHJlYWR5IGluaXRpYWxpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjEzNwogICAgLy8gc2VsZi5jeHRfYXNzZXRfaWQudmFsdWUgPSBhc3NldC5pZAogICAgYnl0ZWNfMSAvLyAiY3h0X2Fzc2V0X2lkIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE0My0xNDcKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gYXNzZXRfYW1vdW50PTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxNDMKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludGNfMyAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE0My0xNDcKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxMjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLnJldGlyZV9jcmVkaXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKcmV0aXJlX2NyZWRpdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgcHVzaGludCAyCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMyAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxNzMKICAgIC8vIGFzc2VydCBheGZlcl90eC5hc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiVHJhbnNmZXIgbXVzdCBiZSB0byBjb250cmFjdCIKICAgIGRpZyAyCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBUcmFuc2ZlciBtdXN0IGJlIHRvIGNvbnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE3NAogICAgLy8gYXNzZXJ0IGF4ZmVyX3R4LnhmZXJfYXNzZXQuaWQgPT0gc2VsZi5jeHRfYXNzZXRfaWQudmFsdWUsICJJbmNvcnJlY3QgYXNzZXQgSUQiCiAgICBkaWcgMgogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3h0X2Fzc2V0X2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN4dF9hc3NldF9pZCBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gSW5jb3JyZWN0IGFzc2V0IElECiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE3NQogICAgLy8gYXNzZXJ0IGF4ZmVyX3R4LmFzc2V0X2Ftb3VudCA+IDAsICJBbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybyIKICAgIGRpZyAyCiAgICBndHhucyBBc3NldEFtb3VudAogICAgZHVwCiAgICBhc3NlcnQgLy8gQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTc3LTE3OAogICAgLy8gIyBVcGRhdGUgZ2xvYmFsIHRhbGx5CiAgICAvLyBzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZSArPSBheGZlcl90eC5hc3NldF9hbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV0aXJlZF9jcmVkaXRzIGV4aXN0cwogICAgZGlnIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE4MAogICAgLy8gbWJyX3BheW1lbnQsIGF4ZmVyX3R4LnNlbmRlciwgYXhmZXJfdHguYXNzZXRfYW1vdW50LCBiZW5lZmljaWFyeSwgbWVtbwogICAgdW5jb3ZlciAzCiAgICBndHhucyBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTc5LTE4MQogICAgLy8gc2VxdWVuY2UgPSBzZWxmLl9yZWNvcmRfY2VydGlmaWNhdGUoCiAgICAvLyAgICAgbWJyX3BheW1lbnQsIGF4ZmVyX3R4LnNlbmRlciwgYXhmZXJfdHguYXNzZXRfYW1vdW50LCBiZW5lZmljaWFyeSwgbWVtbwogICAgLy8gKQogICAgdW5jb3ZlciA0CiAgICBkaWcgMQogICAgZGlnIDMKICAgIHVuY292ZXIgNgogICAgdW5jb3ZlciA2CiAgICBjYWxsc3ViIF9yZWNvcmRfY2VydGlmaWNhdGUKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxODUKICAgIC8vIHNlcXVlbmNlPWFyYzQuVUludDY0KHNlcXVlbmNlKSwKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTg2CiAgICAvLyBhbW91bnQ9YXJjNC5VSW50NjQoYXhmZXJfdHguYXNzZXRfYW1vdW50KSwKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxODcKICAgIC8vIHJldGlyZWRfY3JlZGl0cz1hcmM0LlVJbnQ2NChzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJldGlyZWRfY3JlZGl0cyBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MTgzLTE4OAogICAgLy8gQ3JlZGl0c1JldGlyZWQoCiAgICAvLyAgICAgcmV0aXJlZT1hcmM0LkFkZHJlc3MoYXhmZXJfdHguc2VuZGVyKSwKICAgIC8vICAgICBzZXF1ZW5jZT1hcmM0LlVJbnQ2NChzZXF1ZW5jZSksCiAgICAvLyAgICAgYW1vdW50PWFyYzQuVUludDY0KGF4ZmVyX3R4LmFzc2V0X2Ftb3VudCksCiAgICAvLyAgICAgcmV0aXJlZF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlKSwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgZGlnIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxODItMTg5CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgQ3JlZGl0c1JldGlyZWQoCiAgICAvLyAgICAgICAgIHJldGlyZWU9YXJjNC5BZGRyZXNzKGF4ZmVyX3R4LnNlbmRlciksCiAgICAvLyAgICAgICAgIHNlcXVlbmNlPWFyYzQuVUludDY0KHNlcXVlbmNlKSwKICAgIC8vICAgICAgICAgYW1vdW50PWFyYzQuVUludDY0KGF4ZmVyX3R4LmFzc2V0X2Ftb3VudCksCiAgICAvLyAgICAgICAgIHJldGlyZWRfY3JlZGl0cz1hcmM0LlVJbnQ2NChzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZSksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MTk1OTMxOWQgLy8gbWV0aG9kICJDcmVkaXRzUmV0aXJlZChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIucmV0aXJlX2NyZWRpdHNfYmF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgpyZXRpcmVfY3JlZGl0c19iYXRjaDoKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxOTIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMTMKICAgIC8vIGFzc2V0X2lkID0gc2VsZi5jeHRfYXNzZXRfaWQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJjeHRfYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN4dF9hc3NldF9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjE0CiAgICAvLyBhc3NlcnQgYXNzZXRfaWQgIT0gMCwgIkFzc2V0IG5vdCBpbml0aWFsaXplZCIKICAgIGFzc2VydCAvLyBBc3NldCBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjE2CiAgICAvLyB0cmFuc2ZlcnMgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIxNwogICAgLy8gYW1vdW50ID0gVUludDY0KDApCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjE4CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKEdsb2JhbC5ncm91cF9zaXplKToKICAgIGdsb2JhbCBHcm91cFNpemUKICAgIGludGNfMCAvLyAwCgpyZXRpcmVfY3JlZGl0c19iYXRjaF9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIxOAogICAgLy8gZm9yIGluZGV4IGluIHVyYW5nZShHbG9iYWwuZ3JvdXBfc2l6ZSk6CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBieiByZXRpcmVfY3JlZGl0c19iYXRjaF9hZnRlcl9mb3JAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjE5CiAgICAvLyBpZiBpbmRleCA9PSBUeG4uZ3JvdXBfaW5kZXg6CiAgICBkdXAKICAgIHR4biBHcm91cEluZGV4CiAgICA9PQogICAgYm56IHJldGlyZV9jcmVkaXRzX2JhdGNoX2Zvcl9mb290ZXJAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjIyCiAgICAvLyBpZiB0eG4udHlwZSA9PSBUcmFuc2FjdGlvblR5cGUuQXBwbGljYXRpb25DYWxsOgogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgZHVwCiAgICBidXJ5IDEwCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgPT0KICAgIGJ6IHJldGlyZV9jcmVkaXRzX2JhdGNoX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIyMwogICAgLy8gYXNzZXJ0IHR4bi5hcHBfaWQgIT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQsICJPbmx5IG9uZSByZXRpcmVtZW50IGNhbGwgcGVyIGdyb3VwIgogICAgZHVwCiAgICBndHhucyBBcHBsaWNhdGlvbklECiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgICE9CiAgICBhc3NlcnQgLy8gT25seSBvbmUgcmV0aXJlbWVudCBjYWxsIHBlciBncm91cAoKcmV0aXJlX2NyZWRpdHNfYmF0Y2hfZm9yX2Zvb3RlckAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjE4CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKEdsb2JhbC5ncm91cF9zaXplKToKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiByZXRpcmVfY3JlZGl0c19iYXRjaF9mb3JfaGVhZGVyQDIKCnJldGlyZV9jcmVkaXRzX2JhdGNoX2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMjQKICAgIC8vIGVsaWYgdHhuLnR5cGUgPT0gVHJhbnNhY3Rpb25UeXBlLkFzc2V0VHJhbnNmZXI6CiAgICBkaWcgOAogICAgaW50Y18zIC8vIGF4ZmVyCiAgICA9PQogICAgYnogcmV0aXJlX2NyZWRpdHNfYmF0Y2hfZm9yX2Zvb3RlckAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMjUKICAgIC8vIGFzc2VydCB0eG4uYXNzZXRfcmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlRyYW5zZmVyIG11c3QgYmUgdG8gY29udHJhY3QiCiAgICBkdXBuIDIKICAgIGd0eG5zIEFzc2V0UmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFRyYW5zZmVyIG11c3QgYmUgdG8gY29udHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjI2CiAgICAvLyBhc3NlcnQgdHhuLnhmZXJfYXNzZXQuaWQgPT0gYXNzZXRfaWQsICJJbmNvcnJlY3QgYXNzZXQgSUQiCiAgICBkdXAKICAgIGd0eG5zIFhmZXJBc3NldAogICAgZGlnIDYKICAgID09CiAgICBhc3NlcnQgLy8gSW5jb3JyZWN0IGFzc2V0IElECiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIyNwogICAgLy8gYXNzZXJ0IHR4bi5hc3NldF9hbW91bnQgPiAwLCAiQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBndHhucyBBc3NldEFtb3VudAogICAgZHVwCiAgICBhc3NlcnQgLy8gQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjI4CiAgICAvLyB0cmFuc2ZlcnMgKz0gMQogICAgZGlnIDQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjI5CiAgICAvLyBhbW91bnQgKz0gdHhuLmFzc2V0X2Ftb3VudAogICAgZGlnIDMKICAgICsKICAgIGJ1cnkgMwogICAgYiByZXRpcmVfY3JlZGl0c19iYXRjaF9mb3JfZm9vdGVyQDExCgpyZXRpcmVfY3JlZGl0c19iYXRjaF9hZnRlcl9mb3JAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIzMAogICAgLy8gYXNzZXJ0IHRyYW5zZmVycyA+IDAsICJObyB0cmFuc2ZlcnMgdG8gcmV0aXJlIgogICAgZGlnIDMKICAgIGR1cAogICAgYXNzZXJ0IC8vIE5vIHRyYW5zZmVycyB0byByZXRpcmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjMyLTIzMwogICAgLy8gIyBVcGRhdGUgZ2xvYmFsIHRhbGx5IG9uY2UgZm9yIHRoZSB3aG9sZSBiYXRjaAogICAgLy8gc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUgKz0gYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAicmV0aXJlZF9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJldGlyZWRfY3JlZGl0cyBleGlzdHMKICAgIGRpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgICsKICAgIGJ5dGVjXzAgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIzNAogICAgLy8gc2VxdWVuY2UgPSBzZWxmLl9yZWNvcmRfY2VydGlmaWNhdGUobWJyX3BheW1lbnQsIFR4bi5zZW5kZXIsIGFtb3VudCwgYmVuZWZpY2lhcnksIG1lbW8pCiAgICBkaWcgOQogICAgdHhuIFNlbmRlcgogICAgZGlnIDIKICAgIGRpZyAxMQogICAgZGlnIDExCiAgICBjYWxsc3ViIF9yZWNvcmRfY2VydGlmaWNhdGUKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMzcKICAgIC8vIHJldGlyZWU9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMzgKICAgIC8vIHNlcXVlbmNlPWFyYzQuVUludDY0KHNlcXVlbmNlKSwKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjM5CiAgICAvLyB0cmFuc2ZlcnM9YXJjNC5VSW50NjQodHJhbnNmZXJzKSwKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyNDAKICAgIC8vIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI0MQogICAgLy8gcmV0aXJlZF9jcmVkaXRzPWFyYzQuVUludDY0KHNlbGYucmV0aXJlZF9jcmVkaXRzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJyZXRpcmVkX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV0aXJlZF9jcmVkaXRzIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMzYtMjQyCiAgICAvLyBDcmVkaXRzUmV0aXJlZEJhdGNoKAogICAgLy8gICAgIHJldGlyZWU9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIHNlcXVlbmNlPWFyYzQuVUludDY0KHNlcXVlbmNlKSwKICAgIC8vICAgICB0cmFuc2ZlcnM9YXJjNC5VSW50NjQodHJhbnNmZXJzKSwKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICByZXRpcmVkX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgLy8gKQogICAgdW5jb3ZlciA0CiAgICBkaWcgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyMzUtMjQzCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgQ3JlZGl0c1JldGlyZWRCYXRjaCgKICAgIC8vICAgICAgICAgcmV0aXJlZT1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgICAgIHNlcXVlbmNlPWFyYzQuVUludDY0KHNlcXVlbmNlKSwKICAgIC8vICAgICAgICAgdHJhbnNmZXJzPWFyYzQuVUludDY0KHRyYW5zZmVycyksCiAgICAvLyAgICAgICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgICAgICByZXRpcmVkX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGU5MGMwNDg5IC8vIG1ldGhvZCAiQ3JlZGl0c1JldGlyZWRCYXRjaChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToxOTIKICAgIC8vIEBhYmltZXRob2QoKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLmNlcnRpZmljYXRlX21icltyb3V0aW5nXSgpIC0+IHZvaWQ6CmNlcnRpZmljYXRlX21icjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6Mjc2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6Mjc5CiAgICAvLyByZXR1cm4gc2VsZi5fY2VydGlmaWNhdGVfbWJyKHJldGlyZWUpCiAgICBjYWxsc3ViIF9jZXJ0aWZpY2F0ZV9tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6Mjc2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIuZ2V0X2NlcnRpZmljYXRlX2NvdW50W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2NlcnRpZmljYXRlX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyODEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyODQKICAgIC8vIHJldHVybiBzZWxmLmNlcnRpZmljYXRlX2NvdW50cy5nZXQocmV0aXJlZSwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBieXRlYyA1IC8vIDB4NmUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI4MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLmdldF9jZXJ0aWZpY2F0ZXNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfY2VydGlmaWNhdGVzOgogICAgaW50Y18wIC8vIDAKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyODYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzAwCiAgICAvLyBhc3NlcnQgbGltaXQgPD0gTUFYX0NFUlRJRklDQVRFU19QQUdFLCAiVG9vIG1hbnkgY2VydGlmaWNhdGVzIGZvciBvbmUgcGFnZSIKICAgIGR1cAogICAgcHVzaGludCAxMgogICAgPD0KICAgIGFzc2VydCAvLyBUb28gbWFueSBjZXJ0aWZpY2F0ZXMgZm9yIG9uZSBwYWdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMwMQogICAgLy8gY291bnQgPSBzZWxmLmNlcnRpZmljYXRlX2NvdW50cy5nZXQocmV0aXJlZSwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBieXRlYyA1IC8vIDB4NmUKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTozMDIKICAgIC8vIGVuZCA9IHN0YXJ0ICsgbGltaXQKICAgIGNvdmVyIDIKICAgICsKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMwMwogICAgLy8gaWYgZW5kID4gY291bnQ6CiAgICA+CiAgICBieiBnZXRfY2VydGlmaWNhdGVzX2FmdGVyX2lmX2Vsc2VAMwogICAgZGlnIDEKICAgIGJ1cnkgMQoKZ2V0X2NlcnRpZmljYXRlc19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMwNQogICAgLy8gcGFnZSA9IGFyYzQuRHluYW1pY0FycmF5W1JldGlyZW1lbnRDZXJ0aWZpY2F0ZV0oKQogICAgcHVzaGJ5dGVzIDB4MDAwMAogICAgYnVyeSA2CiAgICBkaWcgMgogICAgYnVyeSA1CgpnZXRfY2VydGlmaWNhdGVzX2Zvcl9oZWFkZXJANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzA2CiAgICAvLyBmb3Igc2VxdWVuY2UgaW4gdXJhbmdlKHN0YXJ0LCBlbmQpOgogICAgZGlnIDQKICAgIGRpZyAxCiAgICA8CiAgICBieiBnZXRfY2VydGlmaWNhdGVzX2FmdGVyX2ZvckA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMwNwogICAgLy8ga2V5ID0gQ2VydGlmaWNhdGVLZXkocmV0aXJlZT1hcmM0LkFkZHJlc3MocmV0aXJlZSksIHNlcXVlbmNlPWFyYzQuVUludDY0KHNlcXVlbmNlKSkKICAgIGRpZyA0CiAgICBkdXAKICAgIGl0b2IKICAgIGRpZyA1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzA4CiAgICAvLyBwYWdlLmFwcGVuZChzZWxmLmNlcnRpZmljYXRlc1trZXldLmNvcHkoKSkKICAgIHB1c2hieXRlcyAweDcyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNlcnRpZmljYXRlcyBlbnRyeSBleGlzdHMKICAgIGRpZyA3CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0IC8vIG9uIGVycm9yOiBtYXggYXJyYXkgbGVuZ3RoIGV4Y2VlZGVkCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcmVwbGFjZTIgMAogICAgYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMwNgogICAgLy8gZm9yIHNlcXVlbmNlIGluIHVyYW5nZShzdGFydCwgZW5kKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDUKICAgIGIgZ2V0X2NlcnRpZmljYXRlc19mb3JfaGVhZGVyQDQKCmdldF9jZXJ0aWZpY2F0ZXNfYWZ0ZXJfZm9yQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI4NgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBkaWcgNgogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5SZXRpcmVtZW50TWFuYWdlci5nZXRfcmV0aXJlbWVudF9zdGF0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yZXRpcmVtZW50X3N0YXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weTozMTQKICAgIC8vIHJldHVybiBzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXRpcmVkX2NyZWRpdHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMxMQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0LlJldGlyZW1lbnRNYW5hZ2VyLmdldF9zdGF0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9zdGF0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzIwCiAgICAvLyBhc3NldF9pZD1hcmM0LlVJbnQ2NChzZWxmLmN4dF9hc3NldF9pZC52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3h0X2Fzc2V0X2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN4dF9hc3NldF9pZCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzIxCiAgICAvLyByZXRpcmVkX2NyZWRpdHM9YXJjNC5VSW50NjQoc2VsZi5yZXRpcmVkX2NyZWRpdHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInJldGlyZWRfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXRpcmVkX2NyZWRpdHMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMxOS0zMjIKICAgIC8vIHJldHVybiBSZXRpcmVtZW50U3RhdHMoCiAgICAvLyAgICAgYXNzZXRfaWQ9YXJjNC5VSW50NjQoc2VsZi5jeHRfYXNzZXRfaWQudmFsdWUpLAogICAgLy8gICAgIHJldGlyZWRfY3JlZGl0cz1hcmM0LlVJbnQ2NChzZWxmLnJldGlyZWRfY3JlZGl0cy52YWx1ZSksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MzE2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIuX2NlcnRpZmljYXRlX21icihyZXRpcmVlOiBieXRlcykgLT4gdWludDY0OgpfY2VydGlmaWNhdGVfbWJyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyNDYtMjQ3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9jZXJ0aWZpY2F0ZV9tYnIoc2VsZiwgcmV0aXJlZTogQWNjb3VudCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI0OC0yNDkKICAgIC8vICMgVGhlIGNvdW50IGJveCBpcyBvbmx5IGNyZWF0ZWQgYnkgdGhlIHJldGlyZWUncyBmaXJzdCBjZXJ0aWZpY2F0ZS4KICAgIC8vIGlmIHJldGlyZWUgaW4gc2VsZi5jZXJ0aWZpY2F0ZV9jb3VudHM6CiAgICBieXRlYyA1IC8vIDB4NmUKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IF9jZXJ0aWZpY2F0ZV9tYnJfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI1MAogICAgLy8gcmV0dXJuIFVJbnQ2NChDRVJUSUZJQ0FURV9NQlIpCiAgICBwdXNoaW50IDUwOTAwCiAgICByZXRzdWIKCl9jZXJ0aWZpY2F0ZV9tYnJfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyNTEKICAgIC8vIHJldHVybiBVSW50NjQoQ0VSVElGSUNBVEVfTUJSICsgQ0VSVElGSUNBVEVfQ09VTlRfTUJSKQogICAgcHVzaGludCA2OTgwMAogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuUmV0aXJlbWVudE1hbmFnZXIuX3JlY29yZF9jZXJ0aWZpY2F0ZShtYnJfcGF5bWVudDogdWludDY0LCByZXRpcmVlOiBieXRlcywgYW1vdW50OiB1aW50NjQsIGJlbmVmaWNpYXJ5OiBieXRlcywgbWVtbzogYnl0ZXMpIC0+IHVpbnQ2NCwgYnl0ZXM6Cl9yZWNvcmRfY2VydGlmaWNhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI1My0yNjEKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3JlY29yZF9jZXJ0aWZpY2F0ZSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIG1icl9wYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICAgICByZXRpcmVlOiBBY2NvdW50LAogICAgLy8gICAgIGFtb3VudDogVUludDY0LAogICAgLy8gICAgIGJlbmVmaWNpYXJ5OiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgbWVtbzogTWVtbywKICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gNSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI2MwogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJQYXltZW50IG11c3QgYmUgdG8gY29udHJhY3QiCiAgICBmcmFtZV9kaWcgLTUKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBQYXltZW50IG11c3QgYmUgdG8gY29udHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjY0CiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQuYW1vdW50ID49IHNlbGYuX2NlcnRpZmljYXRlX21icihyZXRpcmVlKSwgIkluc3VmZmljaWVudCBNQlIgcGF5bWVudCIKICAgIGZyYW1lX2RpZyAtNQogICAgZ3R4bnMgQW1vdW50CiAgICBmcmFtZV9kaWcgLTQKICAgIGNhbGxzdWIgX2NlcnRpZmljYXRlX21icgogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgTUJSIHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjY1CiAgICAvLyBzZXF1ZW5jZSA9IHNlbGYuY2VydGlmaWNhdGVfY291bnRzLmdldChyZXRpcmVlLCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGJ5dGVjIDUgLy8gMHg2ZQogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI2NgogICAgLy8ga2V5ID0gQ2VydGlmaWNhdGVLZXkocmV0aXJlZT1hcmM0LkFkZHJlc3MocmV0aXJlZSksIHNlcXVlbmNlPWFyYzQuVUludDY0KHNlcXVlbmNlKSkKICAgIGR1cAogICAgaXRvYgogICAgZnJhbWVfZGlnIC00CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjY4CiAgICAvLyBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyNjkKICAgIC8vIHJvdW5kPWFyYzQuVUludDY0KEdsb2JhbC5yb3VuZCksCiAgICBnbG9iYWwgUm91bmQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjY3LTI3MgogICAgLy8gc2VsZi5jZXJ0aWZpY2F0ZXNba2V5XSA9IFJldGlyZW1lbnRDZXJ0aWZpY2F0ZSgKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICByb3VuZD1hcmM0LlVJbnQ2NChHbG9iYWwucm91bmQpLAogICAgLy8gICAgIGJlbmVmaWNpYXJ5PWJlbmVmaWNpYXJ5LAogICAgLy8gICAgIG1lbW89bWVtby5jb3B5KCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyNjcKICAgIC8vIHNlbGYuY2VydGlmaWNhdGVzW2tleV0gPSBSZXRpcmVtZW50Q2VydGlmaWNhdGUoCiAgICBwdXNoYnl0ZXMgMHg3MgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXRpcmVtZW50X21hbmFnZXIvY29udHJhY3QucHk6MjY3LTI3MgogICAgLy8gc2VsZi5jZXJ0aWZpY2F0ZXNba2V5XSA9IFJldGlyZW1lbnRDZXJ0aWZpY2F0ZSgKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICByb3VuZD1hcmM0LlVJbnQ2NChHbG9iYWwucm91bmQpLAogICAgLy8gICAgIGJlbmVmaWNpYXJ5PWJlbmVmaWNpYXJ5LAogICAgLy8gICAgIG1lbW89bWVtby5jb3B5KCksCiAgICAvLyApCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmV0aXJlbWVudF9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI3MwogICAgLy8gc2VsZi5jZXJ0aWZpY2F0ZV9jb3VudHNbcmV0aXJlZV0gPSBzZXF1ZW5jZSArIDEKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JldGlyZW1lbnRfbWFuYWdlci9jb250cmFjdC5weToyNzQKICAgIC8vIHJldHVybiBzZXF1ZW5jZQogICAgZnJhbWVfZGlnIC0xCiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [432, 603], "errorMessage": "Amount must be greater than zero"}, {"pc": [348], "errorMessage": "Asset already initialized"}, {"pc": [531], "errorMessage": "Asset not initialized"}, {"pc": [301], "errorMessage": "Cannot import from itself"}, {"pc": [426, 599], "errorMessage": "Incorrect asset ID"}, {"pc": [946], "errorMessage": "Insufficient MBR payment"}, {"pc": [621], "errorMessage": "No transfers to retire"}, {"pc": [288], "errorMessage": "Only creator can import state"}, {"pc": [342], "errorMessage": "Only creator can init asset"}, {"pc": [245], "errorMessage": "Only creator can migrate"}, {"pc": [237], "errorMessage": "Only creator can update"}, {"pc": [569], "errorMessage": "Only one retirement call per group"}, {"pc": [935], "errorMessage": "Payment must be to contract"}, {"pc": [296], "errorMessage": "Previous app has another creator"}, {"pc": [308], "errorMessage": "State already imported"}, {"pc": [252], "errorMessage": "State is newer than this program"}, {"pc": [776], "errorMessage": "Too many certificates for one page"}, {"pc": [416, 592], "errorMessage": "Transfer must be to contract"}, {"pc": [292], "errorMessage": "application exists"}, {"pc": [839], "errorMessage": "check self.certificates entry exists"}, {"pc": [346, 424, 530, 887], "errorMessage": "check self.cxt_asset_id exists"}, {"pc": [306], "errorMessage": "check self.migrated_from exists"}, {"pc": [316, 436, 468, 625, 662, 876, 892], "errorMessage": "check self.retired_credits exists"}, {"pc": [249], "errorMessage": "check self.schema_version exists"}, {"pc": [400, 408, 514, 522, 699, 717, 748], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [281, 335, 757, 770], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [845], "errorMessage": "max array length exceeded"}, {"pc": [392], "errorMessage": "transaction type is axfer"}, {"pc": [382, 506], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +66,36 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class CertificateKey:
+    """Struct for CertificateKey"""
+    retiree: str
+    sequence: int
+
+@dataclasses.dataclass(frozen=True)
+class RetirementCertificate:
+    """Struct for RetirementCertificate"""
+    amount: int
+    round: int
+    beneficiary: str
+    memo: bytes
+
+@dataclasses.dataclass(frozen=True)
+class RetirementStats:
+    """Struct for RetirementStats"""
+    asset_id: int
+    retired_credits: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ImportStateArgs:
+    """Dataclass for import_state arguments"""
+    previous: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "import_state(uint64)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class InitAssetArgs:
     """Dataclass for init_asset arguments"""
@@ -76,17 +108,106 @@ class InitAssetArgs:
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class RetireCreditsArgs:
     """Dataclass for retire_credits arguments"""
+    mbr_payment: algokit_utils.AppMethodCallTransactionArgument
     axfer_tx: algokit_utils.AppMethodCallTransactionArgument
+    beneficiary: str
+    memo: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "retire_credits(pay,axfer,address,byte[32])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RetireCreditsBatchArgs:
+    """Dataclass for retire_credits_batch arguments"""
+    mbr_payment: algokit_utils.AppMethodCallTransactionArgument
+    beneficiary: str
+    memo: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "retire_credits_batch(pay,address,byte[32])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CertificateMbrArgs:
+    """Dataclass for certificate_mbr arguments"""
+    retiree: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "certificate_mbr(address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetCertificateCountArgs:
+    """Dataclass for get_certificate_count arguments"""
+    retiree: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_certificate_count(address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetCertificatesArgs:
+    """Dataclass for get_certificates arguments"""
+    retiree: str
+    start: int
+    limit: int
 
     @property
     def abi_method_signature(self) -> str:
-        return "retire_credits(axfer)void"
+        return "get_certificates(address,uint64,uint64)(uint64,uint64,address,byte[32])[]"
+
+
+class _RetirementManagerUpdate:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppUpdateMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        return self.app_client.params.update(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update()void",
+        }))
 
 
 class RetirementManagerParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def update(self) -> "_RetirementManagerUpdate":
+        return _RetirementManagerUpdate(self.app_client)
+
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate()uint64",
+        }))
+
+    def import_state(
+        self,
+        args: tuple[int] | ImportStateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_state(uint64)void",
+            "args": method_args,
+        }))
+
     def init_asset(
         self,
         args: tuple[int] | InitAssetArgs,
@@ -102,14 +223,66 @@ class RetirementManagerParams:
 
     def retire_credits(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | RetireCreditsArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | RetireCreditsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "retire_credits(axfer)void",
+            "method": "retire_credits(pay,axfer,address,byte[32])uint64",
+            "args": method_args,
+        }))
+
+    def retire_credits_batch(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | RetireCreditsBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "retire_credits_batch(pay,address,byte[32])uint64",
+            "args": method_args,
+        }))
+
+    def certificate_mbr(
+        self,
+        args: tuple[str] | CertificateMbrArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "certificate_mbr(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_certificate_count(
+        self,
+        args: tuple[str] | GetCertificateCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_certificate_count(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_certificates(
+        self,
+        args: tuple[str, int, int] | GetCertificatesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_certificates(address,uint64,uint64)(uint64,uint64,address,byte[32])[]",
             "args": method_args,
         }))
 
@@ -124,6 +297,17 @@ class RetirementManagerParams:
             "method": "get_retirement_stats()uint64",
         }))
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64)",
+        }))
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -146,10 +330,56 @@ class RetirementManagerParams:
         )
 
 
+class _RetirementManagerUpdateTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        return self.app_client.create_transaction.update(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update()void",
+        }))
+
+
 class RetirementManagerCreateTransactionParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def update(self) -> "_RetirementManagerUpdateTransaction":
+        return _RetirementManagerUpdateTransaction(self.app_client)
+
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate()uint64",
+        }))
+
+    def import_state(
+        self,
+        args: tuple[int] | ImportStateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_state(uint64)void",
+            "args": method_args,
+        }))
+
     def init_asset(
         self,
         args: tuple[int] | InitAssetArgs,
@@ -165,14 +395,66 @@ class RetirementManagerCreateTransactionParams:
 
     def retire_credits(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | RetireCreditsArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | RetireCreditsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "retire_credits(pay,axfer,address,byte[32])uint64",
+            "args": method_args,
+        }))
+
+    def retire_credits_batch(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | RetireCreditsBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "retire_credits_batch(pay,address,byte[32])uint64",
+            "args": method_args,
+        }))
+
+    def certificate_mbr(
+        self,
+        args: tuple[str] | CertificateMbrArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "retire_credits(axfer)void",
+            "method": "certificate_mbr(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_certificate_count(
+        self,
+        args: tuple[str] | GetCertificateCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_certificate_count(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_certificates(
+        self,
+        args: tuple[str, int, int] | GetCertificatesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_certificates(address,uint64,uint64)(uint64,uint64,address,byte[32])[]",
             "args": method_args,
         }))
 
@@ -187,6 +469,17 @@ class RetirementManagerCreateTransactionParams:
             "method": "get_retirement_stats()uint64",
         }))
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64)",
+        }))
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -209,10 +502,65 @@ class RetirementManagerCreateTransactionParams:
         )
 
 
+class _RetirementManagerUpdateSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        response = self.app_client.send.update(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update()void",
+        }), send_params=send_params, compilation_params=compilation_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppUpdateTransactionResult[None], parsed_response)
+
+
 class RetirementManagerSend:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def update(self) -> "_RetirementManagerUpdateSend":
+        return _RetirementManagerUpdateSend(self.app_client)
+
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def import_state(
+        self,
+        args: tuple[int] | ImportStateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_state(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def init_asset(
         self,
         args: tuple[int] | InitAssetArgs,
@@ -231,19 +579,83 @@ class RetirementManagerSend:
 
     def retire_credits(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | RetireCreditsArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | RetireCreditsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
+    ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "retire_credits(axfer)void",
+            "method": "retire_credits(pay,axfer,address,byte[32])uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def retire_credits_batch(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | RetireCreditsBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "retire_credits_batch(pay,address,byte[32])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def certificate_mbr(
+        self,
+        args: tuple[str] | CertificateMbrArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "certificate_mbr(address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_certificate_count(
+        self,
+        args: tuple[str] | GetCertificateCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_certificate_count(address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_certificates(
+        self,
+        args: tuple[str, int, int] | GetCertificatesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, int, str, bytes]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_certificates(address,uint64,uint64)(uint64,uint64,address,byte[32])[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[int, int, str, bytes]]], parsed_response)
 
     def get_retirement_stats(
         self,
@@ -259,6 +671,20 @@ class RetirementManagerSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[RetirementStats]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_stats()(uint64,uint64)",
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(RetirementStats, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[RetirementStats], parsed_response)
+
     def create(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -288,6 +714,8 @@ class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     retired_credits: int
     cxt_asset_id: int
+    schema_version: int
+    migrated_from: int
 
 class RetirementManagerState:
     """Methods to access state for the current RetirementManager app"""
@@ -302,6 +730,13 @@ class RetirementManagerState:
             """Methods to access global_state for the current app"""
             return _GlobalState(self.app_client)
 
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
 class _GlobalState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -341,6 +776,100 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def schema_version(self) -> int:
+        """Get the current value of the schema_version key in global_state state"""
+        value = self.app_client.state.global_state.get_value("schema_version")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def migrated_from(self) -> int:
+        """Get the current value of the migrated_from key in global_state state"""
+        value = self.app_client.state.global_state.get_value("migrated_from")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "RetirementCertificate": RetirementCertificate
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def certificate_counts(self) -> "_MapState[str, int]":
+        """Get values from the certificate_counts map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "certificate_counts",
+            None
+        )
+
+    @property
+    def certificates(self) -> "_MapState[CertificateKey, RetirementCertificate]":
+        """Get values from the certificates map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "certificates",
+            self._struct_classes.get("RetirementCertificate")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
 class RetirementManagerClient:
     """Client for interacting with RetirementManager smart contract"""
 
@@ -487,28 +1016,76 @@ class RetirementManagerClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["init_asset(uint64)void"],
+        method: typing.Literal["migrate()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["import_state(uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["retire_credits(axfer)void"],
+        method: typing.Literal["init_asset(uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["retire_credits(pay,axfer,address,byte[32])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["retire_credits_batch(pay,address,byte[32])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["certificate_mbr(address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_certificate_count(address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_certificates(address,uint64,uint64)(uint64,uint64,address,byte[32])[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[int, int, str, bytes]] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_retirement_stats()uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_stats()(uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> RetirementStats | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["create()void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["update()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -519,7 +1096,7 @@ class RetirementManagerClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | RetirementStats | int | list[tuple[int, int, str, bytes]]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -559,7 +1136,28 @@ class RetirementManagerMethodCallCreateParams(
             }
         )
 
-class RetirementManagerFactory(algokit_utils.TypedAppFactoryProtocol[RetirementManagerMethodCallCreateParams, None, None]):
+@dataclasses.dataclass(frozen=True)
+class RetirementManagerMethodCallUpdateParams(
+    algokit_utils.BaseAppClientMethodCallParams[
+        typing.Any,
+        str | None,
+    ]
+):
+    """Parameters for calling RetirementManager contract using ABI"""
+    on_complete: typing.Literal[OnComplete.UpdateApplicationOC] | None = None
+    method: str | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientMethodCallParams:
+        method_args = _parse_abi_args(self.args)
+        return algokit_utils.AppClientMethodCallParams(
+            **{
+                **self.__dict__,
+                "method": self.method or getattr(self.args, "abi_method_signature", None),
+                "args": method_args,
+            }
+        )
+
+class RetirementManagerFactory(algokit_utils.TypedAppFactoryProtocol[RetirementManagerMethodCallCreateParams, RetirementManagerMethodCallUpdateParams, None]):
     """Factory for deploying and managing RetirementManagerClient smart contracts"""
 
     def __init__(
@@ -605,7 +1203,7 @@ class RetirementManagerFactory(algokit_utils.TypedAppFactoryProtocol[RetirementM
         on_update: algokit_utils.OnUpdate | None = None,
         on_schema_break: algokit_utils.OnSchemaBreak | None = None,
         create_params: RetirementManagerMethodCallCreateParams | None = None,
-        update_params: None = None,
+        update_params: RetirementManagerMethodCallUpdateParams | None = None,
         delete_params: None = None,
         existing_deployments: algokit_utils.ApplicationLookup | None = None,
         ignore_cache: bool = False,
@@ -618,7 +1216,7 @@ class RetirementManagerFactory(algokit_utils.TypedAppFactoryProtocol[RetirementM
             on_update=on_update,
             on_schema_break=on_schema_break,
             create_params=create_params.to_algokit_utils_params() if create_params else None,
-            update_params=update_params,
+            update_params=update_params.to_algokit_utils_params() if update_params else None,
             delete_params=delete_params,
             existing_deployments=existing_deployments,
             ignore_cache=ignore_cache,
@@ -691,17 +1289,56 @@ class RetirementManagerFactoryCreateParams:
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
-    def bare(
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def migrate(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the migrate()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "migrate()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def import_state(
         self,
+        args: tuple[int] | ImportStateArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
-    ) -> algokit_utils.AppCreateParams:
-        """Creates an instance using a bare call"""
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the import_state(uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-            compilation_params=compilation_params)
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "import_state(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
     def init_asset(
         self,
@@ -725,18 +1362,98 @@ class RetirementManagerFactoryCreateParams:
 
     def retire_credits(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | RetireCreditsArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | RetireCreditsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the retire_credits(pay,axfer,address,byte[32])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "retire_credits(pay,axfer,address,byte[32])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def retire_credits_batch(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | RetireCreditsBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the retire_credits_batch(pay,address,byte[32])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "retire_credits_batch(pay,address,byte[32])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def certificate_mbr(
+        self,
+        args: tuple[str] | CertificateMbrArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the certificate_mbr(address)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "certificate_mbr(address)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_certificate_count(
+        self,
+        args: tuple[str] | GetCertificateCountArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_certificate_count(address)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_certificate_count(address)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_certificates(
+        self,
+        args: tuple[str, int, int] | GetCertificatesArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the retire_credits(axfer)void ABI method"""
+        """Creates a new instance using the get_certificates(address,uint64,uint64)(uint64,uint64,address,byte[32])[] ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "retire_credits(axfer)void",
+                "method": "get_certificates(address,uint64,uint64)(uint64,uint64,address,byte[32])[]",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -762,6 +1479,25 @@ class RetirementManagerFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_stats(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_stats()(uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_stats()(uint64,uint64)",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def create(
         self,
         *,
@@ -781,6 +1517,25 @@ class RetirementManagerFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def update(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the update()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "update()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
 class RetirementManagerFactoryUpdateParams:
     """Parameters for 'update' operations of RetirementManager contract"""
 
@@ -911,6 +1666,29 @@ class RetirementManagerFactorySendCreate:
             )
 
 
+class _RetirementManagerUpdateComposer:
+    def __init__(self, composer: "RetirementManagerComposer"):
+        self.composer = composer
+    def update(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "RetirementManagerComposer":
+        self.composer._composer.add_app_update_method_call(
+            self.composer.client.params.update.update(
+                
+                params=params,
+                compilation_params=compilation_params
+            )
+        )
+        self.composer._result_mappers.append(
+            lambda v: self.composer.client.decode_return_value(
+                "update()void", v
+            )
+        )
+        return self.composer
+
+
 class RetirementManagerComposer:
     """Composer for creating transaction groups for RetirementManager contract calls"""
 
@@ -919,10 +1697,52 @@ class RetirementManagerComposer:
         self._composer = client.algorand.new_group()
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
 
+    @property
+    def update(self) -> "_RetirementManagerUpdateComposer":
+        return _RetirementManagerUpdateComposer(self)
+
+    def migrate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "RetirementManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.migrate(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "migrate()uint64", v
+            )
+        )
+        return self
+
+    def import_state(
+        self,
+        args: tuple[int] | ImportStateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "RetirementManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.import_state(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "import_state(uint64)void", v
+            )
+        )
+        return self
+
     def init_asset(
         self,
         args: tuple[int] | InitAssetArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "RetirementManagerComposer":
         self._composer.add_app_call_method_call(
             self.client.params.init_asset(
@@ -939,8 +1759,9 @@ class RetirementManagerComposer:
 
     def retire_credits(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | RetireCreditsArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | RetireCreditsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "RetirementManagerComposer":
         self._composer.add_app_call_method_call(
             self.client.params.retire_credits(
@@ -950,14 +1771,91 @@ class RetirementManagerComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "retire_credits(axfer)void", v
+                "retire_credits(pay,axfer,address,byte[32])uint64", v
+            )
+        )
+        return self
+
+    def retire_credits_batch(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | RetireCreditsBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "RetirementManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.retire_credits_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "retire_credits_batch(pay,address,byte[32])uint64", v
+            )
+        )
+        return self
+
+    def certificate_mbr(
+        self,
+        args: tuple[str] | CertificateMbrArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "RetirementManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.certificate_mbr(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "certificate_mbr(address)uint64", v
+            )
+        )
+        return self
+
+    def get_certificate_count(
+        self,
+        args: tuple[str] | GetCertificateCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "RetirementManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_certificate_count(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_certificate_count(address)uint64", v
+            )
+        )
+        return self
+
+    def get_certificates(
+        self,
+        args: tuple[str, int, int] | GetCertificatesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "RetirementManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_certificates(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_certificates(address,uint64,uint64)(uint64,uint64,address,byte[32])[]", v
             )
         )
         return self
 
     def get_retirement_stats(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "RetirementManagerComposer":
         self._composer.add_app_call_method_call(
             self.client.params.get_retirement_stats(
@@ -972,9 +1870,28 @@ class RetirementManagerComposer:
         )
         return self
 
+    def get_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "RetirementManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_stats(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_stats()(uint64,uint64)", v
+            )
+        )
+        return self
+
     def create(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "RetirementManagerComposer":
         self._composer.add_app_call_method_call(
             self.client.params.create(
@@ -1,6 +1,33 @@
-from algopy import ARC4Contract, Account, Asset, GlobalState, LocalState, Txn, Global, UInt64, gtxn, itxn
+from algopy import ARC4Contract, Account, Application, Asset, GlobalState, LocalState, Txn, Global, UInt64, arc4, gtxn, itxn, op
 from algopy.arc4 import abimethod, baremethod
 
+# Bump when a change needs `migrate` to convert the state of an updated app.
+SCHEMA_VERSION = 1
+
+
+class MarketplaceStats(arc4.Struct, kw_only=True):
+    """Every counter of the marketplace, as returned by `get_stats`."""
+
+    asset_id: arc4.UInt64
+    total_credits: arc4.UInt64
+    retired_credits: arc4.UInt64
+
+
+class CreditsBought(arc4.Struct, kw_only=True):
+    """ARC-28 event of `buy_credits`: $CXT sent to a buyer for an ALGO payment."""
+
+    buyer: arc4.Address
+    amount: arc4.UInt64
+    paid: arc4.UInt64
+    total_credits: arc4.UInt64
+
+
+class CreditsDeposited(arc4.Struct, kw_only=True):
+    """ARC-28 event of `mint_credits`: $CXT deposited into the marketplace."""
+
+    depositor: arc4.Address
+    amount: arc4.UInt64
+
 
 class CarbonMarketplace(ARC4Contract):
     """Marketplace for distributing $CXT carbon credits via real tokens.
@@ -9,12 +36,16 @@ class CarbonMarketplace(ARC4Contract):
         total_credits    – total credits distributed (informative)
         retired_credits  – cumulative credits permanently retired
         cxt_asset_id    – the Asset ID of the $CXT token
+        schema_version  – version of the state layout, see `migrate`
+        migrated_from   – the app whose counters were imported, if any
     """
 
     def __init__(self) -> None:
         self.total_credits = GlobalState(UInt64(0), key="total_credits")
         self.retired_credits = GlobalState(UInt64(0), key="retired_credits")
         self.cxt_asset_id = GlobalState(UInt64(0), key="cxt_asset_id")
+        self.schema_version = GlobalState(UInt64(0), key="schema_version")
+        self.migrated_from = GlobalState(UInt64(0), key="migrated_from")
 
     @abimethod(create="require")
     def create(self) -> None:
@@ -22,6 +53,48 @@ class CarbonMarketplace(ARC4Contract):
         self.total_credits.value = UInt64(0)
         self.retired_credits.value = UInt64(0)
         self.cxt_asset_id.value = UInt64(0)
+        self.schema_version.value = UInt64(SCHEMA_VERSION)
+        self.migrated_from.value = UInt64(0)
+
+    @abimethod(allow_actions=["UpdateApplication"])
+    def update(self) -> None:
+        """Replace the program in place, keeping the app ID and state. Creator only."""
+        assert Txn.sender == Global.creator_address, "Only creator can update"
+
+    @abimethod()
+    def migrate(self) -> UInt64:
+        """Convert the state of an updated app to the current layout. Creator only.
+
+        Returns:
+            The schema version the state is now at.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can migrate"
+        assert self.schema_version.value <= SCHEMA_VERSION, "State is newer than this program"
+        # Conversions go here, one `if self.schema_version.value < N:` block per version.
+        self.schema_version.value = UInt64(SCHEMA_VERSION)
+        return self.schema_version.value
+
+    @abimethod()
+    def import_state(self, previous: Application) -> None:
+        """Copy the counters of a marketplace this app replaces. Creator only.
+
+        Only allowed once, before any credits were distributed, and from an app of the
+        same creator. The $CXT held by the previous app is not moved.
+
+        Args:
+            previous: The marketplace app to import from.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can import state"
+        assert previous.creator == Global.creator_address, "Previous app has another creator"
+        assert previous.id != Global.current_application_id.id, "Cannot import from itself"
+        assert self.migrated_from.value == 0, "State already imported"
+        assert self.total_credits.value == 0, "Credits already distributed"
+
+        total, _exists = op.AppGlobal.get_ex_uint64(previous, b"total_credits")
+        retired, _exists = op.AppGlobal.get_ex_uint64(previous, b"retired_credits")
+        self.total_credits.value = total
+        self.retired_credits.value += retired
+        self.migrated_from.value = previous.id
 
     @abimethod()
     def init_asset(self, asset: Asset) -> None:
@@ -71,6 +144,14 @@ class CarbonMarketplace(ARC4Contract):
         ).submit()
         
         self.total_credits.value += amount
+        arc4.emit(
+            CreditsBought(
+                buyer=arc4.Address(Txn.sender),
+                amount=arc4.UInt64(amount),
+                paid=arc4.UInt64(buyer_tx.amount),
+                total_credits=arc4.UInt64(self.total_credits.value),
+            )
+        )
 
     @abimethod()
     def mint_credits(self, axfer_tx: gtxn.AssetTransferTransaction) -> None:
@@ -84,7 +165,12 @@ class CarbonMarketplace(ARC4Contract):
         assert axfer_tx.xfer_asset.id == self.cxt_asset_id.value, "Incorrect asset ID"
         
         # Informative update, the actual balance is on the ASA
-        pass
+        arc4.emit(
+            CreditsDeposited(
+                depositor=arc4.Address(axfer_tx.sender),
+                amount=arc4.UInt64(axfer_tx.asset_amount),
+            )
+        )
 
     @abimethod(readonly=True)
     def get_asset_id(self) -> UInt64:
@@ -100,3 +186,12 @@ class CarbonMarketplace(ARC4Contract):
     def get_retired_credits(self) -> UInt64:
         """Return the cumulative retired credits."""
         return self.retired_credits.value
+
+    @abimethod(readonly=True)
+    def get_stats(self) -> MarketplaceStats:
+        """Return the $CXT Asset ID, total distributed and retired credits in one call."""
+        return MarketplaceStats(
+            asset_id=arc4.UInt64(self.cxt_asset_id.value),
+            total_credits=arc4.UInt64(self.total_credits.value),
+            retired_credits=arc4.UInt64(self.retired_credits.value),
+        )
@@ -1,65 +1,65 @@
 import logging
 import os
+from pathlib import Path
+
 import algokit_utils
 
+from smart_contracts._helpers import trace
+from smart_contracts._helpers.deploy import fund_and_init_asset, update_policy
+from smart_contracts._helpers.deploy_manifest import deploy_app
+from smart_contracts._helpers.migration import import_app_state, migrate_app
+
 logger = logging.getLogger(__name__)
 
+artifact_dir = Path(__file__).parent.parent / "artifacts" / Path(__file__).parent.name
+
 
-def deploy() -> None:
+def deploy(
+    algorand: algokit_utils.AlgorandClient | None = None,
+    deployer: algokit_utils.SigningAccount | None = None,
+    cxt_asset_id: int | None = None,
+    mode: str = "update",
+) -> int:
     from smart_contracts.artifacts.carbon_marketplace.carbon_marketplace_client import (
         CarbonMarketplaceFactory,
         CarbonMarketplaceMethodCallCreateParams,
+        CarbonMarketplaceMethodCallUpdateParams,
     )
 
-    algorand = algokit_utils.AlgorandClient.from_environment()
-    deployer_ = algorand.account.from_environment("DEPLOYER")
+    # A shared client and deployer are passed in when several contracts deploy together
+    algorand = algorand or algokit_utils.AlgorandClient.from_environment()
+    deployer_ = deployer or algorand.account.from_environment("DEPLOYER")
 
     factory = algorand.client.get_typed_app_factory(
         CarbonMarketplaceFactory, default_sender=deployer_.address
     )
 
-    app_client, result = factory.deploy(
-        on_update=algokit_utils.OnUpdate.AppendApp,
-        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
-        create_params=CarbonMarketplaceMethodCallCreateParams(method="create()void"),
-    )
+    with trace.span("factory deploy", "deploy", contract=factory.app_name):
+        deployed = deploy_app(
+            algorand,
+            factory,
+            deployer_.address,
+            artifact_dir,
+            **update_policy(mode),
+            create_params=CarbonMarketplaceMethodCallCreateParams(method="create()void"),
+            update_params=CarbonMarketplaceMethodCallUpdateParams(method="update()void"),
+        )
+    app_client = deployed.client
 
-    # Always ensure the contract has enough ALGO for MBR (at least 0.5 ALGO)
-    try:
-        app_info = algorand.account.get_information(app_client.app_address)
-        if app_info.amount < 500_000:
-            logger.info(f"Funding {app_client.app_name} with 1 ALGO for MBR")
-            algorand.send.payment(
-                algokit_utils.PaymentParams(
-                    amount=algokit_utils.AlgoAmount(algo=1),
-                    sender=deployer_.address,
-                    receiver=app_client.app_address,
-                )
-            )
-    except Exception as e:
-        logger.warning(f"Could not verify/fund contract: {e}")
+    # Convert the state of an updated app, or copy the counters of the app it replaced
+    migrate_app(algorand, deployed)
+    import_app_state(algorand, deployed)
 
-    # Initialize with $CXT ASA if provided
-    cxt_asset_id = int(os.getenv("CXT_ASSET_ID", 0))
-    if cxt_asset_id != 0:
-        try:
-            current_asset_id = app_client.state.global_state.cxt_asset_id
-            
-            if current_asset_id == 0:
-                logger.info(f"Initializing {app_client.app_name} with $CXT ASA {cxt_asset_id}")
-                app_client.send.init_asset(
-                    args=(cxt_asset_id,),
-                    params=algokit_utils.CommonAppCallParams(
-                        asset_references=[cxt_asset_id],
-                        extra_fee=algokit_utils.AlgoAmount(micro_algo=1000)
-                    )
-                )
-                logger.info(f"Successfully initialized {app_client.app_name} with ASA {cxt_asset_id}")
-            else:
-                logger.info(f"{app_client.app_name} already initialized with ASA {current_asset_id}")
-        except Exception as e:
-            logger.warning(f"Could not initialize asset: {e}")
+    # Fund the app's minimum balance and initialize it with the $CXT ASA,
+    # if provided, in one atomic group. The ASA is passed in from the deployment
+    # graph; CXT_ASSET_ID is only read when this is called on its own.
+    if cxt_asset_id is None:
+        cxt_asset_id = int(os.getenv("CXT_ASSET_ID", 0))
+    fund_and_init_asset(
+        algorand, app_client, deployer_.address, deployed.created, artifact_dir, cxt_asset_id
+    )
 
     logger.info(
         f"Deployed {app_client.app_name} ({app_client.app_id}) successfully"
     )
+    return app_client.app_id
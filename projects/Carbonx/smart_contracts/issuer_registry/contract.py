@@ -1,6 +1,29 @@
-from algopy import ARC4Contract, Account, GlobalState, LocalState, Txn, Global, UInt64, Bytes
+from algopy import ARC4Contract, Account, Application, GlobalState, LocalState, Txn, Global, UInt64, Bytes, arc4, op
 from algopy.arc4 import abimethod, baremethod
 
+# Bump when a change needs `migrate` to convert the state of an updated app.
+SCHEMA_VERSION = 1
+
+
+class IssuerRegistered(arc4.Struct, kw_only=True):
+    """ARC-28 event of `register_issuer`."""
+
+    issuer: arc4.Address
+
+
+class IssuerApproved(arc4.Struct, kw_only=True):
+    """ARC-28 event of `approve_issuer`, with the new number of approved issuers."""
+
+    issuer: arc4.Address
+    approved_count: arc4.UInt64
+
+
+class IssuerRevoked(arc4.Struct, kw_only=True):
+    """ARC-28 event of `revoke_issuer`, with the new number of approved issuers."""
+
+    issuer: arc4.Address
+    approved_count: arc4.UInt64
+
 
 class IssuerRegistry(ARC4Contract):
     """Registry for carbon credit issuers with admin approval workflow.
@@ -8,6 +31,8 @@ class IssuerRegistry(ARC4Contract):
     Global state:
         admin           – address of the contract administrator
         approved_count  – total number of currently approved issuers
+        schema_version  – version of the state layout, see `migrate`
+        migrated_from   – the registry issuers are imported from, if any
 
     Local state (per account):
         is_registered   – 1 if the account has registered as an issuer
@@ -17,6 +42,8 @@ class IssuerRegistry(ARC4Contract):
     def __init__(self) -> None:
         self.admin = GlobalState(Bytes(), key="admin")
         self.approved_count = GlobalState(UInt64(0), key="approved_count")
+        self.schema_version = GlobalState(UInt64(0), key="schema_version")
+        self.migrated_from = GlobalState(UInt64(0), key="migrated_from")
         self.is_registered = LocalState(UInt64, key="is_registered")
         self.is_approved = LocalState(UInt64, key="is_approved")
 
@@ -25,6 +52,66 @@ class IssuerRegistry(ARC4Contract):
         """Set the contract creator as admin."""
         self.admin.value = Txn.sender.bytes
         self.approved_count.value = UInt64(0)
+        self.schema_version.value = UInt64(SCHEMA_VERSION)
+        self.migrated_from.value = UInt64(0)
+
+    @abimethod(allow_actions=["UpdateApplication"])
+    def update(self) -> None:
+        """Replace the program in place, keeping the app ID and issuer state. Admin only."""
+        assert Txn.sender.bytes == self.admin.value, "Only admin can update"
+
+    @abimethod()
+    def migrate(self) -> UInt64:
+        """Convert the state of an updated app to the current layout. Admin only.
+
+        Returns:
+            The schema version the state is now at.
+        """
+        assert Txn.sender.bytes == self.admin.value, "Only admin can migrate"
+        assert self.schema_version.value <= SCHEMA_VERSION, "State is newer than this program"
+        # Conversions go here, one `if self.schema_version.value < N:` block per version.
+        self.schema_version.value = UInt64(SCHEMA_VERSION)
+        return self.schema_version.value
+
+    @abimethod()
+    def import_issuers(
+        self, previous: Application, accounts: arc4.DynamicArray[arc4.Address]
+    ) -> UInt64:
+        """Copy the issuer state of `accounts` from a registry this app replaces. Admin only.
+
+        Accounts that have not opted in to this app, or already have state here, are
+        skipped, so the same batch can be sent again once more issuers opt in.
+
+        Args:
+            previous: The registry app to import from; the same for every batch.
+            accounts: The issuers to import.
+
+        Returns:
+            The number of issuers imported by this call.
+        """
+        assert Txn.sender.bytes == self.admin.value, "Only admin can import issuers"
+        assert previous.creator == Global.creator_address, "Previous app has another creator"
+        assert previous.id != Global.current_application_id.id, "Cannot import from itself"
+        if self.migrated_from.value == 0:
+            self.migrated_from.value = previous.id
+        assert self.migrated_from.value == previous.id, "Already importing from another app"
+
+        imported = UInt64(0)
+        for address in accounts:
+            account = Account(address.bytes)
+            if not op.app_opted_in(account, Global.current_application_id):
+                continue
+            if self.is_registered.get(account, default=UInt64(0)) != 0:
+                continue
+            registered, _exists = op.AppLocal.get_ex_uint64(account, previous, b"is_registered")
+            if registered == 0:
+                continue
+            approved, _exists = op.AppLocal.get_ex_uint64(account, previous, b"is_approved")
+            self.is_registered[account] = registered
+            self.is_approved[account] = approved
+            self.approved_count.value += approved
+            imported += 1
+        return imported
 
     @baremethod(allow_actions=["OptIn"])
     def opt_in(self) -> None:
@@ -40,6 +127,7 @@ class IssuerRegistry(ARC4Contract):
         current = self.is_registered.get(Txn.sender, default=UInt64(0))
         assert current == 0, "Already registered"
         self.is_registered[Txn.sender] = UInt64(1)
+        arc4.emit(IssuerRegistered(issuer=arc4.Address(Txn.sender)))
 
     @abimethod()
     def approve_issuer(self, account: Account) -> None:
@@ -54,6 +142,12 @@ class IssuerRegistry(ARC4Contract):
         assert already_approved == 0, "Account already approved"
         self.is_approved[account] = UInt64(1)
         self.approved_count.value += UInt64(1)
+        arc4.emit(
+            IssuerApproved(
+                issuer=arc4.Address(account),
+                approved_count=arc4.UInt64(self.approved_count.value),
+            )
+        )
 
     @abimethod()
     def revoke_issuer(self, account: Account) -> None:
@@ -66,6 +160,12 @@ class IssuerRegistry(ARC4Contract):
         assert approved == 1, "Account not approved"
         self.is_approved[account] = UInt64(0)
         self.approved_count.value -= UInt64(1)
+        arc4.emit(
+            IssuerRevoked(
+                issuer=arc4.Address(account),
+                approved_count=arc4.UInt64(self.approved_count.value),
+            )
+        )
 
     @abimethod(readonly=True)
     def get_issuer_status(self, account: Account) -> UInt64:
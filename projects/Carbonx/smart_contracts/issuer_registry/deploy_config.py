@@ -1,44 +1,57 @@
 import logging
+from pathlib import Path
 
 import algokit_utils
 
+from smart_contracts._helpers import trace
+from smart_contracts._helpers.deploy import fund_and_init_asset, update_policy
+from smart_contracts._helpers.deploy_manifest import deploy_app
+from smart_contracts._helpers.migration import import_account_state, migrate_app
+
 logger = logging.getLogger(__name__)
 
+artifact_dir = Path(__file__).parent.parent / "artifacts" / Path(__file__).parent.name
+
 
-def deploy() -> None:
+def deploy(
+    algorand: algokit_utils.AlgorandClient | None = None,
+    deployer: algokit_utils.SigningAccount | None = None,
+    mode: str = "update",
+) -> int:
     from smart_contracts.artifacts.issuer_registry.issuer_registry_client import (
         IssuerRegistryFactory,
         IssuerRegistryMethodCallCreateParams,
+        IssuerRegistryMethodCallUpdateParams,
     )
 
-    algorand = algokit_utils.AlgorandClient.from_environment()
-    deployer_ = algorand.account.from_environment("DEPLOYER")
+    # A shared client and deployer are passed in when several contracts deploy together
+    algorand = algorand or algokit_utils.AlgorandClient.from_environment()
+    deployer_ = deployer or algorand.account.from_environment("DEPLOYER")
 
     factory = algorand.client.get_typed_app_factory(
         IssuerRegistryFactory, default_sender=deployer_.address
     )
 
-    app_client, result = factory.deploy(
-        on_update=algokit_utils.OnUpdate.AppendApp,
-        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
-        create_params=IssuerRegistryMethodCallCreateParams(method="create()void"),
-    )
-
-    # Always ensure the contract has enough ALGO for MBR (at least 0.5 ALGO)
-    try:
-        app_info = algorand.account.get_information(app_client.app_address)
-        if app_info.amount < 500_000:
-            logger.info(f"Funding {app_client.app_name} with 1 ALGO for MBR")
-            algorand.send.payment(
-                algokit_utils.PaymentParams(
-                    amount=algokit_utils.AlgoAmount(algo=1),
-                    sender=deployer_.address,
-                    receiver=app_client.app_address,
-                )
-            )
-    except Exception as e:
-        logger.warning(f"Could not verify/fund contract: {e}")
+    with trace.span("factory deploy", "deploy", contract=factory.app_name):
+        deployed = deploy_app(
+            algorand,
+            factory,
+            deployer_.address,
+            artifact_dir,
+            **update_policy(mode),
+            create_params=IssuerRegistryMethodCallCreateParams(method="create()void"),
+            update_params=IssuerRegistryMethodCallUpdateParams(method="update()void"),
+        )
+    app_client = deployed.client
+
+    # Convert the state of an updated app, or copy the issuers of the app it replaced
+    migrate_app(algorand, deployed)
+    import_account_state(algorand, deployed, "import_issuers", b"is_registered")
+
+    # Always ensure the contract holds its minimum balance
+    fund_and_init_asset(algorand, app_client, deployer_.address, deployed.created, artifact_dir)
 
     logger.info(
         f"Deployed {app_client.app_name} ({app_client.app_id}) successfully"
     )
+    return app_client.app_id
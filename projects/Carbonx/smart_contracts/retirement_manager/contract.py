@@ -1,6 +1,63 @@
-from algopy import ARC4Contract, GlobalState, Txn, Global, UInt64, gtxn, Asset
+import typing
+
+from algopy import ARC4Contract, Account, Application, BoxMap, GlobalState, Txn, Global, TransactionType, UInt64, arc4, gtxn, Asset, op, subroutine, urange
 from algopy.arc4 import abimethod
 
+# Bump when a change needs `migrate` to convert the state of an updated app.
+SCHEMA_VERSION = 1
+
+Memo: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+
+# Certificate boxes are keyed by b"r" + retiree (32) + sequence (8) and hold 80 bytes;
+# the count boxes by b"n" + retiree (32) and hold a uint64. Each box adds
+# 2500 + 400 per key and value byte to the app account's minimum balance.
+CERTIFICATE_MBR = 2_500 + 400 * (1 + 40 + 80)
+CERTIFICATE_COUNT_MBR = 2_500 + 400 * (1 + 32 + 8)
+# Certificates per `get_certificates` call; the returned array must fit in one 1024-byte log.
+MAX_CERTIFICATES_PAGE = 12
+
+
+class RetirementStats(arc4.Struct, kw_only=True):
+    """Every counter of the retirement manager, as returned by `get_stats`."""
+
+    asset_id: arc4.UInt64
+    retired_credits: arc4.UInt64
+
+
+class CertificateKey(arc4.Struct, kw_only=True):
+    """Key of a retirement certificate: the n-th retirement of an account, from 0."""
+
+    retiree: arc4.Address
+    sequence: arc4.UInt64
+
+
+class RetirementCertificate(arc4.Struct, kw_only=True):
+    """Fixed-layout record of one retirement, as kept in its certificate box."""
+
+    amount: arc4.UInt64
+    round: arc4.UInt64
+    beneficiary: arc4.Address
+    memo: Memo
+
+
+class CreditsRetired(arc4.Struct, kw_only=True):
+    """ARC-28 event of `retire_credits`: $CXT permanently retired by an account."""
+
+    retiree: arc4.Address
+    sequence: arc4.UInt64
+    amount: arc4.UInt64
+    retired_credits: arc4.UInt64
+
+
+class CreditsRetiredBatch(arc4.Struct, kw_only=True):
+    """ARC-28 event of `retire_credits_batch`: one record for every lot in the group."""
+
+    retiree: arc4.Address
+    sequence: arc4.UInt64
+    transfers: arc4.UInt64
+    amount: arc4.UInt64
+    retired_credits: arc4.UInt64
+
 
 class RetirementManager(ARC4Contract):
     """Manages carbon credit retirements by verifying $CXT ASA transfers.
@@ -8,17 +65,65 @@ class RetirementManager(ARC4Contract):
     Global state:
         retired_credits  – credits permanently retired
         cxt_asset_id    – the Asset ID of the $CXT token
+        schema_version  – version of the state layout, see `migrate`
+        migrated_from   – the app whose tally was imported, if any
+
+    Boxes (per retiree, paid for by the retiree, see `retire_credits`):
+        n<retiree>             – number of certificates of the retiree
+        r<retiree><sequence>   – `RetirementCertificate` of each retirement
     """
 
     def __init__(self) -> None:
         self.retired_credits = GlobalState(UInt64(0), key="retired_credits")
         self.cxt_asset_id = GlobalState(UInt64(0), key="cxt_asset_id")
+        self.schema_version = GlobalState(UInt64(0), key="schema_version")
+        self.migrated_from = GlobalState(UInt64(0), key="migrated_from")
+        self.certificate_counts = BoxMap(Account, UInt64, key_prefix=b"n")
+        self.certificates = BoxMap(CertificateKey, RetirementCertificate, key_prefix=b"r")
 
     @abimethod(create="require")
     def create(self) -> None:
         """Initialise retirement tracking."""
         self.retired_credits.value = UInt64(0)
         self.cxt_asset_id.value = UInt64(0)
+        self.schema_version.value = UInt64(SCHEMA_VERSION)
+        self.migrated_from.value = UInt64(0)
+
+    @abimethod(allow_actions=["UpdateApplication"])
+    def update(self) -> None:
+        """Replace the program in place, keeping the app ID and state. Creator only."""
+        assert Txn.sender == Global.creator_address, "Only creator can update"
+
+    @abimethod()
+    def migrate(self) -> UInt64:
+        """Convert the state of an updated app to the current layout. Creator only.
+
+        Returns:
+            The schema version the state is now at.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can migrate"
+        assert self.schema_version.value <= SCHEMA_VERSION, "State is newer than this program"
+        # Conversions go here, one `if self.schema_version.value < N:` block per version.
+        self.schema_version.value = UInt64(SCHEMA_VERSION)
+        return self.schema_version.value
+
+    @abimethod()
+    def import_state(self, previous: Application) -> None:
+        """Add the retired tally of a retirement manager this app replaces. Creator only.
+
+        Only allowed once, and from an app of the same creator.
+
+        Args:
+            previous: The retirement manager app to import from.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can import state"
+        assert previous.creator == Global.creator_address, "Previous app has another creator"
+        assert previous.id != Global.current_application_id.id, "Cannot import from itself"
+        assert self.migrated_from.value == 0, "State already imported"
+
+        retired, _exists = op.AppGlobal.get_ex_uint64(previous, b"retired_credits")
+        self.retired_credits.value += retired
+        self.migrated_from.value = previous.id
 
     @abimethod()
     def init_asset(self, asset: Asset) -> None:
@@ -42,15 +147,28 @@ class RetirementManager(ARC4Contract):
         ).submit()
 
     @abimethod()
-    def retire_credits(self, axfer_tx: gtxn.AssetTransferTransaction) -> None:
-        """Retire carbon credits permanently.
+    def retire_credits(
+        self,
+        mbr_payment: gtxn.PaymentTransaction,
+        axfer_tx: gtxn.AssetTransferTransaction,
+        beneficiary: arc4.Address,
+        memo: Memo,
+    ) -> UInt64:
+        """Retire carbon credits permanently and record a certificate of it.
         
         Requires an atomic group:
-        1. Asset Transfer ($CXT) from User to RetirementManager
-        2. App Call to this method
+        1. Payment of the certificate's box MBR to RetirementManager, see `certificate_mbr`
+        2. Asset Transfer ($CXT) from User to RetirementManager
+        3. App Call to this method
         
         Args:
+            mbr_payment: Payment covering the minimum balance of the certificate boxes.
             axfer_tx: The asset transfer from the user to the contract.
+            beneficiary: The account the credits are retired on behalf of.
+            memo: Free-form reference, e.g. a hash of the retirement claim.
+
+        Returns:
+            The sequence number of the certificate, per retiree.
         """
         assert axfer_tx.asset_receiver == Global.current_application_address, "Transfer must be to contract"
         assert axfer_tx.xfer_asset.id == self.cxt_asset_id.value, "Incorrect asset ID"
@@ -58,8 +176,147 @@ class RetirementManager(ARC4Contract):
         
         # Update global tally
         self.retired_credits.value += axfer_tx.asset_amount
+        sequence = self._record_certificate(
+            mbr_payment, axfer_tx.sender, axfer_tx.asset_amount, beneficiary, memo
+        )
+        arc4.emit(
+            CreditsRetired(
+                retiree=arc4.Address(axfer_tx.sender),
+                sequence=arc4.UInt64(sequence),
+                amount=arc4.UInt64(axfer_tx.asset_amount),
+                retired_credits=arc4.UInt64(self.retired_credits.value),
+            )
+        )
+        return sequence
+
+    @abimethod()
+    def retire_credits_batch(
+        self, mbr_payment: gtxn.PaymentTransaction, beneficiary: arc4.Address, memo: Memo
+    ) -> UInt64:
+        """Retire every $CXT transfer in the group with a single app call.
+
+        The group holds the MBR payment, up to 14 asset transfers from the user(s) to
+        RetirementManager, and this call. Every asset transfer in the group is
+        validated like the one passed to `retire_credits`; other transaction types are
+        ignored. No other call to this app may be in the group, so no transfer is
+        counted twice. The whole batch is recorded as one certificate under the
+        caller (`Txn.sender`), even when the transfers come from several senders.
+
+        Args:
+            mbr_payment: Payment covering the minimum balance of the certificate boxes.
+            beneficiary: The account the credits are retired on behalf of.
+            memo: Free-form reference, e.g. a hash of the retirement claim.
+
+        Returns:
+            The sequence number of the certificate, per retiree, as `retire_credits`.
+        """
+        asset_id = self.cxt_asset_id.value
+        assert asset_id != 0, "Asset not initialized"
+
+        transfers = UInt64(0)
+        amount = UInt64(0)
+        for index in urange(Global.group_size):
+            if index == Txn.group_index:
+                continue
+            txn = gtxn.Transaction(index)
+            if txn.type == TransactionType.ApplicationCall:
+                assert txn.app_id != Global.current_application_id, "Only one retirement call per group"
+            elif txn.type == TransactionType.AssetTransfer:
+                assert txn.asset_receiver == Global.current_application_address, "Transfer must be to contract"
+                assert txn.xfer_asset.id == asset_id, "Incorrect asset ID"
+                assert txn.asset_amount > 0, "Amount must be greater than zero"
+                transfers += 1
+                amount += txn.asset_amount
+        assert transfers > 0, "No transfers to retire"
+
+        # Update global tally once for the whole batch
+        self.retired_credits.value += amount
+        sequence = self._record_certificate(mbr_payment, Txn.sender, amount, beneficiary, memo)
+        arc4.emit(
+            CreditsRetiredBatch(
+                retiree=arc4.Address(Txn.sender),
+                sequence=arc4.UInt64(sequence),
+                transfers=arc4.UInt64(transfers),
+                amount=arc4.UInt64(amount),
+                retired_credits=arc4.UInt64(self.retired_credits.value),
+            )
+        )
+        return sequence
+
+    @subroutine
+    def _certificate_mbr(self, retiree: Account) -> UInt64:
+        # The count box is only created by the retiree's first certificate.
+        if retiree in self.certificate_counts:
+            return UInt64(CERTIFICATE_MBR)
+        return UInt64(CERTIFICATE_MBR + CERTIFICATE_COUNT_MBR)
+
+    @subroutine
+    def _record_certificate(
+        self,
+        mbr_payment: gtxn.PaymentTransaction,
+        retiree: Account,
+        amount: UInt64,
+        beneficiary: arc4.Address,
+        memo: Memo,
+    ) -> UInt64:
+        """Store the next certificate of `retiree`, paid for by `mbr_payment`."""
+        assert mbr_payment.receiver == Global.current_application_address, "Payment must be to contract"
+        assert mbr_payment.amount >= self._certificate_mbr(retiree), "Insufficient MBR payment"
+        sequence = self.certificate_counts.get(retiree, default=UInt64(0))
+        key = CertificateKey(retiree=arc4.Address(retiree), sequence=arc4.UInt64(sequence))
+        self.certificates[key] = RetirementCertificate(
+            amount=arc4.UInt64(amount),
+            round=arc4.UInt64(Global.round),
+            beneficiary=beneficiary,
+            memo=memo.copy(),
+        )
+        self.certificate_counts[retiree] = sequence + 1
+        return sequence
+
+    @abimethod(readonly=True)
+    def certificate_mbr(self, retiree: Account) -> UInt64:
+        """Return the MBR payment the next retirement of `retiree` needs, in microAlgos."""
+        return self._certificate_mbr(retiree)
+
+    @abimethod(readonly=True)
+    def get_certificate_count(self, retiree: Account) -> UInt64:
+        """Return the number of retirement certificates of `retiree`."""
+        return self.certificate_counts.get(retiree, default=UInt64(0))
+
+    @abimethod(readonly=True)
+    def get_certificates(
+        self, retiree: Account, start: UInt64, limit: UInt64
+    ) -> arc4.DynamicArray[RetirementCertificate]:
+        """Return a page of the retirement certificates of `retiree`, oldest first.
+
+        Read the full history in pages of up to `MAX_CERTIFICATES_PAGE`, from
+        `start` = 0 until a page comes back short.
+
+        Args:
+            retiree: The account whose certificates to read.
+            start: Sequence number of the first certificate of the page.
+            limit: Maximum number of certificates to return.
+        """
+        assert limit <= MAX_CERTIFICATES_PAGE, "Too many certificates for one page"
+        count = self.certificate_counts.get(retiree, default=UInt64(0))
+        end = start + limit
+        if end > count:
+            end = count
+        page = arc4.DynamicArray[RetirementCertificate]()
+        for sequence in urange(start, end):
+            key = CertificateKey(retiree=arc4.Address(retiree), sequence=arc4.UInt64(sequence))
+            page.append(self.certificates[key].copy())
+        return page
 
     @abimethod(readonly=True)
     def get_retirement_stats(self) -> UInt64:
         """Return the total retired credits."""
         return self.retired_credits.value
+
+    @abimethod(readonly=True)
+    def get_stats(self) -> RetirementStats:
+        """Return the $CXT Asset ID and total retired credits in one call."""
+        return RetirementStats(
+            asset_id=arc4.UInt64(self.cxt_asset_id.value),
+            retired_credits=arc4.UInt64(self.retired_credits.value),
+        )
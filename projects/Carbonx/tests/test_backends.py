@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.backends import InProcessBackend
+
+pytest.importorskip("puyapy")
+
+CONTRACT = """\
+from algopy import ARC4Contract, arc4
+
+
+class Demo(ARC4Contract):
+    @arc4.abimethod
+    def hello(self, name: arc4.String) -> arc4.String:
+        return "Hello, " + name
+"""
+
+
+@pytest.fixture
+def contract(tmp_path: Path) -> Path:
+    contract_path = tmp_path / "demo" / "contract.py"
+    contract_path.parent.mkdir()
+    contract_path.write_text(CONTRACT)
+    return contract_path
+
+
+def test_compile_logs_at_info_and_reuses_the_parsed_contract(
+    contract: Path, tmp_path: Path
+) -> None:
+    backend = InProcessBackend()
+
+    first = backend.compile(contract, tmp_path / "O1", ["-O1"])
+    second = backend.compile(contract, tmp_path / "O2", ["-O2"])
+
+    assert "debug" not in first
+    assert (tmp_path / "O1" / "Demo.approval.teal").exists()
+    assert (tmp_path / "O2" / "Demo.approval.teal").exists()
+    assert list(backend._parsed) == [contract.resolve()]
+    assert "debug" not in second
+
+
+def test_compile_errors_fail_the_build(contract: Path, tmp_path: Path) -> None:
+    contract.write_text(CONTRACT + 'x: int = "a"\n')
+
+    with pytest.raises(Exception, match="Incompatible types in assignment"):
+        InProcessBackend().compile(contract, tmp_path / "out", [])
@@ -0,0 +1,114 @@
+import json
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers import build_cache
+from smart_contracts._helpers.build import build
+from smart_contracts._helpers.build_cache import BuildCache
+
+APPROVAL = """\
+#pragma version 10
+main:
+    pushint 1
+    return
+"""
+
+
+class _FakeBackend:
+    """Writes a fixed program and records the flags of every compile and client."""
+
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.compiles: list[list[str]] = []
+        self.clients: list[Path] = []
+
+    def compile(self, contract_path: Path, output_dir: Path, flags: Sequence[str]) -> str:
+        self.compiles.append(list(flags))
+        (output_dir / "Demo.approval.teal").write_text(APPROVAL)
+        (output_dir / "Demo.arc56.json").write_text(json.dumps({"name": "Demo"}))
+        return ""
+
+    def generate_client(self, app_spec_path: Path, output_path: Path) -> str:
+        self.clients.append(output_path)
+        output_path.write_text("# generated\n")
+        return ""
+
+
+@pytest.fixture
+def contract(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(build_cache, "tool_versions", lambda: {})
+    monkeypatch.setattr("smart_contracts._helpers.build.project_root", tmp_path)
+    contract_path = tmp_path / "smart_contracts" / "demo" / "contract.py"
+    contract_path.parent.mkdir(parents=True)
+    contract_path.write_text("")
+    return contract_path
+
+
+def _write_matrix(output_dir: Path, level: int) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / "demo.optimization_matrix.json"
+    path.write_text(json.dumps({"policy": "size", "selected_level": level, "levels": []}))
+    return path
+
+
+def test_build_uses_the_compiler_default_without_a_matrix(
+    contract: Path, tmp_path: Path
+) -> None:
+    backend = _FakeBackend()
+
+    build(tmp_path / "artifacts" / "demo", contract, backend=backend)
+
+    assert not any(flag.startswith("-O") for flag in backend.compiles[0])
+
+
+def test_build_compiles_at_the_level_the_matrix_selected(contract: Path, tmp_path: Path) -> None:
+    output_dir = tmp_path / "artifacts" / "demo"
+    matrix = _write_matrix(output_dir, 2)
+    backend = _FakeBackend()
+
+    build(output_dir, contract, backend=backend)
+    build(output_dir, contract, backend=backend, optimization_level=0)
+
+    assert backend.compiles[0][-1] == "-O2"
+    # An explicit level, as the matrix passes, wins over the recorded one.
+    assert backend.compiles[1][-1] == "-O0"
+    assert json.loads(matrix.read_text())["selected_level"] == 2
+
+
+def test_matrix_survives_cached_rebuilds(contract: Path, tmp_path: Path) -> None:
+    output_dir = tmp_path / "artifacts" / "demo"
+    matrix = _write_matrix(output_dir, 1)
+    cache = BuildCache(tmp_path / "cache")
+    backend = _FakeBackend()
+
+    build(output_dir, contract, cache, backend)
+    build(output_dir, contract, cache, backend)
+
+    # The second build was restored from the cache at the same level.
+    assert backend.compiles == [["--output-source-map", "-O1"]]
+    assert matrix.exists()
+    assert (output_dir / "Demo.cost_report.json").exists()
+
+
+def test_client_is_regenerated_when_the_generator_changes(
+    contract: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    output_dir = tmp_path / "artifacts" / "demo"
+    backend = _FakeBackend()
+    versions = {"algokit-client-generator": "2.1.0"}
+    monkeypatch.setattr(build_cache, "tool_versions", lambda: versions)
+
+    build(output_dir, contract, backend=backend)
+    build(output_dir, contract, backend=backend)
+    assert len(backend.clients) == 1
+    [client_path] = backend.clients
+    assert "# algokit-client-generator: 2.1.0" in client_path.read_text()
+
+    versions["algokit-client-generator"] = "2.2.0"
+    build(output_dir, contract, backend=backend)
+
+    assert len(backend.clients) == 2
+    assert "# algokit-client-generator: 2.2.0" in client_path.read_text()
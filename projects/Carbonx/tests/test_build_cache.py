@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers import build_cache
+from smart_contracts._helpers.build_cache import BuildCache, cache_key, local_dependencies
+
+FLAGS = ["--output-source-map", "py", "backend=cli"]
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(build_cache, "tool_versions", lambda: {"puyapy": "5.7.1"})
+    package = tmp_path / "smart_contracts"
+    (package / "demo").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "demo" / "__init__.py").write_text("")
+    (package / "demo" / "contract.py").write_text(
+        "from smart_contracts.demo.constants import FEE\nfrom . import limits\n"
+    )
+    (package / "demo" / "constants.py").write_text("FEE = 1\n")
+    (package / "demo" / "limits.py").write_text("MAX = 2\n")
+    (package / "demo" / "unused.py").write_text("X = 3\n")
+    return tmp_path
+
+
+def _key(project: Path, flags: list[str] = FLAGS) -> str:
+    return cache_key(project / "smart_contracts" / "demo" / "contract.py", project, flags)
+
+
+def test_local_dependencies_follow_absolute_and_relative_imports(project: Path) -> None:
+    demo = project / "smart_contracts" / "demo"
+
+    dependencies = local_dependencies(demo / "contract.py", project)
+
+    assert demo / "contract.py" in dependencies
+    assert demo / "constants.py" in dependencies
+    assert demo / "limits.py" in dependencies
+    assert demo / "unused.py" not in dependencies
+
+
+def test_key_is_stable_while_nothing_changes(project: Path) -> None:
+    assert _key(project) == _key(project)
+
+
+def test_key_changes_with_the_contract_and_its_imports(project: Path) -> None:
+    demo = project / "smart_contracts" / "demo"
+    keys = {_key(project)}
+
+    (demo / "contract.py").write_text((demo / "contract.py").read_text() + "# edited\n")
+    keys.add(_key(project))
+    (demo / "constants.py").write_text("FEE = 2\n")
+    keys.add(_key(project))
+    (demo / "limits.py").write_text("MAX = 3\n")
+    keys.add(_key(project))
+
+    assert len(keys) == 4
+
+
+def test_key_ignores_files_the_contract_does_not_import(project: Path) -> None:
+    before = _key(project)
+
+    (project / "smart_contracts" / "demo" / "unused.py").write_text("X = 4\n")
+
+    assert _key(project) == before
+
+
+def test_key_changes_with_flags_backend_and_tool_versions(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    before = _key(project)
+
+    assert _key(project, [*FLAGS, "-O2"]) != before
+    assert _key(project, [*FLAGS[:-1], "backend=inprocess"]) != before
+    monkeypatch.setattr(build_cache, "tool_versions", lambda: {"puyapy": "5.8.0"})
+    assert _key(project) != before
+
+
+def test_cache_round_trip(tmp_path: Path) -> None:
+    cache = BuildCache(tmp_path / "cache")
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    (output_dir / "Demo.approval.teal").write_text("#pragma version 10\n")
+
+    assert not cache.restore("ab" * 32, tmp_path / "restored")
+    cache.store("ab" * 32, output_dir)
+    assert cache.restore("ab" * 32, tmp_path / "restored")
+    assert (tmp_path / "restored" / "Demo.approval.teal").read_text() == "#pragma version 10\n"
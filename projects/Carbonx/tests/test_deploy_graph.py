@@ -0,0 +1,124 @@
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.deploy_graph import load_graph, waves
+
+
+def _graph(tmp_path: Path, document: str) -> Path:
+    path = tmp_path / "deployment.toml"
+    path.write_text(document)
+    return path
+
+
+def test_references_are_split_from_literal_params(tmp_path: Path) -> None:
+    nodes = load_graph(
+        _graph(
+            tmp_path,
+            """
+[assets.cxt]
+unit_name = "CXT"
+total = 100
+
+[apps.retirement_manager]
+cxt_asset_id = "assets.cxt"
+mode = "append"
+""",
+        )
+    )
+
+    app = nodes["apps.retirement_manager"]
+    assert app.params == {"mode": "append"}
+    assert app.references == {"cxt_asset_id": "assets.cxt"}
+    assert nodes["assets.cxt"].params == {"unit_name": "CXT", "total": 100}
+    assert nodes["assets.cxt"].references == {}
+
+
+def test_literals_that_only_start_like_references_stay_params(tmp_path: Path) -> None:
+    nodes = load_graph(
+        _graph(
+            tmp_path,
+            """
+[assets.cxt]
+url = "apps.carbonx.finance"
+unit_name = "assets"
+
+[apps.issuer_registry]
+note = "assets.cxt and more"
+""",
+        )
+    )
+
+    assert nodes["assets.cxt"].params == {"url": "apps.carbonx.finance", "unit_name": "assets"}
+    assert nodes["apps.issuer_registry"].params == {"note": "assets.cxt and more"}
+    assert nodes["apps.issuer_registry"].references == {}
+
+
+def test_unknown_reference_is_rejected(tmp_path: Path) -> None:
+    path = _graph(tmp_path, '[apps.marketplace]\ncxt_asset_id = "assets.missing"\n')
+
+    with pytest.raises(Exception, match="references unknown assets.missing"):
+        load_graph(path)
+
+
+def test_assets_cannot_reference_other_nodes(tmp_path: Path) -> None:
+    path = _graph(tmp_path, '[assets.a]\nunit_name = "A"\n\n[assets.b]\nbacking = "assets.a"\n')
+
+    with pytest.raises(Exception, match="assets.b .* cannot reference other nodes"):
+        load_graph(path)
+
+
+def test_missing_graph_is_empty(tmp_path: Path) -> None:
+    assert load_graph(tmp_path / "deployment.toml") == {}
+
+
+def test_waves_order_references_first(tmp_path: Path) -> None:
+    nodes = load_graph(
+        _graph(
+            tmp_path,
+            """
+[assets.cxt]
+unit_name = "CXT"
+
+[apps.registry]
+
+[apps.marketplace]
+cxt_asset_id = "assets.cxt"
+registry_app_id = "apps.registry"
+
+[apps.retirement_manager]
+cxt_asset_id = "assets.cxt"
+""",
+        )
+    )
+
+    assert waves(nodes, ["apps.marketplace", "apps.retirement_manager"]) == [
+        ["apps.registry", "assets.cxt"],
+        ["apps.marketplace", "apps.retirement_manager"],
+    ]
+    # Only the selected nodes and what they reference are included.
+    assert waves(nodes, ["apps.retirement_manager"]) == [
+        ["assets.cxt"],
+        ["apps.retirement_manager"],
+    ]
+
+
+def test_circular_references_are_rejected(tmp_path: Path) -> None:
+    nodes = load_graph(
+        _graph(
+            tmp_path,
+            """
+[apps.a]
+b_app_id = "apps.b"
+
+[apps.b]
+c_app_id = "apps.c"
+
+[apps.c]
+a_app_id = "apps.a"
+""",
+        )
+    )
+
+    with pytest.raises(Exception, match="Circular reference in the deployment graph"):
+        waves(nodes, ["apps.a"])
@@ -0,0 +1,141 @@
+import functools
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from smart_contracts._helpers import deploy_journal
+from smart_contracts._helpers.deploy import fund_and_init_asset
+from smart_contracts._helpers.deploy_executor import DeployExecutor
+from smart_contracts._helpers.deploy_journal import DeployJournal, round_of
+
+ARTIFACT_DIR = Path(__file__).parents[1] / "smart_contracts" / "artifacts" / "carbon_marketplace"
+
+
+@pytest.fixture(autouse=True)
+def journal_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(deploy_journal, "journal_dir", tmp_path)
+    return tmp_path
+
+
+def test_confirmed_steps_are_resumed_by_the_next_run() -> None:
+    journal = DeployJournal("testnet-v1.0", "hash")
+    journal.record("CarbonMarketplace", "fund", ["TX1"], 10, app_id=1)
+    journal.record("CarbonMarketplace", "init asset", ["TX2"], 11, app_id=1, asset_id=5)
+
+    resumed = DeployJournal("testnet-v1.0", "hash")
+
+    entry = resumed.find("CarbonMarketplace", "init asset", app_id=1)
+    assert entry is not None
+    assert entry["tx_ids"] == ["TX2"]
+    assert entry["confirmed_round"] == 11
+    assert entry["asset_id"] == 5
+    assert resumed.find("CarbonMarketplace", "init asset", app_id=2) is None
+    assert resumed.find("RetirementManager", "fund") is None
+
+
+def test_completed_runs_are_not_resumed() -> None:
+    journal = DeployJournal("testnet-v1.0", "hash")
+    journal.record("CarbonMarketplace", "fund", ["TX1"], 10)
+    journal.complete()
+    journal.record("IssuerRegistry", "fund", ["TX3"], 12)
+
+    resumed = DeployJournal("testnet-v1.0", "hash")
+
+    assert resumed.find("CarbonMarketplace", "fund") is None
+    assert resumed.find("IssuerRegistry", "fund") is not None
+
+
+def test_steps_of_a_reset_network_are_not_resumed() -> None:
+    DeployJournal("localnet", "old hash").record("CarbonMarketplace", "fund", ["TX1"], 10)
+
+    assert DeployJournal("localnet", "new hash").find("CarbonMarketplace", "fund") is None
+
+
+def test_line_cut_short_by_a_crash_is_skipped(journal_dir: Path) -> None:
+    journal = DeployJournal("testnet-v1.0", "hash")
+    journal.record("CarbonMarketplace", "fund", ["TX1"], 10)
+    path = journal_dir / "testnet-v1.0.journal.jsonl"
+    path.write_bytes(path.read_bytes() + b'{"genesis_hash": "hash", "node": "Carb')
+
+    DeployJournal("testnet-v1.0", "hash").record("RetirementManager", "fund", ["TX2"], 11)
+    resumed = DeployJournal("testnet-v1.0", "hash")
+
+    assert resumed.find("CarbonMarketplace", "fund") is not None
+    assert resumed.find("RetirementManager", "fund") is not None
+    assert len(path.read_text().splitlines()) == 3
+
+
+def test_round_of_reads_dicts_and_objects() -> None:
+    class Confirmation:
+        confirmed_round = 7
+
+    assert round_of({"confirmed-round": 5}) == 5
+    assert round_of(Confirmation()) == 7
+    assert round_of(None) is None
+
+
+class _FakeGroup:
+    """Records the transactions added to a group; sending raises `error` if given."""
+
+    def __init__(self, error: Exception | None) -> None:
+        self.error = error
+        self.transactions: list[str] = []
+
+    def composer(self) -> "_FakeGroup":
+        return self
+
+    def add_payment(self, params: object) -> None:
+        self.transactions.append("payment")
+
+    def init_asset(self, args: tuple, params: object) -> None:
+        self.transactions.append("init_asset")
+
+    def send(self, params: object) -> SimpleNamespace:
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(tx_ids=["PAY", "INIT"], confirmations=[{"confirmed-round": 7}])
+
+
+class _FakeAppClient:
+    app_name = "CarbonMarketplace"
+    app_id = 1
+    app_address = "APP"
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.group = _FakeGroup(error)
+
+    def new_group(self) -> _FakeGroup:
+        return self.group
+
+
+def test_failed_init_fails_the_deploy_and_is_retried(
+    journal_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(deploy_journal, "_journals", {})
+    network = SimpleNamespace(genesis_id="testnet-v1.0", genesis_hash="hash")
+    algorand = SimpleNamespace(client=SimpleNamespace(network=lambda: network))
+    path = journal_dir / "testnet-v1.0.journal.jsonl"
+
+    def deploy(algorand: SimpleNamespace, app_client: _FakeAppClient) -> int:
+        fund_and_init_asset(algorand, app_client, "DEPLOYER", True, ARTIFACT_DIR, 5)
+        return app_client.app_id
+
+    failing = _FakeAppClient(Exception("node timed out"))
+    executor = DeployExecutor(1, algorand=algorand)
+    executor.submit("apps.carbon_marketplace", functools.partial(deploy, app_client=failing))
+    with pytest.raises(Exception, match="node timed out"):
+        executor.wait()
+
+    # Neither the step nor the end of the run was recorded, so a rerun retries the step.
+    assert not path.exists()
+
+    retry = _FakeAppClient()
+    executor = DeployExecutor(1, algorand=algorand)
+    executor.submit("apps.carbon_marketplace", functools.partial(deploy, app_client=retry))
+    executor.wait()
+
+    assert retry.group.transactions == ["payment", "init_asset"]
+    steps = [json.loads(line)["step"] for line in path.read_text().splitlines()]
+    assert steps == ["fund and init_asset", "run complete"]
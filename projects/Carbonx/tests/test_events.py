@@ -0,0 +1,70 @@
+import base64
+import json
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.events import Event, EventDecoder, block_events
+
+artifacts_dir = Path(__file__).parent.parent / "smart_contracts" / "artifacts"
+
+APP_SPEC = {
+    "events": [
+        {
+            "name": "CreditsBought",
+            "args": [
+                {"type": "address", "name": "buyer"},
+                {"type": "uint64", "name": "amount"},
+                {"type": "uint64", "name": "paid"},
+                {"type": "uint64", "name": "total_credits"},
+            ],
+        }
+    ]
+}
+
+BUYER = "AAAQEAYEAUDAOCAJBIFQYDIOB4IBCEQTCQKRMFYYDENBWHA5DYP7MUPJQE"
+# sha512/256("CreditsBought(address,uint64,uint64,uint64)")[:4], then the ABI-encoded fields.
+LOG = bytes.fromhex(
+    "e355792f"
+    "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f"
+    "0000000000000005"
+    "00000000001e8480"
+    "0000000000000007"
+)
+EVENT_FIELDS = {"buyer": BUYER, "amount": 5, "paid": 2_000_000, "total_credits": 7}
+
+
+def test_known_log_is_decoded_through_its_selector() -> None:
+    decoder = EventDecoder(APP_SPEC)
+
+    assert decoder.decode(LOG, app_id=1, round_=2) == Event("CreditsBought", EVENT_FIELDS, 1, 2)
+    assert decoder.decode(base64.b64encode(LOG).decode()) == Event("CreditsBought", EVENT_FIELDS)
+    # An ABI return value is logged with the 151f7c75 prefix, not an event selector.
+    assert decoder.decode(bytes.fromhex("151f7c75") + LOG[4:]) is None
+
+
+def test_events_of_confirmations_and_blocks() -> None:
+    decoder = EventDecoder(APP_SPEC)
+    logs = [base64.b64encode(LOG).decode(), base64.b64encode(b"other").decode()]
+    confirmation = {"txn": {"txn": {"apid": 7}}, "logs": logs, "confirmed-round": 9}
+
+    assert decoder.decode_confirmation(confirmation) == [
+        Event("CreditsBought", EVENT_FIELDS, 7, 9)
+    ]
+
+    class Algod:
+        def block_info(self, round_: int) -> dict:
+            # An app call to app 8 whose inner call to app 7 emits the event.
+            inner = {"txn": {"apid": 7}, "dt": {"lg": [LOG]}}
+            return {"block": {"txns": [{"txn": {"apid": 8}, "dt": {"lg": [LOG], "itx": [inner]}}]}}
+
+    assert block_events(Algod(), 9, {7: decoder}) == [Event("CreditsBought", EVENT_FIELDS, 7, 9)]
+
+
+@pytest.mark.parametrize(
+    "contract", ["carbon_marketplace", "issuer_registry", "retirement_manager"]
+)
+def test_built_app_specs_declare_events(contract: str) -> None:
+    app_spec_path = next((artifacts_dir / contract).glob("*.arc56.json"))
+
+    assert json.loads(app_spec_path.read_text())["events"]
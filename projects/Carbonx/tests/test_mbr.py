@@ -0,0 +1,53 @@
+from smart_contracts._helpers.mbr import abi_static_size, box_min_balance
+
+
+def test_static_sizes_of_basic_types() -> None:
+    assert abi_static_size("uint64") == 8
+    assert abi_static_size("AVMUint64") == 8
+    assert abi_static_size("uint8") == 1
+    assert abi_static_size("uint512") == 64
+    assert abi_static_size("ufixed64x2") == 8
+    assert abi_static_size("bool") == 1
+    assert abi_static_size("byte") == 1
+    assert abi_static_size("address") == 32
+
+
+def test_static_arrays_and_packed_bools() -> None:
+    assert abi_static_size("byte[32]") == 32
+    assert abi_static_size("uint64[4]") == 32
+    assert abi_static_size("bool[9]") == 2
+    assert abi_static_size("address[2][3]") == 192
+
+
+def test_tuples_pack_consecutive_bools() -> None:
+    assert abi_static_size("(uint64,bool,bool,uint8)") == 8 + 1 + 1
+    assert abi_static_size("(bool,bool,bool,bool,bool,bool,bool,bool,bool)") == 2
+    assert abi_static_size("(uint64,(bool,byte[4]),bool)") == 8 + 5 + 1
+
+
+def test_dynamic_types_have_no_static_size() -> None:
+    assert abi_static_size("string") is None
+    assert abi_static_size("uint64[]") is None
+    assert abi_static_size("AVMBytes") is None
+    assert abi_static_size("(uint64,string)") is None
+    assert abi_static_size("string[2]") is None
+
+
+def test_structs_are_resolved_from_the_app_spec() -> None:
+    structs = {
+        "RetirementCertificate": [
+            {"name": "amount", "type": "uint64"},
+            {"name": "round", "type": "uint64"},
+            {"name": "beneficiary", "type": "address"},
+            {"name": "memo", "type": "byte[32]"},
+        ],
+        "Wrapper": [{"name": "certificate", "type": "RetirementCertificate"}],
+    }
+
+    assert abi_static_size("RetirementCertificate", structs) == 80
+    assert abi_static_size("Wrapper", structs) == 80
+
+
+def test_box_min_balance() -> None:
+    # The prefix, a 32-byte address and a uint64 value.
+    assert box_min_balance(1 + 32, 8) == 2_500 + 400 * 41
@@ -0,0 +1,144 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from smart_contracts._helpers import deploy_journal, migration
+from smart_contracts._helpers.deploy_manifest import DeployedApp
+
+PREVIOUS_APP_ID = 100
+APP_ID = 200
+MARKER = b"is_registered"
+
+
+@dataclass
+class _Return:
+    value: int
+
+
+@dataclass
+class _Group:
+    calls: list[tuple[Any, ...]] = field(default_factory=list)
+
+    def import_issuers(self, args: tuple[Any, ...], params: Any) -> None:
+        self.calls.append(args)
+        assert params.account_references == args[1]
+        assert params.app_references == [PREVIOUS_APP_ID]
+
+    def send(self) -> Any:
+        class Result:
+            returns = [_Return(len(accounts)) for _, accounts in self.calls]
+            tx_ids = [f"TX{index}" for index in range(len(self.calls))]
+            confirmations = [{"confirmed-round": 42}]
+
+        return Result()
+
+
+@dataclass
+class _AppClient:
+    app_name: str = "IssuerRegistry"
+    app_id: int = APP_ID
+    groups: list[_Group] = field(default_factory=list)
+
+    def new_group(self) -> _Group:
+        self.groups.append(_Group())
+        return self.groups[-1]
+
+
+class _Indexer:
+    def __init__(self, pages: list[list[dict[str, Any]]]) -> None:
+        self.pages = pages
+
+    def accounts(self, application_id: int, limit: int, next_page: str | None) -> dict:
+        assert application_id == PREVIOUS_APP_ID
+        index = int(next_page or 0)
+        response: dict[str, Any] = {
+            "accounts": self.pages[index] if index < len(self.pages) else []
+        }
+        if index + 1 < len(self.pages):
+            response["next-token"] = str(index + 1)
+        return response
+
+
+class _Algorand:
+    def __init__(self, indexer: _Indexer) -> None:
+        class Network:
+            genesis_id = "testnet-v1.0"
+            genesis_hash = "hash"
+
+        class Client:
+            def network(self) -> Any:
+                return Network()
+
+        self.client = Client()
+        self.client.indexer = indexer  # type: ignore[attr-defined]
+
+
+def _account(address: str, *, opted_in: bool = True, imported: bool = False) -> dict:
+    local_states = [{"id": PREVIOUS_APP_ID, "key-value": []}]
+    if opted_in:
+        keys = [{"key": "aXNfcmVnaXN0ZXJlZA=="}] if imported else []
+        local_states.append({"id": APP_ID, "key-value": keys})
+    return {"address": address, "apps-local-state": local_states}
+
+
+@pytest.fixture(autouse=True)
+def journal_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(deploy_journal, "journal_dir", tmp_path)
+    monkeypatch.setattr(deploy_journal, "_journals", {})
+    return tmp_path
+
+
+def test_pending_accounts_are_imported_in_batches_and_groups() -> None:
+    pending = [_account(f"A{index}") for index in range(70)]
+    skipped = [_account("IMPORTED", imported=True), _account("NOT_OPTED_IN", opted_in=False)]
+    # Two indexer pages, with accounts that need no import mixed in.
+    indexer = _Indexer([pending[:40] + skipped, pending[40:]])
+    app_client = _AppClient()
+
+    migration.import_account_state(
+        _Algorand(indexer),  # type: ignore[arg-type]
+        DeployedApp(app_client, "create", PREVIOUS_APP_ID),
+        "import_issuers",
+        MARKER,
+    )
+
+    # 70 accounts, 4 per call and 16 calls per group.
+    assert [len(group.calls) for group in app_client.groups] == [16, 2]
+    batches = [accounts for group in app_client.groups for _, accounts in group.calls]
+    assert all(len(batch) == migration.ACCOUNTS_PER_CALL for batch in batches[:-1])
+    assert len(batches[-1]) == 2
+    assert [address for batch in batches for address in batch] == [
+        f"A{index}" for index in range(70)
+    ]
+    assert all(
+        previous == PREVIOUS_APP_ID for group in app_client.groups for previous, _ in group.calls
+    )
+
+    journal = deploy_journal.DeployJournal("testnet-v1.0", "hash")
+    entry = journal.find("IssuerRegistry", "import_issuers", app_id=APP_ID)
+    assert entry is not None
+    # The latest entry is the second group: one call of 4 accounts and one of 2.
+    assert entry["imported"] == 6
+    assert entry["confirmed_round"] == 42
+
+
+def test_nothing_is_sent_without_a_previous_app_or_pending_accounts() -> None:
+    app_client = _AppClient()
+    indexer = _Indexer([[_account("IMPORTED", imported=True)]])
+
+    migration.import_account_state(
+        _Algorand(indexer),  # type: ignore[arg-type]
+        DeployedApp(app_client, "create", None),
+        "import_issuers",
+        MARKER,
+    )
+    migration.import_account_state(
+        _Algorand(indexer),  # type: ignore[arg-type]
+        DeployedApp(app_client, "create", PREVIOUS_APP_ID),
+        "import_issuers",
+        MARKER,
+    )
+
+    assert app_client.groups == []
@@ -0,0 +1,80 @@
+import importlib.util
+from collections.abc import Iterator
+from pathlib import Path
+from types import ModuleType
+
+import algopy
+import pytest
+from algopy import arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts._helpers.teal_report import (
+    APP_CALL_BUDGET,
+    ProgramAnalysis,
+    parse_teal,
+)
+
+# The older contracts of the nested projects/Carbonx tree, which has no tests of its own.
+NESTED_ROOT = Path(__file__).parents[1] / "projects" / "Carbonx" / "smart_contracts"
+APPROVAL_TEAL = (
+    NESTED_ROOT / "artifacts" / "carbon_marketplace" / "CarbonMarketplace.approval.teal"
+)
+
+# ApplicationArgs of one app call hold at most 2,048 bytes.
+MAX_APP_ARGS_BYTES = 2_048
+
+
+@pytest.fixture(scope="module")
+def nested_contract() -> ModuleType:
+    # Loaded under its own name, as the nested `smart_contracts` package shadows ours.
+    spec = importlib.util.spec_from_file_location(
+        "nested_carbon_marketplace", NESTED_ROOT / "carbon_marketplace" / "contract.py"
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as context:
+        yield context
+
+
+def test_full_page_of_balances_fits_one_app_call(nested_contract: ModuleType) -> None:
+    page = nested_contract.MAX_BALANCES_PAGE
+    instructions, labels = parse_teal(APPROVAL_TEAL.read_text())
+    analysis = ProgramAnalysis(instructions, labels)
+    # The static cost counts the loop once; add an iteration per address of the page.
+    static_cost = analysis.method_report(
+        *analysis.method_entries()["get_balances(address[])uint64[]"]
+    ).cost
+    loop = range(labels["get_balances_for_header@2"], labels["get_balances_after_for@5"])
+    iteration_cost = sum(instructions[index].cost for index in loop)
+
+    assert static_cost + page * iteration_cost <= APP_CALL_BUDGET
+    # Selector, then the array length and its addresses.
+    assert 4 + 2 + 32 * page <= MAX_APP_ARGS_BYTES
+
+
+def test_get_balances_reads_a_full_page(
+    context: AlgopyTestContext, nested_contract: ModuleType
+) -> None:
+    contract = nested_contract.CarbonMarketplace()
+    contract.create()
+    page = nested_contract.MAX_BALANCES_PAGE
+    accounts = [context.any.account() for _ in range(page)]
+    contract.balances[accounts[0]] = algopy.UInt64(5)
+
+    balances = contract.get_balances(
+        arc4.DynamicArray(*(arc4.Address(account) for account in accounts))
+    )
+
+    assert [balance.as_uint64() for balance in balances] == [5] + [0] * (page - 1)
+    with pytest.raises(AssertionError, match="Too many addresses for one page"):
+        contract.get_balances(
+            arc4.DynamicArray(
+                *(arc4.Address(account) for account in [*accounts, context.any.account()])
+            )
+        )
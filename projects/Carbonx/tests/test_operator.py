@@ -0,0 +1,65 @@
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers import deploy_manifest, operator
+from smart_contracts._helpers.operator import Operator
+
+
+def test_deploy_drops_cached_app_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    deployed: list[str | None] = []
+    smart_contracts_main = types.ModuleType("smart_contracts.__main__")
+    smart_contracts_main.main = lambda action, contract: deployed.append(contract)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "smart_contracts.__main__", smart_contracts_main)
+    # Skips __init__, which sets up an Algorand client from the environment.
+    operator = Operator.__new__(Operator)
+    operator._app_clients = {"retirement_manager": object()}
+
+    assert operator.run("deploy", ["retirement_manager"]) == "deployed"
+
+    assert deployed == ["retirement_manager"]
+    # A replaced app gets a new ID, so the next command looks it up in the manifest again.
+    assert operator._app_clients == {}
+
+
+def test_export_frontend_ships_app_specs_and_deployed_ids(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    artifacts_dir = tmp_path / "artifacts"
+    for contract, app_name in [("retirement_manager", "RetirementManager"), ("registry", "Registry")]:
+        (artifacts_dir / contract).mkdir(parents=True)
+        (artifacts_dir / contract / f"{app_name}.arc56.json").write_text(
+            json.dumps({"name": app_name})
+        )
+    frontend_dir = tmp_path / "frontend"
+    frontend_dir.mkdir()
+    # Networks exported earlier are kept.
+    (frontend_dir / "deployments.json").write_text(json.dumps({"mainnet-v1.0": {"registry": 1}}))
+    monkeypatch.setattr(operator, "artifacts_dir", artifacts_dir)
+    monkeypatch.setattr(operator, "frontend_contracts_dir", frontend_dir)
+    monkeypatch.setattr(deploy_manifest, "manifest_dir", tmp_path / "deployments")
+    deploy_manifest.DeploymentManifest("testnet-v1.0", "hash").record(
+        "RetirementManager", {"app_id": 42}
+    )
+    network = types.SimpleNamespace(genesis_id="testnet-v1.0", genesis_hash="hash")
+    export = Operator.__new__(Operator)
+    export.algorand = types.SimpleNamespace(  # type: ignore[assignment]
+        client=types.SimpleNamespace(network=lambda: network)
+    )
+
+    output = export.run("export-frontend", [])
+
+    assert output.splitlines() == [
+        "registry: app spec only, not deployed on testnet-v1.0",
+        "retirement_manager: app 42 on testnet-v1.0",
+    ]
+    assert json.loads((frontend_dir / "deployments.json").read_text()) == {
+        "mainnet-v1.0": {"registry": 1},
+        "testnet-v1.0": {"retirement_manager": 42},
+    }
+    assert json.loads((frontend_dir / "RetirementManager.arc56.json").read_text()) == {
+        "name": "RetirementManager"
+    }
@@ -0,0 +1,133 @@
+from collections.abc import Iterator
+
+import algopy
+import pytest
+from algopy import arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.retirement_manager.contract import (
+    CERTIFICATE_COUNT_MBR,
+    CERTIFICATE_MBR,
+    Memo,
+    RetirementManager,
+)
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as context:
+        yield context
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> RetirementManager:
+    contract = RetirementManager()
+    contract.create()
+    return contract
+
+
+@pytest.fixture()
+def cxt(context: AlgopyTestContext, contract: RetirementManager) -> algopy.Asset:
+    asset = context.any.asset()
+    contract.cxt_asset_id.value = asset.id
+    return asset
+
+
+def _retire_batch(
+    context: AlgopyTestContext, contract: RetirementManager, *transfers: algopy.gtxn.Transaction
+) -> algopy.UInt64:
+    """Calls retire_credits_batch in a group of the MBR payment, `transfers` and the call."""
+    app = context.ledger.get_app(contract)
+    sender = context.default_sender
+    payment = context.any.txn.payment(
+        sender=sender,
+        receiver=app.address,
+        amount=algopy.UInt64(CERTIFICATE_MBR + CERTIFICATE_COUNT_MBR),
+    )
+    call = context.txn.defer_app_call(
+        contract.retire_credits_batch, payment, arc4.Address(sender), Memo.from_bytes(bytes(32))
+    )
+    with context.txn.create_group([payment, *transfers, call]):
+        return call.submit()
+
+
+def _transfer(
+    context: AlgopyTestContext,
+    contract: RetirementManager,
+    asset: algopy.Asset,
+    amount: int,
+    receiver: algopy.Account | None = None,
+    sender: algopy.Account | None = None,
+) -> algopy.gtxn.AssetTransferTransaction:
+    return context.any.txn.asset_transfer(
+        sender=sender or context.default_sender,
+        asset_receiver=receiver or context.ledger.get_app(contract).address,
+        xfer_asset=asset,
+        asset_amount=algopy.UInt64(amount),
+    )
+
+
+def test_batch_retires_every_transfer_in_the_group(
+    context: AlgopyTestContext, contract: RetirementManager, cxt: algopy.Asset
+) -> None:
+    first = _retire_batch(
+        context, contract, _transfer(context, contract, cxt, 3), _transfer(context, contract, cxt, 4)
+    )
+    second = _retire_batch(context, contract, _transfer(context, contract, cxt, 5))
+
+    # Like retire_credits, each batch returns the sequence of its certificate.
+    assert (first, second) == (0, 1)
+    assert contract.retired_credits.value == 12
+
+
+def test_batch_records_transfers_of_several_senders_under_the_caller(
+    context: AlgopyTestContext, contract: RetirementManager, cxt: algopy.Asset
+) -> None:
+    other_sender = context.any.account()
+
+    _retire_batch(
+        context,
+        contract,
+        _transfer(context, contract, cxt, 3),
+        _transfer(context, contract, cxt, 4, sender=other_sender),
+    )
+
+    assert contract.get_certificate_count(context.default_sender) == 1
+    assert contract.get_certificate_count(other_sender) == 0
+    assert contract.retired_credits.value == 7
+
+
+def test_batch_rejects_another_call_to_the_app(
+    context: AlgopyTestContext, contract: RetirementManager, cxt: algopy.Asset
+) -> None:
+    # A second call could count the same transfers again.
+    other_call = context.any.txn.application_call(app_id=context.ledger.get_app(contract))
+
+    with pytest.raises(AssertionError, match="Only one retirement call per group"):
+        _retire_batch(context, contract, _transfer(context, contract, cxt, 3), other_call)
+
+
+def test_batch_rejects_a_transfer_of_another_asset(
+    context: AlgopyTestContext, contract: RetirementManager, cxt: algopy.Asset
+) -> None:
+    other_asset = context.any.asset()
+
+    with pytest.raises(AssertionError, match="Incorrect asset ID"):
+        _retire_batch(
+            context,
+            contract,
+            _transfer(context, contract, cxt, 3),
+            _transfer(context, contract, other_asset, 4),
+        )
+
+
+def test_batch_rejects_a_transfer_to_another_account(
+    context: AlgopyTestContext, contract: RetirementManager, cxt: algopy.Asset
+) -> None:
+    with pytest.raises(AssertionError, match="Transfer must be to contract"):
+        _retire_batch(
+            context,
+            contract,
+            _transfer(context, contract, cxt, 3),
+            _transfer(context, contract, cxt, 4, receiver=context.any.account()),
+        )
@@ -0,0 +1,170 @@
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.teal_report import (
+    ProgramAnalysis,
+    build_report,
+    check_budget,
+    parse_teal,
+    write_reports,
+)
+
+# A router with two methods: `cheap` runs straight through, `loop` calls a subroutine
+# from inside a loop.
+PROGRAM = """\
+#pragma version 10
+
+main:
+    txn NumAppArgs
+    bz main_bare
+    pushbytess 0x01 0x02 // method "cheap()void", method "loop()void"
+    txna ApplicationArgs 0
+    match main_cheap main_loop
+    err
+
+main_bare:
+    txn OnCompletion
+    !
+    return
+
+main_cheap:
+    pushbytes "a//b" // not a comment inside the string
+    sha256
+    pop
+    pushint 1
+    return
+
+main_loop:
+    pushint 0
+    store 0
+
+loop:
+    load 0
+    pushint 3
+    <
+    bz done
+    callsub helper
+    load 0
+    pushint 1
+    +
+    store 0
+    b loop
+
+done:
+    pushint 1
+    return
+
+helper:
+    pushbytes 0x01
+    keccak256
+    pop
+    retsub
+"""
+
+# txn, bz, pushbytess, txna, match
+ROUTER_COST = 5
+
+
+def _analysis() -> ProgramAnalysis:
+    return ProgramAnalysis(*parse_teal(PROGRAM))
+
+
+def test_parse_teal_keeps_strings_with_comment_markers() -> None:
+    instructions, labels = parse_teal(PROGRAM)
+
+    pushbytes = next(instruction for instruction in instructions if instruction.op == "pushbytes")
+    assert pushbytes.args == ['"a//b"']
+    assert pushbytes.comment == "not a comment inside the string"
+    assert instructions[labels["main_cheap"]] is pushbytes
+
+
+def test_method_entries_follow_the_router_match() -> None:
+    analysis = _analysis()
+    _, labels = parse_teal(PROGRAM)
+
+    entries = analysis.method_entries()
+
+    assert set(entries) == {"cheap()void", "loop()void"}
+    assert entries["cheap()void"][1] == labels["main_cheap"]
+    assert entries["loop()void"][1] == labels["main_loop"]
+
+
+def test_straight_line_method_cost_includes_router_and_opcode_costs() -> None:
+    analysis = _analysis()
+    report = analysis.method_report(*analysis.method_entries()["cheap()void"])
+
+    # pushbytes, sha256 (35), pop, pushint, return
+    assert report.cost == ROUTER_COST + 1 + 35 + 1 + 1 + 1
+    assert not report.has_loops
+    assert report.scratch_slots == 0
+    assert report.size_bytes is None
+
+
+def test_loop_body_and_subroutine_are_counted_once_on_the_longest_path() -> None:
+    analysis = _analysis()
+    report = analysis.method_report(*analysis.method_entries()["loop()void"])
+
+    helper = 1 + 130 + 1 + 1  # pushbytes, keccak256, pop, retsub
+    body = (1 + helper) + 5  # callsub, then load, pushint, +, store, b
+    assert report.cost == ROUTER_COST + 2 + 4 + max(body, 2)
+    assert report.has_loops
+    assert report.scratch_slots == 1
+
+
+def test_empty_program_has_no_methods() -> None:
+    analysis = ProgramAnalysis(*parse_teal("#pragma version 10\n"))
+
+    assert analysis.back_edges == set()
+    assert analysis.method_entries() == {}
+
+
+def test_write_reports_and_check_budget(tmp_path: Path) -> None:
+    (tmp_path / "Demo.approval.teal").write_text(PROGRAM)
+
+    [path] = write_reports(tmp_path)
+
+    assert path.name == "Demo.cost_report.json"
+    report = build_report(tmp_path / "Demo.approval.teal")
+    assert report["contract"] == "Demo"
+    assert report["program_size_bytes"] is None
+    with pytest.raises(Exception, match=r"Demo\.loop\(\)void"):
+        check_budget([tmp_path], report["methods"]["loop()void"]["cost"] - 1)
+
+
+def test_check_budget_warns_about_methods_with_loops(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    (tmp_path / "Demo.approval.teal").write_text(PROGRAM)
+    write_reports(tmp_path)
+    methods = build_report(tmp_path / "Demo.approval.teal")["methods"]
+
+    check_budget([tmp_path], methods["loop()void"]["cost"])
+
+    [record] = caplog.records
+    assert record.levelname == "WARNING"
+    assert f"Demo.loop()void: {methods['loop()void']['cost']}" in record.message
+    looping = [signature for signature, method in methods.items() if method["has_loops"]]
+    assert looping == ["loop()void"]
+
+
+def test_router_with_one_pushbytes_per_selector() -> None:
+    # -O0 output: a pushbytes per method, then the match.
+    teal = """\
+#pragma version 10
+main:
+    pushbytes 0x01 // method "first()void"
+    pushbytes 0x02 // method "second()void"
+    txna ApplicationArgs 0
+    match first second
+    err
+first:
+    pushint 1
+    return
+second:
+    pushint 1
+    return
+"""
+    analysis = ProgramAnalysis(*parse_teal(teal))
+
+    assert set(analysis.method_entries()) == {"first()void", "second()void"}
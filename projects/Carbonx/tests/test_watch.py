@@ -0,0 +1,50 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers import watch
+from smart_contracts._helpers.watch import WatchedContract, watch_contracts
+
+
+class _Stop(BaseException):
+    """Ends the otherwise endless watch loop."""
+
+
+def _touch(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_files_saved_during_a_rebuild_trigger_another(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    contract_path = tmp_path / "smart_contracts" / "demo" / "contract.py"
+    contract_path.parent.mkdir(parents=True)
+    contract_path.write_text("")
+    deploy_config_path = contract_path.with_name("deploy_config.py")
+    deploy_config_path.write_text("")
+    _touch(contract_path, 1_000_000_000)
+    contract = WatchedContract("demo", contract_path, deploy_config_path)
+
+    polls = iter(range(6))
+
+    def sleep(interval: float) -> None:
+        poll = next(polls, None)
+        if poll == 0:
+            _touch(contract_path, 2_000_000_000)
+        elif poll is None:
+            raise _Stop
+
+    rebuilds: list[set[Path]] = []
+
+    def on_change(changed: WatchedContract, files: set[Path]) -> None:
+        rebuilds.append(files)
+        if len(rebuilds) == 1:
+            # Saved again while the first rebuild runs.
+            _touch(contract_path, 3_000_000_000)
+
+    monkeypatch.setattr(watch.time, "sleep", sleep)
+    with pytest.raises(_Stop):
+        watch_contracts([contract], tmp_path, on_change)
+
+    assert rebuilds == [{contract_path.resolve()}, {contract_path.resolve()}]